@@ -25,3 +25,25 @@ def gen_sha512_hash(item: dict[str, Any], hashcode: Iterable[str]) -> str:
     """
     hashed = "".join([str(item[column]) for column in hashcode])
     return f"{sha512(hashed.encode('utf-8'), usedforsecurity=False).hexdigest()}"
+
+
+def gen_sha512_hashes(values: Iterable[Any]) -> list[str]:
+    """Generate a SHA512 hash for each value in a batch.
+
+    Equivalent to calling `gen_sha512_hash({"text": value}, ["text"])` for each value,
+    without building an intermediate dict per item.
+
+    Parameters
+    ----------
+    values : Iterable[Any]
+        The values to hash.
+
+    Returns
+    -------
+    list[str]
+        The SHA512 hashes as hexadecimal strings, in input order.
+    """
+    return [
+        sha512(str(value).encode("utf-8"), usedforsecurity=False).hexdigest()
+        for value in values
+    ]
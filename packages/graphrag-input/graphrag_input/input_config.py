@@ -38,3 +38,11 @@ class InputConfig(BaseModel):
         description="The input text column to use.",
         default=None,
     )
+    concurrency: int = Field(
+        description="The maximum number of input files to read and parse concurrently.",
+        default=8,
+    )
+    ordered: bool = Field(
+        description="Whether to yield documents in file order when reading files concurrently.",
+        default=True,
+    )
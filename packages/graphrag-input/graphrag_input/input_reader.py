@@ -5,13 +5,18 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import re
 from abc import ABCMeta, abstractmethod
-from typing import TYPE_CHECKING
+from collections import deque
+from dataclasses import asdict
+from typing import TYPE_CHECKING, TypeVar
+
+import pyarrow as pa
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator
+    from collections.abc import AsyncIterator, Awaitable, Callable
 
     from graphrag_storage import Storage
 
@@ -19,6 +24,8 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 class InputReader(metaclass=ABCMeta):
     """Provide a cache interface for the pipeline."""
@@ -28,11 +35,15 @@ class InputReader(metaclass=ABCMeta):
         storage: Storage,
         file_pattern: str,
         encoding: str = "utf-8",
+        concurrency: int = 8,
+        ordered: bool = True,
         **kwargs,
     ):
         self._storage = storage
         self._encoding = encoding
         self._file_pattern = file_pattern
+        self._concurrency = max(1, concurrency)
+        self._ordered = ordered
 
     async def read_files(self) -> list[TextDocument]:
         """Load all files from storage and return them as a single list."""
@@ -53,14 +64,10 @@ class InputReader(metaclass=ABCMeta):
         file_count = len(files)
         doc_count = 0
 
-        for file in files:
-            try:
-                for doc in await self.read_file(file):
-                    doc_count += 1
-                    yield doc
-            except Exception as e:  # noqa: BLE001 (catching Exception is fine here)
-                logger.warning("Warning! Error loading file %s. Skipping...", file)
-                logger.warning("Error: %s", e)
+        async for docs in self._prefetch_files(files, self.read_file, list):
+            for doc in docs:
+                doc_count += 1
+                yield doc
 
         logger.info(
             "Found %d %s files, loading %d",
@@ -74,6 +81,111 @@ class InputReader(metaclass=ABCMeta):
             doc_count,
         )
 
+    async def iter_tables(self) -> AsyncIterator[pa.Table]:
+        """Async generator that yields one Arrow table of documents per loaded file.
+
+        This is the columnar counterpart of iterating the reader: each table has the
+        `TextDocument` fields as columns, so callers can write documents in batches
+        without materializing a Python object per row.
+        """
+        files = list(self._storage.find(re.compile(self._file_pattern)))
+        if len(files) == 0:
+            msg = f"No {self._file_pattern} matches found in storage"
+            logger.warning(msg)
+            return
+
+        doc_count = 0
+        async for table in self._prefetch_files(
+            files, self.read_file_table, _empty_table
+        ):
+            if table.num_rows > 0:
+                doc_count += table.num_rows
+                yield table
+
+        logger.info(
+            "Found %d %s files, loading %d",
+            len(files),
+            self._file_pattern,
+            doc_count,
+        )
+
+    async def read_file_table(self, path: str) -> pa.Table:
+        """Read a file into an Arrow table of documents.
+
+        The default implementation converts the documents returned by `read_file`;
+        readers with a native columnar path should override it.
+
+        Args:
+            - path - The path to read the file from.
+
+        Returns
+        -------
+            - output - Table with a row for each document in the file.
+        """
+        documents = await self.read_file(path)
+        return pa.Table.from_pylist([asdict(doc) for doc in documents])
+
+    async def _prefetch_files(
+        self,
+        files: list[str],
+        read: Callable[[str], Awaitable[T]],
+        empty: Callable[[], T],
+    ) -> AsyncIterator[T]:
+        """Read up to `concurrency` files at once, yielding each file's result.
+
+        When `ordered` is set, results are yielded in file order; otherwise they are
+        yielded as soon as each file finishes loading.
+        """
+        if self._ordered:
+            queue: deque[asyncio.Task[T]] = deque()
+            try:
+                for file in files:
+                    queue.append(
+                        asyncio.create_task(self._read_safe(read, file, empty))
+                    )
+                    if len(queue) >= self._concurrency:
+                        yield await queue.popleft()
+                while queue:
+                    yield await queue.popleft()
+            finally:
+                for task in queue:
+                    task.cancel()
+            return
+
+        pending: set[asyncio.Task[T]] = set()
+        try:
+            for file in files:
+                if len(pending) >= self._concurrency:
+                    done, pending = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for task in done:
+                        yield task.result()
+                pending.add(asyncio.create_task(self._read_safe(read, file, empty)))
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    yield task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _read_safe(
+        self,
+        read: Callable[[str], Awaitable[T]],
+        path: str,
+        empty: Callable[[], T],
+    ) -> T:
+        """Read a single file, logging and skipping it on failure."""
+        try:
+            return await read(path)
+        except Exception as e:  # noqa: BLE001 (catching Exception is fine here)
+            logger.warning("Warning! Error loading file %s. Skipping...", path)
+            logger.warning("Error: %s", e)
+            return empty()
+
     @abstractmethod
     async def read_file(self, path: str) -> list[TextDocument]:
         """Read a file into a list of documents.
@@ -85,3 +197,8 @@ class InputReader(metaclass=ABCMeta):
         -------
             - output - List with an entry for each document in the file.
         """
+
+
+def _empty_table() -> pa.Table:
+    """Return an empty table for files that fail to load."""
+    return pa.table({})
@@ -3,10 +3,13 @@
 
 """A module containing 'JSONFileReader' model."""
 
+import asyncio
 import json
 import logging
 
-from graphrag_input.structured_file_reader import StructuredFileReader
+import pyarrow as pa
+
+from graphrag_input.structured_file_reader import StructuredFileReader, rows_to_table
 from graphrag_input.text_document import TextDocument
 
 logger = logging.getLogger(__name__)
@@ -31,8 +34,25 @@ class JSONFileReader(StructuredFileReader):
         -------
             - output - list with a TextDocument for each row in the file.
         """
+        rows = await self._read_rows(path)
+        return await self.process_data_columns(rows, path)
+
+    async def read_source_table(self, path: str) -> pa.Table:
+        """Read a JSON file into an Arrow table.
+
+        Args:
+            - path - The path to read the file from.
+
+        Returns
+        -------
+            - output - Table with a row for each object in the file.
+        """
+        rows = await self._read_rows(path)
+        return await asyncio.to_thread(rows_to_table, rows)
+
+    async def _read_rows(self, path: str) -> list[dict]:
+        """Read a JSON file into a list of row dicts."""
         text = await self._storage.get(path, encoding=self._encoding)
-        as_json = json.loads(text)
+        as_json = await asyncio.to_thread(json.loads, text)
         # json file could just be a single object, or an array of objects
-        rows = as_json if isinstance(as_json, list) else [as_json]
-        return await self.process_data_columns(rows, path)
+        return as_json if isinstance(as_json, list) else [as_json]
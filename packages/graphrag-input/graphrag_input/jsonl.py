@@ -3,10 +3,15 @@
 
 """A module containing 'JSONLinesFileReader' model."""
 
+import asyncio
+import io
 import json
 import logging
 
-from graphrag_input.structured_file_reader import StructuredFileReader
+import pyarrow as pa
+import pyarrow.json as pajson
+
+from graphrag_input.structured_file_reader import StructuredFileReader, rows_to_table
 from graphrag_input.text_document import TextDocument
 
 logger = logging.getLogger(__name__)
@@ -34,28 +39,57 @@ class JSONLinesFileReader(StructuredFileReader):
             - output - list with a TextDocument for each row in the file.
         """
         text = await self._storage.get(path, encoding=self._encoding)
-        rows: list[dict] = []
-        for line_number, line in enumerate(text.splitlines(), start=1):
-            if not line.strip():
-                continue
-
-            try:
-                parsed_row = json.loads(line)
-            except json.JSONDecodeError:
-                logger.warning(
-                    "Skipping malformed JSONL row in %s at line %s",
-                    path,
-                    line_number,
-                )
-                continue
-
-            if isinstance(parsed_row, dict):
-                rows.append(parsed_row)
-            else:
-                logger.warning(
-                    "Skipping non-object JSONL row in %s at line %s",
-                    path,
-                    line_number,
-                )
-
+        rows = await asyncio.to_thread(_parse_jsonl, text, path)
         return await self.process_data_columns(rows, path)
+
+    async def read_source_table(self, path: str) -> pa.Table:
+        """Read a JSON lines file into an Arrow table with pyarrow's JSON parser.
+
+        Files that pyarrow cannot parse as a whole (malformed or non-object rows) fall
+        back to the line-by-line parser, which skips the invalid rows.
+
+        Args:
+            - path - The path to read the file from.
+
+        Returns
+        -------
+            - output - Table with a row for each valid row in the file.
+        """
+        text = await self._storage.get(path, encoding=self._encoding)
+        return await asyncio.to_thread(_read_jsonl_table, text, path)
+
+
+def _parse_jsonl(text: str, path: str) -> list[dict]:
+    """Parse JSON lines text into a list of row dicts, skipping invalid rows."""
+    rows: list[dict] = []
+    for line_number, line in enumerate(text.splitlines(), start=1):
+        if not line.strip():
+            continue
+
+        try:
+            parsed_row = json.loads(line)
+        except json.JSONDecodeError:
+            logger.warning(
+                "Skipping malformed JSONL row in %s at line %s",
+                path,
+                line_number,
+            )
+            continue
+
+        if isinstance(parsed_row, dict):
+            rows.append(parsed_row)
+        else:
+            logger.warning(
+                "Skipping non-object JSONL row in %s at line %s",
+                path,
+                line_number,
+            )
+    return rows
+
+
+def _read_jsonl_table(text: str, path: str) -> pa.Table:
+    """Parse JSON lines text into an Arrow table, skipping invalid rows."""
+    try:
+        return pajson.read_json(io.BytesIO(text.encode("utf-8")))
+    except pa.ArrowInvalid:
+        return rows_to_table(_parse_jsonl(text, path))
@@ -3,6 +3,7 @@
 
 """A module containing 'TextFileReader' model."""
 
+import asyncio
 import logging
 from io import BytesIO
 from pathlib import Path
@@ -34,8 +35,10 @@ class MarkItDownFileReader(InputReader):
         """
         bytes = await self._storage.get(path, encoding=self._encoding, as_bytes=True)
         md = MarkItDown()
-        result = md.convert_stream(
-            BytesIO(bytes), stream_info=StreamInfo(extension=Path(path).suffix)
+        result = await asyncio.to_thread(
+            md.convert_stream,
+            BytesIO(bytes),
+            stream_info=StreamInfo(extension=Path(path).suffix),
         )
         text = result.markdown
 
@@ -3,9 +3,11 @@
 
 """A module containing 'ParquetFileReader' model."""
 
+import asyncio
 import io
 import logging
 
+import pyarrow as pa
 import pyarrow.parquet as pq
 
 from graphrag_input.structured_file_reader import StructuredFileReader
@@ -33,7 +35,19 @@ class ParquetFileReader(StructuredFileReader):
         -------
             - output - list with a TextDocument for each row in the file.
         """
-        file_bytes = await self._storage.get(path, as_bytes=True)
-        table = pq.read_table(io.BytesIO(file_bytes))
+        table = await self.read_source_table(path)
         rows = table.to_pylist()
         return await self.process_data_columns(rows, path)
+
+    async def read_source_table(self, path: str) -> pa.Table:
+        """Read a parquet file into an Arrow table.
+
+        Args:
+            - path - The path to read the file from.
+
+        Returns
+        -------
+            - output - Table with a row for each row in the file.
+        """
+        file_bytes = await self._storage.get(path, as_bytes=True)
+        return await asyncio.to_thread(pq.read_table, io.BytesIO(file_bytes))
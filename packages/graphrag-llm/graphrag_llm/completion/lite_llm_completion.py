@@ -17,6 +17,7 @@ from graphrag_llm.middleware import (
 )
 from graphrag_llm.types import LLMCompletionChunk, LLMCompletionResponse
 from graphrag_llm.utils import (
+    get_response_headers,
     structure_completion_response,
 )
 
@@ -266,7 +267,9 @@ def _create_base_completions(
             **new_args,
         )
         if isinstance(response, ModelResponse):
-            return LLMCompletionResponse(**response.model_dump())
+            result = LLMCompletionResponse(**response.model_dump())
+            result.response_headers = get_response_headers(response)
+            return result
 
         def _run_iterator() -> Iterator[LLMCompletionChunk]:
             for chunk in response:
@@ -292,7 +295,9 @@ def _create_base_completions(
             **new_args,
         )
         if isinstance(response, ModelResponse):
-            return LLMCompletionResponse(**response.model_dump())
+            result = LLMCompletionResponse(**response.model_dump())
+            result.response_headers = get_response_headers(response)
+            return result
 
         async def _run_iterator() -> AsyncIterator[LLMCompletionChunk]:
             async for chunk in response:
@@ -16,7 +16,7 @@ class RateLimitConfig(BaseModel):
 
     type: str = Field(
         default=RateLimitType.SlidingWindow,
-        description="The type of rate limit strategy to use. [sliding_window] (default: sliding_window).",
+        description="The type of rate limit strategy to use. [sliding_window, adaptive, shared_sliding_window] (default: sliding_window).",
     )
 
     period_in_seconds: int | None = Field(
@@ -34,6 +34,36 @@ class RateLimitConfig(BaseModel):
         description="The maximum number of tokens allowed per period. (default: None, no limit).",
     )
 
+    initial_concurrency: int | None = Field(
+        default=None,
+        description="The number of concurrent requests the adaptive rate limit starts with. (default: 4).",
+    )
+
+    min_concurrency: int | None = Field(
+        default=None,
+        description="The lowest concurrency the adaptive rate limit may shrink to. (default: 1).",
+    )
+
+    max_concurrency: int | None = Field(
+        default=None,
+        description="The highest concurrency the adaptive rate limit may grow to. (default: 64).",
+    )
+
+    latency_threshold: float | None = Field(
+        default=None,
+        description="How many times slower than the 90th percentile of recent latencies a request must be for the adaptive rate limit to treat it as throttled. (default: 3.0).",
+    )
+
+    database_path: str | None = Field(
+        default=None,
+        description="The SQLite database the shared sliding window is kept in. (default: a file in the system temp directory).",
+    )
+
+    quota_key: str | None = Field(
+        default=None,
+        description="The name of the quota the shared sliding window draws from, e.g. the deployment name. (default: the model's deployment name or model id).",
+    )
+
     def _validate_sliding_window_config(self) -> None:
         """Validate Sliding Window rate limit configuration."""
         if self.period_in_seconds is not None and self.period_in_seconds <= 0:
@@ -52,9 +82,39 @@ class RateLimitConfig(BaseModel):
             msg = "tokens_per_period must be a positive integer for Sliding Window rate limit."
             raise ValueError(msg)
 
+    def _validate_adaptive_config(self) -> None:
+        """Validate Adaptive rate limit configuration."""
+        for name in ("initial_concurrency", "min_concurrency", "max_concurrency"):
+            value = getattr(self, name)
+            if value is not None and value <= 0:
+                msg = f"{name} must be a positive integer for Adaptive rate limit."
+                raise ValueError(msg)
+
+        bounds = [
+            value
+            for value in (
+                self.min_concurrency,
+                self.initial_concurrency,
+                self.max_concurrency,
+            )
+            if value is not None
+        ]
+        if bounds != sorted(bounds):
+            msg = "Adaptive rate limit requires min_concurrency <= initial_concurrency <= max_concurrency."
+            raise ValueError(msg)
+
+        if self.latency_threshold is not None and self.latency_threshold <= 1:
+            msg = "latency_threshold must be greater than 1 for Adaptive rate limit."
+            raise ValueError(msg)
+
     @model_validator(mode="after")
     def _validate_model(self):
         """Validate the rate limit configuration based on its type."""
-        if self.type == RateLimitType.SlidingWindow:
+        if self.type in (
+            RateLimitType.SlidingWindow,
+            RateLimitType.SharedSlidingWindow,
+        ):
             self._validate_sliding_window_config()
+        elif self.type == RateLimitType.Adaptive:
+            self._validate_adaptive_config()
         return self
@@ -39,6 +39,21 @@ class RetryConfig(BaseModel):
         description="The maximum delay in seconds between retries.",
     )
 
+    retry_budget: float | None = Field(
+        default=None,
+        description="The number of retries allowed per request, shared by all requests to the same model, for exponential backoff. (default: None, no budget).",
+    )
+
+    circuit_breaker_threshold: float | None = Field(
+        default=None,
+        description="The share of failed requests, between 0 and 1, that pauses all requests to the same model for exponential backoff. (default: None, no circuit breaker).",
+    )
+
+    circuit_breaker_cooldown: float | None = Field(
+        default=None,
+        description="The number of seconds requests are paused for once the circuit breaker opens. (default: 30).",
+    )
+
     def _validate_exponential_backoff_config(self) -> None:
         """Validate Exponential Backoff retry configuration."""
         if self.max_retries is not None and self.max_retries <= 1:
@@ -53,6 +68,23 @@ class RetryConfig(BaseModel):
             msg = "max_delay must be greater than 1 for Exponential Backoff retry."
             raise ValueError(msg)
 
+        if self.retry_budget is not None and self.retry_budget <= 0:
+            msg = "retry_budget must be greater than 0 for Exponential Backoff retry."
+            raise ValueError(msg)
+
+        if self.circuit_breaker_threshold is not None and not (
+            0 < self.circuit_breaker_threshold <= 1
+        ):
+            msg = "circuit_breaker_threshold must be between 0 and 1 for Exponential Backoff retry."
+            raise ValueError(msg)
+
+        if (
+            self.circuit_breaker_cooldown is not None
+            and self.circuit_breaker_cooldown <= 0
+        ):
+            msg = "circuit_breaker_cooldown must be greater than 0 for Exponential Backoff retry."
+            raise ValueError(msg)
+
     def _validate_immediate_config(self) -> None:
         """Validate Immediate retry configuration."""
         if self.max_retries is not None and self.max_retries <= 1:
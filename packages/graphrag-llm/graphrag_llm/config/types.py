@@ -44,6 +44,8 @@ class RateLimitType(StrEnum):
     """Enum for built-in RateLimit types."""
 
     SlidingWindow = "sliding_window"
+    Adaptive = "adaptive"
+    SharedSlidingWindow = "shared_sliding_window"
 
 
 class RetryType(StrEnum):
@@ -111,13 +111,19 @@ def create_embedding(
     if model_config.rate_limit:
         from graphrag_llm.rate_limit.rate_limit_factory import create_rate_limiter
 
-        rate_limiter = create_rate_limiter(rate_limit_config=model_config.rate_limit)
+        rate_limiter = create_rate_limiter(
+            rate_limit_config=model_config.rate_limit,
+            default_quota_key=model_config.azure_deployment_name or model_id,
+        )
 
     retrier: Retry | None = None
     if model_config.retry:
         from graphrag_llm.retry.retry_factory import create_retry
 
-        retrier = create_retry(retry_config=model_config.retry)
+        retrier = create_retry(
+            retry_config=model_config.retry,
+            model_id=model_config.azure_deployment_name or model_id,
+        )
 
     metrics_store: MetricsStore = NoopMetricsStore()
     metrics_processor: MetricsProcessor | None = None
@@ -12,6 +12,7 @@ from graphrag_llm.config.types import AuthMethod
 from graphrag_llm.embedding.embedding import LLMEmbedding
 from graphrag_llm.middleware import with_middleware_pipeline
 from graphrag_llm.types import LLMEmbeddingResponse
+from graphrag_llm.utils import get_response_headers
 
 if TYPE_CHECKING:
     from graphrag_cache import Cache, CacheKeyCreator
@@ -186,13 +187,17 @@ def _create_base_embeddings(
         new_args: dict[str, Any] = {**base_args, **kwargs}
 
         response = litellm.embedding(**new_args)
-        return LLMEmbeddingResponse(**response.model_dump())
+        result = LLMEmbeddingResponse(**response.model_dump())
+        result.response_headers = get_response_headers(response)
+        return result
 
     async def _base_embedding_async(**kwargs: Any) -> LLMEmbeddingResponse:
         kwargs.pop("metrics", None)  # Remove metrics if present
         new_args: dict[str, Any] = {**base_args, **kwargs}
 
         response = await litellm.aembedding(**new_args)
-        return LLMEmbeddingResponse(**response.model_dump())
+        result = LLMEmbeddingResponse(**response.model_dump())
+        result.response_headers = get_response_headers(response)
+        return result
 
     return _base_embedding, _base_embedding_async
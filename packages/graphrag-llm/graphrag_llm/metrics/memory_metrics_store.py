@@ -27,6 +27,7 @@ _default_sort_order: list[str] = [
     "runtime_duration_seconds",
     "cached_responses",
     "cache_hit_rate",
+    "coalesced_responses",
     "streaming_responses",
     "responses_with_tokens",
     "prompt_tokens",
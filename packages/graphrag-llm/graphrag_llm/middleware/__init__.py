@@ -11,6 +11,7 @@ from graphrag_llm.middleware.with_middleware_pipeline import with_middleware_pip
 from graphrag_llm.middleware.with_rate_limiting import with_rate_limiting
 from graphrag_llm.middleware.with_request_count import with_request_count
 from graphrag_llm.middleware.with_retries import with_retries
+from graphrag_llm.middleware.with_singleflight import with_singleflight
 
 __all__ = [
     "with_cache",
@@ -21,4 +22,5 @@ __all__ = [
     "with_rate_limiting",
     "with_request_count",
     "with_retries",
+    "with_singleflight",
 ]
@@ -12,6 +12,7 @@ from graphrag_llm.middleware.with_metrics import with_metrics
 from graphrag_llm.middleware.with_rate_limiting import with_rate_limiting
 from graphrag_llm.middleware.with_request_count import with_request_count
 from graphrag_llm.middleware.with_retries import with_retries
+from graphrag_llm.middleware.with_singleflight import with_singleflight
 
 if TYPE_CHECKING:
     from graphrag_cache import Cache, CacheKeyCreator
@@ -48,6 +49,10 @@ def with_middleware_pipeline(
     Full Pipeline Order:
         - with_requests_counts: Counts incoming requests and
             successes, and failures that bubble back up.
+        - with_singleflight: Coalesces concurrent identical requests
+            so that only one of them reaches the cache and the model.
+            Only applied together with the cache, so that coalescing
+            never changes what identical requests return.
         - with_cache: Returns cached responses when available
             and caches new successful responses that bubble back up.
         - with_retries: Retries failed requests.
@@ -139,6 +144,11 @@ def with_middleware_pipeline(
             cache=cache,
             cache_key_creator=cache_key_creator,
         )
+        model_fn, async_model_fn = with_singleflight(
+            sync_middleware=model_fn,
+            async_middleware=async_model_fn,
+            cache_key_creator=cache_key_creator,
+        )
 
     if metrics_processor:
         model_fn, async_model_fn = with_request_count(
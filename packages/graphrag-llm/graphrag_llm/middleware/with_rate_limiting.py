@@ -3,8 +3,14 @@
 
 """Rate limit middleware."""
 
+import time
 from typing import TYPE_CHECKING, Any
 
+from graphrag_llm.utils.response_headers import (
+    get_response_headers,
+    is_throttling_error,
+)
+
 if TYPE_CHECKING:
     from graphrag_llm.rate_limit import RateLimiter
     from graphrag_llm.tokenizer import Tokenizer
@@ -26,6 +32,10 @@ def with_rate_limiting(
 ]:
     """Wrap model functions with rate limit middleware.
 
+    The outcome of every request (its latency, the provider response
+    headers and whether it was throttled) is reported back to the rate
+    limiter so that adaptive rate limiters can adjust to the provider.
+
     Args
     ----
         sync_middleware: LLMFunction
@@ -59,7 +69,17 @@ def with_rate_limiting(
             token_count += sum(tokenizer.num_tokens(text) for text in input)
 
         with rate_limiter.acquire(token_count):
-            return sync_middleware(**kwargs)
+            start_time = time.perf_counter()
+            try:
+                response = sync_middleware(**kwargs)
+            except Exception as e:
+                _record_error(rate_limiter, e, time.perf_counter() - start_time)
+                raise
+            rate_limiter.record_response(
+                latency=time.perf_counter() - start_time,
+                headers=get_response_headers(response),
+            )
+            return response
 
     async def _rate_limit_middleware_async(
         **kwargs: Any,
@@ -73,7 +93,32 @@ def with_rate_limiting(
             token_count += tokenizer.num_prompt_tokens(messages=messages)
         elif input:
             token_count += sum(tokenizer.num_tokens(text) for text in input)
-        with rate_limiter.acquire(token_count):
-            return await async_middleware(**kwargs)
+        async with rate_limiter.acquire_async(token_count):
+            start_time = time.perf_counter()
+            try:
+                response = await async_middleware(**kwargs)
+            except Exception as e:
+                _record_error(rate_limiter, e, time.perf_counter() - start_time)
+                raise
+            rate_limiter.record_response(
+                latency=time.perf_counter() - start_time,
+                headers=get_response_headers(response),
+            )
+            return response
 
     return (_rate_limit_middleware, _rate_limit_middleware_async)  # type: ignore
+
+
+def _record_error(
+    rate_limiter: "RateLimiter", error: Exception, latency: float
+) -> None:
+    """Report a throttled request to the rate limiter.
+
+    Other errors say nothing about the provider's capacity and are ignored.
+    """
+    if is_throttling_error(error):
+        rate_limiter.record_response(
+            latency=latency,
+            headers=get_response_headers(error),
+            throttled=True,
+        )
@@ -0,0 +1,155 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Singleflight middleware."""
+
+import asyncio
+import threading
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from graphrag_cache import CacheKeyCreator
+
+    from graphrag_llm.types import (
+        AsyncLLMFunction,
+        LLMFunction,
+        Metrics,
+    )
+
+
+class _InFlightCall:
+    """A request shared by the threads that issued it concurrently."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.response: Any = None
+        self.error: BaseException | None = None
+        self.metrics: Metrics | None = None
+
+
+def with_singleflight(
+    *,
+    sync_middleware: "LLMFunction",
+    async_middleware: "AsyncLLMFunction",
+    cache_key_creator: "CacheKeyCreator",
+) -> tuple[
+    "LLMFunction",
+    "AsyncLLMFunction",
+]:
+    """Wrap model functions with singleflight middleware.
+
+    Concurrent requests with the same cache key share a single in-flight
+    request: the first caller makes the request and the others wait for
+    its response (or error) instead of sending their own. Sync callers are
+    coalesced across threads and async callers within an event loop.
+
+    Args
+    ----
+        sync_middleware: LLMFunction
+            The synchronous model function to wrap.
+            Either a completion function or an embedding function.
+        async_middleware: AsyncLLMFunction
+            The asynchronous model function to wrap.
+            Either a completion function or an embedding function.
+        cache_key_creator: CacheKeyCreator
+            The cache key creator used to identify identical requests.
+
+    Returns
+    -------
+        tuple[LLMFunction, AsyncLLMFunction]
+            The synchronous and asynchronous model functions with singleflight.
+
+    """
+    lock = threading.Lock()
+    sync_calls: dict[str, _InFlightCall] = {}
+    async_calls: dict[str, asyncio.Future] = {}
+
+    def _singleflight_middleware(
+        **kwargs: Any,
+    ):
+        is_streaming = kwargs.get("stream") or False
+        is_mocked = kwargs.get("mock_response") or False
+
+        if is_streaming or is_mocked:
+            return sync_middleware(**kwargs)
+
+        cache_key = cache_key_creator(kwargs)
+
+        with lock:
+            call = sync_calls.get(cache_key)
+            is_leader = call is None
+            if call is None:
+                call = _InFlightCall()
+                sync_calls[cache_key] = call
+
+        if not is_leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            _share_metrics(kwargs.get("metrics"), call.metrics)
+            return call.response
+
+        try:
+            call.response = sync_middleware(**kwargs)
+            call.metrics = kwargs.get("metrics")
+            return call.response  # noqa: TRY300
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with lock:
+                del sync_calls[cache_key]
+            call.done.set()
+
+    async def _singleflight_middleware_async(
+        **kwargs: Any,
+    ):
+        is_streaming = kwargs.get("stream") or False
+        is_mocked = kwargs.get("mock_response") or False
+
+        if is_streaming or is_mocked:
+            return await async_middleware(**kwargs)
+
+        cache_key = cache_key_creator(kwargs)
+        event_loop = asyncio.get_running_loop()
+
+        in_flight = async_calls.get(cache_key)
+        if in_flight is not None and in_flight.get_loop() is event_loop:
+            # shield so a cancelled follower does not cancel the shared request
+            shared = await asyncio.shield(in_flight)
+            if shared is not None:
+                response, metrics = shared
+                _share_metrics(kwargs.get("metrics"), metrics)
+                return response
+            # the leader was cancelled, so make the request ourselves
+            return await async_middleware(**kwargs)
+
+        future = event_loop.create_future()
+        async_calls[cache_key] = future
+        try:
+            response = await async_middleware(**kwargs)
+        except asyncio.CancelledError:
+            future.set_result(None)
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # mark the error as retrieved in case nobody is waiting on it
+            future.exception()
+            raise
+        else:
+            future.set_result((response, kwargs.get("metrics")))
+            return response
+        finally:
+            if async_calls.get(cache_key) is future:
+                del async_calls[cache_key]
+
+    return (_singleflight_middleware, _singleflight_middleware_async)  # type: ignore
+
+
+def _share_metrics(metrics: "Metrics | None", shared: "Metrics | None") -> None:
+    """Copy the metrics of the shared request onto a coalesced request."""
+    if metrics is None:
+        return
+    if shared is not None:
+        metrics.update(shared)
+    metrics["coalesced_responses"] = 1
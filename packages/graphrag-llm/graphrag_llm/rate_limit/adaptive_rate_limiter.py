@@ -0,0 +1,223 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Adaptive (AIMD) Rate Limiter."""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from collections.abc import AsyncGenerator, Generator
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any
+
+from graphrag_llm.rate_limit.rate_limiter import RateLimiter
+from graphrag_llm.utils.response_headers import get_retry_after
+
+_POLL_INTERVAL = 0.01
+_LATENCY_WINDOW = 100
+_LATENCY_PERCENTILE = 0.9
+_MIN_LATENCY_SAMPLES = 10
+
+
+class AdaptiveRateLimiter(RateLimiter):
+    """Adaptive Rate Limiter implementation.
+
+    Limits the number of concurrent requests and adjusts the limit with
+    additive-increase/multiplicative-decrease (AIMD): every successful request
+    raises the limit by `increase_step / limit` (about `increase_step` per
+    round of requests), while a throttled request or a latency spike
+    multiplies it by `decrease_factor`. The limit is decreased at most once
+    per round, since requests already in flight were sent under the old limit.
+
+    A latency spike is a successful request slower than `latency_threshold`
+    times the 90th percentile of recent latencies. Comparing against a high
+    percentile rather than the fastest request keeps long completions from
+    being mistaken for throttling.
+
+    `Retry-After` headers, and remaining-quota headers reporting zero, pause
+    all new requests until the provider is ready to accept them again.
+    """
+
+    _limit: float
+    _min_concurrency: int
+    _max_concurrency: int
+    _increase_step: float
+    _decrease_factor: float
+    _latency_threshold: float
+    _lock: threading.Lock
+    _in_flight: int = 0
+    _blocked_until: float = 0.0
+    _last_decrease: float = 0.0
+    _latencies: deque[float]
+
+    def __init__(
+        self,
+        *,
+        initial_concurrency: int | None = None,
+        min_concurrency: int | None = None,
+        max_concurrency: int | None = None,
+        increase_step: float = 1.0,
+        decrease_factor: float = 0.5,
+        latency_threshold: float | None = None,
+        **kwargs: Any,
+    ):
+        """Initialize the Adaptive Rate Limiter.
+
+        Args
+        ----
+            initial_concurrency: int | None
+                The number of concurrent requests to start with. Defaults to 4.
+            min_concurrency: int | None
+                The lowest the concurrency limit may shrink to. Defaults to 1.
+            max_concurrency: int | None
+                The highest the concurrency limit may grow to. Defaults to 64.
+            increase_step: float
+                How much the concurrency limit grows per round of successful requests.
+            decrease_factor: float
+                The factor the concurrency limit is multiplied by when the provider throttles.
+            latency_threshold: float | None
+                A request slower than this multiple of the 90th percentile of recent latencies counts as throttled. Defaults to 3.0.
+
+        Raises
+        ------
+            ValueError
+                If the concurrency bounds are not positive or not ordered,
+                or if decrease_factor is not between 0 and 1,
+                or if latency_threshold is not greater than 1.
+        """
+        self._min_concurrency = min_concurrency or 1
+        self._max_concurrency = max_concurrency or 64
+        initial = initial_concurrency or min(4, self._max_concurrency)
+
+        if not 0 < self._min_concurrency <= initial <= self._max_concurrency:
+            msg = "Adaptive rate limit requires 0 < min_concurrency <= initial_concurrency <= max_concurrency."
+            raise ValueError(msg)
+        if not 0 < decrease_factor < 1:
+            msg = "decrease_factor must be between 0 and 1 for Adaptive rate limit."
+            raise ValueError(msg)
+        latency_threshold = latency_threshold or 3.0
+        if latency_threshold <= 1:
+            msg = "latency_threshold must be greater than 1 for Adaptive rate limit."
+            raise ValueError(msg)
+
+        self._limit = float(initial)
+        self._increase_step = increase_step
+        self._decrease_factor = decrease_factor
+        self._latency_threshold = latency_threshold
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._blocked_until = 0.0
+        self._last_decrease = 0.0
+        self._latencies = deque(maxlen=_LATENCY_WINDOW)
+
+    @property
+    def concurrency(self) -> int:
+        """The current concurrency limit."""
+        return int(self._limit)
+
+    def _try_acquire(self) -> float:
+        """Take a slot if one is free, otherwise return how long to wait."""
+        with self._lock:
+            wait = self._blocked_until - time.monotonic()
+            if wait > 0:
+                return wait
+            if self._in_flight >= int(self._limit):
+                return _POLL_INTERVAL
+            self._in_flight += 1
+            return 0.0
+
+    def _release(self) -> None:
+        with self._lock:
+            self._in_flight -= 1
+
+    @contextmanager
+    def acquire(self, token_count: int) -> Generator[None]:
+        """
+        Acquire Rate Limiter.
+
+        Args
+        ----
+            token_count: The estimated number of tokens for the current request.
+
+        Yields
+        ------
+            None: This context manager does not return any value.
+        """
+        while (wait := self._try_acquire()) > 0:
+            time.sleep(wait)
+        try:
+            yield
+        finally:
+            self._release()
+
+    @asynccontextmanager
+    async def acquire_async(self, token_count: int) -> AsyncGenerator[None]:
+        """
+        Acquire Rate Limiter without blocking the event loop.
+
+        Args
+        ----
+            token_count: The estimated number of tokens for the current request.
+
+        Yields
+        ------
+            None: This context manager does not return any value.
+        """
+        # poll, since both the limit and the pause can change at any time
+        while (wait := self._try_acquire()) > 0:  # noqa: ASYNC110
+            await asyncio.sleep(wait)
+        try:
+            yield
+        finally:
+            self._release()
+
+    def record_response(
+        self,
+        *,
+        latency: float,
+        headers: dict[str, str] | None = None,
+        throttled: bool = False,
+    ) -> None:
+        """
+        Adjust the concurrency limit to the outcome of a request.
+
+        Args
+        ----
+            latency: float
+                The duration of the request in seconds.
+            headers: dict[str, str] | None
+                The lower-cased provider response headers, if any.
+            throttled: bool
+                Whether the provider rejected the request for exceeding its rate limits.
+        """
+        now = time.monotonic()
+        retry_after = get_retry_after(headers or {})
+
+        with self._lock:
+            if retry_after is not None:
+                self._blocked_until = max(self._blocked_until, now + retry_after)
+
+            if not throttled:
+                if len(self._latencies) >= _MIN_LATENCY_SAMPLES:
+                    latencies = sorted(self._latencies)
+                    baseline = latencies[
+                        int(_LATENCY_PERCENTILE * (len(latencies) - 1))
+                    ]
+                    throttled = latency > baseline * self._latency_threshold
+                self._latencies.append(latency)
+
+            if throttled:
+                # only the first signal from requests sent under the current
+                # limit shrinks it, the rest were already in flight
+                if now - latency >= self._last_decrease:
+                    self._limit = max(
+                        self._limit * self._decrease_factor,
+                        float(self._min_concurrency),
+                    )
+                    self._last_decrease = now
+            elif retry_after is None:
+                self._limit = min(
+                    self._limit + self._increase_step / self._limit,
+                    float(self._max_concurrency),
+                )
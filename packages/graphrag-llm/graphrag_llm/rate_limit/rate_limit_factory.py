@@ -49,6 +49,8 @@ def register_rate_limiter(
 
 def create_rate_limiter(
     rate_limit_config: "RateLimitConfig",
+    *,
+    default_quota_key: str | None = None,
 ) -> RateLimiter:
     """Create a RateLimiter instance.
 
@@ -56,6 +58,9 @@ def create_rate_limiter(
     ----
         rate_limit_config: RateLimitConfig
             The configuration for the rate limit strategy.
+        default_quota_key: str | None (default: None)
+            The quota key to use when the configuration does not set one,
+            e.g. the model or deployment the rate limiter guards.
 
     Returns
     -------
@@ -64,6 +69,8 @@ def create_rate_limiter(
     """
     strategy = rate_limit_config.type
     init_args = rate_limit_config.model_dump()
+    if init_args.get("quota_key") is None:
+        init_args["quota_key"] = default_quota_key
 
     if strategy not in rate_limit_factory:
         match strategy:
@@ -77,6 +84,26 @@ def create_rate_limiter(
                     rate_limiter_initializer=SlidingWindowRateLimiter,
                 )
 
+            case RateLimitType.Adaptive:
+                from graphrag_llm.rate_limit.adaptive_rate_limiter import (
+                    AdaptiveRateLimiter,
+                )
+
+                register_rate_limiter(
+                    rate_limit_type=RateLimitType.Adaptive,
+                    rate_limiter_initializer=AdaptiveRateLimiter,
+                )
+
+            case RateLimitType.SharedSlidingWindow:
+                from graphrag_llm.rate_limit.shared_sliding_window_rate_limiter import (
+                    SharedSlidingWindowRateLimiter,
+                )
+
+                register_rate_limiter(
+                    rate_limit_type=RateLimitType.SharedSlidingWindow,
+                    rate_limiter_initializer=SharedSlidingWindowRateLimiter,
+                )
+
             case _:
                 msg = f"RateLimitConfig.type '{strategy}' is not registered in the RateLimitFactory. Registered strategies: {', '.join(rate_limit_factory.keys())}"
                 raise ValueError(msg)
@@ -4,8 +4,8 @@
 """LiteLLM Rate Limiter."""
 
 from abc import ABC, abstractmethod
-from collections.abc import Iterator
-from contextlib import contextmanager
+from collections.abc import AsyncGenerator, Iterator
+from contextlib import asynccontextmanager, contextmanager
 from typing import Any
 
 
@@ -36,3 +36,46 @@ class RateLimiter(ABC):
             None: This context manager does not return any value.
         """
         raise NotImplementedError
+
+    @asynccontextmanager
+    async def acquire_async(self, token_count: int) -> AsyncGenerator[None]:
+        """
+        Acquire Rate Limiter from async code.
+
+        Defaults to the synchronous `acquire`. Rate limiters that wait for
+        capacity should override this to wait without blocking the event loop.
+
+        Args
+        ----
+            token_count: int
+                The estimated number of prompt and response tokens for the current request.
+
+        Yields
+        ------
+            None: This context manager does not return any value.
+        """
+        with self.acquire(token_count):
+            yield
+
+    def record_response(  # noqa: B027
+        self,
+        *,
+        latency: float,
+        headers: dict[str, str] | None = None,
+        throttled: bool = False,
+    ) -> None:
+        """
+        Report the outcome of a request made under this rate limiter.
+
+        Called after every request so that rate limiters can adapt to the
+        provider. Does nothing by default.
+
+        Args
+        ----
+            latency: float
+                The duration of the request in seconds.
+            headers: dict[str, str] | None
+                The lower-cased provider response headers, if any.
+            throttled: bool
+                Whether the provider rejected the request for exceeding its rate limits.
+        """
@@ -0,0 +1,178 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Sliding Window Rate Limiter shared across processes."""
+
+import asyncio
+import sqlite3
+import tempfile
+import time
+from collections.abc import AsyncGenerator, Generator
+from contextlib import asynccontextmanager, closing, contextmanager
+from pathlib import Path
+from typing import Any
+
+from graphrag_llm.rate_limit.rate_limiter import RateLimiter
+
+_DEFAULT_DATABASE = "graphrag_rate_limits.sqlite"
+_MIN_WAIT = 0.01
+
+
+class SharedSlidingWindowRateLimiter(RateLimiter):
+    """Sliding Window Rate Limiter implementation shared across processes.
+
+    The request and token windows are kept in a SQLite database instead of
+    process memory, so every process on the host that uses the same database
+    and quota key draws from one requests-per-period and tokens-per-period
+    quota. Each acquisition runs in an exclusive transaction.
+    """
+
+    _rpp: int | None = None
+    _tpp: int | None = None
+    _period_in_seconds: int
+    _stagger: float = 0.0
+    _database_path: Path
+    _quota_key: str
+
+    def __init__(
+        self,
+        *,
+        period_in_seconds: int | None = None,
+        requests_per_period: int | None = None,
+        tokens_per_period: int | None = None,
+        database_path: str | None = None,
+        quota_key: str | None = None,
+        **kwargs: Any,
+    ):
+        """Initialize the Shared Sliding Window Rate Limiter.
+
+        Args
+        ----
+            period_in_seconds: int | None
+                The time period in seconds for rate limiting. Defaults to 60.
+            requests_per_period: int | None
+                The maximum number of requests allowed per time period. If None, request limiting is disabled.
+            tokens_per_period: int | None
+                The maximum number of tokens allowed per time period. If None, token limiting is disabled.
+            database_path: str | None
+                The SQLite database the windows are kept in. Defaults to a file in the system temp directory.
+            quota_key: str | None
+                The name of the quota to draw from, e.g. the deployment name. The completion and embedding factories default it to the model's deployment or model id; otherwise defaults to "default".
+        """
+        self._rpp = requests_per_period
+        self._tpp = tokens_per_period
+        self._period_in_seconds = period_in_seconds or 60
+        self._database_path = Path(
+            database_path or Path(tempfile.gettempdir()) / _DEFAULT_DATABASE
+        )
+        self._quota_key = quota_key or "default"
+
+        if self._rpp is not None and self._rpp > 0:
+            self._stagger = self._period_in_seconds / self._rpp
+
+        self._database_path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS rate_limit_window "
+                "(quota_key TEXT NOT NULL, timestamp REAL NOT NULL, tokens INTEGER NOT NULL)"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS rate_limit_window_key "
+                "ON rate_limit_window (quota_key, timestamp)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        # autocommit mode so that transactions are started explicitly
+        return sqlite3.connect(self._database_path, timeout=60, isolation_level=None)
+
+    def _try_acquire(self, token_count: int) -> float:
+        """Record the request if it fits the windows, otherwise return how long to wait."""
+        with closing(self._connect()) as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                wait = self._try_acquire_in_transaction(connection, token_count)
+            except Exception:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+            return wait
+
+    def _try_acquire_in_transaction(
+        self, connection: sqlite3.Connection, token_count: int
+    ) -> float:
+        current_time = time.time()
+        connection.execute(
+            "DELETE FROM rate_limit_window WHERE quota_key = ? AND timestamp < ?",
+            (self._quota_key, current_time - self._period_in_seconds),
+        )
+        requests, tokens, oldest, latest = connection.execute(
+            "SELECT COUNT(*), COALESCE(SUM(tokens), 0), MIN(timestamp), MAX(timestamp) "
+            "FROM rate_limit_window WHERE quota_key = ?",
+            (self._quota_key,),
+        ).fetchone()
+        until_oldest_expires = max(
+            (oldest or current_time) + self._period_in_seconds - current_time,
+            _MIN_WAIT,
+        )
+
+        if self._rpp is not None and self._rpp > 0 and requests >= self._rpp:
+            return until_oldest_expires
+
+        # as with the in-process sliding window, a request larger than the
+        # whole token limit is let through once the window is empty
+        if (
+            self._tpp is not None
+            and self._tpp > 0
+            and (
+                tokens >= self._tpp
+                or (token_count <= self._tpp and tokens + token_count > self._tpp)
+            )
+        ):
+            return until_oldest_expires
+
+        if self._stagger > 0 and latest is not None:
+            wait = self._stagger - (current_time - latest)
+            if wait > 0:
+                return wait
+
+        connection.execute(
+            "INSERT INTO rate_limit_window (quota_key, timestamp, tokens) VALUES (?, ?, ?)",
+            (self._quota_key, current_time, token_count),
+        )
+        return 0.0
+
+    @contextmanager
+    def acquire(self, token_count: int) -> Generator[None]:
+        """
+        Acquire Rate Limiter.
+
+        Args
+        ----
+            token_count: The estimated number of tokens for the current request.
+
+        Yields
+        ------
+            None: This context manager does not return any value.
+        """
+        while (wait := self._try_acquire(token_count)) > 0:
+            time.sleep(wait)
+        yield
+
+    @asynccontextmanager
+    async def acquire_async(self, token_count: int) -> AsyncGenerator[None]:
+        """
+        Acquire Rate Limiter without blocking the event loop while waiting.
+
+        Args
+        ----
+            token_count: The estimated number of tokens for the current request.
+
+        Yields
+        ------
+            None: This context manager does not return any value.
+        """
+        # poll, since other processes share the windows; the SQLite lock can
+        # block for up to the connection timeout, so keep it off the event loop
+        while (wait := await asyncio.to_thread(self._try_acquire, token_count)) > 0:  # noqa: ASYNC110
+            await asyncio.sleep(wait)
+        yield
@@ -0,0 +1,130 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Circuit breaker shared by concurrent requests."""
+
+import threading
+import time
+from collections import deque
+
+# how often requests check whether the half-open probe has finished
+_PROBE_POLL_INTERVAL = 0.5
+
+
+class CircuitBreaker:
+    """Pause all requests while the provider is failing.
+
+    The outcomes of the last `window` requests are tracked. When the share of
+    failures reaches `failure_threshold`, the circuit opens and requests wait
+    for `cooldown` seconds (or longer, if the provider asked for it) before
+    being sent. After that the circuit is half open: a single probe request is
+    let through while the others keep waiting. If the probe fails the circuit
+    opens again straight away, and if it succeeds the circuit closes.
+    """
+
+    _failure_threshold: float
+    _window: int
+    _cooldown: float
+    _outcomes: deque[bool]
+    _open_until: float = 0.0
+    _half_open: bool = False
+    _probe_started: float | None = None
+    _lock: threading.Lock
+
+    def __init__(
+        self,
+        failure_threshold: float,
+        cooldown: float = 30.0,
+        window: int = 20,
+    ) -> None:
+        """Initialize CircuitBreaker.
+
+        Args
+        ----
+            failure_threshold: float
+                The share of failed requests, between 0 and 1, that opens the circuit.
+            cooldown: float (default=30.0)
+                The number of seconds requests are paused once the circuit opens.
+            window: int (default=20)
+                The number of most recent requests the failure share is computed over.
+        """
+        self._failure_threshold = failure_threshold
+        self._cooldown = cooldown
+        self._window = window
+        self._outcomes = deque(maxlen=window)
+        self._open_until = 0.0
+        self._half_open = False
+        self._probe_started = None
+        self._lock = threading.Lock()
+
+    @property
+    def wait_time(self) -> float:
+        """The number of seconds until the cooldown ends."""
+        return max(self._open_until - time.monotonic(), 0.0)
+
+    def acquire(self) -> float:
+        """Ask to send a request.
+
+        While the circuit is half open, only the first caller is let through
+        as the probe. A probe that is never recorded, e.g. because it was
+        cancelled, is replaced by another one after `cooldown` seconds.
+
+        Returns
+        -------
+            float: 0 if the request may be sent now, otherwise the number of
+            seconds to wait before asking again.
+        """
+        now = time.monotonic()
+        with self._lock:
+            if now < self._open_until:
+                return self._open_until - now
+            if not self._half_open:
+                return 0.0
+            if (
+                self._probe_started is not None
+                and now - self._probe_started < self._cooldown
+            ):
+                return min(self._cooldown, _PROBE_POLL_INTERVAL)
+            self._probe_started = now
+            return 0.0
+
+    def release(self) -> None:
+        """Let another request probe the circuit.
+
+        Called when a request ends with an error that says nothing about
+        whether the provider has recovered.
+        """
+        with self._lock:
+            self._probe_started = None
+
+    def record_success(self) -> None:
+        """Record a successful request."""
+        with self._lock:
+            if time.monotonic() >= self._open_until:
+                self._half_open = False
+                self._probe_started = None
+            self._outcomes.append(True)
+
+    def record_failure(self, retry_after: float | None = None) -> None:
+        """Record a failed request, opening the circuit if needed.
+
+        Args
+        ----
+            retry_after: float | None
+                The number of seconds the provider asked callers to wait, if any.
+        """
+        now = time.monotonic()
+        with self._lock:
+            if now < self._open_until:
+                # sent before the circuit opened
+                return
+            self._outcomes.append(False)
+            failures = self._outcomes.count(False)
+            if self._half_open or (
+                len(self._outcomes) == self._window
+                and failures / self._window >= self._failure_threshold
+            ):
+                self._open_until = now + max(self._cooldown, retry_after or 0.0)
+                self._half_open = True
+                self._probe_started = None
+                self._outcomes.clear()
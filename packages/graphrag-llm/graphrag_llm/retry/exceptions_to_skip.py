@@ -20,3 +20,12 @@ _default_exceptions_to_skip = [
     "APIResponseValidationError",
     "BudgetExceededError",
 ]
+
+# skipped errors that still mean the provider is failing, so they count
+# towards opening the circuit breaker
+_provider_failure_exceptions = [
+    "APIConnectionError",
+    "APIError",
+    "ServiceUnavailableError",
+    "InternalServerError",
+]
@@ -9,21 +9,34 @@ import time
 from collections.abc import Awaitable, Callable
 from typing import TYPE_CHECKING, Any
 
-from graphrag_llm.retry.exceptions_to_skip import _default_exceptions_to_skip
+from graphrag_llm.retry.circuit_breaker import CircuitBreaker
+from graphrag_llm.retry.exceptions_to_skip import (
+    _default_exceptions_to_skip,
+    _provider_failure_exceptions,
+)
 from graphrag_llm.retry.retry import Retry
+from graphrag_llm.retry.retry_budget import RetryBudget
+from graphrag_llm.utils.response_headers import get_response_headers, get_retry_after
 
 if TYPE_CHECKING:
     from graphrag_llm.types import Metrics
 
 
 class ExponentialRetry(Retry):
-    """Exponential backoff retry implementation."""
+    """Exponential backoff retry implementation.
+
+    A `Retry-After` hint from the provider replaces the computed backoff.
+    Optionally, retries are drawn from a retry budget shared by all requests,
+    and a circuit breaker pauses all requests while most of them fail.
+    """
 
     _base_delay: float
     _jitter: bool
     _max_retries: int
     _max_delay: float
     _exceptions_to_skip: list[str]
+    _retry_budget: RetryBudget | None
+    _circuit_breaker: CircuitBreaker | None
 
     def __init__(
         self,
@@ -33,6 +46,9 @@ class ExponentialRetry(Retry):
         jitter: bool = True,
         max_delay: float | None = None,
         exceptions_to_skip: list[str] | None = None,
+        retry_budget: float | None = None,
+        circuit_breaker_threshold: float | None = None,
+        circuit_breaker_cooldown: float | None = None,
         **kwargs: dict,
     ) -> None:
         """Initialize ExponentialRetry.
@@ -47,6 +63,15 @@ class ExponentialRetry(Retry):
                 Whether to apply jitter to the delay intervals.
             max_delay: float | None
                 The maximum delay between retries. If None, there is no limit.
+                Does not apply to delays requested by the provider.
+            retry_budget: float | None
+                The number of retries allowed per request, shared by all requests.
+                If None, every request may use all of its retries.
+            circuit_breaker_threshold: float | None
+                The share of failed requests that pauses all requests.
+                If None, requests are never paused.
+            circuit_breaker_cooldown: float | None
+                The number of seconds requests are paused for. Defaults to 30.
 
         Raises
         ------
@@ -59,27 +84,71 @@ class ExponentialRetry(Retry):
         self._max_retries = max_retries
         self._max_delay = max_delay or float("inf")
         self._exceptions_to_skip = exceptions_to_skip or _default_exceptions_to_skip
+        self._retry_budget = (
+            RetryBudget(retry_budget) if retry_budget is not None else None
+        )
+        self._circuit_breaker = (
+            CircuitBreaker(
+                circuit_breaker_threshold, cooldown=circuit_breaker_cooldown or 30.0
+            )
+            if circuit_breaker_threshold is not None
+            else None
+        )
+
+    def _wait_time(self) -> float:
+        """Get how long the circuit breaker pauses this request for."""
+        return self._circuit_breaker.acquire() if self._circuit_breaker else 0.0
+
+    def _record_success(self) -> None:
+        if self._circuit_breaker is not None:
+            self._circuit_breaker.record_success()
+
+    def _backoff(self, error: Exception, retries: int, delay: float) -> float | None:
+        """Get the delay before the next retry, or None to stop retrying."""
+        retry_after = get_retry_after(get_response_headers(error))
+        if error.__class__.__name__ in self._exceptions_to_skip:
+            # not retried, but server errors still show the provider is failing
+            if self._circuit_breaker is not None:
+                if _is_provider_failure(error):
+                    self._circuit_breaker.record_failure(retry_after)
+                else:
+                    self._circuit_breaker.release()
+            return None
+
+        if self._circuit_breaker is not None:
+            self._circuit_breaker.record_failure(retry_after)
+
+        if retries >= self._max_retries:
+            return None
+        if self._retry_budget is not None and not self._retry_budget.try_withdraw():
+            return None
+        if retry_after is not None:
+            return retry_after
+        return min(
+            self._max_delay,
+            delay + (self._jitter * random.uniform(0, 1)),  # noqa: S311
+        )
 
     def retry(self, *, func: Callable[..., Any], input_args: dict[str, Any]) -> Any:
         """Retry a synchronous function."""
         retries: int = 0
         delay = 1.0
         metrics: Metrics | None = input_args.get("metrics")
+        if self._retry_budget is not None:
+            self._retry_budget.record_request()
         while True:
+            while (wait_time := self._wait_time()) > 0:
+                time.sleep(wait_time)
             try:
-                return func(**input_args)
+                response = func(**input_args)
+                self._record_success()
+                return response  # noqa: TRY300
             except Exception as e:
-                if e.__class__.__name__ in self._exceptions_to_skip:
-                    raise
-
-                if retries >= self._max_retries:
+                sleep_delay = self._backoff(e, retries, delay * self._base_delay)
+                if sleep_delay is None:
                     raise
                 retries += 1
                 delay *= self._base_delay
-                sleep_delay = min(
-                    self._max_delay,
-                    delay + (self._jitter * random.uniform(0, 1)),  # noqa: S311
-                )
 
                 time.sleep(sleep_delay)
             finally:
@@ -97,23 +166,32 @@ class ExponentialRetry(Retry):
         retries: int = 0
         delay = 1.0
         metrics: Metrics | None = input_args.get("metrics")
+        if self._retry_budget is not None:
+            self._retry_budget.record_request()
         while True:
+            while (wait_time := self._wait_time()) > 0:  # noqa: ASYNC110
+                await asyncio.sleep(wait_time)
             try:
-                return await func(**input_args)
+                response = await func(**input_args)
+                self._record_success()
+                return response  # noqa: TRY300
             except Exception as e:
-                if e.__class__.__name__ in self._exceptions_to_skip:
-                    raise
-                if retries >= self._max_retries:
+                sleep_delay = self._backoff(e, retries, delay * self._base_delay)
+                if sleep_delay is None:
                     raise
                 retries += 1
                 delay *= self._base_delay
-                sleep_delay = min(
-                    self._max_delay,
-                    delay + (self._jitter * random.uniform(0, 1)),  # noqa: S311
-                )
 
                 await asyncio.sleep(sleep_delay)
             finally:
                 if metrics is not None:
                     metrics["retries"] = retries
                     metrics["requests_with_retries"] = 1 if retries > 0 else 0
+
+
+def _is_provider_failure(error: Exception) -> bool:
+    """Check whether an error is caused by the provider rather than the request."""
+    status_code = getattr(error, "status_code", None)
+    if isinstance(status_code, int):
+        return status_code >= 500
+    return error.__class__.__name__ in _provider_failure_exceptions
@@ -0,0 +1,50 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Retry budget shared by concurrent requests."""
+
+import threading
+
+
+class RetryBudget:
+    """Token bucket that caps retries to a fraction of requests.
+
+    Every request deposits `ratio` tokens and every retry withdraws one, so
+    that in steady state at most `ratio` retries are sent per request, plus a
+    burst of up to `reserve` retries. When the provider fails every request,
+    the number of retries stays bounded instead of multiplying the load.
+    """
+
+    _ratio: float
+    _reserve: float
+    _tokens: float
+    _lock: threading.Lock
+
+    def __init__(self, ratio: float, reserve: int = 10) -> None:
+        """Initialize RetryBudget.
+
+        Args
+        ----
+            ratio: float
+                The number of retries allowed per request.
+            reserve: int (default=10)
+                The number of retries available before any request was made,
+                and the most that can be saved up.
+        """
+        self._ratio = ratio
+        self._reserve = float(reserve)
+        self._tokens = float(reserve)
+        self._lock = threading.Lock()
+
+    def record_request(self) -> None:
+        """Deposit the retry allowance of a new request."""
+        with self._lock:
+            self._tokens = min(self._tokens + self._ratio, self._reserve)
+
+    def try_withdraw(self) -> bool:
+        """Take a retry from the budget, returning False if it is spent."""
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
@@ -47,6 +47,7 @@ def register_retry(
 
 def create_retry(
     retry_config: "RetryConfig",
+    model_id: str | None = None,
 ) -> Retry:
     """Create a Retry instance.
 
@@ -54,6 +55,10 @@ def create_retry(
     ----
         retry_config: RetryConfig
             The configuration for the retry strategy.
+        model_id: str | None (default: None)
+            The model the retries are for. Exponential backoff retriers are
+            shared by models with the same id and settings, so each model gets
+            its own retry budget and circuit breaker.
 
     Returns
     -------
@@ -68,9 +73,12 @@ def create_retry(
             case RetryType.ExponentialBackoff:
                 from graphrag_llm.retry.exponential_retry import ExponentialRetry
 
+                # shared by all instances of a model with the same settings so
+                # that the retry budget and circuit breaker apply process-wide
                 retry_factory.register(
                     strategy=RetryType.ExponentialBackoff,
                     initializer=ExponentialRetry,
+                    scope="singleton",
                 )
             case RetryType.Immediate:
                 from graphrag_llm.retry.immediate_retry import ImmediateRetry
@@ -83,4 +91,7 @@ def create_retry(
                 msg = f"RetryConfig.type '{strategy}' is not registered in the RetryFactory. Registered strategies: {', '.join(retry_factory.keys())}"
                 raise ValueError(msg)
 
+    if strategy == RetryType.ExponentialBackoff:
+        init_args["model_id"] = model_id
+
     return retry_factory.create(strategy=strategy, init_args=init_args)
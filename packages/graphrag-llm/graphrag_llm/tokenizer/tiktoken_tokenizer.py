@@ -40,6 +40,20 @@ class TiktokenTokenizer(Tokenizer):
         """
         return self._encoding.encode(text)
 
+    def encode_batch(self, texts: list[str]) -> list[list[int]]:
+        """Encode several texts into lists of tokens on tiktoken's thread pool.
+
+        Args
+        ----
+            texts: list[str]
+                The input texts to encode.
+
+        Returns
+        -------
+            list[list[int]]: The tokens of each text, in input order.
+        """
+        return self._encoding.encode_batch(texts)
+
     def decode(self, tokens: list[int]) -> str:
         """Decode a list of tokens back into a string.
 
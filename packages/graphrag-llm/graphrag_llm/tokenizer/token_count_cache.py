@@ -0,0 +1,59 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Bounded cache of token counts keyed by content hash."""
+
+import hashlib
+import threading
+from collections import OrderedDict
+
+
+class TokenCountCache:
+    """Least-recently-used cache of token counts.
+
+    Texts are keyed by a hash of their content rather than held on to, so the
+    cache stays small even when it counts long descriptions and reports.
+    """
+
+    _max_size: int
+    _counts: OrderedDict[bytes, int]
+    _lock: threading.Lock
+
+    def __init__(self, max_size: int = 65536) -> None:
+        """Initialize TokenCountCache.
+
+        Args
+        ----
+            max_size: int (default=65536)
+                The maximum number of token counts to keep.
+        """
+        self._max_size = max_size
+        self._counts = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of cached token counts."""
+        return len(self._counts)
+
+    @staticmethod
+    def key(text: str) -> bytes:
+        """Get the cache key of a text."""
+        return hashlib.blake2b(
+            text.encode("utf-8", errors="surrogatepass"), digest_size=16
+        ).digest()
+
+    def get(self, key: bytes) -> int | None:
+        """Get a cached token count."""
+        with self._lock:
+            count = self._counts.get(key)
+            if count is not None:
+                self._counts.move_to_end(key)
+            return count
+
+    def set(self, key: bytes, count: int) -> None:
+        """Cache a token count, evicting the least recently used one if full."""
+        with self._lock:
+            self._counts[key] = count
+            self._counts.move_to_end(key)
+            if len(self._counts) > self._max_size:
+                self._counts.popitem(last=False)
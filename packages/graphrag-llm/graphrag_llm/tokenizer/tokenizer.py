@@ -6,12 +6,18 @@
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Any
 
+from graphrag_llm.tokenizer.token_count_cache import TokenCountCache
+
 if TYPE_CHECKING:
     from graphrag_llm.types import LLMCompletionMessagesParam
 
 
 class Tokenizer(ABC):
-    """Tokenizer Abstract Base Class."""
+    """Tokenizer Abstract Base Class.
+
+    Token counts are cached per tokenizer by a hash of the text, so counting
+    the same description or report again does not encode it again.
+    """
 
     @abstractmethod
     def __init__(self, **kwargs: Any) -> None:
@@ -32,6 +38,22 @@ class Tokenizer(ABC):
         """
         raise NotImplementedError
 
+    def encode_batch(self, texts: list[str]) -> list[list[int]]:
+        """Encode several texts into lists of tokens.
+
+        Tokenizers with a native batch encoder should override this.
+
+        Args
+        ----
+            texts: list[str]
+                The input texts to encode.
+
+        Returns
+        -------
+            list[list[int]]: The tokens of each text, in input order.
+        """
+        return [self.encode(text) for text in texts]
+
     @abstractmethod
     def decode(self, tokens: list[int]) -> str:
         """Decode a list of tokens back into a string.
@@ -96,16 +118,75 @@ class Tokenizer(ABC):
                     total_tokens += self.num_tokens(str(value)) + tokens_per_name
         return total_tokens
 
-    def num_tokens(self, text: str) -> int:
+    def num_tokens(self, text: str, cache: bool = True) -> int:
         """Return the number of tokens in the given text.
 
         Args
         ----
             text: str
                 The input text to analyze.
+            cache: bool (default=True)
+                Whether to look up and keep the count in the token count cache.
+                Pass False for one-off texts that would only evict useful counts.
 
         Returns
         -------
             int: The number of tokens in the input text.
         """
-        return len(self.encode(text))
+        if not cache:
+            return len(self.encode(text))
+        token_counts = self._token_count_cache
+        key = token_counts.key(text)
+        count = token_counts.get(key)
+        if count is None:
+            count = len(self.encode(text))
+            token_counts.set(key, count)
+        return count
+
+    def num_tokens_batch(self, texts: list[str], cache: bool = True) -> list[int]:
+        """Return the number of tokens in each of the given texts.
+
+        Texts that were not counted before are encoded in a single batch.
+
+        Args
+        ----
+            texts: list[str]
+                The input texts to analyze.
+            cache: bool (default=True)
+                Whether to look up and keep the counts in the token count cache.
+                Pass False for one-off texts that would only evict useful counts.
+
+        Returns
+        -------
+            list[int]: The number of tokens in each text, in input order.
+        """
+        if not cache:
+            return [len(tokens) for tokens in self.encode_batch(texts)]
+        token_counts = self._token_count_cache
+        keys = [token_counts.key(text) for text in texts]
+        counts = [token_counts.get(key) for key in keys]
+        missing: dict[bytes, str] = {
+            key: text
+            for key, text, count in zip(keys, texts, counts, strict=True)
+            if count is None
+        }
+        if missing:
+            encoded = self.encode_batch(list(missing.values()))
+            new_counts = {
+                key: len(tokens) for key, tokens in zip(missing, encoded, strict=True)
+            }
+            for key, count in new_counts.items():
+                token_counts.set(key, count)
+            counts = [
+                new_counts[key] if count is None else count
+                for key, count in zip(keys, counts, strict=True)
+            ]
+        return counts  # type: ignore
+
+    @property
+    def _token_count_cache(self) -> TokenCountCache:
+        # created lazily since subclasses do not call the base initializer
+        cache = self.__dict__.get("_token_counts")
+        if cache is None:
+            cache = self.__dict__.setdefault("_token_counts", TokenCountCache())
+        return cache
@@ -40,7 +40,7 @@ from openai.types.completion_usage import (
 )
 from openai.types.create_embedding_response import CreateEmbeddingResponse, Usage
 from openai.types.embedding import Embedding
-from pydantic import BaseModel, computed_field
+from pydantic import BaseModel, PrivateAttr, computed_field
 from typing_extensions import TypedDict
 
 LLMCompletionMessagesParam = str | Sequence[ChatCompletionMessageParam | dict[str, Any]]
@@ -97,6 +97,17 @@ class LLMCompletionResponse(ChatCompletion, Generic[ResponseFormat]):
     service_tier: str | None = None  # type: ignore
     """Loosen the type to str | None to allow for more flexibility in service tier representation."""
 
+    _response_headers: dict[str, str] = PrivateAttr(default_factory=dict)
+
+    @property
+    def response_headers(self) -> dict[str, str]:
+        """The provider response headers, if the response came from a provider."""
+        return self._response_headers
+
+    @response_headers.setter
+    def response_headers(self, headers: dict[str, str]) -> None:
+        self._response_headers = headers
+
     @computed_field
     @property
     def content(self) -> str:
@@ -188,6 +199,17 @@ class LLMEmbeddingResponse(CreateEmbeddingResponse):
     Adds utilities for accessing embeddings.
     """
 
+    _response_headers: dict[str, str] = PrivateAttr(default_factory=dict)
+
+    @property
+    def response_headers(self) -> dict[str, str]:
+        """The provider response headers, if the response came from a provider."""
+        return self._response_headers
+
+    @response_headers.setter
+    def response_headers(self, headers: dict[str, str]) -> None:
+        self._response_headers = headers
+
     @computed_field
     @property
     def embeddings(self) -> list[list[float]]:
@@ -21,6 +21,11 @@ from graphrag_llm.utils.gather_completion_response import (
     gather_completion_response,
     gather_completion_response_async,
 )
+from graphrag_llm.utils.response_headers import (
+    get_response_headers,
+    get_retry_after,
+    is_throttling_error,
+)
 from graphrag_llm.utils.structure_response import (
     structure_completion_response,
 )
@@ -36,5 +41,8 @@ __all__ = [
     "create_embedding_response",
     "gather_completion_response",
     "gather_completion_response_async",
+    "get_response_headers",
+    "get_retry_after",
+    "is_throttling_error",
     "structure_completion_response",
 ]
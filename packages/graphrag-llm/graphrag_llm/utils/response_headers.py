@@ -0,0 +1,88 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Read throttling hints from provider response headers."""
+
+import re
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any
+
+_PROVIDER_PREFIX = "llm_provider-"
+_DURATION_PATTERN = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+_DURATION_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+def get_response_headers(source: Any) -> dict[str, str]:
+    """Get the lower-cased provider headers of a response or an error.
+
+    Works with graphrag-llm responses, raw LiteLLM responses and the
+    provider errors raised by LiteLLM or OpenAI clients.
+    """
+    headers = getattr(source, "response_headers", None)
+    if not headers:
+        hidden_params = getattr(source, "_hidden_params", None) or {}
+        headers = hidden_params.get("additional_headers")
+    if not headers:
+        try:
+            headers = getattr(getattr(source, "response", None), "headers", None)
+        except Exception:  # noqa: BLE001
+            headers = None
+    if not headers:
+        return {}
+    normalized: dict[str, str] = {}
+    for key, value in dict(headers).items():
+        name = str(key).lower()
+        name = name.removeprefix(_PROVIDER_PREFIX)
+        normalized.setdefault(name, str(value))
+    return normalized
+
+
+def is_throttling_error(error: BaseException) -> bool:
+    """Whether the error is the provider asking the caller to slow down."""
+    return (
+        getattr(error, "status_code", None) == 429
+        or type(error).__name__ == "RateLimitError"
+    )
+
+
+def parse_duration(value: str) -> float | None:
+    """Parse a header duration such as "20", "1.5s", "20ms" or "6m0s" to seconds."""
+    value = value.strip().lower()
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    parts = _DURATION_PATTERN.findall(value)
+    if not parts or "".join(number + unit for number, unit in parts) != value:
+        return None
+    return sum(float(number) * _DURATION_UNITS[unit] for number, unit in parts)
+
+
+def get_retry_after(headers: dict[str, str]) -> float | None:
+    """Get the number of seconds the provider asked the caller to wait.
+
+    Honors `retry-after-ms`, `retry-after` (seconds or an HTTP date) and,
+    when a remaining-quota header reports zero, the matching reset header.
+    """
+    if "retry-after-ms" in headers:
+        delay = parse_duration(headers["retry-after-ms"])
+        if delay is not None:
+            return delay / 1000
+    if "retry-after" in headers:
+        delay = parse_duration(headers["retry-after"])
+        if delay is not None:
+            return delay
+        try:
+            retry_at = parsedate_to_datetime(headers["retry-after"])
+        except (TypeError, ValueError):
+            retry_at = None
+        if retry_at is not None:
+            return max(retry_at.timestamp() - time.time(), 0.0)
+    delays = [
+        parse_duration(headers.get(f"x-ratelimit-reset-{quota}", ""))
+        for quota in ("requests", "tokens")
+        if headers.get(f"x-ratelimit-remaining-{quota}", "").strip() == "0"
+    ]
+    delays = [delay for delay in delays if delay is not None]
+    return max(delays) if delays else None
@@ -3,6 +3,7 @@
 
 """Azure Blob Storage implementation of Storage."""
 
+import asyncio
 import logging
 import re
 from collections.abc import Iterator
@@ -215,6 +216,38 @@ class AzureBlobStorage(Storage):
     async def clear(self) -> None:
         """Clear the cache."""
 
+    async def copy_to(self, other: Storage, keys: list[str]) -> None:
+        """Copy the given keys to another storage instance.
+
+        Copies between blob storages in the same account are performed
+        server-side, so the data never passes through this process.
+        """
+        if (
+            not isinstance(other, AzureBlobStorage)
+            or other._blob_service_client.url != self._blob_service_client.url  # noqa: SLF001
+        ):
+            await super().copy_to(other, keys)
+            return
+        source_container = self._blob_service_client.get_container_client(
+            self._container_name
+        )
+        target_container = other._blob_service_client.get_container_client(  # noqa: SLF001
+            other._container_name  # noqa: SLF001
+        )
+        for key in keys:
+            source_blob = source_container.get_blob_client(self._keyname(key))
+            if not source_blob.exists():
+                continue
+            target_blob = target_container.get_blob_client(other._keyname(key))  # noqa: SLF001
+            copy = target_blob.start_copy_from_url(source_blob.url)
+            status = copy.get("copy_status")
+            while status == "pending":
+                await asyncio.sleep(0.5)
+                status = target_blob.get_blob_properties().copy.status
+            if status != "success":
+                msg = f"Server-side copy of {key} failed with status {status}"
+                raise RuntimeError(msg)
+
     def child(self, name: str | None) -> "Storage":
         """Create a child storage instance."""
         if name is None:
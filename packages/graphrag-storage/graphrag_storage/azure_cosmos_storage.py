@@ -263,6 +263,17 @@ class AzureCosmosStorage(Storage):
                         item=item["id"], partition_key=item["id"]
                     )
 
+    async def copy_to(self, other: Storage, keys: list[str]) -> None:
+        """Copy the given keys to another storage instance.
+
+        Item bodies are copied as JSON strings so the target re-parses them
+        into structured bodies rather than storing opaque bytes.
+        """
+        for key in keys:
+            value = await self.get(key)
+            if value is not None:
+                await other.set(key, value)
+
     def child(self, name: str | None) -> "AzureCosmosStorage":
         """Create a child storage with an extended namespace prefix.
 
@@ -3,6 +3,7 @@
 
 """File-based Storage implementation of Storage."""
 
+import asyncio
 import logging
 import os
 import re
@@ -124,6 +125,25 @@ class FileStorage(Storage):
             else:
                 file.unlink()
 
+    async def copy_to(self, other: Storage, keys: list[str]) -> None:
+        """Copy the given keys to another storage instance.
+
+        When the target is also file-based, files are copied on disk with
+        shutil.copyfile, which uses the kernel's zero-copy path where available.
+        Hardlinks are not used since set() rewrites files in place.
+        """
+        if type(other) is not FileStorage or type(self) is not FileStorage:
+            await super().copy_to(other, keys)
+            return
+        target = cast("FileStorage", other)
+        for key in keys:
+            source_path = _join_path(self._base_dir, key)
+            if not await exists(source_path):
+                continue
+            target_path = _join_path(target._base_dir, key)  # noqa: SLF001
+            target_path.parent.mkdir(parents=True, exist_ok=True)
+            await asyncio.to_thread(shutil.copyfile, source_path, target_path)
+
     def child(self, name: str | None) -> "Storage":
         """Create a child storage instance."""
         if name is None:
@@ -76,6 +76,22 @@ class MemoryStorage(FileStorage):
         """Clear the storage."""
         self._storage.clear()
 
+    async def copy_to(self, other: "Storage", keys: list[str]) -> None:
+        """Copy the given keys to another storage instance.
+
+        Args:
+            - other - The storage to copy the keys to.
+            - keys - The keys to copy.
+        """
+        if isinstance(other, MemoryStorage):
+            for key in keys:
+                if key in self._storage:
+                    other._storage[key] = self._storage[key]  # noqa: SLF001
+            return
+        for key in keys:
+            if key in self._storage:
+                await other.set(key, self._storage[key])
+
     def child(self, name: str | None) -> "Storage":
         """Create a child storage instance."""
         return MemoryStorage()
@@ -118,6 +118,25 @@ class Storage(ABC):
     def keys(self) -> list[str]:
         """List all keys in the storage."""
 
+    async def copy_to(self, other: "Storage", keys: list[str]) -> None:
+        """Copy the given keys to another storage instance.
+
+        The default implementation copies the raw bytes of each key through
+        this process. Implementations should override it with a native copy
+        when both storages share a backend.
+
+        Args
+        ----
+            - other: Storage
+                The storage to copy the keys to.
+            - keys: list[str]
+                The keys to copy.
+        """
+        for key in keys:
+            value = await self.get(key, as_bytes=True)
+            if value is not None:
+                await other.set(key, value)
+
     @abstractmethod
     async def get_creation_date(self, key: str) -> str:
         """Get the creation date for the given key.
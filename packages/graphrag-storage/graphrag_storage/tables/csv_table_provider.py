@@ -102,6 +102,30 @@ class CSVTableProvider(TableProvider):
         """
         return await self._storage.has(f"{table_name}.csv")
 
+    async def copy_to(
+        self, other: TableProvider, table_names: list[str] | None = None
+    ) -> None:
+        """Copy tables to another table provider.
+
+        When the target is also a CSVTableProvider, the CSV files are copied
+        through the storage layer without being parsed.
+
+        Args
+        ----
+            other: TableProvider
+                The table provider to copy the tables to.
+            table_names: list[str] | None
+                The tables to copy. Defaults to all tables in this provider.
+        """
+        if not isinstance(other, CSVTableProvider):
+            await super().copy_to(other, table_names)
+            return
+        names = table_names if table_names is not None else self.list()
+        await self._storage.copy_to(
+            other._storage,  # noqa: SLF001
+            [f"{table_name}.csv" for table_name in names],
+        )
+
     def list(self) -> list[str]:
         """List all table names in storage.
 
@@ -10,6 +10,8 @@ from io import BytesIO
 from typing import TYPE_CHECKING, Any, cast
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 
 from graphrag_storage.tables.table import RowTransformer, Table
 
@@ -72,6 +74,7 @@ class ParquetTable(Table):
         self._truncate = truncate
         self._df: pd.DataFrame | None = None
         self._write_rows: list[dict[str, Any]] = []
+        self._write_batches: list[pa.Table] = []
 
     def __aiter__(self) -> AsyncIterator[Any]:
         """Iterate through rows one at a time.
@@ -131,20 +134,51 @@ class ParquetTable(Table):
         """
         self._write_rows.append(row)
 
+    async def write_batch(self, batch: pa.Table | pa.RecordBatch) -> None:
+        """Accumulate a batch of rows for later write, keeping it in Arrow form.
+
+        Rows accumulated by write() so far are converted into a batch first,
+        so rows reach the file in the order they were written.
+
+        Args
+        ----
+            batch: Arrow table or record batch of rows to write.
+        """
+        if isinstance(batch, pa.RecordBatch):
+            batch = pa.Table.from_batches([batch])
+        self._flush_rows()
+        self._write_batches.append(batch)
+
+    def _flush_rows(self) -> None:
+        """Convert the accumulated rows into a batch after the earlier ones."""
+        if self._write_rows:
+            self._write_batches.append(
+                pa.Table.from_pandas(
+                    pd.DataFrame(self._write_rows), preserve_index=False
+                )
+            )
+            self._write_rows = []
+
     async def close(self) -> None:
         """Flush accumulated rows to Parquet file and release resources.
 
-        Converts all accumulated rows to a DataFrame and writes
-        to storage as a Parquet file. If truncate=False and file exists,
-        appends to existing data.
+        Concatenates the accumulated batches in Arrow, in the order they
+        were written, and writes them to storage as a Parquet file. If
+        truncate=False and file exists, appends to existing data. The file
+        is written the same way whether rows came from write() or
+        write_batch().
         """
-        if self._write_rows:
-            new_df = pd.DataFrame(self._write_rows)
+        self._flush_rows()
+        if self._write_batches:
+            tables = self._write_batches
             if not self._truncate and await self._storage.has(self._file_key):
                 existing_data = await self._storage.get(self._file_key, as_bytes=True)
-                existing_df = pd.read_parquet(BytesIO(existing_data))
-                new_df = pd.concat([existing_df, new_df], ignore_index=True)
-            await self._storage.set(self._file_key, new_df.to_parquet())
-            self._write_rows = []
+                tables.insert(0, pq.read_table(BytesIO(existing_data)))
+            table = pa.concat_tables(tables, promote_options="permissive")
+            buffer = BytesIO()
+            # the pandas metadata of the first batch would not describe the rest
+            pq.write_table(table.replace_schema_metadata(None), buffer)
+            await self._storage.set(self._file_key, buffer.getvalue())
+            self._write_batches = []
 
         self._df = None
@@ -96,6 +96,30 @@ class ParquetTableProvider(TableProvider):
         """
         return await self._storage.has(f"{table_name}.parquet")
 
+    async def copy_to(
+        self, other: TableProvider, table_names: list[str] | None = None
+    ) -> None:
+        """Copy tables to another table provider.
+
+        When the target is also a ParquetTableProvider, the Parquet files are
+        copied through the storage layer without being decoded.
+
+        Args
+        ----
+            other: TableProvider
+                The table provider to copy the tables to.
+            table_names: list[str] | None
+                The tables to copy. Defaults to all tables in this provider.
+        """
+        if not isinstance(other, ParquetTableProvider):
+            await super().copy_to(other, table_names)
+            return
+        names = table_names if table_names is not None else self.list()
+        await self._storage.copy_to(
+            other._storage,  # noqa: SLF001
+            [f"{table_name}.parquet" for table_name in names],
+        )
+
     def list(self) -> list[str]:
         """List all table names in storage.
 
@@ -6,10 +6,13 @@
 from abc import ABC, abstractmethod
 from collections.abc import AsyncIterator, Callable
 from types import TracebackType
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from typing_extensions import Self
 
+if TYPE_CHECKING:
+    import pyarrow as pa
+
 RowTransformer = Callable[[dict[str, Any]], Any]
 
 
@@ -90,6 +93,20 @@ class Table(ABC):
             row: Dictionary representing a single row to write.
         """
 
+    async def write_batch(self, batch: "pa.Table | pa.RecordBatch") -> None:
+        """Write a batch of rows to the table.
+
+        The default implementation writes each row individually. Providers
+        backed by a columnar format should override this to keep the batch
+        in Arrow form.
+
+        Args
+        ----
+            batch: Arrow table or record batch of rows to write.
+        """
+        for row in batch.to_pylist():
+            await self.write(row)
+
     @abstractmethod
     async def close(self) -> None:
         """Flush buffered writes and release resources.
@@ -66,6 +66,26 @@ class TableProvider(ABC):
                 True if the table exists, False otherwise.
         """
 
+    async def copy_to(
+        self, other: "TableProvider", table_names: list[str] | None = None
+    ) -> None:
+        """Copy tables to another table provider.
+
+        The default implementation round-trips each table through a DataFrame.
+        Providers that store tables as files should override this to copy the
+        underlying files without decoding them.
+
+        Args
+        ----
+            other: TableProvider
+                The table provider to copy the tables to.
+            table_names: list[str] | None
+                The tables to copy. Defaults to all tables in this provider.
+        """
+        for table_name in table_names if table_names is not None else self.list():
+            df = await self.read_dataframe(table_name)
+            await other.write_dataframe(table_name, df)
+
     @abstractmethod
     def list(self) -> list[str]:
         """List all table names in the provider.
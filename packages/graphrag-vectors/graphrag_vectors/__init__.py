@@ -14,7 +14,7 @@ from graphrag_vectors.filtering import (
 )
 from graphrag_vectors.index_schema import IndexSchema
 from graphrag_vectors.timestamp import explode_timestamp
-from graphrag_vectors.types import TextEmbedder
+from graphrag_vectors.types import AsyncTextEmbedder, TextEmbedder
 from graphrag_vectors.vector_store import (
     VectorStore,
     VectorStoreDocument,
@@ -31,6 +31,7 @@ from graphrag_vectors.vector_store_type import VectorStoreType
 
 __all__ = [
     "AndExpr",
+    "AsyncTextEmbedder",
     "Condition",
     "F",
     "FilterExpr",
@@ -15,7 +15,7 @@ from graphrag_vectors.timestamp import (
     _timestamp_fields_for,
     explode_timestamp,
 )
-from graphrag_vectors.types import TextEmbedder
+from graphrag_vectors.types import AsyncTextEmbedder, TextEmbedder
 
 # Signature for a function that explodes an ISO 8601 timestamp into
 # a dict of filterable component fields keyed by "{prefix}_{suffix}".
@@ -194,6 +194,27 @@ class VectorStore(ABC):
             )
         return []
 
+    async def similarity_search_by_text_async(
+        self,
+        text: str,
+        text_embedder: AsyncTextEmbedder,
+        k: int = 10,
+        select: list[str] | None = None,
+        filters: FilterExpr | None = None,
+        include_vectors: bool = True,
+    ) -> list[VectorStoreSearchResult]:
+        """Perform a text-based similarity search with an async text embedder."""
+        query_embedding = await text_embedder(text)
+        if query_embedding:
+            return self.similarity_search_by_vector(
+                query_embedding=query_embedding,
+                k=k,
+                select=select,
+                filters=filters,
+                include_vectors=include_vectors,
+            )
+        return []
+
     @abstractmethod
     def search_by_id(
         self,
@@ -7,16 +7,20 @@ WARNING: This API is under development and may undergo changes in future release
 Backwards compatibility is not guaranteed at this time.
 """
 
-from graphrag.api.index import build_index
+from graphrag.api.index import build_index, estimate_index
 from graphrag.api.prompt_tune import generate_indexing_prompts
 from graphrag.api.query import (
     basic_search,
+    basic_search_many,
     basic_search_streaming,
     drift_search,
+    drift_search_many,
     drift_search_streaming,
     global_search,
+    global_search_many,
     global_search_streaming,
     local_search,
+    local_search_many,
     local_search_streaming,
 )
 from graphrag.prompt_tune.types import DocSelectionType
@@ -24,15 +28,20 @@ from graphrag.prompt_tune.types import DocSelectionType
 __all__ = [  # noqa: RUF022
     # index API
     "build_index",
+    "estimate_index",
     # query API
     "global_search",
     "global_search_streaming",
+    "global_search_many",
     "local_search",
     "local_search_streaming",
+    "local_search_many",
     "drift_search",
     "drift_search_streaming",
+    "drift_search_many",
     "basic_search",
     "basic_search_streaming",
+    "basic_search_many",
     # prompt tuning API
     "DocSelectionType",
     "generate_indexing_prompts",
@@ -17,6 +17,8 @@ from graphrag.callbacks.noop_workflow_callbacks import NoopWorkflowCallbacks
 from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
 from graphrag.config.enums import IndexingMethod
 from graphrag.config.models.graph_rag_config import GraphRagConfig
+from graphrag.index import estimate
+from graphrag.index.estimate import IndexEstimate
 from graphrag.index.run.run_pipeline import run_pipeline
 from graphrag.index.run.utils import create_callback_chain
 from graphrag.index.typing.pipeline_run_result import PipelineRunResult
@@ -93,6 +95,29 @@ async def build_index(
     return outputs
 
 
+async def estimate_index(
+    config: GraphRagConfig,
+    method: IndexingMethod | str = IndexingMethod.Standard,
+) -> IndexEstimate:
+    """Estimate the LLM requests, tokens and duration of an indexing run.
+
+    Loads and chunks the input documents without calling any model.
+
+    Parameters
+    ----------
+    config : GraphRagConfig
+        The configuration.
+    method : IndexingMethod default=IndexingMethod.Standard
+        Styling of indexing to perform (full LLM, NLP + LLM, etc.).
+
+    Returns
+    -------
+    IndexEstimate
+        The estimated request volume of each workflow.
+    """
+    return await estimate.estimate_index(config, IndexingMethod(method))
+
+
 def _get_method(method: IndexingMethod | str, is_update_run: bool) -> str:
     m = method.value if isinstance(method, IndexingMethod) else method
     return f"{m}-update" if is_update_run else m
@@ -12,16 +12,20 @@ Contains the following functions:
  - global_search_streaming: Perform a global search and stream results back.
  - local_search: Perform a local search.
  - local_search_streaming: Perform a local search and stream results back.
+ - global_search_many, local_search_many, drift_search_many, basic_search_many:
+   Run many queries through a single search engine.
 
 WARNING: This API is under development and may undergo changes in future releases.
 Backwards compatibility is not guaranteed at this time.
 """
 
 import logging
-from collections.abc import AsyncGenerator
-from typing import Any
+import weakref
+from collections.abc import AsyncGenerator, Callable
+from typing import TYPE_CHECKING, Any, TypeVar
 
 import pandas as pd
+from graphrag_llm.embedding import create_embedding
 from pydantic import validate_call
 
 from graphrag.callbacks.noop_query_callbacks import NoopQueryCallbacks
@@ -31,9 +35,13 @@ from graphrag.config.embeddings import (
     entity_description_embedding,
     text_unit_text_embedding,
 )
+from graphrag.config.enums import RetrievalMode
 from graphrag.config.models.graph_rag_config import GraphRagConfig
 from graphrag.logger.standard_logging import init_loggers
 from graphrag.query.factory import (
+    build_entity_lexical_index,
+    build_entity_name_matcher,
+    build_text_unit_lexical_index,
     get_basic_search_engine,
     get_drift_search_engine,
     get_global_search_engine,
@@ -48,6 +56,18 @@ from graphrag.query.indexer_adapters import (
     read_indexer_reports,
     read_indexer_text_units,
 )
+from graphrag.query.input.retrieval.entity_name_matcher import EntityNameMatcher
+from graphrag.query.input.retrieval.lexical_index import LexicalIndex
+from graphrag.query.structured_search.basic_search.search import BasicSearch
+from graphrag.query.structured_search.batch_search import (
+    BatchSearchResult,
+    PrecomputedEmbedding,
+    embed_queries,
+    search_many,
+)
+from graphrag.query.structured_search.drift_search.search import DRIFTSearch
+from graphrag.query.structured_search.global_search.search import GlobalSearch
+from graphrag.query.structured_search.local_search.search import LocalSearch
 from graphrag.utils.api import (
     get_embedding_store,
     load_search_prompt,
@@ -55,9 +75,20 @@ from graphrag.utils.api import (
 )
 from graphrag.utils.cli import redact
 
+if TYPE_CHECKING:
+    from graphrag_llm.embedding import LLMEmbedding
+
 # Initialize standard logger
 logger = logging.getLogger(__name__)
 
+_IndexT = TypeVar("_IndexT")
+
+# retrieval indexes keyed by the identity of the DataFrame they were built from,
+# so the queries over one loaded dataset share them; each entry is dropped
+# when its DataFrame is garbage collected
+_lexical_indexes: dict[tuple[str, int], LexicalIndex] = {}
+_entity_name_matchers: dict[tuple[str, int], EntityNameMatcher] = {}
+
 
 @validate_call(config={"arbitrary_types_allowed": True})
 async def global_search(
@@ -157,31 +188,15 @@ def global_search_streaming(
     """
     init_loggers(config=config, verbose=verbose, filename="query.log")
 
-    communities_ = read_indexer_communities(communities, community_reports)
-    reports = read_indexer_reports(
-        community_reports,
-        communities,
+    logger.debug("Executing streaming global search query: %s", query)
+    search_engine = _get_global_search_engine(
+        config=config,
+        entities=entities,
+        communities=communities,
+        community_reports=community_reports,
         community_level=community_level,
         dynamic_community_selection=dynamic_community_selection,
-    )
-    entities_ = read_indexer_entities(
-        entities, communities, community_level=community_level
-    )
-    map_prompt = load_search_prompt(config.global_search.map_prompt)
-    reduce_prompt = load_search_prompt(config.global_search.reduce_prompt)
-    knowledge_prompt = load_search_prompt(config.global_search.knowledge_prompt)
-
-    logger.debug("Executing streaming global search query: %s", query)
-    search_engine = get_global_search_engine(
-        config,
-        reports=reports,
-        entities=entities_,
-        communities=communities_,
         response_type=response_type,
-        dynamic_community_selection=dynamic_community_selection,
-        map_system_prompt=map_prompt,
-        reduce_system_prompt=reduce_prompt,
-        general_knowledge_inclusion_prompt=knowledge_prompt,
         callbacks=callbacks,
     )
     return search_engine.stream_search(query=query)
@@ -290,29 +305,17 @@ def local_search_streaming(
     """
     init_loggers(config=config, verbose=verbose, filename="query.log")
 
-    msg = f"Vector Store Args: {redact(config.vector_store.model_dump())}"
-    logger.debug(msg)
-
-    description_embedding_store = get_embedding_store(
-        config=config.vector_store,
-        embedding_name=entity_description_embedding,
-    )
-
-    entities_ = read_indexer_entities(entities, communities, community_level)
-    covariates_ = read_indexer_covariates(covariates) if covariates is not None else []
-    prompt = load_search_prompt(config.local_search.prompt)
-
     logger.debug("Executing streaming local search query: %s", query)
-    search_engine = get_local_search_engine(
+    search_engine = _get_local_search_engine(
         config=config,
-        reports=read_indexer_reports(community_reports, communities, community_level),
-        text_units=read_indexer_text_units(text_units),
-        entities=entities_,
-        relationships=read_indexer_relationships(relationships),
-        covariates={"claims": covariates_},
-        description_embedding_store=description_embedding_store,
+        entities=entities,
+        communities=communities,
+        community_reports=community_reports,
+        text_units=text_units,
+        relationships=relationships,
+        covariates=covariates,
+        community_level=community_level,
         response_type=response_type,
-        system_prompt=prompt,
         callbacks=callbacks,
     )
     return search_engine.stream_search(query=query)
@@ -415,35 +418,15 @@ def drift_search_streaming(
     """
     init_loggers(config=config, verbose=verbose, filename="query.log")
 
-    msg = f"Vector Store Args: {redact(config.vector_store.model_dump())}"
-    logger.debug(msg)
-
-    description_embedding_store = get_embedding_store(
-        config=config.vector_store,
-        embedding_name=entity_description_embedding,
-    )
-
-    full_content_embedding_store = get_embedding_store(
-        config=config.vector_store,
-        embedding_name=community_full_content_embedding,
-    )
-
-    entities_ = read_indexer_entities(entities, communities, community_level)
-    reports = read_indexer_reports(community_reports, communities, community_level)
-    read_indexer_report_embeddings(reports, full_content_embedding_store)
-    prompt = load_search_prompt(config.drift_search.prompt)
-    reduce_prompt = load_search_prompt(config.drift_search.reduce_prompt)
-
     logger.debug("Executing streaming drift search query: %s", query)
-    search_engine = get_drift_search_engine(
+    search_engine = _get_drift_search_engine(
         config=config,
-        reports=reports,
-        text_units=read_indexer_text_units(text_units),
-        entities=entities_,
-        relationships=read_indexer_relationships(relationships),
-        description_embedding_store=description_embedding_store,
-        local_system_prompt=prompt,
-        reduce_system_prompt=reduce_prompt,
+        entities=entities,
+        communities=communities,
+        community_reports=community_reports,
+        text_units=text_units,
+        relationships=relationships,
+        community_level=community_level,
         response_type=response_type,
         callbacks=callbacks,
     )
@@ -524,6 +507,403 @@ def basic_search_streaming(
     """
     init_loggers(config=config, verbose=verbose, filename="query.log")
 
+    logger.debug("Executing streaming basic search query: %s", query)
+    search_engine = _get_basic_search_engine(
+        config=config,
+        text_units=text_units,
+        response_type=response_type,
+        callbacks=callbacks,
+    )
+    return search_engine.stream_search(query=query)
+
+
+@validate_call(config={"arbitrary_types_allowed": True})
+async def global_search_many(
+    config: GraphRagConfig,
+    entities: pd.DataFrame,
+    communities: pd.DataFrame,
+    community_reports: pd.DataFrame,
+    community_level: int | None,
+    dynamic_community_selection: bool,
+    response_type: str,
+    queries: list[str],
+    callbacks: list[QueryCallbacks] | None = None,
+    verbose: bool = False,
+) -> BatchSearchResult:
+    """Perform a global search for each of many queries with a single search engine.
+
+    The data is loaded once and at most `concurrent_requests` queries run at a time.
+
+    Parameters
+    ----------
+    - config (GraphRagConfig): A graphrag configuration (from settings.yaml)
+    - entities (pd.DataFrame): A DataFrame containing the final entities (from entities.parquet)
+    - communities (pd.DataFrame): A DataFrame containing the final communities (from communities.parquet)
+    - community_reports (pd.DataFrame): A DataFrame containing the final community reports (from community_reports.parquet)
+    - community_level (int): The community level to search at.
+    - dynamic_community_selection (bool): Enable dynamic community selection instead of using all community reports at a fixed level.
+    - response_type (str): The type of response to return.
+    - queries (list[str]): The user queries to search for.
+
+    Returns
+    -------
+    BatchSearchResult: One search result (or exception) per query, in query order, and the batch throughput.
+    """
+    init_loggers(config=config, verbose=verbose, filename="query.log")
+
+    logger.debug("Executing global search for %d queries", len(queries))
+    search_engine = _get_global_search_engine(
+        config=config,
+        entities=entities,
+        communities=communities,
+        community_reports=community_reports,
+        community_level=community_level,
+        dynamic_community_selection=dynamic_community_selection,
+        response_type=response_type,
+        callbacks=callbacks,
+    )
+    return await search_many(
+        search_engine, queries, concurrency=config.concurrent_requests
+    )
+
+
+@validate_call(config={"arbitrary_types_allowed": True})
+async def local_search_many(
+    config: GraphRagConfig,
+    entities: pd.DataFrame,
+    communities: pd.DataFrame,
+    community_reports: pd.DataFrame,
+    text_units: pd.DataFrame,
+    relationships: pd.DataFrame,
+    covariates: pd.DataFrame | None,
+    community_level: int,
+    response_type: str,
+    queries: list[str],
+    callbacks: list[QueryCallbacks] | None = None,
+    verbose: bool = False,
+) -> BatchSearchResult:
+    """Perform a local search for each of many queries with a single search engine.
+
+    The data is loaded and the context builder created once, all queries are
+    embedded up front in batched calls, and at most `concurrent_requests`
+    queries run at a time.
+
+    Parameters
+    ----------
+    - config (GraphRagConfig): A graphrag configuration (from settings.yaml)
+    - entities (pd.DataFrame): A DataFrame containing the final entities (from entities.parquet)
+    - community_reports (pd.DataFrame): A DataFrame containing the final community reports (from community_reports.parquet)
+    - text_units (pd.DataFrame): A DataFrame containing the final text units (from text_units.parquet)
+    - relationships (pd.DataFrame): A DataFrame containing the final relationships (from relationships.parquet)
+    - covariates (pd.DataFrame): A DataFrame containing the final covariates (from covariates.parquet)
+    - community_level (int): The community level to search at.
+    - response_type (str): The response type to return.
+    - queries (list[str]): The user queries to search for.
+
+    Returns
+    -------
+    BatchSearchResult: One search result (or exception) per query, in query order, and the batch throughput.
+    """
+    init_loggers(config=config, verbose=verbose, filename="query.log")
+
+    logger.debug("Executing local search for %d queries", len(queries))
+    search_engine = _get_local_search_engine(
+        config=config,
+        entities=entities,
+        communities=communities,
+        community_reports=community_reports,
+        text_units=text_units,
+        relationships=relationships,
+        covariates=covariates,
+        community_level=community_level,
+        response_type=response_type,
+        callbacks=callbacks,
+        text_embedder=await _embed_queries(
+            config, config.local_search.embedding_model_id, queries
+        ),
+    )
+    return await search_many(
+        search_engine, queries, concurrency=config.concurrent_requests
+    )
+
+
+@validate_call(config={"arbitrary_types_allowed": True})
+async def drift_search_many(
+    config: GraphRagConfig,
+    entities: pd.DataFrame,
+    communities: pd.DataFrame,
+    community_reports: pd.DataFrame,
+    text_units: pd.DataFrame,
+    relationships: pd.DataFrame,
+    community_level: int,
+    response_type: str,
+    queries: list[str],
+    callbacks: list[QueryCallbacks] | None = None,
+    verbose: bool = False,
+) -> BatchSearchResult:
+    """Perform a DRIFT search for each of many queries with a single context builder.
+
+    The data is loaded and the context builder created once, each query
+    keeps its own DRIFT state, and at most `concurrent_requests` queries run
+    at a time.
+
+    Parameters
+    ----------
+    - config (GraphRagConfig): A graphrag configuration (from settings.yaml)
+    - entities (pd.DataFrame): A DataFrame containing the final entities (from entities.parquet)
+    - community_reports (pd.DataFrame): A DataFrame containing the final community reports (from community_reports.parquet)
+    - text_units (pd.DataFrame): A DataFrame containing the final text units (from text_units.parquet)
+    - relationships (pd.DataFrame): A DataFrame containing the final relationships (from relationships.parquet)
+    - community_level (int): The community level to search at.
+    - queries (list[str]): The user queries to search for.
+
+    Returns
+    -------
+    BatchSearchResult: One search result (or exception) per query, in query order, and the batch throughput.
+    """
+    init_loggers(config=config, verbose=verbose, filename="query.log")
+
+    logger.debug("Executing drift search for %d queries", len(queries))
+    search_engine = _get_drift_search_engine(
+        config=config,
+        entities=entities,
+        communities=communities,
+        community_reports=community_reports,
+        text_units=text_units,
+        relationships=relationships,
+        community_level=community_level,
+        response_type=response_type,
+        callbacks=callbacks,
+    )
+
+    # DRIFT search keeps the state of its query, so each query gets its own
+    # engine around the shared context builder
+    def new_search_engine() -> DRIFTSearch:
+        return DRIFTSearch(
+            model=search_engine.model,
+            context_builder=search_engine.context_builder,
+            tokenizer=search_engine.tokenizer,
+            callbacks=search_engine.callbacks,
+        )
+
+    return await search_many(
+        new_search_engine, queries, concurrency=config.concurrent_requests
+    )
+
+
+@validate_call(config={"arbitrary_types_allowed": True})
+async def basic_search_many(
+    config: GraphRagConfig,
+    text_units: pd.DataFrame,
+    response_type: str,
+    queries: list[str],
+    callbacks: list[QueryCallbacks] | None = None,
+    verbose: bool = False,
+) -> BatchSearchResult:
+    """Perform a basic search for each of many queries with a single search engine.
+
+    The text units are loaded once, all queries are embedded up front in
+    batched calls, and at most `concurrent_requests` queries run at a time.
+
+    Parameters
+    ----------
+    - config (GraphRagConfig): A graphrag configuration (from settings.yaml)
+    - text_units (pd.DataFrame): A DataFrame containing the final text units (from text_units.parquet)
+    - queries (list[str]): The user queries to search for.
+
+    Returns
+    -------
+    BatchSearchResult: One search result (or exception) per query, in query order, and the batch throughput.
+    """
+    init_loggers(config=config, verbose=verbose, filename="query.log")
+
+    logger.debug("Executing basic search for %d queries", len(queries))
+    search_engine = _get_basic_search_engine(
+        config=config,
+        text_units=text_units,
+        response_type=response_type,
+        callbacks=callbacks,
+        text_embedder=await _embed_queries(
+            config, config.basic_search.embedding_model_id, queries
+        ),
+    )
+    return await search_many(
+        search_engine, queries, concurrency=config.concurrent_requests
+    )
+
+
+async def _embed_queries(
+    config: GraphRagConfig, embedding_model_id: str, queries: list[str]
+) -> PrecomputedEmbedding:
+    """Create the query embedding model with every query embedded up front."""
+    embedding_model = create_embedding(
+        config.get_embedding_model_config(embedding_model_id)
+    )
+    return await embed_queries(
+        embedding_model, queries, batch_size=config.embed_text.batch_size
+    )
+
+
+def _get_global_search_engine(
+    config: GraphRagConfig,
+    entities: pd.DataFrame,
+    communities: pd.DataFrame,
+    community_reports: pd.DataFrame,
+    community_level: int | None,
+    dynamic_community_selection: bool,
+    response_type: str,
+    callbacks: list[QueryCallbacks] | None,
+) -> GlobalSearch:
+    communities_ = read_indexer_communities(communities, community_reports)
+    reports = read_indexer_reports(
+        community_reports,
+        communities,
+        community_level=community_level,
+        dynamic_community_selection=dynamic_community_selection,
+    )
+    entities_ = read_indexer_entities(
+        entities, communities, community_level=community_level
+    )
+    map_prompt = load_search_prompt(config.global_search.map_prompt)
+    reduce_prompt = load_search_prompt(config.global_search.reduce_prompt)
+    knowledge_prompt = load_search_prompt(config.global_search.knowledge_prompt)
+
+    return get_global_search_engine(
+        config,
+        reports=reports,
+        entities=entities_,
+        communities=communities_,
+        response_type=response_type,
+        dynamic_community_selection=dynamic_community_selection,
+        map_system_prompt=map_prompt,
+        reduce_system_prompt=reduce_prompt,
+        general_knowledge_inclusion_prompt=knowledge_prompt,
+        callbacks=callbacks,
+    )
+
+
+def _get_local_search_engine(
+    config: GraphRagConfig,
+    entities: pd.DataFrame,
+    communities: pd.DataFrame,
+    community_reports: pd.DataFrame,
+    text_units: pd.DataFrame,
+    relationships: pd.DataFrame,
+    covariates: pd.DataFrame | None,
+    community_level: int,
+    response_type: str,
+    callbacks: list[QueryCallbacks] | None,
+    text_embedder: "LLMEmbedding | None" = None,
+) -> LocalSearch:
+    msg = f"Vector Store Args: {redact(config.vector_store.model_dump())}"
+    logger.debug(msg)
+
+    description_embedding_store = get_embedding_store(
+        config=config.vector_store,
+        embedding_name=entity_description_embedding,
+    )
+
+    entities_ = read_indexer_entities(entities, communities, community_level)
+    covariates_ = read_indexer_covariates(covariates) if covariates is not None else []
+    prompt = load_search_prompt(config.local_search.prompt)
+    ls_config = config.local_search
+
+    return get_local_search_engine(
+        config=config,
+        reports=read_indexer_reports(community_reports, communities, community_level),
+        text_units=read_indexer_text_units(text_units),
+        entities=entities_,
+        relationships=read_indexer_relationships(relationships),
+        covariates={"claims": covariates_},
+        description_embedding_store=description_embedding_store,
+        response_type=response_type,
+        system_prompt=prompt,
+        callbacks=callbacks,
+        text_embedder=text_embedder,
+        lexical_index=(
+            _get_retrieval_index(
+                _lexical_indexes,
+                "entities",
+                entities,
+                lambda: build_entity_lexical_index(entities_),
+            )
+            if ls_config.retrieval_mode != RetrievalMode.Vector
+            else None
+        ),
+        entity_name_matcher=(
+            _get_retrieval_index(
+                _entity_name_matchers,
+                "entities",
+                entities,
+                lambda: build_entity_name_matcher(entities_),
+            )
+            if ls_config.match_entity_names
+            else None
+        ),
+    )
+
+
+def _get_drift_search_engine(
+    config: GraphRagConfig,
+    entities: pd.DataFrame,
+    communities: pd.DataFrame,
+    community_reports: pd.DataFrame,
+    text_units: pd.DataFrame,
+    relationships: pd.DataFrame,
+    community_level: int,
+    response_type: str,
+    callbacks: list[QueryCallbacks] | None,
+) -> DRIFTSearch:
+    msg = f"Vector Store Args: {redact(config.vector_store.model_dump())}"
+    logger.debug(msg)
+
+    description_embedding_store = get_embedding_store(
+        config=config.vector_store,
+        embedding_name=entity_description_embedding,
+    )
+
+    full_content_embedding_store = get_embedding_store(
+        config=config.vector_store,
+        embedding_name=community_full_content_embedding,
+    )
+
+    entities_ = read_indexer_entities(entities, communities, community_level)
+    reports = read_indexer_reports(community_reports, communities, community_level)
+    read_indexer_report_embeddings(reports, full_content_embedding_store)
+    prompt = load_search_prompt(config.drift_search.prompt)
+    reduce_prompt = load_search_prompt(config.drift_search.reduce_prompt)
+
+    return get_drift_search_engine(
+        config=config,
+        reports=reports,
+        text_units=read_indexer_text_units(text_units),
+        entities=entities_,
+        relationships=read_indexer_relationships(relationships),
+        description_embedding_store=description_embedding_store,
+        local_system_prompt=prompt,
+        reduce_system_prompt=reduce_prompt,
+        response_type=response_type,
+        callbacks=callbacks,
+        entity_name_matcher=(
+            _get_retrieval_index(
+                _entity_name_matchers,
+                "entities",
+                entities,
+                lambda: build_entity_name_matcher(entities_),
+            )
+            if config.drift_search.local_search_match_entity_names
+            else None
+        ),
+    )
+
+
+def _get_basic_search_engine(
+    config: GraphRagConfig,
+    text_units: pd.DataFrame,
+    response_type: str,
+    callbacks: list[QueryCallbacks] | None,
+    text_embedder: "LLMEmbedding | None" = None,
+) -> BasicSearch:
     msg = f"Vector Store Args: {redact(config.vector_store.model_dump())}"
     logger.debug(msg)
 
@@ -533,14 +913,44 @@ def basic_search_streaming(
     )
 
     prompt = load_search_prompt(config.basic_search.prompt)
+    text_units_ = read_indexer_text_units(text_units)
 
-    logger.debug("Executing streaming basic search query: %s", query)
-    search_engine = get_basic_search_engine(
+    return get_basic_search_engine(
         config=config,
-        text_units=read_indexer_text_units(text_units),
+        text_units=text_units_,
         text_unit_embeddings=embedding_store,
         response_type=response_type,
         system_prompt=prompt,
         callbacks=callbacks,
+        text_embedder=text_embedder,
+        lexical_index=(
+            _get_retrieval_index(
+                _lexical_indexes,
+                "text_units",
+                text_units,
+                lambda: build_text_unit_lexical_index(text_units_),
+            )
+            if config.basic_search.retrieval_mode != RetrievalMode.Vector
+            else None
+        ),
     )
-    return search_engine.stream_search(query=query)
+
+
+def _get_retrieval_index(
+    cache: dict[tuple[str, int], _IndexT],
+    kind: str,
+    data: pd.DataFrame,
+    build: Callable[[], _IndexT],
+) -> _IndexT:
+    """Get the index built from a loaded DataFrame, building it on first use.
+
+    The DataFrame's identity is the key, so a DataFrame that is changed in
+    place keeps the index built before the change.
+    """
+    key = (kind, id(data))
+    index = cache.get(key)
+    if index is None:
+        index = build()
+        cache[key] = index
+        weakref.finalize(data, cache.pop, key, None)
+    return index
@@ -116,6 +116,10 @@ def _run_index(
     )
 
     if dry_run:
+        from graphrag.index.estimate import format_estimate
+
+        estimate = asyncio.run(api.estimate_index(config=config, method=method))
+        print(format_estimate(estimate))  # noqa: T201
         logger.info("Dry run complete, exiting...")
         sys.exit(0)
 
@@ -166,7 +166,8 @@ def _index_cli(
         "--dry-run",
         help=(
             "Run the indexing pipeline without executing any steps "
-            "to inspect and validate the configuration."
+            "to inspect and validate the configuration. Loads and chunks "
+            "the input to estimate LLM requests, tokens and run time."
         ),
     ),
     cache: bool = typer.Option(
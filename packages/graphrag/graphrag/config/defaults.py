@@ -19,6 +19,7 @@ from graphrag.config.enums import (
     AsyncType,
     NounPhraseExtractorType,
     ReportingType,
+    RetrievalMode,
 )
 from graphrag.index.operations.build_noun_graph.np_extractors.stop_words import (
     EN_STOP_WORDS,
@@ -51,6 +52,7 @@ class BasicSearchDefaults:
     max_context_tokens: int = 12_000
     completion_model_id: str = DEFAULT_COMPLETION_MODEL_ID
     embedding_model_id: str = DEFAULT_EMBEDDING_MODEL_ID
+    retrieval_mode: RetrievalMode = RetrievalMode.Vector
 
 
 @dataclass
@@ -71,6 +73,7 @@ class ClusterGraphDefaults:
     max_cluster_size: int = 10
     use_lcc: bool = True
     seed: int = 0xDEADBEEF
+    incremental: bool = False
 
 
 @dataclass
@@ -110,6 +113,7 @@ class DriftSearchDefaults:
     local_search_n: int = 1
     local_search_llm_max_gen_tokens: int | None = None
     local_search_llm_max_gen_completion_tokens: int | None = None
+    local_search_match_entity_names: bool = False
     completion_model_id: str = DEFAULT_COMPLETION_MODEL_ID
     embedding_model_id: str = DEFAULT_EMBEDDING_MODEL_ID
 
@@ -137,6 +141,8 @@ class ExtractClaimsDefaults:
     max_gleanings: int = 1
     completion_model_id: str = DEFAULT_COMPLETION_MODEL_ID
     model_instance_name: str = "extract_claims"
+    combined_with_graph: bool = False
+    combined_prompt: None = None
 
 
 @dataclass
@@ -150,6 +156,7 @@ class ExtractGraphDefaults:
     max_gleanings: int = 1
     completion_model_id: str = DEFAULT_COMPLETION_MODEL_ID
     model_instance_name: str = "extract_graph"
+    pack_max_tokens: int = 0
 
 
 @dataclass
@@ -206,6 +213,8 @@ class GlobalSearchDefaults:
     dynamic_search_num_repeats: int = 1
     dynamic_search_use_summary: bool = False
     dynamic_search_max_level: int = 2
+    dynamic_search_rating_cache_size: int = 10_000
+    map_stop_score: int | None = None
     completion_model_id: str = DEFAULT_COMPLETION_MODEL_ID
 
 
@@ -269,6 +278,8 @@ class LocalSearchDefaults:
     max_context_tokens: int = 12_000
     completion_model_id: str = DEFAULT_COMPLETION_MODEL_ID
     embedding_model_id: str = DEFAULT_EMBEDDING_MODEL_ID
+    retrieval_mode: RetrievalMode = RetrievalMode.Vector
+    match_entity_names: bool = False
 
 
 @dataclass
@@ -320,6 +331,8 @@ class SummarizeDescriptionsDefaults:
     max_input_tokens: int = 4_000
     completion_model_id: str = DEFAULT_COMPLETION_MODEL_ID
     model_instance_name: str = "summarize_descriptions"
+    batch_max_tokens: int = 0
+    batch_prompt: None = None
 
 
 @dataclass
@@ -41,6 +41,17 @@ class SearchMethod(Enum):
         return self.value
 
 
+class RetrievalMode(str, Enum):
+    """Enum for how search retrieves text units and entities for a query."""
+
+    Vector = "vector"
+    """Embedding similarity search against the vector store."""
+    Lexical = "lexical"
+    """BM25 keyword search over the indexed text. Needs no embedding call."""
+    Hybrid = "hybrid"
+    """Vector and lexical results fused with reciprocal rank fusion."""
+
+
 class IndexingMethod(str, Enum):
     """Enum for the type of indexing to perform."""
 
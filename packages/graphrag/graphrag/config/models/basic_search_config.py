@@ -6,6 +6,7 @@
 from pydantic import BaseModel, Field
 
 from graphrag.config.defaults import graphrag_config_defaults
+from graphrag.config.enums import RetrievalMode
 
 
 class BasicSearchConfig(BaseModel):
@@ -31,3 +32,7 @@ class BasicSearchConfig(BaseModel):
         description="The maximum tokens.",
         default=graphrag_config_defaults.basic_search.max_context_tokens,
     )
+    retrieval_mode: RetrievalMode = Field(
+        description="How to retrieve candidates for a query: vector, lexical (BM25) or hybrid.",
+        default=graphrag_config_defaults.basic_search.retrieval_mode,
+    )
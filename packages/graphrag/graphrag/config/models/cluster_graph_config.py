@@ -23,3 +23,7 @@ class ClusterGraphConfig(BaseModel):
         description="The seed to use for the clustering.",
         default=graphrag_config_defaults.cluster_graph.seed,
     )
+    incremental: bool = Field(
+        description="Whether update runs recluster the merged graph warm-started from the previous communities, regenerating reports only for communities whose membership changed.",
+        default=graphrag_config_defaults.cluster_graph.incremental,
+    )
@@ -121,3 +121,8 @@ class DRIFTSearchConfig(BaseModel):
         description="The maximum number of generated tokens for the LLM in local search.",
         default=graphrag_config_defaults.drift_search.local_search_llm_max_gen_completion_tokens,
     )
+
+    local_search_match_entity_names: bool = Field(
+        description="Match entities named verbatim in the query before the similarity search in local search.",
+        default=graphrag_config_defaults.drift_search.local_search_match_entity_names,
+    )
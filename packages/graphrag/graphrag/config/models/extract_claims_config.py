@@ -10,6 +10,7 @@ from pydantic import BaseModel, Field
 
 from graphrag.config.defaults import graphrag_config_defaults
 from graphrag.prompts.index.extract_claims import EXTRACT_CLAIMS_PROMPT
+from graphrag.prompts.index.extract_graph_claims import GRAPH_CLAIMS_EXTRACTION_PROMPT
 
 
 @dataclass
@@ -17,6 +18,7 @@ class ClaimExtractionPrompts:
     """Claim extraction prompt templates."""
 
     extraction_prompt: str
+    combined_extraction_prompt: str
 
 
 class ExtractClaimsConfig(BaseModel):
@@ -46,6 +48,14 @@ class ExtractClaimsConfig(BaseModel):
         description="The maximum number of entity gleanings to use.",
         default=graphrag_config_defaults.extract_claims.max_gleanings,
     )
+    combined_with_graph: bool = Field(
+        description="Whether to extract claims in the same completion as entities and relationships during graph extraction, using the graph extraction model and gleanings.",
+        default=graphrag_config_defaults.extract_claims.combined_with_graph,
+    )
+    combined_prompt: str | None = Field(
+        description="The combined graph and claim extraction prompt to use.",
+        default=graphrag_config_defaults.extract_claims.combined_prompt,
+    )
 
     def resolved_prompts(self) -> ClaimExtractionPrompts:
         """Get the resolved claim extraction prompts."""
@@ -53,4 +63,9 @@ class ExtractClaimsConfig(BaseModel):
             extraction_prompt=Path(self.prompt).read_text(encoding="utf-8")
             if self.prompt
             else EXTRACT_CLAIMS_PROMPT,
+            combined_extraction_prompt=Path(self.combined_prompt).read_text(
+                encoding="utf-8"
+            )
+            if self.combined_prompt
+            else GRAPH_CLAIMS_EXTRACTION_PROMPT,
         )
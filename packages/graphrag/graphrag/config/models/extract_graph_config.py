@@ -42,6 +42,10 @@ class ExtractGraphConfig(BaseModel):
         description="The maximum number of entity gleanings to use.",
         default=graphrag_config_defaults.extract_graph.max_gleanings,
     )
+    pack_max_tokens: int = Field(
+        description="Token budget for packing consecutive short text units into one extraction prompt. 0 extracts each text unit with its own prompt.",
+        default=graphrag_config_defaults.extract_graph.pack_max_tokens,
+    )
 
     def resolved_prompts(self) -> ExtractGraphPrompts:
         """Get the resolved graph extraction prompts."""
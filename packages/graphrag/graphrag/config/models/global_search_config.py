@@ -43,6 +43,10 @@ class GlobalSearchConfig(BaseModel):
         description="The reduce llm maximum response length in words.",
         default=graphrag_config_defaults.global_search.reduce_max_length,
     )
+    map_stop_score: int | None = Field(
+        description="Cancel the remaining map calls once the reduce context is full of key points scoring at least this much. Disabled if not set.",
+        default=graphrag_config_defaults.global_search.map_stop_score,
+    )
 
     # configurations for dynamic community selection
     dynamic_search_threshold: int = Field(
@@ -65,3 +69,7 @@ class GlobalSearchConfig(BaseModel):
         description="The maximum level of community hierarchy to consider if none of the processed communities are relevant",
         default=graphrag_config_defaults.global_search.dynamic_search_max_level,
     )
+    dynamic_search_rating_cache_size: int = Field(
+        description="The maximum number of community ratings kept for reuse by later queries. Set to 0 to disable the cache.",
+        default=graphrag_config_defaults.global_search.dynamic_search_rating_cache_size,
+    )
@@ -6,6 +6,7 @@
 from pydantic import BaseModel, Field
 
 from graphrag.config.defaults import graphrag_config_defaults
+from graphrag.config.enums import RetrievalMode
 
 
 class LocalSearchConfig(BaseModel):
@@ -47,3 +48,11 @@ class LocalSearchConfig(BaseModel):
         description="The maximum tokens.",
         default=graphrag_config_defaults.local_search.max_context_tokens,
     )
+    retrieval_mode: RetrievalMode = Field(
+        description="How to retrieve candidates for a query: vector, lexical (BM25) or hybrid.",
+        default=graphrag_config_defaults.local_search.retrieval_mode,
+    )
+    match_entity_names: bool = Field(
+        description="Match entities named verbatim in the query before the similarity search.",
+        default=graphrag_config_defaults.local_search.match_entity_names,
+    )
@@ -9,7 +9,10 @@ from pathlib import Path
 from pydantic import BaseModel, Field
 
 from graphrag.config.defaults import graphrag_config_defaults
-from graphrag.prompts.index.summarize_descriptions import SUMMARIZE_PROMPT
+from graphrag.prompts.index.summarize_descriptions import (
+    BATCH_SUMMARIZE_PROMPT,
+    SUMMARIZE_PROMPT,
+)
 
 
 @dataclass
@@ -17,6 +20,7 @@ class SummarizeDescriptionsPrompts:
     """Description summarization prompt templates."""
 
     summarize_prompt: str
+    batch_summarize_prompt: str
 
 
 class SummarizeDescriptionsConfig(BaseModel):
@@ -42,6 +46,14 @@ class SummarizeDescriptionsConfig(BaseModel):
         description="Maximum tokens to submit from the input entity descriptions.",
         default=graphrag_config_defaults.summarize_descriptions.max_input_tokens,
     )
+    batch_max_tokens: int = Field(
+        description="Token budget for packing the descriptions of several entities and relationships into one summarization request. 0 summarizes each of them in its own request.",
+        default=graphrag_config_defaults.summarize_descriptions.batch_max_tokens,
+    )
+    batch_prompt: str | None = Field(
+        description="The batched description summarization prompt to use.",
+        default=graphrag_config_defaults.summarize_descriptions.batch_prompt,
+    )
 
     def resolved_prompts(self) -> SummarizeDescriptionsPrompts:
         """Get the resolved description summarization prompts."""
@@ -49,4 +61,7 @@ class SummarizeDescriptionsConfig(BaseModel):
             summarize_prompt=Path(self.prompt).read_text(encoding="utf-8")
             if self.prompt
             else SUMMARIZE_PROMPT,
+            batch_summarize_prompt=Path(self.batch_prompt).read_text(encoding="utf-8")
+            if self.batch_prompt
+            else BATCH_SUMMARIZE_PROMPT,
         )
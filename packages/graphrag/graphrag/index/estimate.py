@@ -0,0 +1,416 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Estimate the LLM request volume and duration of an indexing run."""
+
+import dataclasses
+import logging
+import math
+from dataclasses import dataclass, field
+
+from graphrag_chunking.chunker_factory import create_chunker
+from graphrag_input import create_input_reader
+from graphrag_llm.config import ModelConfig, RateLimitType
+from graphrag_storage import create_storage
+
+from graphrag.config.defaults import DEFAULT_ENTITY_TYPES
+from graphrag.config.embeddings import text_unit_text_embedding
+from graphrag.config.enums import IndexingMethod
+from graphrag.config.models.graph_rag_config import GraphRagConfig
+from graphrag.index.operations.extract_covariates.claim_extractor import (
+    INPUT_CLAIM_DESCRIPTION_KEY,
+    INPUT_ENTITY_SPEC_KEY,
+)
+from graphrag.index.operations.extract_graph.graph_claim_extractor import (
+    CLAIM_DESCRIPTION_KEY,
+)
+from graphrag.index.operations.extract_graph.graph_extractor import (
+    ENTITY_TYPES_KEY,
+    INPUT_TEXT_KEY,
+)
+from graphrag.index.operations.extract_graph.utils import pack_text_units
+from graphrag.index.workflows.create_base_text_units import chunk_document
+from graphrag.prompts.index import extract_claims, extract_graph, extract_graph_claims
+from graphrag.tokenizer.get_tokenizer import get_tokenizer
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class WorkflowEstimate:
+    """The estimated LLM usage of one workflow."""
+
+    workflow: str
+    model_id: str
+    requests: int | None = None
+    """None if the request volume depends on the outputs of earlier workflows."""
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    seconds: float = 0.0
+
+
+@dataclass
+class IndexEstimate:
+    """The estimated LLM usage of an indexing run."""
+
+    num_documents: int = 0
+    num_text_units: int = 0
+    text_unit_tokens: int = 0
+    workflows: list[WorkflowEstimate] = field(default_factory=list)
+
+    @property
+    def requests(self) -> int:
+        """Total number of estimated requests."""
+        return sum(workflow.requests or 0 for workflow in self.workflows)
+
+    @property
+    def prompt_tokens(self) -> int:
+        """Total number of estimated prompt tokens."""
+        return sum(workflow.prompt_tokens for workflow in self.workflows)
+
+    @property
+    def completion_tokens(self) -> int:
+        """Total number of estimated completion tokens."""
+        return sum(workflow.completion_tokens for workflow in self.workflows)
+
+    @property
+    def seconds(self) -> float:
+        """Estimated wall-clock time of the estimated workflows, run one after another."""
+        return sum(workflow.seconds for workflow in self.workflows)
+
+
+async def estimate_index(
+    config: GraphRagConfig,
+    method: IndexingMethod = IndexingMethod.Standard,
+    completion_tokens_per_request: int = 1000,
+    seconds_per_completion: float = 10.0,
+    seconds_per_embedding: float = 1.0,
+) -> IndexEstimate:
+    """Estimate the LLM requests, tokens and duration of an indexing run.
+
+    Input documents are loaded and chunked exactly as in the pipeline, and
+    the configured prompt templates and gleaning settings are applied to the
+    chunks. No model is called. Gleanings are assumed to run to their
+    configured maximum, so the extraction estimates are upper bounds.
+
+    Workflows whose inputs depend on the extracted graph (description
+    summarization, community reports and their embeddings) are listed
+    without a request count.
+
+    Args
+    ----
+        config: GraphRagConfig
+            The configuration of the run.
+        method: IndexingMethod
+            The indexing method of the run.
+        completion_tokens_per_request: int
+            The assumed number of tokens generated per extraction request.
+        seconds_per_completion: float
+            The assumed latency of a completion request.
+        seconds_per_embedding: float
+            The assumed latency of an embedding request.
+    """
+    estimate = IndexEstimate()
+    chunk_tokens = await _chunk_input(config, estimate)
+    is_standard = method in (IndexingMethod.Standard, IndexingMethod.StandardUpdate)
+    combine_claims = (
+        config.extract_claims.enabled and config.extract_claims.combined_with_graph
+    )
+
+    if is_standard:
+        model_id = config.extract_graph.completion_model_id
+        model_config = config.get_completion_model_config(model_id)
+        tokenizer = get_tokenizer(model_config)
+        prompts = extract_graph
+        template = config.extract_graph.resolved_prompts().extraction_prompt
+        variables = {
+            INPUT_TEXT_KEY: "",
+            ENTITY_TYPES_KEY: ",".join(config.extract_graph.entity_types),
+        }
+        if combine_claims:
+            prompts = extract_graph_claims
+            template = (
+                config.extract_claims.resolved_prompts().combined_extraction_prompt
+            )
+            variables[CLAIM_DESCRIPTION_KEY] = config.extract_claims.description
+        template_tokens = tokenizer.num_tokens(template.format(**variables))
+        prompt_chunk_tokens = chunk_tokens
+        if config.extract_graph.pack_max_tokens > 0 and not combine_claims:
+            # packed prompts add a preamble and a header per text unit
+            preamble_tokens = tokenizer.num_tokens(extract_graph.PACKED_TEXT_PROMPT)
+            header_tokens = tokenizer.num_tokens(extract_graph.DOCUMENT_HEADER)
+            prompt_chunk_tokens = [
+                preamble_tokens + sum(chunk_tokens[i] + header_tokens for i in group)
+                if len(group) > 1
+                else chunk_tokens[group[0]]
+                for group in pack_text_units(
+                    chunk_tokens, config.extract_graph.pack_max_tokens
+                )
+            ]
+        estimate.workflows.append(
+            _estimate_extraction(
+                workflow="extract_graph",
+                model_id=model_id,
+                model_config=model_config,
+                concurrent_requests=config.concurrent_requests,
+                chunk_tokens=prompt_chunk_tokens,
+                template_tokens=template_tokens,
+                continue_tokens=tokenizer.num_tokens(prompts.CONTINUE_PROMPT),
+                loop_tokens=tokenizer.num_tokens(prompts.LOOP_PROMPT),
+                max_gleanings=config.extract_graph.max_gleanings,
+                completion_tokens_per_request=completion_tokens_per_request,
+                seconds_per_request=seconds_per_completion,
+            )
+        )
+
+        estimate.workflows.append(
+            WorkflowEstimate(
+                workflow="summarize_descriptions",
+                model_id=config.summarize_descriptions.completion_model_id,
+            )
+        )
+
+    if is_standard and config.extract_claims.enabled and not combine_claims:
+        model_id = config.extract_claims.completion_model_id
+        model_config = config.get_completion_model_config(model_id)
+        tokenizer = get_tokenizer(model_config)
+        template = config.extract_claims.resolved_prompts().extraction_prompt
+        template_tokens = tokenizer.num_tokens(
+            template.format(**{
+                INPUT_TEXT_KEY: "",
+                INPUT_CLAIM_DESCRIPTION_KEY: config.extract_claims.description,
+                INPUT_ENTITY_SPEC_KEY: DEFAULT_ENTITY_TYPES,
+            })
+        )
+        estimate.workflows.append(
+            _estimate_extraction(
+                workflow="extract_covariates",
+                model_id=model_id,
+                model_config=model_config,
+                concurrent_requests=config.concurrent_requests,
+                chunk_tokens=chunk_tokens,
+                template_tokens=template_tokens,
+                continue_tokens=tokenizer.num_tokens(extract_claims.CONTINUE_PROMPT),
+                loop_tokens=tokenizer.num_tokens(extract_claims.LOOP_PROMPT),
+                max_gleanings=config.extract_claims.max_gleanings,
+                completion_tokens_per_request=completion_tokens_per_request,
+                seconds_per_request=seconds_per_completion,
+            )
+        )
+
+    estimate.workflows.append(
+        WorkflowEstimate(
+            workflow="create_community_reports"
+            if is_standard
+            else "create_community_reports_text",
+            model_id=config.community_reports.completion_model_id,
+        )
+    )
+
+    if text_unit_text_embedding in config.embed_text.names:
+        estimate.workflows.append(
+            _estimate_embedding(config, chunk_tokens, seconds_per_embedding)
+        )
+    if any(name != text_unit_text_embedding for name in config.embed_text.names):
+        estimate.workflows.append(
+            WorkflowEstimate(
+                workflow="generate_text_embeddings (graph outputs)",
+                model_id=config.embed_text.embedding_model_id,
+            )
+        )
+
+    logger.info(
+        "Estimated %d requests, %d prompt tokens and %d completion tokens in %.0fs",
+        estimate.requests,
+        estimate.prompt_tokens,
+        estimate.completion_tokens,
+        estimate.seconds,
+    )
+    return estimate
+
+
+async def _chunk_input(config: GraphRagConfig, estimate: IndexEstimate) -> list[int]:
+    """Load and chunk the input documents, returning the tokens of every chunk."""
+    tokenizer = get_tokenizer(encoding_model=config.chunking.encoding_model)
+    chunker = create_chunker(config.chunking, tokenizer.encode, tokenizer.decode)
+    input_reader = create_input_reader(
+        config.input, create_storage(config.input_storage)
+    )
+
+    chunk_tokens: list[int] = []
+    async for document in input_reader:
+        estimate.num_documents += 1
+        chunks = [
+            chunk_text
+            for chunk_text in chunk_document(
+                dataclasses.asdict(document), chunker, config.chunking.prepend_metadata
+            )
+            if chunk_text is not None
+        ]
+        chunk_tokens.extend(tokenizer.num_tokens_batch(chunks))
+
+    estimate.num_text_units = len(chunk_tokens)
+    estimate.text_unit_tokens = sum(chunk_tokens)
+    return chunk_tokens
+
+
+def _estimate_extraction(
+    *,
+    workflow: str,
+    model_id: str,
+    model_config: ModelConfig,
+    concurrent_requests: int,
+    chunk_tokens: list[int],
+    template_tokens: int,
+    continue_tokens: int,
+    loop_tokens: int,
+    max_gleanings: int,
+    completion_tokens_per_request: int,
+    seconds_per_request: float,
+) -> WorkflowEstimate:
+    """Estimate an extraction that sends every chunk through a gleaning conversation."""
+    estimate = WorkflowEstimate(workflow=workflow, model_id=model_id, requests=0)
+    for tokens in chunk_tokens:
+        history = template_tokens + tokens
+        requests = [(history, completion_tokens_per_request)]
+        history += completion_tokens_per_request
+        for gleaning in range(max_gleanings):
+            history += continue_tokens
+            requests.append((history, completion_tokens_per_request))
+            history += completion_tokens_per_request
+            if gleaning < max_gleanings - 1:
+                # the Y/N question whether to keep gleaning
+                history += loop_tokens
+                requests.append((history, 1))
+        estimate.requests += len(requests)  # type: ignore
+        estimate.prompt_tokens += sum(prompt for prompt, _ in requests)
+        estimate.completion_tokens += sum(completion for _, completion in requests)
+
+    estimate.seconds = _estimate_seconds(
+        model_config,
+        concurrent_requests,
+        requests=estimate.requests or 0,
+        tokens=estimate.prompt_tokens + estimate.completion_tokens,
+        seconds_per_request=seconds_per_request,
+    )
+    return estimate
+
+
+def _estimate_embedding(
+    config: GraphRagConfig, chunk_tokens: list[int], seconds_per_request: float
+) -> WorkflowEstimate:
+    """Estimate the text unit embeddings, batched as in generate_text_embeddings."""
+    model_id = config.embed_text.embedding_model_id
+    batch_size = config.embed_text.batch_size
+    batch_max_tokens = config.embed_text.batch_max_tokens
+
+    requests = 0
+    batch_length = 0
+    batch_tokens = 0
+    for tokens in chunk_tokens:
+        # texts longer than a batch are split into batch-sized snippets
+        for _ in range(max(math.ceil(tokens / batch_max_tokens), 1)):
+            snippet_tokens = min(tokens, batch_max_tokens)
+            if batch_length and (
+                batch_length >= batch_size
+                or batch_tokens + snippet_tokens > batch_max_tokens
+            ):
+                requests += 1
+                batch_length = 0
+                batch_tokens = 0
+            batch_length += 1
+            batch_tokens += snippet_tokens
+    if batch_length:
+        requests += 1
+
+    return WorkflowEstimate(
+        workflow="generate_text_embeddings (text units)",
+        model_id=model_id,
+        requests=requests,
+        prompt_tokens=sum(chunk_tokens),
+        seconds=_estimate_seconds(
+            config.get_embedding_model_config(model_id),
+            config.concurrent_requests,
+            requests=requests,
+            tokens=sum(chunk_tokens),
+            seconds_per_request=seconds_per_request,
+        ),
+    )
+
+
+def _estimate_seconds(
+    model_config: ModelConfig,
+    concurrent_requests: int,
+    *,
+    requests: int,
+    tokens: int,
+    seconds_per_request: float,
+) -> float:
+    """Estimate the wall-clock time under the concurrency and rate limits.
+
+    The estimate is the slowest of the concurrency bound and the requests
+    and tokens per period of a sliding window rate limit.
+    """
+    seconds = requests * seconds_per_request / max(concurrent_requests, 1)
+    rate_limit = model_config.rate_limit
+    if rate_limit is None:
+        return seconds
+
+    if rate_limit.type == RateLimitType.Adaptive:
+        concurrency = min(rate_limit.max_concurrency or 64, concurrent_requests)
+        return requests * seconds_per_request / max(concurrency, 1)
+
+    if rate_limit.type in (
+        RateLimitType.SlidingWindow,
+        RateLimitType.SharedSlidingWindow,
+    ):
+        period = rate_limit.period_in_seconds or 60
+        if rate_limit.requests_per_period:
+            seconds = max(seconds, requests / rate_limit.requests_per_period * period)
+        if rate_limit.tokens_per_period:
+            seconds = max(seconds, tokens / rate_limit.tokens_per_period * period)
+    return seconds
+
+
+def format_estimate(estimate: IndexEstimate) -> str:
+    """Format an estimate as a plain-text table."""
+    rows = [("workflow", "model", "requests", "prompt tokens", "output tokens", "time")]
+    rows.extend(
+        (
+            workflow.workflow,
+            workflow.model_id,
+            f"{workflow.requests:,}" if workflow.requests is not None else "n/a",
+            f"{workflow.prompt_tokens:,}",
+            f"{workflow.completion_tokens:,}",
+            _format_seconds(workflow.seconds),
+        )
+        for workflow in estimate.workflows
+    )
+    rows.append((
+        "total",
+        "",
+        f"{estimate.requests:,}",
+        f"{estimate.prompt_tokens:,}",
+        f"{estimate.completion_tokens:,}",
+        _format_seconds(estimate.seconds),
+    ))
+    widths = [max(len(row[column]) for row in rows) for column in range(len(rows[0]))]
+    lines = [
+        f"{estimate.num_documents:,} documents, {estimate.num_text_units:,} text units, "
+        f"{estimate.text_unit_tokens:,} tokens",
+        *(
+            "  ".join(
+                value.ljust(width) if column < 2 else value.rjust(width)
+                for column, (value, width) in enumerate(zip(row, widths, strict=True))
+            )
+            for row in rows
+        ),
+        "n/a: depends on the extracted graph and is not estimated.",
+    ]
+    return "\n".join(lines)
+
+
+def _format_seconds(seconds: float) -> str:
+    minutes, seconds = divmod(round(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}h{minutes:02d}m{seconds:02d}s"
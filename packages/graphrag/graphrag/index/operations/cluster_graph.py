@@ -22,13 +22,19 @@ def cluster_graph(
     max_cluster_size: int,
     use_lcc: bool,
     seed: int | None = None,
+    starting_communities: dict[str, int] | None = None,
 ) -> Communities:
-    """Apply a hierarchical clustering algorithm to a relationships DataFrame."""
+    """Apply a hierarchical clustering algorithm to a relationships DataFrame.
+
+    starting_communities optionally maps node titles to a prior top-level
+    community, warm-starting the clustering from that partition.
+    """
     node_id_to_community_map, parent_mapping = _compute_leiden_communities(
         edges=edges,
         max_cluster_size=max_cluster_size,
         use_lcc=use_lcc,
         seed=seed,
+        starting_communities=starting_communities,
     )
 
     levels = sorted(node_id_to_community_map.keys())
@@ -53,6 +59,7 @@ def _compute_leiden_communities(
     max_cluster_size: int,
     use_lcc: bool,
     seed: int | None = None,
+    starting_communities: dict[str, int] | None = None,
 ) -> tuple[dict[int, dict[str, int]], dict[int, int]]:
     """Return Leiden root communities and their hierarchy mapping."""
     edge_df = edges.copy()
@@ -84,7 +91,10 @@ def _compute_leiden_communities(
     )
 
     community_mapping = hierarchical_leiden(
-        edge_list, max_cluster_size=max_cluster_size, random_seed=seed
+        edge_list,
+        max_cluster_size=max_cluster_size,
+        random_seed=seed,
+        starting_communities=_seed_communities(edge_list, starting_communities),
     )
     results: dict[int, dict[str, int]] = {}
     hierarchy: dict[int, int] = {}
@@ -97,3 +107,28 @@ def _compute_leiden_communities(
         )
 
     return results, hierarchy
+
+
+def _seed_communities(
+    edge_list: list[tuple[str, str, float]],
+    starting_communities: dict[str, int] | None,
+) -> dict[str, int] | None:
+    """Restrict a prior partition to the nodes in the edge list.
+
+    Leiden requires every node to have a starting community, so nodes
+    without a prior assignment are placed in new singleton communities.
+    """
+    if not starting_communities:
+        return None
+    nodes = sorted({
+        node for source, target, _ in edge_list for node in (source, target)
+    })
+    seeds: dict[str, int] = {}
+    next_community = max(starting_communities.values(), default=-1) + 1
+    for node in nodes:
+        community = starting_communities.get(node)
+        if community is None or community < 0:
+            community = next_community
+            next_community += 1
+        seeds[node] = community
+    return seeds
@@ -3,7 +3,9 @@
 
 """Streaming text embedding operation."""
 
+import hashlib
 import logging
+from collections import OrderedDict
 from typing import TYPE_CHECKING, Any
 
 import numpy as np
@@ -19,6 +21,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# recently embedded vectors kept for rows repeating a text from an earlier flush
+_MAX_REUSED_EMBEDDINGS = 4096
+
 
 async def embed_text(
     input_table: Table,
@@ -32,6 +37,8 @@ async def embed_text(
     vector_store: VectorStore,
     id_column: str = "id",
     output_table: Table | None = None,
+    include_ids: set[str] | None = None,
+    overwrite: bool = True,
 ) -> int:
     """Embed text from a streaming Table into a vector store.
 
@@ -39,14 +46,26 @@ async def embed_text(
     which dispatches API batches concurrently up to
     ``num_threads``.  The buffer is sized so each flush produces
     enough batches to saturate the concurrency limit.
+
+    Identical texts are embedded once and the vector is shared by every
+    row with that text, including rows in later flushes as long as the
+    vector is still among the most recently embedded.
+
+    When ``include_ids`` is given, rows whose id is not in the set are
+    skipped. With ``overwrite`` disabled the existing index is kept and
+    the embedded rows are appended to it.
     """
-    vector_store.create_index()
+    if overwrite:
+        vector_store.create_index()
 
     buffer: list[dict[str, Any]] = []
+    embedded: OrderedDict[bytes, Any] = OrderedDict()
     total_rows = 0
     flush_size = batch_size * num_threads
 
     async for row in input_table:
+        if include_ids is not None and row[id_column] not in include_ids:
+            continue
         text = row.get(embed_column)
         if text is None:
             text = ""
@@ -69,6 +88,7 @@ async def embed_text(
                 num_threads,
                 vector_store,
                 output_table,
+                embedded,
             )
             buffer.clear()
 
@@ -85,6 +105,7 @@ async def embed_text(
             num_threads,
             vector_store,
             output_table,
+            embedded,
         )
 
     return total_rows
@@ -102,22 +123,46 @@ async def _flush_embedding_buffer(
     num_threads: int,
     vector_store: VectorStore,
     output_table: Table | None,
+    embedded: OrderedDict[bytes, Any],
 ) -> int:
     """Embed a buffer of rows and load results into the vector store."""
-    texts: list[str] = [row[embed_column] for row in buffer]
     ids: list[str] = [row[id_column] for row in buffer]
+    keys: list[bytes] = [_text_key(row[embed_column]) for row in buffer]
+
+    # only embed the distinct texts not embedded by an earlier flush
+    vectors_by_key: dict[bytes, Any] = {}
+    texts: dict[bytes, str] = {}
+    for key, row in zip(keys, buffer, strict=True):
+        if key in embedded:
+            embedded.move_to_end(key)
+            vectors_by_key[key] = embedded[key]
+        elif key not in texts:
+            texts[key] = row[embed_column]
+
+    if texts:
+        result = await run_embed_text(
+            list(texts.values()),
+            callbacks,
+            model,
+            tokenizer,
+            batch_size,
+            batch_max_tokens,
+            num_threads,
+        )
+        for key, vector in zip(texts, result.embeddings or [], strict=True):
+            vectors_by_key[key] = vector
+            if vector is not None:
+                # a compact copy, rather than a view pinning the whole batch
+                embedded[key] = np.array(vector)
+                if len(embedded) > _MAX_REUSED_EMBEDDINGS:
+                    embedded.popitem(last=False)
+
+    if len(texts) < len(buffer):
+        logger.debug(
+            "Embedded %d new distinct texts for %d rows", len(texts), len(buffer)
+        )
 
-    result = await run_embed_text(
-        texts,
-        callbacks,
-        model,
-        tokenizer,
-        batch_size,
-        batch_max_tokens,
-        num_threads,
-    )
-
-    vectors = result.embeddings or []
+    vectors = [vectors_by_key[key] for key in keys]
     skipped = 0
     documents: list[VectorStoreDocument] = []
     for doc_id, doc_vector in zip(ids, vectors, strict=True):
@@ -151,3 +196,10 @@ async def _flush_embedding_buffer(
             await output_table.write({"id": doc_id, "embedding": doc_vector})
 
     return len(buffer)
+
+
+def _text_key(text: str) -> bytes:
+    """Get the key identifying a text without holding on to it."""
+    return hashlib.blake2b(
+        text.encode("utf-8", errors="surrogatepass"), digest_size=16
+    ).digest()
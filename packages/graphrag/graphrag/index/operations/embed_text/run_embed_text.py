@@ -44,8 +44,11 @@ async def run_embed_text(
 
     semaphore: asyncio.Semaphore = asyncio.Semaphore(num_threads)
 
+    # Embed each distinct text once, the positions map every input back to it
+    unique_input, positions = _deduplicate_texts(input)
+
     # Break up the input texts. The sizes here indicate how many snippets are in each input text
-    texts, input_sizes = _prepare_embed_texts(input, tokenizer, batch_max_tokens)
+    texts, input_sizes = _prepare_embed_texts(unique_input, tokenizer, batch_max_tokens)
     text_batches = _create_text_batches(
         texts,
         tokenizer,
@@ -53,8 +56,9 @@ async def run_embed_text(
         batch_max_tokens,
     )
     logger.info(
-        "embedding %d inputs via %d snippets using %d batches. max_batch_size=%d, batch_max_tokens=%d",
+        "embedding %d inputs (%d unique) via %d snippets using %d batches. max_batch_size=%d, batch_max_tokens=%d",
         len(input),
+        len(unique_input),
         len(texts),
         len(text_batches),
         batch_size,
@@ -70,7 +74,7 @@ async def run_embed_text(
     embeddings = await _execute(model, text_batches, ticker, semaphore)
     embeddings = _reconstitute_embeddings(embeddings, input_sizes)
 
-    return TextEmbeddingResult(embeddings=embeddings)
+    return TextEmbeddingResult(embeddings=[embeddings[i] for i in positions])
 
 
 async def _execute(
@@ -124,6 +128,13 @@ def _create_text_batches(
     return result
 
 
+def _deduplicate_texts(input: list[str]) -> tuple[list[str], list[int]]:
+    """Collapse identical texts, returning the unique texts and each input's position among them."""
+    unique: dict[str, int] = {}
+    positions = [unique.setdefault(text, len(unique)) for text in input]
+    return list(unique), positions
+
+
 def _prepare_embed_texts(
     input: list[str],
     tokenizer: Tokenizer,
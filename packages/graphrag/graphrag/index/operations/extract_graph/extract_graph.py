@@ -10,8 +10,15 @@ import pandas as pd
 
 from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
 from graphrag.config.enums import AsyncType
+from graphrag.index.operations.extract_graph.graph_claim_extractor import (
+    CLAIM_COLUMNS,
+    GraphClaimExtractor,
+)
 from graphrag.index.operations.extract_graph.graph_extractor import GraphExtractor
-from graphrag.index.operations.extract_graph.utils import filter_orphan_relationships
+from graphrag.index.operations.extract_graph.utils import (
+    filter_orphan_relationships,
+    pack_text_units,
+)
 from graphrag.index.utils.derive_from_rows import derive_from_rows
 
 if TYPE_CHECKING:
@@ -31,8 +38,28 @@ async def extract_graph(
     max_gleanings: int,
     num_threads: int,
     async_type: AsyncType,
+    pack_max_tokens: int = 0,
 ) -> tuple[pd.DataFrame, pd.DataFrame]:
-    """Extract a graph from a piece of text using a language model."""
+    """Extract a graph from a piece of text using a language model.
+
+    With a ``pack_max_tokens`` budget, consecutive short text units share
+    one extraction prompt of up to that many text tokens.
+    """
+    if pack_max_tokens > 0:
+        return await _extract_packed_graph(
+            text_units=text_units,
+            callbacks=callbacks,
+            text_column=text_column,
+            id_column=id_column,
+            model=model,
+            prompt=prompt,
+            entity_types=entity_types,
+            max_gleanings=max_gleanings,
+            num_threads=num_threads,
+            async_type=async_type,
+            pack_max_tokens=pack_max_tokens,
+        )
+
     num_started = 0
 
     async def run_strategy(row):
@@ -73,6 +100,143 @@ async def extract_graph(
     return (entities, relationships)
 
 
+async def _extract_packed_graph(
+    text_units: pd.DataFrame,
+    callbacks: WorkflowCallbacks,
+    text_column: str,
+    id_column: str,
+    model: "LLMCompletion",
+    prompt: str,
+    entity_types: list[str],
+    max_gleanings: int,
+    num_threads: int,
+    async_type: AsyncType,
+    pack_max_tokens: int,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Extract a graph with groups of short text units sharing one prompt each."""
+    texts = [text.strip() for text in text_units[text_column]]
+    ids = text_units[id_column].tolist()
+    groups = pack_text_units(model.tokenizer.num_tokens_batch(texts), pack_max_tokens)
+    packs = pd.DataFrame({
+        "texts": [[texts[i] for i in group] for group in groups],
+        "ids": [[ids[i] for i in group] for group in groups],
+    })
+    logger.info("Packed %d text units into %d extraction prompts", len(ids), len(packs))
+
+    async def run_strategy(row):
+        if len(row["ids"]) == 1:
+            return await _run_extract_graph(
+                text=row["texts"][0],
+                source_id=row["ids"][0],
+                entity_types=entity_types,
+                model=model,
+                prompt=prompt,
+                max_gleanings=max_gleanings,
+            )
+        extractor = GraphExtractor(
+            model=model,
+            prompt=prompt,
+            max_gleanings=max_gleanings,
+            on_error=lambda e, s, d: logger.error(
+                "Entity Extraction Error", exc_info=e, extra={"stack": s, "details": d}
+            ),
+        )
+        return await extractor.extract_packed(
+            row["texts"],
+            entity_types=entity_types,
+            source_ids=row["ids"],
+        )
+
+    results = await derive_from_rows(
+        packs,
+        run_strategy,
+        callbacks,
+        num_threads=num_threads,
+        async_type=async_type,
+        progress_msg="extract graph progress: ",
+    )
+
+    entity_dfs = []
+    relationship_dfs = []
+    for result in results:
+        if result:
+            entity_dfs.append(result[0])
+            relationship_dfs.append(result[1])
+
+    entities = _merge_entities(entity_dfs)
+    relationships = _merge_relationships(relationship_dfs)
+    relationships = filter_orphan_relationships(relationships, entities)
+
+    return (entities, relationships)
+
+
+async def extract_graph_and_claims(
+    text_units: pd.DataFrame,
+    callbacks: WorkflowCallbacks,
+    text_column: str,
+    id_column: str,
+    model: "LLMCompletion",
+    prompt: str,
+    entity_types: list[str],
+    claim_description: str,
+    max_gleanings: int,
+    num_threads: int,
+    async_type: AsyncType,
+) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """Extract a graph and the claims against its entities with one prompt per text unit.
+
+    Returns the merged entities and relationships, as ``extract_graph`` does,
+    and one claim row per extracted claim with its ``text_unit_id``.
+    """
+
+    async def run_strategy(row):
+        extractor = GraphClaimExtractor(
+            model=model,
+            prompt=prompt,
+            max_gleanings=max_gleanings,
+            claim_description=claim_description,
+            on_error=lambda e, s, d: logger.error(
+                "Graph and Claim Extraction Error",
+                exc_info=e,
+                extra={"stack": s, "details": d},
+            ),
+        )
+        return await extractor(
+            row[text_column].strip(),
+            entity_types=entity_types,
+            source_id=row[id_column],
+        )
+
+    results = await derive_from_rows(
+        text_units,
+        run_strategy,
+        callbacks,
+        num_threads=num_threads,
+        async_type=async_type,
+        progress_msg="extract graph and claims progress: ",
+    )
+
+    entity_dfs = []
+    relationship_dfs = []
+    claim_dfs = []
+    for result in results:
+        if result:
+            entity_dfs.append(result[0])
+            relationship_dfs.append(result[1])
+            claim_dfs.append(result[2])
+
+    entities = _merge_entities(entity_dfs)
+    relationships = _merge_relationships(relationship_dfs)
+    relationships = filter_orphan_relationships(relationships, entities)
+    claims = (
+        pd.concat(claim_dfs, ignore_index=True)
+        if claim_dfs
+        else pd.DataFrame(columns=CLAIM_COLUMNS)
+    )
+
+    return (entities, relationships, claims)
+
+
 async def _run_extract_graph(
     text: str,
     source_id: str,
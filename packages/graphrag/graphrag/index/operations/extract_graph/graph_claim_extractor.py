@@ -0,0 +1,120 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Combined graph and claim extraction helpers that return tabular data."""
+
+import logging
+import re
+import traceback
+from typing import TYPE_CHECKING, Any
+
+import pandas as pd
+
+from graphrag.index.operations.extract_graph.graph_extractor import (
+    COMPLETION_DELIMITER,
+    RECORD_DELIMITER,
+    TUPLE_DELIMITER,
+    GraphExtractor,
+)
+from graphrag.index.typing.error_handler import ErrorHandlerFn
+from graphrag.prompts.index.extract_graph_claims import (
+    CONTINUE_PROMPT,
+    LOOP_PROMPT,
+)
+
+if TYPE_CHECKING:
+    from graphrag_llm.completion import LLMCompletion
+
+CLAIM_DESCRIPTION_KEY = "claim_description"
+CLAIM_FIELDS = [
+    "subject_id",
+    "object_id",
+    "type",
+    "status",
+    "start_date",
+    "end_date",
+    "description",
+    "source_text",
+]
+CLAIM_COLUMNS = [*CLAIM_FIELDS, "text_unit_id"]
+
+logger = logging.getLogger(__name__)
+
+
+class GraphClaimExtractor(GraphExtractor):
+    """Extracts entities, relationships and claims in a single completion.
+
+    Uses the same gleaning loop as the graph extractor, and the prompt asks
+    for claim records alongside the entity and relationship records.
+    """
+
+    _claim_description: str
+    _continue_prompt: str = CONTINUE_PROMPT
+    _loop_prompt: str = LOOP_PROMPT
+
+    def __init__(
+        self,
+        model: "LLMCompletion",
+        prompt: str,
+        max_gleanings: int,
+        claim_description: str,
+        on_error: ErrorHandlerFn | None = None,
+    ):
+        """Init method definition."""
+        super().__init__(
+            model=model, prompt=prompt, max_gleanings=max_gleanings, on_error=on_error
+        )
+        self._claim_description = claim_description
+
+    async def __call__(  # type: ignore[override]
+        self, text: str, entity_types: list[str], source_id: str
+    ) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+        """Extract entities, relationships and claims from the supplied text."""
+        try:
+            result = await self._process_document(text, entity_types)
+        except Exception as e:  # pragma: no cover - defensive logging
+            logger.exception("error extracting graph and claims")
+            self._on_error(
+                e,
+                traceback.format_exc(),
+                {
+                    "source_id": source_id,
+                    "text": text,
+                },
+            )
+            entities, relationships = self._process_result(
+                "", source_id, TUPLE_DELIMITER, RECORD_DELIMITER
+            )
+            return entities, relationships, pd.DataFrame(columns=CLAIM_COLUMNS)
+
+        entities, relationships = self._process_result(
+            result,
+            source_id,
+            TUPLE_DELIMITER,
+            RECORD_DELIMITER,
+        )
+        return entities, relationships, self._process_claims(result, source_id)
+
+    def _prompt_variables(self, text: str, entity_types: list[str]) -> dict[str, str]:
+        return {
+            **super()._prompt_variables(text, entity_types),
+            CLAIM_DESCRIPTION_KEY: self._claim_description,
+        }
+
+    def _process_claims(self, result: str, source_id: str) -> pd.DataFrame:
+        """Parse the claim records of the result string into a data frame."""
+        claims: list[dict[str, Any]] = []
+        for raw_record in result.split(RECORD_DELIMITER):
+            record = raw_record.strip().removesuffix(COMPLETION_DELIMITER).strip()
+            record = re.sub(r"^\(|\)$", "", record)
+            record_attributes = record.split(TUPLE_DELIMITER)
+            if record_attributes[0] != '"claim"' or len(record_attributes) < 3:
+                continue
+
+            values = [value.strip() for value in record_attributes[1:]]
+            claim: dict[str, Any] = dict.fromkeys(CLAIM_FIELDS)
+            claim.update(zip(CLAIM_FIELDS, values, strict=False))
+            claim["text_unit_id"] = source_id
+            claims.append(claim)
+
+        return pd.DataFrame(claims, columns=CLAIM_COLUMNS)
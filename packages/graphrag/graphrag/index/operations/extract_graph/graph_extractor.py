@@ -17,7 +17,9 @@ from graphrag.index.typing.error_handler import ErrorHandlerFn
 from graphrag.index.utils.string import clean_str
 from graphrag.prompts.index.extract_graph import (
     CONTINUE_PROMPT,
+    DOCUMENT_HEADER,
     LOOP_PROMPT,
+    PACKED_TEXT_PROMPT,
 )
 
 if TYPE_CHECKING:
@@ -31,6 +33,7 @@ ENTITY_TYPES_KEY = "entity_types"
 TUPLE_DELIMITER = "<|>"
 RECORD_DELIMITER = "##"
 COMPLETION_DELIMITER = "<|COMPLETE|>"
+_DOCUMENT_RECORD = re.compile(r'\(\s*"?document"?\s*<\|>\s*(\d+)\s*\)', re.IGNORECASE)
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +45,8 @@ class GraphExtractor:
     _extraction_prompt: str
     _max_gleanings: int
     _on_error: ErrorHandlerFn
+    _continue_prompt: str = CONTINUE_PROMPT
+    _loop_prompt: str = LOOP_PROMPT
 
     def __init__(
         self,
@@ -82,37 +87,73 @@ class GraphExtractor:
             RECORD_DELIMITER,
         )
 
+    async def extract_packed(
+        self, texts: list[str], entity_types: list[str], source_ids: list[str]
+    ) -> tuple[pd.DataFrame, pd.DataFrame]:
+        """Extract entities and relationships from several short texts with one prompt.
+
+        The texts are numbered in the prompt, and the model opens the records
+        of each text with a ("document"<|><number>) record, so every entity and
+        relationship keeps the id of the text unit it was extracted from.
+        """
+        text = PACKED_TEXT_PROMPT + "\n\n".join(
+            f"{DOCUMENT_HEADER.format(document_number=i)}\n{text}"
+            for i, text in enumerate(texts, start=1)
+        )
+        try:
+            turns = await self._complete_turns(text, entity_types)
+        except Exception as e:  # pragma: no cover - defensive logging
+            logger.exception("error extracting graph")
+            self._on_error(
+                e,
+                traceback.format_exc(),
+                {
+                    "source_id": source_ids,
+                    "text": text,
+                },
+            )
+            return _empty_entities_df(), _empty_relationships_df()
+
+        return self._process_packed_result(turns, texts, source_ids)
+
+    def _prompt_variables(self, text: str, entity_types: list[str]) -> dict[str, str]:
+        return {
+            INPUT_TEXT_KEY: text,
+            ENTITY_TYPES_KEY: ",".join(entity_types),
+        }
+
     async def _process_document(self, text: str, entity_types: list[str]) -> str:
+        return RECORD_DELIMITER.join(await self._complete_turns(text, entity_types))
+
+    async def _complete_turns(self, text: str, entity_types: list[str]) -> list[str]:
+        """Run the extraction and its gleanings, returning each model response."""
         messages_builder = CompletionMessagesBuilder().add_user_message(
-            self._extraction_prompt.format(**{
-                INPUT_TEXT_KEY: text,
-                ENTITY_TYPES_KEY: ",".join(entity_types),
-            })
+            self._extraction_prompt.format(**self._prompt_variables(text, entity_types))
         )
 
         response: LLMCompletionResponse = await self._model.completion_async(
             messages=messages_builder.build(),
         )  # type: ignore
-        results = response.content
-        messages_builder.add_assistant_message(results)
+        results = [response.content]
+        messages_builder.add_assistant_message(response.content)
 
         # if gleanings are specified, enter a loop to extract more entities
         # there are two exit criteria: (a) we hit the configured max, (b) the model says there are no more entities
         if self._max_gleanings > 0:
             for i in range(self._max_gleanings):
-                messages_builder.add_user_message(CONTINUE_PROMPT)
+                messages_builder.add_user_message(self._continue_prompt)
                 response: LLMCompletionResponse = await self._model.completion_async(
                     messages=messages_builder.build(),
                 )  # type: ignore
                 response_text = response.content
                 messages_builder.add_assistant_message(response_text)
-                results += response_text
+                results.append(response_text)
 
                 # if this is the final glean, don't bother updating the continuation flag
                 if i >= self._max_gleanings - 1:
                     break
 
-                messages_builder.add_user_message(LOOP_PROMPT)
+                messages_builder.add_user_message(self._loop_prompt)
                 response: LLMCompletionResponse = await self._model.completion_async(
                     messages=messages_builder.build(),
                 )  # type: ignore
@@ -135,8 +176,9 @@ class GraphExtractor:
         records = [r.strip() for r in result.split(record_delimiter)]
 
         for raw_record in records:
-            record = re.sub(r"^\(|\)$", "", raw_record.strip())
-            if not record or record == COMPLETION_DELIMITER:
+            record = raw_record.strip().removesuffix(COMPLETION_DELIMITER).strip()
+            record = re.sub(r"^\(|\)$", "", record)
+            if not record:
                 continue
 
             record_attributes = record.split(tuple_delimiter)
@@ -177,6 +219,103 @@ class GraphExtractor:
 
         return entities_df, relationships_df
 
+    def _process_packed_result(
+        self, turns: list[str], texts: list[str], source_ids: list[str]
+    ) -> tuple[pd.DataFrame, pd.DataFrame]:
+        """Split each model response by its document records and parse each part.
+
+        Responses are split separately, so records a gleaning sends before
+        reopening a document are attributed by mention rather than to the last
+        document of the previous response.
+        """
+        documents: list[list[str]] = [[] for _ in source_ids]
+        unattributed: list[str] = []
+        for turn in turns:
+            # splits into the text before the first document record, then
+            # alternating document numbers and the records that follow them
+            parts = _DOCUMENT_RECORD.split(turn)
+            unattributed.append(parts[0])
+            for number, records in zip(parts[1::2], parts[2::2], strict=True):
+                if 0 < int(number) <= len(documents):
+                    documents[int(number) - 1].append(records)
+                else:
+                    unattributed.append(records)
+
+        results = [
+            self._process_result(
+                RECORD_DELIMITER.join(records),
+                source_id,
+                TUPLE_DELIMITER,
+                RECORD_DELIMITER,
+            )
+            for source_id, records in zip(source_ids, documents, strict=True)
+        ]
+        if any(records.strip() for records in unattributed):
+            entities, relationships = self._process_result(
+                RECORD_DELIMITER.join(unattributed),
+                "",
+                TUPLE_DELIMITER,
+                RECORD_DELIMITER,
+            )
+            results.append(
+                _attribute_by_mention(entities, relationships, texts, source_ids)
+            )
+
+        entity_dfs = [entities for entities, _ in results if not entities.empty]
+        relationship_dfs = [
+            relationships for _, relationships in results if not relationships.empty
+        ]
+        return (
+            pd.concat(entity_dfs, ignore_index=True)
+            if entity_dfs
+            else _empty_entities_df(),
+            pd.concat(relationship_dfs, ignore_index=True)
+            if relationship_dfs
+            else _empty_relationships_df(),
+        )
+
+
+def _attribute_by_mention(
+    entities: pd.DataFrame,
+    relationships: pd.DataFrame,
+    texts: list[str],
+    source_ids: list[str],
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Attribute records outside of any document to the texts that mention them.
+
+    Names only match whole words, so "AI" is not found in "SAID". Records
+    that no text mentions are dropped rather than guessed.
+    """
+    upper_texts = [text.upper() for text in texts]
+
+    def mentioned_in(*names: str) -> list[str]:
+        patterns = [re.compile(rf"(?<!\w){re.escape(name)}(?!\w)") for name in names]
+        return [
+            source_id
+            for source_id, text in zip(source_ids, upper_texts, strict=True)
+            if all(pattern.search(text) for pattern in patterns)
+        ]
+
+    entities["source_id"] = [mentioned_in(title) for title in entities["title"]]
+    relationships["source_id"] = [
+        mentioned_in(source, target)
+        for source, target in zip(
+            relationships["source"], relationships["target"], strict=True
+        )
+    ]
+    dropped_entities = sum(not ids for ids in entities["source_id"])
+    dropped_relationships = sum(not ids for ids in relationships["source_id"])
+    if dropped_entities or dropped_relationships:
+        logger.warning(
+            "Dropped %d entities and %d relationships that could not be attributed to a text unit",
+            dropped_entities,
+            dropped_relationships,
+        )
+    return (
+        entities.explode("source_id").dropna(subset=["source_id"]),
+        relationships.explode("source_id").dropna(subset=["source_id"]),
+    )
+
 
 def _empty_entities_df() -> pd.DataFrame:
     return pd.DataFrame(columns=["title", "type", "description", "source_id"])
@@ -51,3 +51,33 @@ def filter_orphan_relationships(
             dropped,
         )
     return filtered
+
+
+def pack_text_units(token_counts: list[int], max_tokens: int) -> list[list[int]]:
+    """Group consecutive short text units so each group shares one extraction prompt.
+
+    Parameters
+    ----------
+    token_counts:
+        The number of tokens of each text unit, in order.
+    max_tokens:
+        The maximum number of text tokens per group. Text units at
+        least this long are always extracted on their own.
+
+    Returns
+    -------
+    list[list[int]]
+        The positions of the text units in each group, in order.
+    """
+    groups: list[list[int]] = []
+    group: list[int] = []
+    group_tokens = 0
+    for i, tokens in enumerate(token_counts):
+        if group and group_tokens + tokens > max_tokens:
+            groups.append(group)
+            group, group_tokens = [], 0
+        group.append(i)
+        group_tokens += tokens
+    if group:
+        groups.append(group)
+    return groups
@@ -10,6 +10,7 @@ import graphrag.data_model.schemas as schemas
 from graphrag.index.operations.summarize_communities.graph_context.sort_context import (
     sort_context,
 )
+from graphrag.index.operations.summarize_communities.utils import count_row_tokens
 
 
 def build_mixed_context(
@@ -51,24 +52,47 @@ def build_mixed_context(
                 tokenizer=tokenizer,
                 sub_community_reports=substitute_reports,
             )
-            if tokenizer.num_tokens(new_context_string) <= max_context_tokens:
+            if (
+                tokenizer.num_tokens(new_context_string, cache=False)
+                <= max_context_tokens
+            ):
                 exceeded_limit = False
                 context_string = new_context_string
                 break
 
     if exceeded_limit:
         # if all sub-community reports exceed the limit, we add reports until context is full
-        substitute_reports = []
-        for sub_community_context in sorted_context:
-            substitute_reports.append({
+        substitute_reports = [
+            {
                 schemas.COMMUNITY_ID: sub_community_context[schemas.SUB_COMMUNITY],
                 schemas.FULL_CONTENT: sub_community_context[schemas.FULL_CONTENT],
-            })
-            new_context_string = pd.DataFrame(substitute_reports).to_csv(
-                index=False, sep=","
-            )
-            if tokenizer.num_tokens(new_context_string) > max_context_tokens:
+            }
+            for sub_community_context in sorted_context
+        ]
+        # count each report once and keep a running total, rather than
+        # re-tokenizing the growing table after every report
+        total_tokens = tokenizer.num_tokens(
+            f"{schemas.COMMUNITY_ID},{schemas.FULL_CONTENT}\n"
+        )
+        report_count = 0
+        for tokens in count_row_tokens(substitute_reports, tokenizer):
+            total_tokens += tokens
+            if total_tokens > max_context_tokens:
                 break
+            report_count += 1
 
-            context_string = new_context_string
+        # the running total is an estimate, so check the final context once
+        context_string = _reports_csv(substitute_reports[:report_count])
+        while (
+            report_count > 0
+            and tokenizer.num_tokens(context_string, cache=False) > max_context_tokens
+        ):
+            report_count -= 1
+            context_string = _reports_csv(substitute_reports[:report_count])
     return context_string
+
+
+def _reports_csv(reports: list[dict]) -> str:
+    if not reports:
+        return ""
+    return pd.DataFrame(reports).to_csv(index=False, sep=",")
@@ -230,9 +230,9 @@ def build_level_context(
         invalid_context_df.loc[:, schemas.CONTEXT_STRING] = _sort_and_trim_context(
             invalid_context_df, tokenizer, max_context_tokens
         )
-        invalid_context_df[schemas.CONTEXT_SIZE] = invalid_context_df.loc[
-            :, schemas.CONTEXT_STRING
-        ].map(tokenizer.num_tokens)
+        invalid_context_df[schemas.CONTEXT_SIZE] = tokenizer.num_tokens_batch(
+            invalid_context_df[schemas.CONTEXT_STRING].tolist(), cache=False
+        )
         invalid_context_df[schemas.CONTEXT_EXCEED_FLAG] = False
         return union(valid_context_df, invalid_context_df)
 
@@ -258,8 +258,8 @@ def build_level_context(
     )
 
     result = union(valid_context_df, community_df, remaining_df)
-    result[schemas.CONTEXT_SIZE] = result.loc[:, schemas.CONTEXT_STRING].map(
-        tokenizer.num_tokens
+    result[schemas.CONTEXT_SIZE] = tokenizer.num_tokens_batch(
+        result[schemas.CONTEXT_STRING].tolist(), cache=False
     )
 
     result[schemas.CONTEXT_EXCEED_FLAG] = False
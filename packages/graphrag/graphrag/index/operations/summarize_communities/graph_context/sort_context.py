@@ -6,6 +6,7 @@ import pandas as pd
 from graphrag_llm.tokenizer import Tokenizer
 
 import graphrag.data_model.schemas as schemas
+from graphrag.index.operations.summarize_communities.utils import count_row_tokens
 
 
 def sort_context(
@@ -82,12 +83,40 @@ def sort_context(
     # Sort edges by degree (desc) and ID (asc)
     edges.sort(key=lambda x: (-x.get(edge_degree_column, 0), x.get(edge_id_column, "")))
 
+    # Count each record's tokens once and keep a running total, rather than
+    # re-tokenizing the growing context string after every edge
+    if max_context_tokens:
+        nodes = list(node_details.values())
+        claims = [claim for claims in claim_details.values() for claim in claims]
+        node_tokens = dict(
+            zip(
+                (node[schemas.SHORT_ID] for node in nodes),
+                count_row_tokens(nodes, tokenizer),
+                strict=True,
+            )
+        )
+        claim_tokens = dict(
+            zip(
+                (claim[schemas.SHORT_ID] for claim in claims),
+                count_row_tokens(claims, tokenizer),
+                strict=True,
+            )
+        )
+        edge_tokens = count_row_tokens(edges, tokenizer)
+        total_tokens = tokenizer.num_tokens(
+            _get_context_string([], [], [], sub_community_reports), cache=False
+        )
+
+    def _header_tokens(label: str, record: dict) -> int:
+        return tokenizer.num_tokens(f"\n\n-----{label}-----\n{','.join(record)}\n")
+
     # Deduplicate and build context incrementally
     edge_ids, nodes_ids, claims_ids = set(), set(), set()
     sorted_edges, sorted_nodes, sorted_claims = [], [], []
-    context_string = ""
+    # the number of nodes, edges and claims in the context after each edge
+    steps: list[tuple[int, int, int]] = []
 
-    for edge in edges:
+    for edge_index, edge in enumerate(edges):
         source, target = edge[edge_source_column], edge[edge_target_column]
 
         # Add source and target node details
@@ -95,6 +124,10 @@ def sort_context(
             if node and node[schemas.SHORT_ID] not in nodes_ids:
                 nodes_ids.add(node[schemas.SHORT_ID])
                 sorted_nodes.append(node)
+                if max_context_tokens:
+                    if len(sorted_nodes) == 1:
+                        total_tokens += _header_tokens("Entities", node)
+                    total_tokens += node_tokens[node[schemas.SHORT_ID]]
 
         # Add claims related to source and target
         for claims in [claim_details.get(source), claim_details.get(target)]:
@@ -103,27 +136,47 @@ def sort_context(
                     if claim[schemas.SHORT_ID] not in claims_ids:
                         claims_ids.add(claim[schemas.SHORT_ID])
                         sorted_claims.append(claim)
+                        if max_context_tokens:
+                            if len(sorted_claims) == 1:
+                                total_tokens += _header_tokens("Claims", claim)
+                            total_tokens += claim_tokens[claim[schemas.SHORT_ID]]
 
         # Add the edge
         if edge[schemas.SHORT_ID] not in edge_ids:
             edge_ids.add(edge[schemas.SHORT_ID])
             sorted_edges.append(edge)
-
-        # Generate new context string
-        new_context_string = _get_context_string(
-            sorted_nodes, sorted_edges, sorted_claims, sub_community_reports
-        )
-        if (
-            max_context_tokens
-            and tokenizer.num_tokens(new_context_string) > max_context_tokens
-        ):
+            if max_context_tokens:
+                if len(sorted_edges) == 1:
+                    total_tokens += _header_tokens("Relationships", edge)
+                total_tokens += edge_tokens[edge_index]
+
+        step = (len(sorted_nodes), len(sorted_edges), len(sorted_claims))
+        if max_context_tokens and total_tokens > max_context_tokens:
+            # the first edge is kept even if it does not fit
+            if not steps:
+                steps.append(step)
             break
-        context_string = new_context_string
+        steps.append(step)
+
+    def _context_at(step: tuple[int, int, int]) -> str:
+        node_count, edge_count, claim_count = step
+        return _get_context_string(
+            sorted_nodes[:node_count],
+            sorted_edges[:edge_count],
+            sorted_claims[:claim_count],
+            sub_community_reports,
+        )
 
-    # Return the final context string
-    return context_string or _get_context_string(
-        sorted_nodes, sorted_edges, sorted_claims, sub_community_reports
-    )
+    context_string = _context_at(steps[-1] if steps else (0, 0, 0))
+    # the running total is an estimate, so check the final context once
+    while (
+        max_context_tokens
+        and len(steps) > 1
+        and tokenizer.num_tokens(context_string, cache=False) > max_context_tokens
+    ):
+        steps.pop()
+        context_string = _context_at(steps[-1])
+    return context_string
 
 
 def parallel_sort_context_batch(
@@ -154,8 +207,8 @@ def parallel_sort_context_batch(
         )
 
     # Calculate other columns
-    community_df[schemas.CONTEXT_SIZE] = community_df[schemas.CONTEXT_STRING].apply(
-        tokenizer.num_tokens
+    community_df[schemas.CONTEXT_SIZE] = tokenizer.num_tokens_batch(
+        community_df[schemas.CONTEXT_STRING].tolist(), cache=False
     )
     community_df[schemas.CONTEXT_EXCEED_FLAG] = (
         community_df[schemas.CONTEXT_SIZE] > max_context_tokens
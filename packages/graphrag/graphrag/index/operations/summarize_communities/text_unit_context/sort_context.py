@@ -9,6 +9,7 @@ import pandas as pd
 from graphrag_llm.tokenizer import Tokenizer
 
 import graphrag.data_model.schemas as schemas
+from graphrag.index.operations.summarize_communities.utils import count_row_tokens
 
 logger = logging.getLogger(__name__)
 
@@ -66,20 +67,42 @@ def sort_context(
         local_context, key=lambda x: x[schemas.ENTITY_DEGREE], reverse=True
     )
 
-    current_text_units = []
-    context_string = ""
-    for record in sorted_text_units:
-        current_text_units.append(record)
-        if max_context_tokens:
-            new_context_string = get_context_string(
-                current_text_units, sub_community_reports
+    if not max_context_tokens:
+        return get_context_string(sorted_text_units, sub_community_reports)
+
+    # Count each text unit's tokens once and keep a running total, rather than
+    # re-tokenizing the growing context string after every text unit
+    row_tokens = count_row_tokens(sorted_text_units, tokenizer)
+    total_tokens = tokenizer.num_tokens(
+        get_context_string([], sub_community_reports), cache=False
+    )
+    fitting_count = 0
+    for count, (record, tokens) in enumerate(
+        zip(sorted_text_units, row_tokens, strict=True), start=1
+    ):
+        if count == 1:
+            total_tokens += tokenizer.num_tokens(
+                f"\n\n-----SOURCES-----\n{','.join(record)}\n"
             )
-            if tokenizer.num_tokens(new_context_string) > max_context_tokens:
-                break
+        total_tokens += tokens
+        if total_tokens > max_context_tokens:
+            break
+        fitting_count = count
 
-            context_string = new_context_string
+    # the running total is an estimate, so check the final context once
+    context_string = get_context_string(
+        sorted_text_units[:fitting_count], sub_community_reports
+    )
+    while (
+        fitting_count > 0
+        and tokenizer.num_tokens(context_string, cache=False) > max_context_tokens
+    ):
+        fitting_count -= 1
+        context_string = get_context_string(
+            sorted_text_units[:fitting_count], sub_community_reports
+        )
 
-    if context_string == "":
+    if fitting_count == 0:
         return get_context_string(sorted_text_units, sub_community_reports)
 
     return context_string
@@ -3,7 +3,11 @@
 
 """A module containing community report generation utilities."""
 
+import csv
+import io
+
 import pandas as pd
+from graphrag_llm.tokenizer import Tokenizer
 
 import graphrag.data_model.schemas as schemas
 
@@ -15,3 +19,21 @@ def get_levels(
     levels = df[level_column].dropna().unique()
     levels = [int(lvl) for lvl in levels if lvl != -1]
     return sorted(levels, reverse=True)
+
+
+def count_row_tokens(records: list[dict], tokenizer: Tokenizer) -> list[int]:
+    """Count the tokens each record adds as a row of a CSV context table.
+
+    Context builders keep a running sum of these counts rather than counting
+    the whole context again after every record. The rows are one-off strings,
+    so they are counted without the shared token count cache.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    rows = []
+    for record in records:
+        writer.writerow(record.values())
+        rows.append(buffer.getvalue())
+        buffer.seek(0)
+        buffer.truncate()
+    return tokenizer.num_tokens_batch(rows, cache=False)
@@ -4,19 +4,26 @@
 """A module containing 'SummarizationResult' and 'SummarizeExtractor' models."""
 
 import json
+import logging
+import traceback
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
+from pydantic import BaseModel, Field
+
 from graphrag.index.typing.error_handler import ErrorHandlerFn
 
 if TYPE_CHECKING:
     from graphrag_llm.completion import LLMCompletion
     from graphrag_llm.types import LLMCompletionResponse
 
+logger = logging.getLogger(__name__)
+
 # these tokens are used in the prompt
 ENTITY_NAME_KEY = "entity_name"
 DESCRIPTION_LIST_KEY = "description_list"
 MAX_LENGTH_KEY = "max_length"
+INPUT_ITEMS_KEY = "input_items"
 
 
 @dataclass
@@ -27,6 +34,19 @@ class SummarizationResult:
     description: str
 
 
+class SummaryModel(BaseModel):
+    """A model for the expected LLM response shape."""
+
+    id: int = Field(description="The id of the summarized item.")
+    description: str = Field(description="The summary of the item's descriptions.")
+
+
+class BatchSummaryResponse(BaseModel):
+    """A model for the expected LLM response shape."""
+
+    summaries: list[SummaryModel] = Field(description="One summary per item.")
+
+
 class SummarizeExtractor:
     """Unipartite graph extractor class definition."""
 
@@ -93,8 +113,9 @@ class SummarizeExtractor:
         descriptions_collected = []
         result = ""
 
+        description_tokens = self._tokenizer.num_tokens_batch(descriptions)
         for i, description in enumerate(descriptions):
-            usable_tokens -= self._tokenizer.num_tokens(description)
+            usable_tokens -= description_tokens[i]
             descriptions_collected.append(description)
 
             # If buffer is full, or all descriptions have been added, summarize
@@ -132,3 +153,67 @@ class SummarizeExtractor:
         )  # type: ignore
         # Calculate result
         return response.content
+
+
+class BatchSummarizeExtractor:
+    """Summarizes the descriptions of several entities or relationships in one request."""
+
+    _model: "LLMCompletion"
+    _summarization_prompt: str
+    _on_error: ErrorHandlerFn
+    _max_summary_length: int
+
+    def __init__(
+        self,
+        model: "LLMCompletion",
+        max_summary_length: int,
+        summarization_prompt: str,
+        on_error: ErrorHandlerFn | None = None,
+    ):
+        """Init method definition."""
+        self._model = model
+        self._summarization_prompt = summarization_prompt
+        self._on_error = on_error or (lambda _e, _s, _d: None)
+        self._max_summary_length = max_summary_length
+
+    async def __call__(
+        self,
+        items: list[tuple[str | tuple[str, str], list[str]]],
+    ) -> list[SummarizationResult | None]:
+        """Call method definition.
+
+        Items are numbered in the prompt and the summaries are mapped back by
+        that number. Items the response has no summary for come back as None.
+        """
+        output = None
+        try:
+            prompt = self._summarization_prompt.format(**{
+                INPUT_ITEMS_KEY: json.dumps(
+                    [
+                        {"id": i, "entities": id, "descriptions": sorted(descriptions)}
+                        for i, (id, descriptions) in enumerate(items)
+                    ],
+                    ensure_ascii=False,
+                ),
+                MAX_LENGTH_KEY: self._max_summary_length,
+            })
+            response = await self._model.completion_async(
+                messages=prompt,
+                response_format=BatchSummaryResponse,
+            )
+            output = response.formatted_response  # type: ignore
+        except Exception as e:
+            logger.exception("error generating batched description summaries")
+            self._on_error(e, traceback.format_exc(), None)
+
+        summaries = (
+            {summary.id: summary.description for summary in output.summaries}
+            if output
+            else {}
+        )
+        return [
+            SummarizationResult(id=id, description=summaries[i])
+            if summaries.get(i)
+            else None
+            for i, (id, _) in enumerate(items)
+        ]
@@ -5,24 +5,29 @@
 
 import asyncio
 import logging
+from collections.abc import Iterable, Iterator
 from typing import TYPE_CHECKING
 
 import pandas as pd
 
 from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
 from graphrag.index.operations.summarize_descriptions.description_summary_extractor import (
+    BatchSummarizeExtractor,
     SummarizeExtractor,
 )
 from graphrag.index.operations.summarize_descriptions.typing import (
     SummarizedDescriptionResult,
 )
-from graphrag.logger.progress import ProgressTicker, progress_ticker
+from graphrag.logger.progress import progress_ticker
 
 if TYPE_CHECKING:
     from graphrag_llm.completion import LLMCompletion
+    from graphrag_llm.tokenizer import Tokenizer
 
 logger = logging.getLogger(__name__)
 
+_SummarizeItem = tuple[str | tuple[str, str], list[str]]
+
 
 async def summarize_descriptions(
     entities_df: pd.DataFrame,
@@ -33,86 +38,146 @@ async def summarize_descriptions(
     max_input_tokens: int,
     prompt: str,
     num_threads: int,
+    batch_prompt: str | None = None,
+    batch_max_tokens: int = 0,
 ) -> tuple[pd.DataFrame, pd.DataFrame]:
-    """Summarize entity and relationship descriptions from an entity graph, using a language model."""
-
-    async def get_summarized(
-        nodes: pd.DataFrame, edges: pd.DataFrame, semaphore: asyncio.Semaphore
-    ):
-        ticker_length = len(nodes) + len(edges)
+    """Summarize entity and relationship descriptions from an entity graph, using a language model.
+
+    Entities and relationships are fed through one bounded queue to
+    ``num_threads`` workers, so the model is kept busy from the first entity
+    to the last relationship and only a few pending items exist at a time.
+
+    With a ``batch_max_tokens`` budget, the descriptions of several entities
+    and relationships are packed into one ``batch_prompt`` request, since most
+    of them only have a few short descriptions to merge.
+    """
+    ticker = progress_ticker(
+        callbacks.progress,
+        len(entities_df) + len(relationships_df),
+        description="Summarize entity/relationship description progress: ",
+    )
+    node_descriptions: list[dict[str, str]] = []
+    edge_descriptions: list[dict[str, str]] = []
+    queue: asyncio.Queue[_SummarizeItem | list[_SummarizeItem] | None] = asyncio.Queue(
+        maxsize=num_threads * 2
+    )
 
-        ticker = progress_ticker(
-            callbacks.progress,
-            ticker_length,
-            description="Summarize entity/relationship description progress: ",
+    async def produce() -> None:
+        items: Iterable[_SummarizeItem | list[_SummarizeItem]] = _summarize_items(
+            entities_df, relationships_df
         )
-
-        node_futures = [
-            do_summarize_descriptions(
-                str(row.title),  # type: ignore
-                sorted(set(row.description)),  # type: ignore
-                ticker,
-                semaphore,
-            )
-            for row in nodes.itertuples(index=False)
-        ]
-
-        node_results = await asyncio.gather(*node_futures)
-
-        node_descriptions = [
-            {
-                "title": result.id,
-                "description": result.description,
-            }
-            for result in node_results
-        ]
-
-        edge_futures = [
-            do_summarize_descriptions(
-                (str(row.source), str(row.target)),  # type: ignore
-                sorted(set(row.description)),  # type: ignore
-                ticker,
-                semaphore,
+        if batch_prompt and batch_max_tokens > 0:
+            items = _pack_items(
+                items, model.tokenizer, batch_max_tokens, max_input_tokens
             )
-            for row in edges.itertuples(index=False)
-        ]
-
-        edge_results = await asyncio.gather(*edge_futures)
-
-        edge_descriptions = [
-            {
-                "source": result.id[0],
-                "target": result.id[1],
-                "description": result.description,
-            }
-            for result in edge_results
-        ]
-
-        entity_descriptions = pd.DataFrame(node_descriptions)
-        relationship_descriptions = pd.DataFrame(edge_descriptions)
-        return entity_descriptions, relationship_descriptions
-
-    async def do_summarize_descriptions(
-        id: str | tuple[str, str],
-        descriptions: list[str],
-        ticker: ProgressTicker,
-        semaphore: asyncio.Semaphore,
-    ):
-        async with semaphore:
-            results = await run_summarize_descriptions(
-                id,
-                descriptions,
-                model,
-                max_summary_length,
-                max_input_tokens,
-                prompt,
-            )
-            ticker(1)
-        return results
+        for item in items:
+            await queue.put(item)
+        for _ in range(num_threads):
+            await queue.put(None)
+
+    async def work() -> None:
+        while (item := await queue.get()) is not None:
+            if isinstance(item, list):
+                results = await run_batch_summarize_descriptions(
+                    item,
+                    model,
+                    max_summary_length,
+                    max_input_tokens,
+                    prompt,
+                    batch_prompt,  # type: ignore
+                )
+            else:
+                results = [
+                    await run_summarize_descriptions(
+                        item[0],
+                        item[1],
+                        model,
+                        max_summary_length,
+                        max_input_tokens,
+                        prompt,
+                    )
+                ]
+            for result in results:
+                _collect_result(result, node_descriptions, edge_descriptions)
+            ticker(len(results))
+
+    tasks = [
+        asyncio.create_task(produce()),
+        *(asyncio.create_task(work()) for _ in range(num_threads)),
+    ]
+    try:
+        await asyncio.gather(*tasks)
+    finally:
+        # on failure, stop the remaining workers instead of draining the queue
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    entity_descriptions = pd.DataFrame(
+        node_descriptions, columns=["title", "description"]
+    )
+    relationship_descriptions = pd.DataFrame(
+        edge_descriptions, columns=["source", "target", "description"]
+    )
+    return entity_descriptions, relationship_descriptions
+
 
-    semaphore = asyncio.Semaphore(num_threads)
+def _summarize_items(
+    nodes: pd.DataFrame, edges: pd.DataFrame
+) -> Iterator[_SummarizeItem]:
+    """Yield the id and sorted unique descriptions of every node, then every edge."""
+    for row in nodes.itertuples(index=False):
+        yield str(row.title), sorted(set(row.description))  # type: ignore
+    for row in edges.itertuples(index=False):
+        yield (str(row.source), str(row.target)), sorted(set(row.description))  # type: ignore
 
-    return await get_summarized(entities_df, relationships_df, semaphore)
+
+def _pack_items(
+    items: Iterable[_SummarizeItem],
+    tokenizer: "Tokenizer",
+    max_tokens: int,
+    max_input_tokens: int,
+) -> Iterator[_SummarizeItem | list[_SummarizeItem]]:
+    """Pack the items that need a summary into batches of up to max_tokens of descriptions.
+
+    Items with a single description need no request, and items too large to
+    share a request are summarized on their own.
+    """
+    batch: list[_SummarizeItem] = []
+    batch_tokens = 0
+    for item in items:
+        if len(item[1]) < 2:
+            yield item
+            continue
+        tokens = sum(tokenizer.num_tokens_batch(item[1]))
+        if tokens > min(max_tokens, max_input_tokens):
+            yield item
+            continue
+        if batch_tokens + tokens > max_tokens:
+            yield batch if len(batch) > 1 else batch[0]
+            batch, batch_tokens = [], 0
+        batch.append(item)
+        batch_tokens += tokens
+    if batch:
+        yield batch if len(batch) > 1 else batch[0]
+
+
+def _collect_result(
+    result: SummarizedDescriptionResult,
+    node_descriptions: list[dict[str, str]],
+    edge_descriptions: list[dict[str, str]],
+) -> None:
+    if isinstance(result.id, tuple):
+        edge_descriptions.append({
+            "source": result.id[0],
+            "target": result.id[1],
+            "description": result.description,
+        })
+    else:
+        node_descriptions.append({
+            "title": result.id,
+            "description": result.description,
+        })
 
 
 async def run_summarize_descriptions(
@@ -138,3 +203,49 @@ async def run_summarize_descriptions(
 
     result = await extractor(id=id, descriptions=descriptions)
     return SummarizedDescriptionResult(id=result.id, description=result.description)
+
+
+async def run_batch_summarize_descriptions(
+    items: list[_SummarizeItem],
+    model: "LLMCompletion",
+    max_summary_length: int,
+    max_input_tokens: int,
+    prompt: str,
+    batch_prompt: str,
+) -> list[SummarizedDescriptionResult]:
+    """Summarize several entities or relationships in one request.
+
+    Items the response has no summary for are summarized on their own.
+    """
+    extractor = BatchSummarizeExtractor(
+        model=model,
+        summarization_prompt=batch_prompt,
+        on_error=lambda e, stack, details: logger.error(
+            "Batched Summarization Error",
+            exc_info=e,
+            extra={"stack": stack, "details": details},
+        ),
+        max_summary_length=max_summary_length,
+    )
+
+    results = await extractor(items)
+    summarized = []
+    for (id, descriptions), result in zip(items, results, strict=True):
+        if result is None:
+            summarized.append(
+                await run_summarize_descriptions(
+                    id,
+                    descriptions,
+                    model,
+                    max_summary_length,
+                    max_input_tokens,
+                    prompt,
+                )
+            )
+        else:
+            summarized.append(
+                SummarizedDescriptionResult(
+                    id=result.id, description=result.description
+                )
+            )
+    return summarized
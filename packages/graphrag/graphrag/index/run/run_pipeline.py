@@ -128,7 +128,11 @@ async def _run_pipeline(
         await _dump_context_json(context)
 
         logger.info("Executing pipeline...")
+        run_only: list[str] | None = None
         for name, workflow_function in pipeline.run():
+            if run_only is not None and name not in run_only:
+                logger.info("Skipping workflow %s at workflow request", name)
+                continue
             last_workflow = name
             context.callbacks.workflow_start(name, None)
 
@@ -144,6 +148,8 @@ async def _run_pipeline(
             if result.stop:
                 logger.info("Halting pipeline at workflow request")
                 break
+            if result.run_only is not None:
+                run_only = result.run_only
 
         context.stats.total_runtime = time.time() - start_time
         logger.info("Indexing pipeline complete.")
@@ -183,7 +189,5 @@ async def _copy_previous_output(
     output_table_provider: TableProvider,
     previous_table_provider: TableProvider,
 ) -> None:
-    """Copy all parquet tables from output to previous storage for backup."""
-    for table_name in output_table_provider.list():
-        table = await output_table_provider.read_dataframe(table_name)
-        await previous_table_provider.write_dataframe(table_name, table)
+    """Copy all tables from output to previous storage for backup."""
+    await output_table_provider.copy_to(previous_table_provider)
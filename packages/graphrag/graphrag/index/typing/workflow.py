@@ -19,6 +19,8 @@ class WorkflowFunctionOutput:
     """The result of the workflow function. This can be anything - we use it only for logging downstream, and expect each workflow function to write official outputs to the provided storage."""
     stop: bool = False
     """Flag to indicate if the workflow should stop after this function. This should only be used when continuation could cause an unstable failure."""
+    run_only: list[str] | None = None
+    """Names of the remaining workflows to run after this function; any others are skipped. None runs the rest of the pipeline."""
 
 
 WorkflowFunction = Callable[
@@ -149,3 +149,102 @@ def _update_and_merge_community_reports(
     ]
 
     return merged_community_reports.loc[:, COMMUNITY_REPORTS_FINAL_COLUMNS]
+
+
+def _get_starting_communities(
+    old_communities: pd.DataFrame,
+    entities: pd.DataFrame,
+) -> dict[str, int]:
+    """Map entity titles to their previous top-level community.
+
+    Parameters
+    ----------
+    old_communities : pd.DataFrame
+        The old communities.
+    entities : pd.DataFrame
+        The merged entities, used to resolve entity ids to titles.
+
+    Returns
+    -------
+    dict[str, int]
+        The previous level 0 community of each entity title.
+    """
+    id_to_title = dict(zip(entities["id"], entities["title"], strict=True))
+    top_level = old_communities[old_communities["level"] == 0]
+    starting_communities: dict[str, int] = {}
+    for community, entity_ids in zip(
+        top_level["community"], top_level["entity_ids"], strict=True
+    ):
+        for entity_id in entity_ids:
+            title = id_to_title.get(entity_id)
+            if title is not None:
+                starting_communities[title] = int(community)
+    return starting_communities
+
+
+def _reconcile_communities(
+    old_communities: pd.DataFrame,
+    new_communities: pd.DataFrame,
+) -> tuple[pd.DataFrame, list[int]]:
+    """Match reclustered communities to the old ones by membership.
+
+    A new community with the same level and entity ids as an old one keeps
+    the old community id, row id and period. All other communities get new
+    ids above the old maximum and are reported as changed.
+
+    Parameters
+    ----------
+    old_communities : pd.DataFrame
+        The old communities.
+    new_communities : pd.DataFrame
+        The communities produced by reclustering the merged graph.
+
+    Returns
+    -------
+    tuple[pd.DataFrame, list[int]]
+        The reconciled communities and the ids of the changed communities.
+    """
+    old_by_membership = {
+        (int(level), frozenset(entity_ids)): row
+        for level, entity_ids, row in zip(
+            old_communities["level"],
+            old_communities["entity_ids"],
+            old_communities.to_dict("records"),
+            strict=True,
+        )
+    }
+    next_id = int(old_communities["community"].max()) + 1 if len(old_communities) else 0
+
+    new_communities = new_communities.sort_values(["level", "community"]).reset_index(
+        drop=True
+    )
+    community_id_mapping: dict[int, int] = {-1: -1}
+    changed: list[int] = []
+    ids: list[str] = []
+    periods: list[str] = []
+    for row in new_communities.to_dict("records"):
+        old = old_by_membership.get((int(row["level"]), frozenset(row["entity_ids"])))
+        if old is not None:
+            community_id_mapping[int(row["community"])] = int(old["community"])
+            ids.append(old["id"])
+            periods.append(old["period"])
+        else:
+            community_id_mapping[int(row["community"])] = next_id
+            changed.append(next_id)
+            next_id += 1
+            ids.append(row["id"])
+            periods.append(row["period"])
+
+    new_communities["id"] = ids
+    new_communities["period"] = periods
+    new_communities["community"] = new_communities["community"].map(
+        community_id_mapping
+    )
+    new_communities["parent"] = new_communities["parent"].map(community_id_mapping)
+    new_communities["children"] = new_communities["children"].apply(
+        lambda children: [community_id_mapping[int(child)] for child in children]
+    )
+    new_communities["title"] = "Community " + new_communities["community"].astype(str)
+    new_communities["human_readable_id"] = new_communities["community"]
+
+    return new_communities.loc[:, COMMUNITIES_FINAL_COLUMNS], changed
@@ -3,12 +3,16 @@
 
 """Dataframe operations and utils for Incremental Indexing."""
 
+import logging
 from dataclasses import dataclass
 
 import numpy as np
 import pandas as pd
+from graphrag_input.hashing import gen_sha512_hashes
 from graphrag_storage.tables.table_provider import TableProvider
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class InputDelta:
@@ -31,6 +35,12 @@ async def get_delta_docs(
 ) -> InputDelta:
     """Get the delta between the input dataset and the final documents.
 
+    Documents are matched by a hash of their text content, so renamed documents
+    with identical content are not re-indexed. Edited documents, whose title is
+    already indexed but whose content changed, are left out of both sides of
+    the delta: replacing a document's previous text units, graph and embeddings
+    is not supported yet, and merging the edit would duplicate the document.
+
     Parameters
     ----------
     input_dataset : pd.DataFrame
@@ -45,19 +55,65 @@ async def get_delta_docs(
     """
     final_docs = await table_provider.read_dataframe("documents")
 
-    # Select distinct title from final docs and from dataset
-    previous_docs: list[str] = final_docs["title"].unique().tolist()
-    dataset_docs: list[str] = input_dataset["title"].unique().tolist()
+    # Hash the text of each document on both sides, independent of any configured id column
+    previous_hashes = pd.Series(
+        gen_sha512_hashes(final_docs["text"]), index=final_docs.index, dtype=object
+    )
+    dataset_hashes = pd.Series(
+        gen_sha512_hashes(input_dataset["text"]),
+        index=input_dataset.index,
+        dtype=object,
+    )
+    previous_titles = set(final_docs["title"])
+    dataset_titles = set(input_dataset["title"])
+
+    changed_docs = ~dataset_hashes.isin(set(previous_hashes))
+    edited_docs = changed_docs & input_dataset["title"].isin(previous_titles)
+    if edited_docs.any():
+        logger.warning(
+            "Skipping %d edited documents; re-index to pick up changes to existing documents",
+            edited_docs.sum(),
+        )
 
     # Get the new documents (using loc to ensure DataFrame)
-    new_docs = input_dataset.loc[~input_dataset["title"].isin(previous_docs)]
+    new_docs = input_dataset.loc[changed_docs & ~edited_docs]
 
     # Get the deleted documents (again using loc to ensure DataFrame)
-    deleted_docs = final_docs.loc[~final_docs["title"].isin(dataset_docs)]
+    deleted_docs = final_docs.loc[
+        ~previous_hashes.isin(set(dataset_hashes))
+        & ~final_docs["title"].isin(dataset_titles)
+    ]
 
     return InputDelta(new_docs, deleted_docs)
 
 
+async def get_changed_text_units(
+    text_units: pd.DataFrame, table_provider: TableProvider
+) -> pd.DataFrame:
+    """Get the text units whose content is not already in the previous index.
+
+    Text unit ids are hashes of the chunk text, so the previous `text_units`
+    table (together with each document's `text_unit_ids`) acts as the manifest
+    of chunk hashes that have already been extracted and embedded.
+
+    Parameters
+    ----------
+    text_units : pd.DataFrame
+        The text units chunked from the delta documents.
+    table_provider : TableProvider
+        The table provider for reading previous text units.
+
+    Returns
+    -------
+    pd.DataFrame
+        The text units that need to be extracted and embedded.
+    """
+    if not await table_provider.has("text_units"):
+        return text_units
+    previous_text_units = await table_provider.read_dataframe("text_units")
+    return text_units.loc[~text_units["id"].isin(set(previous_text_units["id"]))]
+
+
 async def concat_dataframes(
     name: str,
     previous_table_provider: TableProvider,
@@ -48,6 +48,9 @@ from .load_update_documents import (
 from .prune_graph import (
     run_workflow as run_prune_graph,
 )
+from .prune_unchanged_text_units import (
+    run_workflow as run_prune_unchanged_text_units,
+)
 from .update_clean_state import (
     run_workflow as run_update_clean_state,
 )
@@ -57,6 +60,9 @@ from .update_communities import (
 from .update_community_reports import (
     run_workflow as run_update_community_reports,
 )
+from .update_community_reports_text import (
+    run_workflow as run_update_community_reports_text,
+)
 from .update_covariates import (
     run_workflow as run_update_covariates,
 )
@@ -89,9 +95,11 @@ PipelineFactory.register_all({  # noqa: RUF067
     "finalize_graph": run_finalize_graph,
     "generate_text_embeddings": run_generate_text_embeddings,
     "prune_graph": run_prune_graph,
+    "prune_unchanged_text_units": run_prune_unchanged_text_units,
     "update_final_documents": run_update_final_documents,
     "update_text_embeddings": run_update_text_embeddings,
     "update_community_reports": run_update_community_reports,
+    "update_community_reports_text": run_update_community_reports_text,
     "update_entities_relationships": run_update_entities_relationships,
     "update_communities": run_update_communities,
     "update_covariates": run_update_covariates,
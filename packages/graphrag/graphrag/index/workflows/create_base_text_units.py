@@ -97,15 +97,19 @@ async def create_base_text_units(
     sample_size = 5
 
     async for doc in documents_table:
-        chunks = chunk_document(doc, chunker, prepend_metadata)
-        for chunk_text in chunks:
-            if chunk_text is None:
-                continue
+        chunks = [
+            chunk_text
+            for chunk_text in chunk_document(doc, chunker, prepend_metadata)
+            if chunk_text is not None
+        ]
+        for chunk_text, n_tokens in zip(
+            chunks, tokenizer.num_tokens_batch(chunks), strict=True
+        ):
             row = {
                 "id": "",
                 "document_id": doc["id"],
                 "text": chunk_text,
-                "n_tokens": len(tokenizer.encode(chunk_text)),
+                "n_tokens": n_tokens,
             }
             row["id"] = gen_sha512_hash(row, ["text"])
             await text_units_table.write(row)
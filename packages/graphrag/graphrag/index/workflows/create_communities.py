@@ -28,6 +28,10 @@ async def run_workflow(
 ) -> WorkflowFunctionOutput:
     """All the steps to transform final communities."""
     logger.info("Workflow started: create_communities")
+    if config.cluster_graph.incremental and context.previous_table_provider is not None:
+        logger.info("Deferring clustering of the merged graph to update_communities")
+        return WorkflowFunctionOutput(result=None)
+
     reader = DataReader(context.output_table_provider)
     relationships = await reader.relationships()
 
@@ -59,6 +63,7 @@ async def create_communities(
     max_cluster_size: int,
     use_lcc: bool,
     seed: int | None = None,
+    starting_communities: dict[str, int] | None = None,
 ) -> list[dict[str, Any]]:
     """Build communities from clustered relationships and stream rows to the table.
 
@@ -77,6 +82,9 @@ async def create_communities(
             Whether to restrict to the largest connected component.
         seed: int | None
             Random seed for deterministic clustering.
+        starting_communities: dict[str, int] | None
+            Optional prior top-level community per entity title, used to
+            warm-start the clustering.
 
     Returns
     -------
@@ -88,6 +96,7 @@ async def create_communities(
         max_cluster_size,
         use_lcc,
         seed=seed,
+        starting_communities=starting_communities,
     )
 
     title_to_entity_id: dict[str, str] = {}
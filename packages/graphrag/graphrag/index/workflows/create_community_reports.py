@@ -33,7 +33,9 @@ from graphrag.index.typing.context import PipelineRunContext
 from graphrag.index.typing.workflow import WorkflowFunctionOutput
 
 if TYPE_CHECKING:
+    from graphrag_cache import Cache
     from graphrag_llm.completion import LLMCompletion
+    from graphrag_storage.tables.table_provider import TableProvider
 
 logger = logging.getLogger(__name__)
 
@@ -44,15 +46,42 @@ async def run_workflow(
 ) -> WorkflowFunctionOutput:
     """All the steps to transform community reports."""
     logger.info("Workflow started: create_community_reports")
-    reader = DataReader(context.output_table_provider)
+    if config.cluster_graph.incremental and context.previous_table_provider is not None:
+        logger.info("Deferring community reports to the update workflows")
+        return WorkflowFunctionOutput(result=None)
+
+    output = await generate_community_reports(
+        config,
+        context.output_table_provider,
+        context.cache,
+        context.callbacks,
+    )
+
+    await context.output_table_provider.write_dataframe("community_reports", output)
+
+    logger.info("Workflow completed: create_community_reports")
+    return WorkflowFunctionOutput(result=output)
+
+
+async def generate_community_reports(
+    config: GraphRagConfig,
+    table_provider: "TableProvider",
+    cache: "Cache",
+    callbacks: WorkflowCallbacks,
+    communities: pd.DataFrame | None = None,
+) -> pd.DataFrame:
+    """Load the graph tables and generate reports for the given communities.
+
+    All communities in the table provider are summarized if none are given.
+    """
+    reader = DataReader(table_provider)
     relationships = await reader.relationships()
     entities = await reader.entities()
-    communities = await reader.communities()
+    if communities is None:
+        communities = await reader.communities()
 
     claims = None
-    if config.extract_claims.enabled and await context.output_table_provider.has(
-        "covariates"
-    ):
+    if config.extract_claims.enabled and await table_provider.has("covariates"):
         claims = await reader.covariates()
 
     model_config = config.get_completion_model_config(
@@ -62,18 +91,18 @@ async def run_workflow(
 
     model = create_completion(
         model_config,
-        cache=context.cache.child(config.community_reports.model_instance_name),
+        cache=cache.child(config.community_reports.model_instance_name),
         cache_key_creator=cache_key_creator,
     )
 
     tokenizer = model.tokenizer
 
-    output = await create_community_reports(
+    return await create_community_reports(
         relationships=relationships,
         entities=entities,
         communities=communities,
         claims_input=claims,
-        callbacks=context.callbacks,
+        callbacks=callbacks,
         model=model,
         tokenizer=tokenizer,
         prompt=prompts.graph_prompt,
@@ -83,11 +112,6 @@ async def run_workflow(
         async_type=config.async_mode,
     )
 
-    await context.output_table_provider.write_dataframe("community_reports", output)
-
-    logger.info("Workflow completed: create_community_reports")
-    return WorkflowFunctionOutput(result=output)
-
 
 async def create_community_reports(
     relationships: pd.DataFrame,
@@ -32,7 +32,9 @@ from graphrag.index.typing.context import PipelineRunContext
 from graphrag.index.typing.workflow import WorkflowFunctionOutput
 
 if TYPE_CHECKING:
+    from graphrag_cache import Cache
     from graphrag_llm.completion import LLMCompletion
+    from graphrag_storage.tables.table_provider import TableProvider
 
 logger = logging.getLogger(__name__)
 
@@ -43,9 +45,38 @@ async def run_workflow(
 ) -> WorkflowFunctionOutput:
     """All the steps to transform community reports."""
     logger.info("Workflow started: create_community_reports_text")
-    reader = DataReader(context.output_table_provider)
+    if config.cluster_graph.incremental and context.previous_table_provider is not None:
+        logger.info("Deferring community reports to the update workflows")
+        return WorkflowFunctionOutput(result=None)
+
+    output = await generate_community_reports_text(
+        config,
+        context.output_table_provider,
+        context.cache,
+        context.callbacks,
+    )
+
+    await context.output_table_provider.write_dataframe("community_reports", output)
+
+    logger.info("Workflow completed: create_community_reports_text")
+    return WorkflowFunctionOutput(result=output)
+
+
+async def generate_community_reports_text(
+    config: GraphRagConfig,
+    table_provider: "TableProvider",
+    cache: "Cache",
+    callbacks: WorkflowCallbacks,
+    communities: pd.DataFrame | None = None,
+) -> pd.DataFrame:
+    """Load the text unit tables and generate reports for the given communities.
+
+    All communities in the table provider are summarized if none are given.
+    """
+    reader = DataReader(table_provider)
     entities = await reader.entities()
-    communities = await reader.communities()
+    if communities is None:
+        communities = await reader.communities()
     text_units = await reader.text_units()
 
     model_config = config.get_completion_model_config(
@@ -53,7 +84,7 @@ async def run_workflow(
     )
     model = create_completion(
         model_config,
-        cache=context.cache.child(config.community_reports.model_instance_name),
+        cache=cache.child(config.community_reports.model_instance_name),
         cache_key_creator=cache_key_creator,
     )
 
@@ -61,11 +92,11 @@ async def run_workflow(
 
     prompts = config.community_reports.resolved_prompts()
 
-    output = await create_community_reports_text(
+    return await create_community_reports_text(
         entities,
         communities,
         text_units,
-        context.callbacks,
+        callbacks,
         model=model,
         tokenizer=tokenizer,
         prompt=prompts.text_prompt,
@@ -75,11 +106,6 @@ async def run_workflow(
         async_type=config.async_mode,
     )
 
-    await context.output_table_provider.write_dataframe("community_reports", output)
-
-    logger.info("Workflow completed: create_community_reports_text")
-    return WorkflowFunctionOutput(result=output)
-
 
 async def create_community_reports_text(
     entities: pd.DataFrame,
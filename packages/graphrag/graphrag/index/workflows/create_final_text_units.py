@@ -7,6 +7,8 @@ import logging
 from contextlib import nullcontext
 from typing import Any
 
+import pyarrow as pa
+import pyarrow.compute as pc
 from graphrag_storage.tables.table import Table
 
 from graphrag.config.models.graph_rag_config import GraphRagConfig
@@ -78,58 +80,113 @@ async def create_final_text_units(
     relationships_table: Table,
     output_table: Table,
     covariates_table: Table | None,
+    batch_size: int = 10_000,
 ) -> list[dict[str, Any]]:
     """Enrich text units with entity, relationship, and covariate id lookups.
 
-    Streams text units, looks up related ids from pre-built maps, writes
-    each enriched row to output_table, and returns up to 5 sample rows.
+    The reverse lookups are built once as Arrow tables of id lists keyed by
+    text unit id. Text units are then streamed in batches of ``batch_size``
+    rows, joined against the lookups column-wise and written with
+    ``write_batch``. Returns up to 5 sample rows.
     """
     entity_map = await _build_multi_ref_map(entities_table)
     relationship_map = await _build_multi_ref_map(relationships_table)
-    covariate_map: dict[str, list[str]] = (
+    covariate_map = (
         await _build_covariate_map(covariates_table)
         if covariates_table is not None
-        else {}
+        else _group_ids([], [])
     )
 
     sample_rows: list[dict[str, Any]] = []
     human_readable_id = 0
-    async for row in text_units_table:
+    columns: dict[str, list[Any]] = {
+        "id": [],
+        "text": [],
+        "n_tokens": [],
+        "document_id": [],
+    }
+
+    async def flush() -> None:
+        nonlocal human_readable_id
+        num_rows = len(columns["id"])
+        ids = pa.array(columns["id"], pa.string())
         fields = {
-            "id": row["id"],
-            "human_readable_id": human_readable_id,
-            "text": row["text"],
-            "n_tokens": row["n_tokens"],
-            "document_id": row["document_id"],
-            "entity_ids": entity_map.get(row["id"], []),
-            "relationship_ids": relationship_map.get(row["id"], []),
-            "covariate_ids": covariate_map.get(row["id"], []),
+            "id": ids,
+            "human_readable_id": pa.array(
+                range(human_readable_id, human_readable_id + num_rows), pa.int64()
+            ),
+            "text": pa.array(columns["text"], pa.string()),
+            "n_tokens": pa.array(columns["n_tokens"], pa.int64()),
+            "document_id": pa.array(columns["document_id"], pa.string()),
+            "entity_ids": _lookup_ids(entity_map, ids),
+            "relationship_ids": _lookup_ids(relationship_map, ids),
+            "covariate_ids": _lookup_ids(covariate_map, ids),
         }
-        out = {c: fields[c] for c in TEXT_UNITS_FINAL_COLUMNS}
-        await output_table.write(out)
+        batch = pa.table({c: fields[c] for c in TEXT_UNITS_FINAL_COLUMNS})
+        await output_table.write_batch(batch)
         if len(sample_rows) < 5:
-            sample_rows.append(out)
-        human_readable_id += 1
+            sample_rows.extend(batch.slice(0, 5 - len(sample_rows)).to_pylist())
+        human_readable_id += num_rows
+        for values in columns.values():
+            values.clear()
+
+    async for row in text_units_table:
+        for column, values in columns.items():
+            values.append(row[column])
+        if len(columns["id"]) >= batch_size:
+            await flush()
+
+    if columns["id"]:
+        await flush()
 
     return sample_rows
 
 
-async def _build_multi_ref_map(table: Table) -> dict[str, list[str]]:
+def _group_ids(text_unit_ids: list[str], ids: list[str]) -> pa.Table:
+    """Group ids into a ``text_unit_id`` -> ``ids`` list table, keeping their order."""
+    pairs = pa.table({
+        "text_unit_id": pa.array(text_unit_ids, pa.string()),
+        "id": pa.array(ids, pa.string()),
+    })
+    return (
+        pairs
+        .group_by("text_unit_id", use_threads=False)
+        .aggregate([("id", "list")])
+        .rename_columns(["text_unit_id", "ids"])
+    )
+
+
+def _lookup_ids(id_map: pa.Table, text_unit_ids: pa.Array) -> pa.Array:
+    """Take the id list of each text unit, with an empty list where there is none."""
+    positions = pc.index_in(text_unit_ids, value_set=id_map["text_unit_id"])
+    return (
+        id_map["ids"]
+        .take(positions)
+        .combine_chunks()
+        .fill_null(pa.scalar([], pa.list_(pa.string())))
+    )
+
+
+async def _build_multi_ref_map(table: Table) -> pa.Table:
     """Build a text_unit_id -> [row_id] reverse lookup from a table with a text_unit_ids list field.
 
     Expects the table to have been opened with a transformer that
     already parsed ``text_unit_ids`` into a Python list.
     """
-    result: dict[str, list[str]] = {}
+    text_unit_ids: list[str] = []
+    ids: list[str] = []
     async for row in table:
-        for tuid in row["text_unit_ids"]:
-            result.setdefault(tuid, []).append(row["id"])
-    return result
+        tuids = row["text_unit_ids"]
+        text_unit_ids.extend(tuids)
+        ids.extend([row["id"]] * len(tuids))
+    return _group_ids(text_unit_ids, ids)
 
 
-async def _build_covariate_map(table: Table) -> dict[str, list[str]]:
+async def _build_covariate_map(table: Table) -> pa.Table:
     """Build a text_unit_id -> [covariate_id] reverse lookup from the covariate table."""
-    result: dict[str, list[str]] = {}
+    text_unit_ids: list[str] = []
+    ids: list[str] = []
     async for row in table:
-        result.setdefault(row["text_unit_id"], []).append(row["id"])
-    return result
+        text_unit_ids.append(row["text_unit_id"])
+        ids.append(row["id"])
+    return _group_ids(text_unit_ids, ids)
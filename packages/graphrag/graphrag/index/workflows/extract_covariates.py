@@ -36,7 +36,9 @@ async def run_workflow(
     """All the steps to extract and format covariates."""
     logger.info("Workflow started: extract_covariates")
     output = None
-    if config.extract_claims.enabled:
+    if config.extract_claims.enabled and config.extract_claims.combined_with_graph:
+        logger.info("Claims were extracted together with the graph, skipping")
+    elif config.extract_claims.enabled:
         reader = DataReader(context.output_table_provider)
         text_units = await reader.text_units()
 
@@ -102,6 +104,11 @@ async def extract_covariates(
         async_type=async_type,
     )
     text_units.drop(columns=["text_unit_id"], inplace=True)  # don't pollute the global
+    return finalize_covariates(covariates)
+
+
+def finalize_covariates(covariates: pd.DataFrame) -> pd.DataFrame:
+    """Assign ids to extracted covariates and select the final columns."""
     covariates["id"] = covariates["covariate_type"].apply(lambda _x: str(uuid4()))
     covariates["human_readable_id"] = covariates.index
 
@@ -17,11 +17,15 @@ from graphrag.data_model.data_reader import DataReader
 from graphrag.index.operations.extract_graph.extract_graph import (
     extract_graph as extractor,
 )
+from graphrag.index.operations.extract_graph.extract_graph import (
+    extract_graph_and_claims as combined_extractor,
+)
 from graphrag.index.operations.summarize_descriptions.summarize_descriptions import (
     summarize_descriptions,
 )
 from graphrag.index.typing.context import PipelineRunContext
 from graphrag.index.typing.workflow import WorkflowFunctionOutput
+from graphrag.index.workflows.extract_covariates import finalize_covariates
 
 if TYPE_CHECKING:
     from graphrag_llm.completion import LLMCompletion
@@ -58,21 +62,52 @@ async def run_workflow(
         cache_key_creator=cache_key_creator,
     )
 
-    entities, relationships, raw_entities, raw_relationships = await extract_graph(
-        text_units=text_units,
-        callbacks=context.callbacks,
-        extraction_model=extraction_model,
-        extraction_prompt=extraction_prompts.extraction_prompt,
-        entity_types=config.extract_graph.entity_types,
-        max_gleanings=config.extract_graph.max_gleanings,
-        extraction_num_threads=config.concurrent_requests,
-        extraction_async_type=config.async_mode,
-        summarization_model=summarization_model,
-        max_summary_length=config.summarize_descriptions.max_length,
-        max_input_tokens=config.summarize_descriptions.max_input_tokens,
-        summarization_prompt=summarization_prompts.summarize_prompt,
-        summarization_num_threads=config.concurrent_requests,
-    )
+    if config.extract_claims.enabled and config.extract_claims.combined_with_graph:
+        claims_prompts = config.extract_claims.resolved_prompts()
+        (
+            entities,
+            relationships,
+            raw_entities,
+            raw_relationships,
+            covariates,
+        ) = await extract_graph_and_claims(
+            text_units=text_units,
+            callbacks=context.callbacks,
+            extraction_model=extraction_model,
+            extraction_prompt=claims_prompts.combined_extraction_prompt,
+            entity_types=config.extract_graph.entity_types,
+            claim_description=config.extract_claims.description,
+            max_gleanings=config.extract_graph.max_gleanings,
+            extraction_num_threads=config.concurrent_requests,
+            extraction_async_type=config.async_mode,
+            summarization_model=summarization_model,
+            max_summary_length=config.summarize_descriptions.max_length,
+            max_input_tokens=config.summarize_descriptions.max_input_tokens,
+            summarization_prompt=summarization_prompts.summarize_prompt,
+            summarization_num_threads=config.concurrent_requests,
+            summarization_batch_prompt=summarization_prompts.batch_summarize_prompt,
+            summarization_batch_max_tokens=config.summarize_descriptions.batch_max_tokens,
+        )
+        await context.output_table_provider.write_dataframe("covariates", covariates)
+    else:
+        entities, relationships, raw_entities, raw_relationships = await extract_graph(
+            text_units=text_units,
+            callbacks=context.callbacks,
+            extraction_model=extraction_model,
+            extraction_prompt=extraction_prompts.extraction_prompt,
+            entity_types=config.extract_graph.entity_types,
+            max_gleanings=config.extract_graph.max_gleanings,
+            extraction_num_threads=config.concurrent_requests,
+            extraction_async_type=config.async_mode,
+            summarization_model=summarization_model,
+            max_summary_length=config.summarize_descriptions.max_length,
+            max_input_tokens=config.summarize_descriptions.max_input_tokens,
+            summarization_prompt=summarization_prompts.summarize_prompt,
+            summarization_num_threads=config.concurrent_requests,
+            summarization_batch_prompt=summarization_prompts.batch_summarize_prompt,
+            summarization_batch_max_tokens=config.summarize_descriptions.batch_max_tokens,
+            extraction_pack_max_tokens=config.extract_graph.pack_max_tokens,
+        )
 
     await context.output_table_provider.write_dataframe("entities", entities)
     await context.output_table_provider.write_dataframe("relationships", relationships)
@@ -108,6 +143,9 @@ async def extract_graph(
     max_input_tokens: int,
     summarization_prompt: str,
     summarization_num_threads: int,
+    summarization_batch_prompt: str | None = None,
+    summarization_batch_max_tokens: int = 0,
+    extraction_pack_max_tokens: int = 0,
 ) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.DataFrame]:
     """All the steps to create the base entity graph."""
     # this returns a graph for each text unit, to be merged later
@@ -122,8 +160,93 @@ async def extract_graph(
         max_gleanings=max_gleanings,
         num_threads=extraction_num_threads,
         async_type=extraction_async_type,
+        pack_max_tokens=extraction_pack_max_tokens,
+    )
+
+    return await _summarize_extracted_graph(
+        extracted_entities=extracted_entities,
+        extracted_relationships=extracted_relationships,
+        callbacks=callbacks,
+        summarization_model=summarization_model,
+        max_summary_length=max_summary_length,
+        max_input_tokens=max_input_tokens,
+        summarization_prompt=summarization_prompt,
+        summarization_num_threads=summarization_num_threads,
+        summarization_batch_prompt=summarization_batch_prompt,
+        summarization_batch_max_tokens=summarization_batch_max_tokens,
     )
 
+
+async def extract_graph_and_claims(
+    text_units: pd.DataFrame,
+    callbacks: WorkflowCallbacks,
+    extraction_model: "LLMCompletion",
+    extraction_prompt: str,
+    entity_types: list[str],
+    claim_description: str,
+    max_gleanings: int,
+    extraction_num_threads: int,
+    extraction_async_type: AsyncType,
+    summarization_model: "LLMCompletion",
+    max_summary_length: int,
+    max_input_tokens: int,
+    summarization_prompt: str,
+    summarization_num_threads: int,
+    summarization_batch_prompt: str | None = None,
+    summarization_batch_max_tokens: int = 0,
+) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """Create the base entity graph and the claim covariates in a single extraction pass."""
+    extracted_entities, extracted_relationships, claims = await combined_extractor(
+        text_units=text_units,
+        callbacks=callbacks,
+        text_column="text",
+        id_column="id",
+        model=extraction_model,
+        prompt=extraction_prompt,
+        entity_types=entity_types,
+        claim_description=claim_description,
+        max_gleanings=max_gleanings,
+        num_threads=extraction_num_threads,
+        async_type=extraction_async_type,
+    )
+
+    (
+        entities,
+        relationships,
+        raw_entities,
+        raw_relationships,
+    ) = await _summarize_extracted_graph(
+        extracted_entities=extracted_entities,
+        extracted_relationships=extracted_relationships,
+        callbacks=callbacks,
+        summarization_model=summarization_model,
+        max_summary_length=max_summary_length,
+        max_input_tokens=max_input_tokens,
+        summarization_prompt=summarization_prompt,
+        summarization_num_threads=summarization_num_threads,
+        summarization_batch_prompt=summarization_batch_prompt,
+        summarization_batch_max_tokens=summarization_batch_max_tokens,
+    )
+
+    claims["covariate_type"] = "claim"
+    covariates = finalize_covariates(claims)
+
+    return (entities, relationships, raw_entities, raw_relationships, covariates)
+
+
+async def _summarize_extracted_graph(
+    extracted_entities: pd.DataFrame,
+    extracted_relationships: pd.DataFrame,
+    callbacks: WorkflowCallbacks,
+    summarization_model: "LLMCompletion",
+    max_summary_length: int,
+    max_input_tokens: int,
+    summarization_prompt: str,
+    summarization_num_threads: int,
+    summarization_batch_prompt: str | None = None,
+    summarization_batch_max_tokens: int = 0,
+) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """Validate the extracted graph and summarize its descriptions."""
     if len(extracted_entities) == 0:
         error_msg = "Graph Extraction failed. No entities detected during extraction."
         logger.error(error_msg)
@@ -149,6 +272,8 @@ async def extract_graph(
         max_input_tokens=max_input_tokens,
         summarization_prompt=summarization_prompt,
         num_threads=summarization_num_threads,
+        batch_prompt=summarization_batch_prompt,
+        batch_max_tokens=summarization_batch_max_tokens,
     )
 
     return (entities, relationships, raw_entities, raw_relationships)
@@ -163,6 +288,8 @@ async def get_summarized_entities_relationships(
     max_input_tokens: int,
     summarization_prompt: str,
     num_threads: int,
+    batch_prompt: str | None = None,
+    batch_max_tokens: int = 0,
 ) -> tuple[pd.DataFrame, pd.DataFrame]:
     """Summarize the entities and relationships."""
     entity_summaries, relationship_summaries = await summarize_descriptions(
@@ -174,6 +301,8 @@ async def get_summarized_entities_relationships(
         max_input_tokens=max_input_tokens,
         prompt=summarization_prompt,
         num_threads=num_threads,
+        batch_prompt=batch_prompt,
+        batch_max_tokens=batch_max_tokens,
     )
 
     relationships = extracted_relationships.drop(columns=["description"]).merge(
@@ -81,6 +81,24 @@ _update_workflows = [
     "update_text_embeddings",
     "update_clean_state",
 ]
+_fast_update_workflows = [
+    "update_final_documents",
+    "update_entities_relationships",
+    "update_text_units",
+    "update_covariates",
+    "update_communities",
+    "update_community_reports_text",
+    "update_text_embeddings",
+    "update_clean_state",
+]
+
+
+def _with_unchanged_text_units_pruned(workflows: list[str]) -> list[str]:
+    """Skip text units already in the previous index once documents are finalized."""
+    index = workflows.index("create_final_documents") + 1
+    return [*workflows[:index], "prune_unchanged_text_units", *workflows[index:]]
+
+
 PipelineFactory.register_pipeline(
     IndexingMethod.Standard, ["load_input_documents", *_standard_workflows]
 )
@@ -89,9 +107,17 @@ PipelineFactory.register_pipeline(
 )
 PipelineFactory.register_pipeline(
     IndexingMethod.StandardUpdate,
-    ["load_update_documents", *_standard_workflows, *_update_workflows],
+    [
+        "load_update_documents",
+        *_with_unchanged_text_units_pruned(_standard_workflows),
+        *_update_workflows,
+    ],
 )
 PipelineFactory.register_pipeline(
     IndexingMethod.FastUpdate,
-    ["load_update_documents", *_fast_workflows, *_update_workflows],
+    [
+        "load_update_documents",
+        *_with_unchanged_text_units_pruned(_fast_workflows),
+        *_fast_update_workflows,
+    ],
 )
@@ -31,6 +31,7 @@ if TYPE_CHECKING:
     from graphrag_llm.embedding import LLMEmbedding
     from graphrag_llm.tokenizer import Tokenizer
     from graphrag_storage.tables.table_provider import TableProvider
+    from graphrag_vectors import VectorStore
 
 logger = logging.getLogger(__name__)
 
@@ -127,36 +128,68 @@ async def generate_text_embeddings(
         )
         vector_store.connect()
 
-        async with AsyncExitStack() as stack:
-            input_table = await stack.enter_async_context(
-                table_provider.open(
-                    field_config.table_name,
-                    truncate=False,
-                    transformer=field_config.row_transform,
-                )
-            )
-
-            output_table = None
-            if config.snapshots.embeddings:
-                output_table = await stack.enter_async_context(
-                    table_provider.open(f"embeddings.{field_config.name}")
-                )
-
-            count = await embed_text(
-                input_table=input_table,
-                callbacks=callbacks,
-                model=model,
-                tokenizer=tokenizer,
-                embed_column=field_config.embed_column,
-                batch_size=config.embed_text.batch_size,
-                batch_max_tokens=config.embed_text.batch_max_tokens,
-                num_threads=config.concurrent_requests,
-                vector_store=vector_store,
-                output_table=output_table,
-            )
+        count = await embed_field(
+            config=config,
+            field_config=field_config,
+            table_provider=table_provider,
+            callbacks=callbacks,
+            model=model,
+            tokenizer=tokenizer,
+            vector_store=vector_store,
+        )
 
         logger.info(
             "Embedded %d rows for %s",
             count,
             field_config.name,
         )
+
+
+async def embed_field(
+    config: GraphRagConfig,
+    field_config: EmbeddingFieldConfig,
+    table_provider: "TableProvider",
+    callbacks: WorkflowCallbacks,
+    model: "LLMEmbedding",
+    tokenizer: "Tokenizer",
+    vector_store: "VectorStore",
+    include_ids: set[str] | None = None,
+) -> int:
+    """Embed a single field into a connected vector store.
+
+    When ``include_ids`` is given only those rows are embedded and
+    appended to the existing index and snapshot table; otherwise the
+    index and snapshot are rebuilt from scratch.
+    """
+    overwrite = include_ids is None
+    async with AsyncExitStack() as stack:
+        input_table = await stack.enter_async_context(
+            table_provider.open(
+                field_config.table_name,
+                truncate=False,
+                transformer=field_config.row_transform,
+            )
+        )
+
+        output_table = None
+        if config.snapshots.embeddings:
+            output_table = await stack.enter_async_context(
+                table_provider.open(
+                    f"embeddings.{field_config.name}", truncate=overwrite
+                )
+            )
+
+        return await embed_text(
+            input_table=input_table,
+            callbacks=callbacks,
+            model=model,
+            tokenizer=tokenizer,
+            embed_column=field_config.embed_column,
+            batch_size=config.embed_text.batch_size,
+            batch_max_tokens=config.embed_text.batch_max_tokens,
+            num_threads=config.concurrent_requests,
+            vector_store=vector_store,
+            output_table=output_table,
+            include_ids=include_ids,
+            overwrite=overwrite,
+        )
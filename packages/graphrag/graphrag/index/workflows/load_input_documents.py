@@ -4,9 +4,9 @@
 """A module containing run_workflow method definition."""
 
 import logging
-from dataclasses import asdict
 
 import pandas as pd
+import pyarrow as pa
 from graphrag_input import InputReader, create_input_reader
 from graphrag_storage.tables.table import Table
 
@@ -43,18 +43,24 @@ async def run_workflow(
 async def load_input_documents(
     input_reader: InputReader, documents_table: Table, sample_size: int = 5
 ) -> tuple[pd.DataFrame, int]:
-    """Load and parse input documents into a standard format."""
+    """Load and parse input documents into a standard format.
+
+    Documents are read and written one Arrow table per input file, so per-row
+    work is limited to the vectorized column operations in the reader.
+    """
     sample: list[dict] = []
     idx = 0
 
-    async for doc in input_reader:
-        row = asdict(doc)
-        row["human_readable_id"] = idx
-        if "raw_data" not in row:
-            row["raw_data"] = None
-        await documents_table.write(row)
+    async for batch in input_reader.iter_tables():
+        num_rows = batch.num_rows
+        if "raw_data" not in batch.column_names:
+            batch = batch.append_column("raw_data", pa.nulls(num_rows))
+        batch = batch.append_column(
+            "human_readable_id", pa.array(range(idx, idx + num_rows), pa.int64())
+        )
+        await documents_table.write_batch(batch)
         if len(sample) < sample_size:
-            sample.append(row)
-        idx += 1
+            sample.extend(batch.slice(0, sample_size - len(sample)).to_pylist())
+        idx += num_rows
 
     return pd.DataFrame(sample), idx
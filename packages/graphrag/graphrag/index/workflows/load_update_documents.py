@@ -4,9 +4,9 @@
 """A module containing run_workflow method definition."""
 
 import logging
-from dataclasses import asdict
 
 import pandas as pd
+import pyarrow as pa
 from graphrag_input.input_reader import InputReader
 from graphrag_input.input_reader_factory import create_input_reader
 from graphrag_storage.tables.table_provider import TableProvider
@@ -51,8 +51,12 @@ async def load_update_documents(
     previous_table_provider: TableProvider,
 ) -> pd.DataFrame:
     """Load and parse update-only input documents into a standard format."""
-    input_documents = [asdict(doc) async for doc in input_reader]
-    input_documents = pd.DataFrame(input_documents)
+    tables = [table async for table in input_reader.iter_tables()]
+    input_documents = (
+        pa.concat_tables(tables, promote_options="permissive").to_pandas()
+        if tables
+        else pd.DataFrame()
+    )
     input_documents["human_readable_id"] = input_documents.index
     if "raw_data" not in input_documents.columns:
         input_documents["raw_data"] = pd.Series(dtype="object")
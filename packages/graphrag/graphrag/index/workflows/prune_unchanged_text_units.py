@@ -0,0 +1,51 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A module containing run_workflow method definition."""
+
+import logging
+
+from graphrag.config.models.graph_rag_config import GraphRagConfig
+from graphrag.index.typing.context import PipelineRunContext
+from graphrag.index.typing.workflow import WorkflowFunctionOutput
+from graphrag.index.update.incremental_index import get_changed_text_units
+
+logger = logging.getLogger(__name__)
+
+
+async def run_workflow(
+    _config: GraphRagConfig,
+    context: PipelineRunContext,
+) -> WorkflowFunctionOutput:
+    """Drop delta text units that are already present in the previous index."""
+    logger.info("Workflow started: prune_unchanged_text_units")
+    if context.previous_table_provider is None:
+        msg = "previous_table_provider is required for update workflows"
+        raise ValueError(msg)
+
+    text_units = await context.output_table_provider.read_dataframe("text_units")
+    changed_text_units = await get_changed_text_units(
+        text_units, context.previous_table_provider
+    )
+
+    logger.info(
+        "Reusing %d unchanged text units, %d text units to extract",
+        len(text_units) - len(changed_text_units),
+        len(changed_text_units),
+    )
+
+    await context.output_table_provider.write_dataframe(
+        "text_units", changed_text_units.reset_index(drop=True)
+    )
+
+    if len(changed_text_units) == 0:
+        # nothing to extract or embed, but the new documents still need merging
+        logger.warning("No changed text units found.")
+        logger.info("Workflow completed: prune_unchanged_text_units")
+        return WorkflowFunctionOutput(
+            result=changed_text_units,
+            run_only=["update_final_documents", "update_clean_state"],
+        )
+
+    logger.info("Workflow completed: prune_unchanged_text_units")
+    return WorkflowFunctionOutput(result=changed_text_units)
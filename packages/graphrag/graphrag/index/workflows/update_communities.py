@@ -12,7 +12,12 @@ from graphrag.data_model.data_reader import DataReader
 from graphrag.index.run.utils import get_update_table_providers
 from graphrag.index.typing.context import PipelineRunContext
 from graphrag.index.typing.workflow import WorkflowFunctionOutput
-from graphrag.index.update.communities import _update_and_merge_communities
+from graphrag.index.update.communities import (
+    _get_starting_communities,
+    _reconcile_communities,
+    _update_and_merge_communities,
+)
+from graphrag.index.workflows.create_communities import create_communities
 
 logger = logging.getLogger(__name__)
 
@@ -27,11 +32,16 @@ async def run_workflow(
         get_update_table_providers(config, context.state["update_timestamp"])
     )
 
-    community_id_mapping = await _update_communities(
-        previous_table_provider, delta_table_provider, output_table_provider
-    )
-
-    context.state["incremental_update_community_id_mapping"] = community_id_mapping
+    if config.cluster_graph.incremental:
+        changed_communities = await _recluster_communities(
+            config, previous_table_provider, output_table_provider
+        )
+        context.state["incremental_update_changed_communities"] = changed_communities
+    else:
+        community_id_mapping = await _update_communities(
+            previous_table_provider, delta_table_provider, output_table_provider
+        )
+        context.state["incremental_update_community_id_mapping"] = community_id_mapping
 
     logger.info("Workflow completed: update_communities")
     return WorkflowFunctionOutput(result=None)
@@ -52,3 +62,42 @@ async def _update_communities(
     await output_table_provider.write_dataframe("communities", merged_communities)
 
     return community_id_mapping
+
+
+async def _recluster_communities(
+    config: GraphRagConfig,
+    previous_table_provider: TableProvider,
+    output_table_provider: TableProvider,
+) -> list[int]:
+    """Recluster the merged graph warm-started from the old communities."""
+    old_communities = await DataReader(previous_table_provider).communities()
+    reader = DataReader(output_table_provider)
+    entities = await reader.entities()
+    relationships = await reader.relationships()
+
+    async with (
+        output_table_provider.open("entities", truncate=False) as entities_table,
+        output_table_provider.open("communities") as communities_table,
+    ):
+        await create_communities(
+            communities_table,
+            entities_table,
+            relationships,
+            max_cluster_size=config.cluster_graph.max_cluster_size,
+            use_lcc=config.cluster_graph.use_lcc,
+            seed=config.cluster_graph.seed,
+            starting_communities=_get_starting_communities(old_communities, entities),
+        )
+
+    new_communities = await reader.communities()
+    communities, changed_communities = _reconcile_communities(
+        old_communities, new_communities
+    )
+    await output_table_provider.write_dataframe("communities", communities)
+
+    logger.info(
+        "Reclustered into %d communities, %d with changed membership",
+        len(communities),
+        len(changed_communities),
+    )
+    return changed_communities
@@ -4,19 +4,29 @@
 """A module containing run_workflow method definition."""
 
 import logging
+from collections.abc import Awaitable, Callable
 
 import pandas as pd
 from graphrag_storage.tables.table_provider import TableProvider
 
 from graphrag.config.models.graph_rag_config import GraphRagConfig
 from graphrag.data_model.data_reader import DataReader
+from graphrag.index.operations.finalize_community_reports import (
+    finalize_community_reports,
+)
 from graphrag.index.run.utils import get_update_table_providers
 from graphrag.index.typing.context import PipelineRunContext
 from graphrag.index.typing.workflow import WorkflowFunctionOutput
 from graphrag.index.update.communities import _update_and_merge_community_reports
+from graphrag.index.workflows.create_community_reports import (
+    generate_community_reports,
+)
 
 logger = logging.getLogger(__name__)
 
+# generates the reports of the given communities, like generate_community_reports
+CommunityReportsGenerator = Callable[..., Awaitable[pd.DataFrame]]
+
 
 async def run_workflow(
     config: GraphRagConfig,
@@ -24,26 +34,44 @@ async def run_workflow(
 ) -> WorkflowFunctionOutput:
     """Update the community reports from a incremental index run."""
     logger.info("Workflow started: update_community_reports")
+    await update_community_reports(config, context, generate_community_reports)
+    logger.info("Workflow completed: update_community_reports")
+    return WorkflowFunctionOutput(result=None)
+
+
+async def update_community_reports(
+    config: GraphRagConfig,
+    context: PipelineRunContext,
+    generate: CommunityReportsGenerator,
+) -> None:
+    """Merge the community reports, regenerating changed ones with `generate`."""
     output_table_provider, previous_table_provider, delta_table_provider = (
         get_update_table_providers(config, context.state["update_timestamp"])
     )
 
-    community_id_mapping = context.state["incremental_update_community_id_mapping"]
+    if config.cluster_graph.incremental:
+        merged_community_reports = await _refresh_community_reports(
+            config,
+            context,
+            previous_table_provider,
+            output_table_provider,
+            context.state["incremental_update_changed_communities"],
+            generate,
+        )
+    else:
+        community_id_mapping = context.state["incremental_update_community_id_mapping"]
 
-    merged_community_reports = await _update_community_reports(
-        previous_table_provider,
-        delta_table_provider,
-        output_table_provider,
-        community_id_mapping,
-    )
+        merged_community_reports = await _update_community_reports(
+            previous_table_provider,
+            delta_table_provider,
+            output_table_provider,
+            community_id_mapping,
+        )
 
     context.state["incremental_update_merged_community_reports"] = (
         merged_community_reports
     )
 
-    logger.info("Workflow completed: update_community_reports")
-    return WorkflowFunctionOutput(result=None)
-
 
 async def _update_community_reports(
     previous_table_provider: TableProvider,
@@ -65,3 +93,51 @@ async def _update_community_reports(
     )
 
     return merged_community_reports
+
+
+async def _refresh_community_reports(
+    config: GraphRagConfig,
+    context: PipelineRunContext,
+    previous_table_provider: TableProvider,
+    output_table_provider: TableProvider,
+    changed_communities: list[int],
+    generate: CommunityReportsGenerator,
+) -> pd.DataFrame:
+    """Keep reports of unchanged communities and regenerate the changed ones."""
+    communities = await DataReader(output_table_provider).communities()
+    old_community_reports = await DataReader(
+        previous_table_provider
+    ).community_reports()
+
+    changed = communities["community"].isin(changed_communities)
+    kept_community_reports = old_community_reports[
+        old_community_reports["community"].isin(communities.loc[~changed, "community"])
+    ].drop(columns=["parent", "children", "size", "period"])
+    kept_community_reports = finalize_community_reports(
+        kept_community_reports, communities
+    ).assign(id=kept_community_reports["id"].to_numpy())
+    reports = [kept_community_reports]
+
+    if changed.any():
+        reports.append(
+            await generate(
+                config,
+                output_table_provider,
+                context.cache,
+                context.callbacks,
+                communities=communities[changed].reset_index(drop=True),
+            )
+        )
+
+    merged_community_reports = pd.concat(reports, ignore_index=True)
+    logger.info(
+        "Kept %d community reports, regenerated %d",
+        len(reports[0]),
+        len(merged_community_reports) - len(reports[0]),
+    )
+
+    await output_table_provider.write_dataframe(
+        "community_reports", merged_community_reports
+    )
+
+    return merged_community_reports
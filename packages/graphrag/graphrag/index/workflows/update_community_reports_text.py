@@ -0,0 +1,29 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A module containing run_workflow method definition."""
+
+import logging
+
+from graphrag.config.models.graph_rag_config import GraphRagConfig
+from graphrag.index.typing.context import PipelineRunContext
+from graphrag.index.typing.workflow import WorkflowFunctionOutput
+from graphrag.index.workflows.create_community_reports_text import (
+    generate_community_reports_text,
+)
+from graphrag.index.workflows.update_community_reports import (
+    update_community_reports,
+)
+
+logger = logging.getLogger(__name__)
+
+
+async def run_workflow(
+    config: GraphRagConfig,
+    context: PipelineRunContext,
+) -> WorkflowFunctionOutput:
+    """Update the community reports from a incremental fast index run."""
+    logger.info("Workflow started: update_community_reports_text")
+    await update_community_reports(config, context, generate_community_reports_text)
+    logger.info("Workflow completed: update_community_reports_text")
+    return WorkflowFunctionOutput(result=None)
@@ -108,6 +108,8 @@ async def _update_entities_and_relationships(
         max_input_tokens=config.summarize_descriptions.max_input_tokens,
         summarization_prompt=prompts.summarize_prompt,
         num_threads=config.concurrent_requests,
+        batch_prompt=prompts.batch_summarize_prompt,
+        batch_max_tokens=config.summarize_descriptions.batch_max_tokens,
     )
 
     # Save the updated entities back to storage
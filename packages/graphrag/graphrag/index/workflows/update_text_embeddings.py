@@ -4,18 +4,29 @@
 """A module containing run_workflow method definition."""
 
 import logging
+from typing import TYPE_CHECKING
 
+from graphrag_input.hashing import gen_sha512_hashes
 from graphrag_llm.embedding import create_embedding
+from graphrag_vectors import create_vector_store
 
 from graphrag.cache.cache_key_creator import cache_key_creator
+from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
 from graphrag.config.models.graph_rag_config import GraphRagConfig
 from graphrag.index.run.utils import get_update_table_providers
 from graphrag.index.typing.context import PipelineRunContext
 from graphrag.index.typing.workflow import WorkflowFunctionOutput
 from graphrag.index.workflows.generate_text_embeddings import (
-    generate_text_embeddings,
+    EMBEDDING_FIELDS,
+    EmbeddingFieldConfig,
+    embed_field,
 )
 
+if TYPE_CHECKING:
+    from graphrag_llm.embedding import LLMEmbedding
+    from graphrag_llm.tokenizer import Tokenizer
+    from graphrag_storage.tables.table_provider import TableProvider
+
 logger = logging.getLogger(__name__)
 
 
@@ -26,7 +37,7 @@ async def run_workflow(
     """Update text embeddings for an incremental index run."""
     logger.info("Workflow started: update_text_embeddings")
 
-    output_table_provider, _, _ = get_update_table_providers(
+    output_table_provider, previous_table_provider, _ = get_update_table_providers(
         config, context.state["update_timestamp"]
     )
 
@@ -40,9 +51,10 @@ async def run_workflow(
     )
     tokenizer = model.tokenizer
 
-    await generate_text_embeddings(
+    await update_text_embeddings(
         config=config,
         table_provider=output_table_provider,
+        previous_table_provider=previous_table_provider,
         callbacks=context.callbacks,
         model=model,
         tokenizer=tokenizer,
@@ -50,3 +62,122 @@ async def run_workflow(
 
     logger.info("Workflow completed: update_text_embeddings")
     return WorkflowFunctionOutput(result=None)
+
+
+async def update_text_embeddings(
+    config: GraphRagConfig,
+    table_provider: "TableProvider",
+    previous_table_provider: "TableProvider | None",
+    callbacks: WorkflowCallbacks,
+    model: "LLMEmbedding",
+    tokenizer: "Tokenizer",
+) -> None:
+    """Embed only new and changed rows of the merged tables.
+
+    The text of each embedded column is hashed in both the previous and
+    the merged table. Vectors of removed or changed rows are deleted from
+    the existing index, and only new or changed rows are embedded. Fields
+    without a previous table are embedded in full.
+    """
+    embedded_fields = config.embed_text.names
+    logger.info("Updating embeddings for the following fields: %s", embedded_fields)
+
+    for field_name in embedded_fields:
+        field_config = EMBEDDING_FIELDS[field_name]
+
+        if not await table_provider.has(field_config.table_name):
+            logger.warning(
+                "Embedding %s is specified but source table '%s' "
+                "is not in storage. Skipping.",
+                field_config.name,
+                field_config.table_name,
+            )
+            continue
+
+        vector_store = create_vector_store(
+            config.vector_store,
+            config.vector_store.index_schema[field_config.name],
+        )
+        vector_store.connect()
+
+        include_ids = None
+        if previous_table_provider is not None and await previous_table_provider.has(
+            field_config.table_name
+        ):
+            previous = await _hash_field(previous_table_provider, field_config)
+            current = await _hash_field(table_provider, field_config)
+            include_ids = {
+                row_id
+                for row_id, text_hash in current.items()
+                if previous.get(row_id) != text_hash
+            }
+            stale_ids = (previous.keys() - current.keys()) | (
+                include_ids & previous.keys()
+            )
+            logger.info(
+                "Embedding %s: %d new or changed rows, %d stale rows",
+                field_config.name,
+                len(include_ids),
+                len(stale_ids),
+            )
+            if stale_ids:
+                vector_store.remove(list(stale_ids))
+                await _remove_snapshot_rows(
+                    config, table_provider, field_config, stale_ids
+                )
+            if not include_ids:
+                continue
+        else:
+            logger.info(
+                "No previous table for %s, embedding all rows", field_config.name
+            )
+
+        count = await embed_field(
+            config=config,
+            field_config=field_config,
+            table_provider=table_provider,
+            callbacks=callbacks,
+            model=model,
+            tokenizer=tokenizer,
+            vector_store=vector_store,
+            include_ids=include_ids,
+        )
+
+        logger.info(
+            "Embedded %d rows for %s",
+            count,
+            field_config.name,
+        )
+
+
+async def _hash_field(
+    table_provider: "TableProvider",
+    field_config: EmbeddingFieldConfig,
+) -> dict[str, str]:
+    """Map each row id to a hash of the text that would be embedded."""
+    ids: list[str] = []
+    texts: list[str] = []
+    async with table_provider.open(
+        field_config.table_name,
+        truncate=False,
+        transformer=field_config.row_transform,
+    ) as table:
+        async for row in table:
+            ids.append(row["id"])
+            texts.append(row.get(field_config.embed_column) or "")
+    return dict(zip(ids, gen_sha512_hashes(texts), strict=True))
+
+
+async def _remove_snapshot_rows(
+    config: GraphRagConfig,
+    table_provider: "TableProvider",
+    field_config: EmbeddingFieldConfig,
+    ids: set[str],
+) -> None:
+    """Drop stale rows from the embeddings snapshot table, if any."""
+    snapshot_name = f"embeddings.{field_config.name}"
+    if not config.snapshots.embeddings or not await table_provider.has(snapshot_name):
+        return
+    snapshot = await table_provider.read_dataframe(snapshot_name)
+    snapshot = snapshot[~snapshot["id"].isin(ids)]
+    await table_provider.write_dataframe(snapshot_name, snapshot)
@@ -87,6 +87,11 @@ def _update_and_merge_text_units(
             lambda x: [entity_id_mapping.get(i, i) for i in x] if x is not None else x
         )
 
+    # Text unit ids are content hashes, so a delta unit with an existing id is already indexed
+    delta_text_units = delta_text_units.loc[
+        ~delta_text_units["id"].isin(old_text_units["id"])
+    ].copy()
+
     initial_id = old_text_units["human_readable_id"].max() + 1
     delta_text_units["human_readable_id"] = np.arange(
         initial_id, initial_id + len(delta_text_units)
@@ -127,3 +127,9 @@ Output:"""
 
 CONTINUE_PROMPT = "MANY entities and relationships were missed in the last extraction. Remember to ONLY emit entities that match any of the previously extracted types. Add them below using the same format:\n"
 LOOP_PROMPT = "It appears some entities and relationships may have still been missed. Answer Y if there are still entities or relationships that need to be added, or N if there are none. Please answer with a single letter Y or N.\n"
+
+PACKED_TEXT_PROMPT = """The text below is made of several separate documents, each starting with a "-Document <document_number>-" header.
+Extract the entities and relationships of each document separately. Before the records of each document, output a ("document"<|><document_number>) record, and use **##** as the delimiter after it as well. If an entity appears in several documents, output it under each of them. Keep opening each document's records this way when adding entities and relationships that were missed.
+
+"""
+DOCUMENT_HEADER = "-Document {document_number}-"
@@ -41,7 +41,7 @@ class LocalContextBuilder(ABC):
     """Base class for local-search context builders."""
 
     @abstractmethod
-    def build_context(
+    async def build_context(
         self,
         query: str,
         conversation_history: ConversationHistory | None = None,
@@ -66,7 +66,7 @@ class BasicContextBuilder(ABC):
     """Base class for basic-search context builders."""
 
     @abstractmethod
-    def build_context(
+    async def build_context(
         self,
         query: str,
         conversation_history: ConversationHistory | None = None,
@@ -4,9 +4,11 @@
 """Algorithm to dynamically select relevant communities with respect to a query."""
 
 import asyncio
+import hashlib
 import logging
-from collections import Counter
-from copy import deepcopy
+import re
+import threading
+from collections import Counter, OrderedDict
 from time import time
 from typing import TYPE_CHECKING, Any
 
@@ -22,11 +24,63 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+RatingCacheKey = tuple[str, str, str]
+
+
+class RatingCache:
+    """Least-recently-used cache of community ratings.
+
+    Ratings are keyed by the normalized query hash, the community id and a
+    hash of the rated report text.
+    """
+
+    _max_size: int
+    _ratings: OrderedDict[RatingCacheKey, int]
+    _lock: threading.Lock
+
+    def __init__(self, max_size: int = 10_000) -> None:
+        """Initialize RatingCache.
+
+        Args
+        ----
+            max_size: int (default=10_000)
+                The maximum number of ratings to keep.
+        """
+        self._max_size = max_size
+        self._ratings = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of cached ratings."""
+        return len(self._ratings)
+
+    def get(self, key: RatingCacheKey) -> int | None:
+        """Get a cached rating."""
+        with self._lock:
+            rating = self._ratings.get(key)
+            if rating is not None:
+                self._ratings.move_to_end(key)
+            return rating
+
+    def set(self, key: RatingCacheKey, rating: int) -> None:
+        """Cache a rating, evicting the least recently used one if full."""
+        if self._max_size <= 0:
+            return
+        with self._lock:
+            self._ratings[key] = rating
+            self._ratings.move_to_end(key)
+            if len(self._ratings) > self._max_size:
+                self._ratings.popitem(last=False)
+
 
 class DynamicCommunitySelection:
     """Dynamic community selection to select community reports that are relevant to the query.
 
     Any community report with a rating EQUAL or ABOVE the rating_threshold is considered relevant.
+
+    Ratings are stored in rating_cache, keyed by the normalized query hash, the
+    community id and a hash of the rated report text. Pass a shared RatingCache
+    to reuse ratings across selector instances.
     """
 
     def __init__(
@@ -43,6 +97,7 @@ class DynamicCommunitySelection:
         max_level: int = 2,
         concurrent_coroutines: int = 8,
         model_params: dict[str, Any] | None = None,
+        rating_cache: RatingCache | None = None,
     ):
         self.model = model
         self.tokenizer = tokenizer
@@ -54,6 +109,7 @@ class DynamicCommunitySelection:
         self.max_level = max_level
         self.semaphore = asyncio.Semaphore(concurrent_coroutines)
         self.model_params = model_params if model_params else {}
+        self.rating_cache = rating_cache if rating_cache is not None else RatingCache()
 
         self.reports = {report.community_id: report for report in community_reports}
         self.communities = {community.short_id: community for community in communities}
@@ -74,11 +130,16 @@ class DynamicCommunitySelection:
         """
         Select relevant communities with respect to the query.
 
+        Communities are rated as a frontier: as soon as a community is rated
+        relevant its children are scheduled, without waiting for the rest of
+        its level. Ratings are memoized per normalized query, community and
+        report content.
+
         Args:
             query: the query to rate against
         """
         start = time()
-        queue = deepcopy(self.starting_communities)
+        query_key = _normalize_query(query)
         level = 0
 
         ratings = {}  # store the ratings for each community
@@ -89,70 +150,69 @@ class DynamicCommunitySelection:
         }
         relevant_communities = set()
 
-        while queue:
-            gather_results = await asyncio.gather(*[
-                rate_relevancy(
-                    query=query,
-                    description=(
-                        self.reports[community].summary
-                        if self.use_summary
-                        else self.reports[community].full_content
-                    ),
-                    model=self.model,
-                    tokenizer=self.tokenizer,
-                    rate_query=self.rate_query,
-                    num_repeats=self.num_repeats,
-                    semaphore=self.semaphore,
-                    **self.model_params,
-                )
-                for community in queue
-            ])
-
-            communities_to_rate = []
-            for community, result in zip(queue, gather_results, strict=True):
-                rating = result["rating"]
-                logger.debug(
-                    "dynamic community selection: community %s rating %s",
-                    community,
-                    rating,
-                )
-                ratings[community] = rating
-                llm_info["llm_calls"] += result["llm_calls"]
-                llm_info["prompt_tokens"] += result["prompt_tokens"]
-                llm_info["output_tokens"] += result["output_tokens"]
-                if rating >= self.threshold:
-                    relevant_communities.add(community)
-                    # find children nodes of the current node and append them to the queue
-                    # TODO check why some sub_communities are NOT in report_df
-                    if community in self.communities:
-                        for child in self.communities[community].children:
-                            # Convert child to string to match self.reports key type
-                            child_str = str(child)
-                            if child_str in self.reports:
-                                communities_to_rate.append(child_str)
-                            else:
-                                logger.debug(
-                                    "dynamic community selection: cannot find community %s in reports",
-                                    child,
-                                )
-                    # remove parent node if the current node is deemed relevant
-                    if not self.keep_parent and community in self.communities:
-                        relevant_communities.discard(self.communities[community].parent)
-            queue = communities_to_rate
-            level += 1
-            if (
-                (len(queue) == 0)
-                and (len(relevant_communities) == 0)
-                and (str(level) in self.levels)
-                and (level <= self.max_level)
-            ):
-                logger.debug(
-                    "dynamic community selection: no relevant community "
-                    "reports, adding all reports at level %s to rate.",
-                    level,
+        pending: dict[asyncio.Task, str] = {}
+
+        def schedule(communities: list[str]) -> None:
+            for community in communities:
+                task = asyncio.create_task(self._rate(query, query_key, community))
+                pending[task] = community
+
+        schedule(self.starting_communities)
+        try:
+            while pending:
+                done, _ = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
                 )
-                # append all communities at the next level to queue
-                queue = self.levels[str(level)]
+                for task in done:
+                    community = pending.pop(task)
+                    result = task.result()
+                    rating = result["rating"]
+                    logger.debug(
+                        "dynamic community selection: community %s rating %s",
+                        community,
+                        rating,
+                    )
+                    ratings[community] = rating
+                    llm_info["llm_calls"] += result["llm_calls"]
+                    llm_info["prompt_tokens"] += result["prompt_tokens"]
+                    llm_info["output_tokens"] += result["output_tokens"]
+                    if rating >= self.threshold:
+                        relevant_communities.add(community)
+                        # find children nodes of the current node and append them to the queue
+                        # TODO check why some sub_communities are NOT in report_df
+                        if community in self.communities:
+                            children = []
+                            for child in self.communities[community].children:
+                                # Convert child to string to match self.reports key type
+                                child_str = str(child)
+                                if child_str in self.reports:
+                                    children.append(child_str)
+                                else:
+                                    logger.debug(
+                                        "dynamic community selection: cannot find community %s in reports",
+                                        child,
+                                    )
+                            schedule(children)
+                        # remove parent node if the current node is deemed relevant
+                        if not self.keep_parent and community in self.communities:
+                            relevant_communities.discard(
+                                self.communities[community].parent
+                            )
+
+                # nothing was relevant and the frontier is exhausted, so fall
+                # back to rating every community at the next level
+                if not pending and not relevant_communities:
+                    level += 1
+                    if str(level) in self.levels and level <= self.max_level:
+                        logger.debug(
+                            "dynamic community selection: no relevant community "
+                            "reports, adding all reports at level %s to rate.",
+                            level,
+                        )
+                        schedule(self.levels[str(level)])
+        finally:
+            for task in pending:
+                task.cancel()
 
         community_reports = [
             self.reports[community] for community in relevant_communities
@@ -174,3 +234,43 @@ class DynamicCommunitySelection:
 
         llm_info["ratings"] = ratings
         return community_reports, llm_info
+
+    async def _rate(self, query: str, query_key: str, community: str) -> dict[str, Any]:
+        """Rate a single community, reusing a memoized rating if available."""
+        description = (
+            self.reports[community].summary
+            if self.use_summary
+            else self.reports[community].full_content
+        )
+        cache_key = (
+            query_key,
+            community,
+            hashlib.sha256(description.encode("utf-8")).hexdigest(),
+        )
+        cached = self.rating_cache.get(cache_key)
+        if cached is not None:
+            return {
+                "rating": cached,
+                "llm_calls": 0,
+                "prompt_tokens": 0,
+                "output_tokens": 0,
+            }
+
+        result = await rate_relevancy(
+            query=query,
+            description=description,
+            model=self.model,
+            tokenizer=self.tokenizer,
+            rate_query=self.rate_query,
+            num_repeats=self.num_repeats,
+            semaphore=self.semaphore,
+            **self.model_params,
+        )
+        self.rating_cache.set(cache_key, result["rating"])
+        return result
+
+
+def _normalize_query(query: str) -> str:
+    """Hash a query after case folding and stripping punctuation and extra whitespace."""
+    normalized = " ".join(re.findall(r"\w+", query.casefold()))
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
@@ -8,6 +8,7 @@ from typing import TYPE_CHECKING
 
 from graphrag_vectors import VectorStore
 
+from graphrag.config.enums import RetrievalMode
 from graphrag.data_model.entity import Entity
 from graphrag.data_model.relationship import Relationship
 from graphrag.query.input.retrieval.entities import (
@@ -15,6 +16,11 @@ from graphrag.query.input.retrieval.entities import (
     get_entity_by_key,
     get_entity_by_name,
 )
+from graphrag.query.input.retrieval.entity_name_matcher import EntityNameMatcher
+from graphrag.query.input.retrieval.lexical_index import (
+    LexicalIndex,
+    reciprocal_rank_fusion,
+)
 
 if TYPE_CHECKING:
     from graphrag_llm.embedding import LLMEmbedding
@@ -38,7 +44,7 @@ class EntityVectorStoreKey(str, Enum):
         raise ValueError(msg)
 
 
-def map_query_to_entities(
+async def map_query_to_entities(
     query: str,
     text_embedding_vectorstore: VectorStore,
     text_embedder: "LLMEmbedding",
@@ -48,8 +54,20 @@ def map_query_to_entities(
     exclude_entity_names: list[str] | None = None,
     k: int = 10,
     oversample_scaler: int = 2,
+    lexical_index: LexicalIndex | None = None,
+    retrieval_mode: RetrievalMode = RetrievalMode.Vector,
+    entity_name_matcher: EntityNameMatcher | None = None,
 ) -> list[Entity]:
-    """Extract entities that match a given query using semantic similarity of text embeddings of query and entity descriptions."""
+    """Extract entities that match a given query using semantic similarity of text embeddings of query and entity descriptions.
+
+    With a lexical index, lexical mode matches entities by BM25 keyword search
+    without embedding the query, and hybrid mode fuses both rankings.
+
+    With an entity name matcher, entities named verbatim in the query are
+    matched first, ahead of the usual k * oversample_scaler similarity
+    candidates. The similarity search is skipped entirely when the query
+    names k or more entities.
+    """
     if include_entity_names is None:
         include_entity_names = []
     if exclude_entity_names is None:
@@ -57,26 +75,29 @@ def map_query_to_entities(
     all_entities = list(all_entities_dict.values())
     matched_entities = []
     if query != "":
-        # get entities with highest semantic similarity to query
-        # oversample to account for excluded entities
-        search_results = text_embedding_vectorstore.similarity_search_by_text(
-            text=query,
-            text_embedder=lambda t: text_embedder.embedding(input=[t]).first_embedding,
-            k=k * oversample_scaler,
-        )
-        for result in search_results:
-            if embedding_vectorstore_key == EntityVectorStoreKey.ID and isinstance(
-                result.document.id, str
-            ):
-                matched = get_entity_by_id(all_entities_dict, result.document.id)
-            else:
-                matched = get_entity_by_key(
-                    entities=all_entities,
-                    key=embedding_vectorstore_key,
-                    value=result.document.id,
-                )
-            if matched:
-                matched_entities.append(matched)
+        exact_matches = []
+        if entity_name_matcher is not None:
+            exact_matches = [
+                matched
+                for entity_id in entity_name_matcher.find(query)
+                if (matched := get_entity_by_id(all_entities_dict, entity_id))
+                and matched.title not in exclude_entity_names
+            ]
+        if len(exact_matches) < k:
+            matched_entities = await _search_entities(
+                query=query,
+                text_embedding_vectorstore=text_embedding_vectorstore,
+                text_embedder=text_embedder,
+                all_entities_dict=all_entities_dict,
+                embedding_vectorstore_key=embedding_vectorstore_key,
+                k=k * oversample_scaler,
+                lexical_index=lexical_index,
+                retrieval_mode=retrieval_mode,
+            )
+        exact_ids = {entity.id for entity in exact_matches}
+        matched_entities = exact_matches + [
+            entity for entity in matched_entities if entity.id not in exact_ids
+        ]
     else:
         all_entities.sort(key=lambda x: x.rank if x.rank else 0, reverse=True)
         matched_entities = all_entities[:k]
@@ -96,6 +117,67 @@ def map_query_to_entities(
     return included_entities + matched_entities
 
 
+async def _search_entities(
+    query: str,
+    text_embedding_vectorstore: VectorStore,
+    text_embedder: "LLMEmbedding",
+    all_entities_dict: dict[str, Entity],
+    embedding_vectorstore_key: str,
+    k: int,
+    lexical_index: LexicalIndex | None,
+    retrieval_mode: RetrievalMode,
+) -> list[Entity]:
+    """Rank entities against the query by vector and/or lexical similarity."""
+    all_entities = list(all_entities_dict.values())
+    use_lexical = lexical_index is not None and retrieval_mode != RetrievalMode.Vector
+    rankings: list[list[Entity]] = []
+    if not use_lexical or retrieval_mode == RetrievalMode.Hybrid:
+        # get entities with highest semantic similarity to query
+        # oversample to account for excluded entities
+        search_results = (
+            await text_embedding_vectorstore.similarity_search_by_text_async(
+                text=query,
+                text_embedder=lambda t: _embed_query(text_embedder, t),
+                k=k,
+            )
+        )
+        vector_matches = []
+        for result in search_results:
+            if embedding_vectorstore_key == EntityVectorStoreKey.ID and isinstance(
+                result.document.id, str
+            ):
+                matched = get_entity_by_id(all_entities_dict, result.document.id)
+            else:
+                matched = get_entity_by_key(
+                    entities=all_entities,
+                    key=embedding_vectorstore_key,
+                    value=result.document.id,
+                )
+            if matched:
+                vector_matches.append(matched)
+        rankings.append(vector_matches)
+    if use_lexical:
+        lexical_matches = [
+            matched
+            for entity_id, _ in lexical_index.search(query, k=k)  # type: ignore
+            if (matched := get_entity_by_id(all_entities_dict, entity_id))
+        ]
+        rankings.append(lexical_matches)
+
+    if len(rankings) == 1:
+        return rankings[0]
+    by_id = {entity.id: entity for ranking in rankings for entity in ranking}
+    fused = reciprocal_rank_fusion([
+        [entity.id for entity in ranking] for ranking in rankings
+    ])
+    return [by_id[entity_id] for entity_id in fused][:k]
+
+
+async def _embed_query(text_embedder: "LLMEmbedding", text: str) -> list[float]:
+    response = await text_embedder.embedding_async(input=[text])
+    return response.first_embedding
+
+
 def find_nearest_neighbors_by_entity_rank(
     entity_name: str,
     all_entities: list[Entity],
@@ -4,10 +4,11 @@
 """Query Factory methods to support CLI."""
 
 from graphrag_llm.completion import create_completion
-from graphrag_llm.embedding import create_embedding
+from graphrag_llm.embedding import LLMEmbedding, create_embedding
 from graphrag_vectors import VectorStore
 
 from graphrag.callbacks.query_callbacks import QueryCallbacks
+from graphrag.config.enums import RetrievalMode
 from graphrag.config.models.graph_rag_config import GraphRagConfig
 from graphrag.data_model.community import Community
 from graphrag.data_model.community_report import CommunityReport
@@ -15,7 +16,10 @@ from graphrag.data_model.covariate import Covariate
 from graphrag.data_model.entity import Entity
 from graphrag.data_model.relationship import Relationship
 from graphrag.data_model.text_unit import TextUnit
+from graphrag.query.context_builder.dynamic_community_selection import RatingCache
 from graphrag.query.context_builder.entity_extraction import EntityVectorStoreKey
+from graphrag.query.input.retrieval.entity_name_matcher import EntityNameMatcher
+from graphrag.query.input.retrieval.lexical_index import LexicalIndex
 from graphrag.query.structured_search.basic_search.basic_context import (
     BasicSearchContext,
 )
@@ -33,6 +37,9 @@ from graphrag.query.structured_search.local_search.mixed_context import (
 )
 from graphrag.query.structured_search.local_search.search import LocalSearch
 
+# community ratings shared by the global search engines that rate the same way
+_rating_caches: dict[tuple[str, int, int], RatingCache] = {}
+
 
 def get_local_search_engine(
     config: GraphRagConfig,
@@ -45,8 +52,15 @@ def get_local_search_engine(
     description_embedding_store: VectorStore,
     system_prompt: str | None = None,
     callbacks: list[QueryCallbacks] | None = None,
+    text_embedder: LLMEmbedding | None = None,
+    lexical_index: LexicalIndex | None = None,
+    entity_name_matcher: EntityNameMatcher | None = None,
 ) -> LocalSearch:
-    """Create a local search engine based on data + configuration."""
+    """Create a local search engine based on data + configuration.
+
+    Indexes built when the data was loaded can be passed in to share them
+    across engines; otherwise the ones the configuration needs are built here.
+    """
     model_settings = config.get_completion_model_config(
         config.local_search.completion_model_id
     )
@@ -57,7 +71,7 @@ def get_local_search_engine(
         config.local_search.embedding_model_id
     )
 
-    embedding_model = create_embedding(embedding_settings)
+    embedding_model = text_embedder or create_embedding(embedding_settings)
 
     tokenizer = chat_model.tokenizer
 
@@ -65,6 +79,15 @@ def get_local_search_engine(
 
     model_params = model_settings.call_args
 
+    if ls_config.retrieval_mode == RetrievalMode.Vector:
+        lexical_index = None
+    elif lexical_index is None:
+        lexical_index = build_entity_lexical_index(entities)
+    if not ls_config.match_entity_names:
+        entity_name_matcher = None
+    elif entity_name_matcher is None:
+        entity_name_matcher = build_entity_name_matcher(entities)
+
     return LocalSearch(
         model=chat_model,
         system_prompt=system_prompt,
@@ -78,6 +101,9 @@ def get_local_search_engine(
             embedding_vectorstore_key=EntityVectorStoreKey.ID,  # if the vectorstore uses entity title as ids, set this to EntityVectorStoreKey.TITLE
             text_embedder=embedding_model,
             tokenizer=tokenizer,
+            lexical_index=lexical_index,
+            retrieval_mode=ls_config.retrieval_mode,
+            entity_name_matcher=entity_name_matcher,
         ),
         tokenizer=tokenizer,
         model_params=model_params,
@@ -139,6 +165,11 @@ def get_global_search_engine(
             "threshold": gs_config.dynamic_search_threshold,
             "max_level": gs_config.dynamic_search_max_level,
             "model_params": {**model_params},
+            "rating_cache": _get_rating_cache(
+                f"{model_settings.model_provider}/{model_settings.model}",
+                gs_config.dynamic_search_num_repeats,
+                gs_config.dynamic_search_rating_cache_size,
+            ),
         })
 
     return GlobalSearch(
@@ -175,6 +206,7 @@ def get_global_search_engine(
             "context_name": "Reports",
         },
         concurrent_coroutines=config.concurrent_requests,
+        map_stop_score=gs_config.map_stop_score,
         response_type=response_type,
         callbacks=callbacks,
     )
@@ -191,6 +223,8 @@ def get_drift_search_engine(
     local_system_prompt: str | None = None,
     reduce_system_prompt: str | None = None,
     callbacks: list[QueryCallbacks] | None = None,
+    text_embedder: LLMEmbedding | None = None,
+    entity_name_matcher: EntityNameMatcher | None = None,
 ) -> DRIFTSearch:
     """Create a local search engine based on data + configuration."""
     chat_model_settings = config.get_completion_model_config(
@@ -203,10 +237,15 @@ def get_drift_search_engine(
         config.drift_search.embedding_model_id
     )
 
-    embedding_model = create_embedding(embedding_model_settings)
+    embedding_model = text_embedder or create_embedding(embedding_model_settings)
 
     tokenizer = chat_model.tokenizer
 
+    if not config.drift_search.local_search_match_entity_names:
+        entity_name_matcher = None
+    elif entity_name_matcher is None:
+        entity_name_matcher = build_entity_name_matcher(entities)
+
     return DRIFTSearch(
         model=chat_model,
         context_builder=DRIFTSearchContextBuilder(
@@ -221,6 +260,7 @@ def get_drift_search_engine(
             reduce_system_prompt=reduce_system_prompt,
             config=config.drift_search,
             response_type=response_type,
+            entity_name_matcher=entity_name_matcher,
         ),
         tokenizer=tokenizer,
         callbacks=callbacks,
@@ -234,6 +274,8 @@ def get_basic_search_engine(
     response_type: str,
     system_prompt: str | None = None,
     callbacks: list[QueryCallbacks] | None = None,
+    text_embedder: LLMEmbedding | None = None,
+    lexical_index: LexicalIndex | None = None,
 ) -> BasicSearch:
     """Create a basic search engine based on data + configuration."""
     chat_model_settings = config.get_completion_model_config(
@@ -246,7 +288,7 @@ def get_basic_search_engine(
         config.basic_search.embedding_model_id
     )
 
-    embedding_model = create_embedding(embedding_model_settings)
+    embedding_model = text_embedder or create_embedding(embedding_model_settings)
 
     tokenizer = chat_model.tokenizer
 
@@ -254,6 +296,11 @@ def get_basic_search_engine(
 
     model_params = chat_model_settings.call_args
 
+    if bs_config.retrieval_mode == RetrievalMode.Vector:
+        lexical_index = None
+    elif lexical_index is None:
+        lexical_index = build_text_unit_lexical_index(text_units)
+
     return BasicSearch(
         model=chat_model,
         system_prompt=system_prompt,
@@ -263,6 +310,8 @@ def get_basic_search_engine(
             text_unit_embeddings=text_unit_embeddings,
             text_units=text_units,
             tokenizer=tokenizer,
+            lexical_index=lexical_index,
+            retrieval_mode=bs_config.retrieval_mode,
         ),
         tokenizer=tokenizer,
         model_params=model_params,
@@ -273,3 +322,29 @@ def get_basic_search_engine(
         },
         callbacks=callbacks,
     )
+
+
+def _get_rating_cache(model_id: str, num_repeats: int, max_size: int) -> RatingCache:
+    """Get the rating cache shared by engines rating with the same model and repeats."""
+    key = (model_id, num_repeats, max_size)
+    if key not in _rating_caches:
+        _rating_caches[key] = RatingCache(max_size)
+    return _rating_caches[key]
+
+
+def build_entity_lexical_index(entities: list[Entity]) -> LexicalIndex:
+    """Build the lexical index over entity titles and descriptions."""
+    return LexicalIndex([
+        (entity.id, f"{entity.title}\n{entity.description or ''}")
+        for entity in entities
+    ])
+
+
+def build_text_unit_lexical_index(text_units: list[TextUnit]) -> LexicalIndex:
+    """Build the lexical index over text unit texts."""
+    return LexicalIndex([(unit.id, unit.text) for unit in text_units])
+
+
+def build_entity_name_matcher(entities: list[Entity]) -> EntityNameMatcher:
+    """Build the matcher of entity titles."""
+    return EntityNameMatcher([(entity.id, entity.title) for entity in entities])
@@ -0,0 +1,135 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""An Aho-Corasick automaton for exact entity-name matching."""
+
+from collections import deque
+from collections.abc import Iterable
+
+# shorter names are often common words ("AI", "US", "IT"), so they only
+# match with the exact case they were registered with
+_MIN_CASE_INSENSITIVE_LENGTH = 4
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+class EntityNameMatcher:
+    """Find every known entity name in a text with a single scan.
+
+    Names are matched only on word boundaries, so "art" does not match inside
+    "party". Names of four or more characters are matched case-insensitively,
+    shorter ones only with their exact case, so "US" does not match "us". An
+    entity can be registered under several names (e.g. its title and any
+    aliases).
+    """
+
+    def __init__(self, names: Iterable[tuple[str, str]]):
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._output: list[list[int]] = [[]]
+        self._lengths: list[int] = []
+        self._ids: list[list[str]] = []
+        # per pattern, the exact spellings a short name must match, or None
+        self._exact: list[set[str] | None] = []
+        patterns: dict[str, int] = {}
+        for entity_id, name in names:
+            name = (name or "").strip()
+            key = name.casefold()
+            if not key:
+                continue
+            if key not in patterns:
+                patterns[key] = len(self._lengths)
+                self._lengths.append(len(key))
+                self._ids.append([])
+                self._exact.append(
+                    set() if len(name) < _MIN_CASE_INSENSITIVE_LENGTH else None
+                )
+                self._add(key, patterns[key])
+            pattern = patterns[key]
+            exact = self._exact[pattern]
+            if exact is not None:
+                exact.add(name)
+            if entity_id not in self._ids[pattern]:
+                self._ids[pattern].append(entity_id)
+        self._build_failure_links()
+
+    def __len__(self) -> int:
+        """Return the number of distinct names in the automaton."""
+        return len(self._lengths)
+
+    def _add(self, key: str, pattern: int) -> None:
+        state = 0
+        for char in key:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+                self._goto[state][char] = next_state
+            state = next_state
+        self._output[state].append(pattern)
+
+    def _build_failure_links(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                self._output[next_state].extend(self._output[self._fail[next_state]])
+
+    def find(self, text: str) -> list[str]:
+        """Return the ids of entities whose names occur in the text.
+
+        Overlapping matches are resolved leftmost-longest, and ids are
+        returned in order of their first occurrence.
+        """
+        folded = text.casefold()
+        # offsets only line up with the original text if folding kept its length
+        original = text if len(folded) == len(text) else None
+        matches: list[tuple[int, int, int]] = []
+        state = 0
+        for index, char in enumerate(folded):
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            for pattern in self._output[state]:
+                end = index + 1
+                start = end - self._lengths[pattern]
+                exact = self._exact[pattern]
+                if exact is not None and (
+                    original is None or original[start:end] not in exact
+                ):
+                    continue
+                if self._on_boundary(folded, start, end):
+                    matches.append((start, end, pattern))
+
+        matches.sort(key=lambda match: (match[0], match[0] - match[1]))
+        entity_ids: list[str] = []
+        seen: set[str] = set()
+        covered = 0
+        for start, end, pattern in matches:
+            if start < covered:
+                continue
+            covered = end
+            for entity_id in self._ids[pattern]:
+                if entity_id not in seen:
+                    seen.add(entity_id)
+                    entity_ids.append(entity_id)
+        return entity_ids
+
+    @staticmethod
+    def _on_boundary(text: str, start: int, end: int) -> bool:
+        if start > 0 and _is_word_char(text[start]) and _is_word_char(text[start - 1]):
+            return False
+        return not (
+            end < len(text)
+            and _is_word_char(text[end - 1])
+            and _is_word_char(text[end])
+        )
@@ -0,0 +1,76 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A BM25 inverted index for lexical retrieval."""
+
+import heapq
+import math
+import re
+from collections import Counter, defaultdict
+from collections.abc import Iterable
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into case-folded word tokens."""
+    return _TOKEN_PATTERN.findall(text.casefold())
+
+
+class LexicalIndex:
+    """Okapi BM25 inverted index over a collection of (id, text) documents."""
+
+    def __init__(
+        self,
+        documents: Iterable[tuple[str, str]],
+        k1: float = 1.5,
+        b: float = 0.75,
+    ):
+        self.k1 = k1
+        self.b = b
+        self._ids: list[str] = []
+        self._lengths: list[int] = []
+        self._postings: dict[str, list[tuple[int, int]]] = defaultdict(list)
+        for doc_id, text in documents:
+            index = len(self._ids)
+            terms = tokenize(text or "")
+            self._ids.append(doc_id)
+            self._lengths.append(len(terms))
+            for term, count in Counter(terms).items():
+                self._postings[term].append((index, count))
+        self._average_length = (
+            sum(self._lengths) / len(self._lengths) if self._lengths else 0.0
+        )
+
+    def __len__(self) -> int:
+        """Return the number of indexed documents."""
+        return len(self._ids)
+
+    def search(self, query: str, k: int = 10) -> list[tuple[str, float]]:
+        """Return the ids and BM25 scores of the k best matching documents."""
+        scores: dict[int, float] = defaultdict(float)
+        num_documents = len(self._ids)
+        for term in set(tokenize(query)):
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            idf = math.log(
+                1 + (num_documents - len(postings) + 0.5) / (len(postings) + 0.5)
+            )
+            for index, count in postings:
+                norm = 1 - self.b + self.b * self._lengths[index] / self._average_length
+                scores[index] += idf * count * (self.k1 + 1) / (count + self.k1 * norm)
+        best = heapq.nlargest(k, scores.items(), key=lambda item: item[1])
+        return [(self._ids[index], score) for index, score in best]
+
+
+def reciprocal_rank_fusion(
+    rankings: Iterable[list[str]],
+    k: int = 60,
+) -> list[str]:
+    """Fuse ranked id lists by summing 1 / (k + rank) for each id."""
+    scores: dict[str, float] = defaultdict(float)
+    for ranking in rankings:
+        for rank, doc_id in enumerate(ranking):
+            scores[doc_id] += 1 / (k + rank + 1)
+    return sorted(scores, key=lambda doc_id: scores[doc_id], reverse=True)
@@ -82,7 +82,7 @@ class LocalQuestionGen(BaseQuestionGen):
             # generate context data based on the question history
             result = cast(
                 "ContextBuilderResult",
-                self.context_builder.build_context(
+                await self.context_builder.build_context(
                     query=question_text,
                     conversation_history=conversation_history,
                     **kwargs,
@@ -173,7 +173,7 @@ class LocalQuestionGen(BaseQuestionGen):
             # generate context data based on the question history
             result = cast(
                 "ContextBuilderResult",
-                self.context_builder.build_context(
+                await self.context_builder.build_context(
                     query=question_text,
                     conversation_history=conversation_history,
                     **kwargs,
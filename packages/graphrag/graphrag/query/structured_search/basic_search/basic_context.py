@@ -3,19 +3,26 @@
 
 """Basic Context Builder implementation."""
 
+import csv
 import logging
-from typing import TYPE_CHECKING, cast
+from io import StringIO
+from typing import TYPE_CHECKING
 
 import pandas as pd
 from graphrag_llm.tokenizer import Tokenizer
 from graphrag_vectors import VectorStore
 
+from graphrag.config.enums import RetrievalMode
 from graphrag.data_model.text_unit import TextUnit
 from graphrag.query.context_builder.builders import (
     BasicContextBuilder,
     ContextBuilderResult,
 )
 from graphrag.query.context_builder.conversation_history import ConversationHistory
+from graphrag.query.input.retrieval.lexical_index import (
+    LexicalIndex,
+    reciprocal_rank_fusion,
+)
 from graphrag.tokenizer.get_tokenizer import get_tokenizer
 
 if TYPE_CHECKING:
@@ -34,14 +41,21 @@ class BasicSearchContext(BasicContextBuilder):
         text_units: list[TextUnit] | None = None,
         tokenizer: Tokenizer | None = None,
         embedding_vectorstore_key: str = "id",
+        lexical_index: LexicalIndex | None = None,
+        retrieval_mode: RetrievalMode = RetrievalMode.Vector,
     ):
         self.text_embedder = text_embedder
         self.tokenizer = tokenizer or get_tokenizer()
         self.text_units = text_units
         self.text_unit_embeddings = text_unit_embeddings
         self.embedding_vectorstore_key = embedding_vectorstore_key
+        self.lexical_index = lexical_index
+        self.retrieval_mode = retrieval_mode
+        self.text_units_by_id = {unit.id: unit for unit in text_units or []}
+        # token counts of formatted context rows, keyed by (text unit id, delimiter)
+        self._row_tokens: dict[tuple[str, str], int] = {}
 
-    def build_context(
+    async def build_context(
         self,
         query: str,
         conversation_history: ConversationHistory | None = None,
@@ -54,56 +68,84 @@ class BasicSearchContext(BasicContextBuilder):
         **kwargs,
     ) -> ContextBuilderResult:
         """Build the context for the basic search mode."""
+        related_text_units: list[TextUnit] = []
         if query != "":
-            related_texts = self.text_unit_embeddings.similarity_search_by_text(
-                text=query,
-                text_embedder=lambda t: (
-                    self.text_embedder.embedding(input=[t]).first_embedding
-                ),
-                k=k,
-            )
-
-            text_unit_ids = {t.document.id for t in related_texts}
-            text_units_filtered = []
-            text_units_filtered = [
-                {text_id_col: t.short_id, text_col: t.text}
-                for t in self.text_units or []
-                if t.id in text_unit_ids
+            related_text_units = [
+                self.text_units_by_id[text_unit_id]
+                for text_unit_id in await self._retrieve(query, k)
+                if text_unit_id in self.text_units_by_id
             ]
-            related_text_df = pd.DataFrame(text_units_filtered)
-        else:
-            related_text_df = pd.DataFrame({
-                text_id_col: [],
-                text_col: [],
-            })
 
         # add these related text chunks into context until we fill up the context window
-        current_tokens = 0
-        text_ids = []
         current_tokens = len(
             self.tokenizer.encode(text_id_col + column_delimiter + text_col + "\n")
         )
-        for i, row in related_text_df.iterrows():
-            text = row[text_id_col] + column_delimiter + row[text_col] + "\n"
-            tokens = len(self.tokenizer.encode(text))
+        selected: list[TextUnit] = []
+        for unit in related_text_units:
+            tokens = self._count_row_tokens(unit, column_delimiter)
             if current_tokens + tokens > max_context_tokens:
                 msg = f"Reached token limit: {current_tokens + tokens}. Reverting to previous context state"
                 logger.warning(msg)
                 break
 
             current_tokens += tokens
-            text_ids.append(i)
-        final_text_df = cast(
-            "pd.DataFrame",
-            related_text_df[related_text_df.index.isin(text_ids)].reset_index(
-                drop=True
-            ),
-        )
-        final_text = final_text_df.to_csv(
-            index=False, escapechar="\\", sep=column_delimiter
+            selected.append(unit)
+
+        buffer = StringIO()
+        writer = csv.writer(
+            buffer, delimiter=column_delimiter, escapechar="\\", lineterminator="\n"
         )
+        writer.writerow([text_id_col, text_col])
+        writer.writerows((unit.short_id, unit.text) for unit in selected)
+        final_text_df = pd.DataFrame({
+            text_id_col: [unit.short_id for unit in selected],
+            text_col: [unit.text for unit in selected],
+        })
 
         return ContextBuilderResult(
-            context_chunks=final_text,
+            context_chunks=buffer.getvalue(),
             context_records={context_name.lower(): final_text_df},
         )
+
+    async def _retrieve(self, query: str, k: int) -> list[str]:
+        """Return the ids of the k text units best matching the query.
+
+        Lexical retrieval needs no embedding call. In hybrid mode the vector and
+        lexical rankings are fused with reciprocal rank fusion.
+        """
+        use_lexical = (
+            self.lexical_index is not None
+            and self.retrieval_mode != RetrievalMode.Vector
+        )
+        rankings: list[list[str]] = []
+        if use_lexical:
+            rankings.append([
+                text_unit_id
+                for text_unit_id, _ in self.lexical_index.search(query, k=k)  # type: ignore
+            ])
+        if not use_lexical or self.retrieval_mode == RetrievalMode.Hybrid:
+            related_texts = (
+                await self.text_unit_embeddings.similarity_search_by_text_async(
+                    text=query,
+                    text_embedder=self._embed_query,
+                    k=k,
+                )
+            )
+            rankings.insert(0, [str(t.document.id) for t in related_texts])
+        if len(rankings) == 1:
+            return rankings[0]
+        return reciprocal_rank_fusion(rankings)[:k]
+
+    async def _embed_query(self, text: str) -> list[float]:
+        response = await self.text_embedder.embedding_async(input=[text])
+        return response.first_embedding
+
+    def _count_row_tokens(self, unit: TextUnit, column_delimiter: str) -> int:
+        """Return the token count of a context row, computing it once per text unit."""
+        key = (unit.id, column_delimiter)
+        tokens = self._row_tokens.get(key)
+        if tokens is None:
+            text = f"{unit.short_id}{column_delimiter}{unit.text}\n"
+            tokens = self.tokenizer.num_tokens(text)
+            self._row_tokens[key] = tokens
+        return tokens
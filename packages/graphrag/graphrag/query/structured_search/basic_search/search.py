@@ -65,7 +65,7 @@ class BasicSearch(BaseSearch[BasicContextBuilder]):
         search_prompt = ""
         llm_calls, prompt_tokens, output_tokens = {}, {}, {}
 
-        context_result = self.context_builder.build_context(
+        context_result = await self.context_builder.build_context(
             query=query,
             conversation_history=conversation_history,
             **kwargs,
@@ -106,8 +106,8 @@ class BasicSearch(BaseSearch[BasicContextBuilder]):
                 response += response_text
 
             llm_calls["response"] = 1
-            prompt_tokens["response"] = len(self.tokenizer.encode(search_prompt))
-            output_tokens["response"] = len(self.tokenizer.encode(response))
+            prompt_tokens["response"] = self.tokenizer.num_tokens(search_prompt)
+            output_tokens["response"] = self.tokenizer.num_tokens(response)
 
             for callback in self.callbacks:
                 callback.on_context(context_result.context_records)
@@ -118,7 +118,7 @@ class BasicSearch(BaseSearch[BasicContextBuilder]):
                 context_text=context_result.context_chunks,
                 completion_time=time.time() - start_time,
                 llm_calls=1,
-                prompt_tokens=len(self.tokenizer.encode(search_prompt)),
+                prompt_tokens=self.tokenizer.num_tokens(search_prompt),
                 output_tokens=sum(output_tokens.values()),
                 llm_calls_categories=llm_calls,
                 prompt_tokens_categories=prompt_tokens,
@@ -133,7 +133,7 @@ class BasicSearch(BaseSearch[BasicContextBuilder]):
                 context_text=context_result.context_chunks,
                 completion_time=time.time() - start_time,
                 llm_calls=1,
-                prompt_tokens=len(self.tokenizer.encode(search_prompt)),
+                prompt_tokens=self.tokenizer.num_tokens(search_prompt),
                 output_tokens=0,
                 llm_calls_categories=llm_calls,
                 prompt_tokens_categories=prompt_tokens,
@@ -148,7 +148,7 @@ class BasicSearch(BaseSearch[BasicContextBuilder]):
         """Build basic search context that fits a single context window and generate answer for the user query."""
         start_time = time.time()
 
-        context_result = self.context_builder.build_context(
+        context_result = await self.context_builder.build_context(
             query=query,
             conversation_history=conversation_history,
             **self.context_builder_params,
@@ -0,0 +1,156 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Run many queries through a single search engine."""
+
+import asyncio
+import logging
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Unpack
+
+from graphrag_llm.embedding import LLMEmbedding
+from graphrag_llm.types import (
+    LLMEmbedding as EmbeddingData,
+)
+from graphrag_llm.types import (
+    LLMEmbeddingResponse,
+    LLMEmbeddingUsage,
+)
+
+from graphrag.query.structured_search.base import BaseSearch, SearchResult
+
+if TYPE_CHECKING:
+    from graphrag_llm.metrics import MetricsStore
+    from graphrag_llm.tokenizer import Tokenizer
+    from graphrag_llm.types import LLMEmbeddingArgs
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BatchSearchResult:
+    """The results of a batch of queries, in query order."""
+
+    results: list[SearchResult | BaseException]
+    completion_time: float
+
+    @property
+    def queries_per_minute(self) -> float:
+        """Throughput of the batch."""
+        if self.completion_time <= 0:
+            return 0.0
+        return len(self.results) * 60 / self.completion_time
+
+
+class PrecomputedEmbedding(LLMEmbedding):
+    """An embedding model that answers from precomputed query embeddings.
+
+    Inputs that were not precomputed are forwarded to the wrapped model.
+    """
+
+    def __init__(
+        self,
+        embedding: LLMEmbedding,
+        embeddings: dict[str, list[float]],
+        **kwargs: Any,
+    ):
+        self._embedding = embedding
+        self._embeddings = embeddings
+
+    def _lookup(self, inputs: list[str]) -> LLMEmbeddingResponse | None:
+        if not all(text in self._embeddings for text in inputs):
+            return None
+        return LLMEmbeddingResponse(
+            object="list",
+            data=[
+                EmbeddingData(
+                    object="embedding", embedding=self._embeddings[text], index=index
+                )
+                for index, text in enumerate(inputs)
+            ],
+            model="precomputed",
+            usage=LLMEmbeddingUsage(prompt_tokens=0, total_tokens=0),
+        )
+
+    def embedding(
+        self, /, **kwargs: Unpack["LLMEmbeddingArgs"]
+    ) -> LLMEmbeddingResponse:
+        """Sync embedding method."""
+        return self._lookup(kwargs["input"]) or self._embedding.embedding(**kwargs)
+
+    async def embedding_async(
+        self, /, **kwargs: Unpack["LLMEmbeddingArgs"]
+    ) -> LLMEmbeddingResponse:
+        """Async embedding method."""
+        return self._lookup(kwargs["input"]) or await self._embedding.embedding_async(
+            **kwargs
+        )
+
+    @property
+    def metrics_store(self) -> "MetricsStore":
+        """Metrics store."""
+        return self._embedding.metrics_store
+
+    @property
+    def tokenizer(self) -> "Tokenizer":
+        """Tokenizer."""
+        return self._embedding.tokenizer
+
+
+async def embed_queries(
+    embedding: LLMEmbedding,
+    queries: list[str],
+    batch_size: int = 16,
+) -> PrecomputedEmbedding:
+    """Embed all distinct queries in batched calls up front."""
+    distinct = list(dict.fromkeys(query for query in queries if query))
+    embeddings: dict[str, list[float]] = {}
+    for start in range(0, len(distinct), batch_size):
+        batch = distinct[start : start + batch_size]
+        response = await embedding.embedding_async(input=batch)
+        embeddings.update(zip(batch, response.embeddings, strict=True))
+    return PrecomputedEmbedding(embedding, embeddings)
+
+
+async def search_many(
+    search_engine: BaseSearch | Callable[[], BaseSearch],
+    queries: list[str],
+    concurrency: int = 25,
+    **kwargs: Any,
+) -> BatchSearchResult:
+    """Run every query through the same search engine.
+
+    At most `concurrency` queries are in flight at once, so the batch shares
+    a single LLM concurrency budget. A query that raises is returned as its
+    exception instead of failing the whole batch.
+
+    Search engines that keep state between calls can be passed as a callable
+    instead, which is called to create a new engine for each query.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(query: str) -> SearchResult:
+        async with semaphore:
+            engine = (
+                search_engine
+                if isinstance(search_engine, BaseSearch)
+                else search_engine()
+            )
+            return await engine.search(query=query, **kwargs)
+
+    start_time = time.time()
+    results = await asyncio.gather(
+        *(run(query) for query in queries), return_exceptions=True
+    )
+    batch_result = BatchSearchResult(
+        results=list(results), completion_time=time.time() - start_time
+    )
+    logger.info(
+        "Completed %d queries in %.2fs (%.1f queries per minute)",
+        len(queries),
+        batch_result.completion_time,
+        batch_result.queries_per_minute,
+    )
+    return batch_result
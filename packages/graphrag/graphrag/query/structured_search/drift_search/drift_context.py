@@ -24,6 +24,7 @@ from graphrag.prompts.query.drift_search_system_prompt import (
 )
 from graphrag.query.context_builder.builders import DRIFTContextBuilder
 from graphrag.query.context_builder.entity_extraction import EntityVectorStoreKey
+from graphrag.query.input.retrieval.entity_name_matcher import EntityNameMatcher
 from graphrag.query.structured_search.drift_search.primer import PrimerQueryProcessor
 from graphrag.query.structured_search.local_search.mixed_context import (
     LocalSearchMixedContext,
@@ -56,6 +57,7 @@ class DRIFTSearchContextBuilder(DRIFTContextBuilder):
         local_mixed_context: LocalSearchMixedContext | None = None,
         reduce_system_prompt: str | None = None,
         response_type: str | None = None,
+        entity_name_matcher: EntityNameMatcher | None = None,
     ):
         """Initialize the DRIFT search context builder with necessary components."""
         self.config = config
@@ -72,6 +74,7 @@ class DRIFTSearchContextBuilder(DRIFTContextBuilder):
         self.relationships = relationships
         self.covariates = covariates
         self.embedding_vectorstore_key = embedding_vectorstore_key
+        self.entity_name_matcher = entity_name_matcher
 
         self.response_type = response_type
 
@@ -97,6 +100,7 @@ class DRIFTSearchContextBuilder(DRIFTContextBuilder):
             embedding_vectorstore_key=self.embedding_vectorstore_key,
             text_embedder=self.text_embedder,
             tokenizer=self.tokenizer,
+            entity_name_matcher=self.entity_name_matcher,
         )
 
     @staticmethod
@@ -90,8 +90,8 @@ class PrimerQueryProcessor:
         )  # type: ignore
         text = model_response.content
 
-        prompt_tokens = len(self.tokenizer.encode(prompt))
-        output_tokens = len(self.tokenizer.encode(text))
+        prompt_tokens = self.tokenizer.num_tokens(prompt)
+        output_tokens = self.tokenizer.num_tokens(text)
         token_ct = {
             "llm_calls": 1,
             "prompt_tokens": prompt_tokens,
@@ -115,9 +115,8 @@ class PrimerQueryProcessor:
         """
         hyde_query, token_ct = await self.expand_query(query)
         logger.debug("Expanded query: %s", hyde_query)
-        return self.text_embedder.embedding(
-            input=[hyde_query]
-        ).first_embedding, token_ct
+        response = await self.text_embedder.embedding_async(input=[hyde_query])
+        return response.first_embedding, token_ct
 
 
 class DRIFTPrimer:
@@ -169,8 +168,8 @@ class DRIFTPrimer:
 
         token_ct = {
             "llm_calls": 1,
-            "prompt_tokens": len(self.tokenizer.encode(prompt)),
-            "output_tokens": len(self.tokenizer.encode(model_response.content)),
+            "prompt_tokens": self.tokenizer.num_tokens(prompt),
+            "output_tokens": self.tokenizer.num_tokens(model_response.content),
         }
 
         return parsed_response, token_ct
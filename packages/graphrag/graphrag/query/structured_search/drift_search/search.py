@@ -402,10 +402,10 @@ class DRIFTSearch(BaseSearch[DRIFTSearchContextBuilder]):
         reduced_response = await gather_completion_response_async(model_response)
 
         llm_calls["reduce"] = 1
-        prompt_tokens["reduce"] = len(self.tokenizer.encode(search_prompt)) + len(
-            self.tokenizer.encode(query)
-        )
-        output_tokens["reduce"] = len(self.tokenizer.encode(reduced_response))
+        prompt_tokens["reduce"] = self.tokenizer.num_tokens(
+            search_prompt
+        ) + self.tokenizer.num_tokens(query)
+        output_tokens["reduce"] = self.tokenizer.num_tokens(reduced_response)
 
         return reduced_response
 
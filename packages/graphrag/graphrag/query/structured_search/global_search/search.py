@@ -4,6 +4,7 @@
 """The GlobalSearch Implementation."""
 
 import asyncio
+import bisect
 import json
 import logging
 import time
@@ -74,6 +75,7 @@ class GlobalSearch(BaseSearch[GlobalContextBuilder]):
         reduce_max_length: int = 2000,
         context_builder_params: dict[str, Any] | None = None,
         concurrent_coroutines: int = 32,
+        map_stop_score: int | None = None,
     ):
         super().__init__(
             model=model,
@@ -101,6 +103,8 @@ class GlobalSearch(BaseSearch[GlobalContextBuilder]):
         self.map_max_length = map_max_length
         self.reduce_max_length = reduce_max_length
 
+        self.map_stop_score = map_stop_score
+
         self.semaphore = asyncio.Semaphore(concurrent_coroutines)
 
     async def stream_search(
@@ -117,15 +121,10 @@ class GlobalSearch(BaseSearch[GlobalContextBuilder]):
         for callback in self.callbacks:
             callback.on_map_response_start(context_result.context_chunks)  # type: ignore
 
-        map_responses = await asyncio.gather(*[
-            self._map_response_single_batch(
-                context_data=data,
-                query=query,
-                max_length=self.map_max_length,
-                **self.map_llm_params,
-            )
-            for data in context_result.context_chunks
-        ])
+        map_responses = await self._map_responses(
+            context_chunks=context_result.context_chunks,  # type: ignore
+            query=query,
+        )
 
         for callback in self.callbacks:
             callback.on_map_response_end(map_responses)  # type: ignore
@@ -169,15 +168,10 @@ class GlobalSearch(BaseSearch[GlobalContextBuilder]):
         for callback in self.callbacks:
             callback.on_map_response_start(context_result.context_chunks)  # type: ignore
 
-        map_responses = await asyncio.gather(*[
-            self._map_response_single_batch(
-                context_data=data,
-                query=query,
-                max_length=self.map_max_length,
-                **self.map_llm_params,
-            )
-            for data in context_result.context_chunks
-        ])
+        map_responses = await self._map_responses(
+            context_chunks=context_result.context_chunks,  # type: ignore
+            query=query,
+        )
 
         for callback in self.callbacks:
             callback.on_map_response_end(map_responses)
@@ -213,6 +207,71 @@ class GlobalSearch(BaseSearch[GlobalContextBuilder]):
             output_tokens_categories=output_tokens,
         )
 
+    async def _map_responses(
+        self,
+        context_chunks: list[str],
+        query: str,
+    ) -> list[SearchResult]:
+        """Run the map step over every batch of community reports.
+
+        If map_stop_score is set, map results are streamed into a top-k buffer
+        of key points sized to the reduce token budget, and the remaining map
+        calls are cancelled once the buffer is full of key points scoring at
+        least map_stop_score. A cancelled batch could still have contributed a
+        higher scored key point, so this trades some recall for latency.
+        """
+        if self.map_stop_score is None:
+            return await asyncio.gather(*[
+                self._map_response_single_batch(
+                    context_data=data,
+                    query=query,
+                    max_length=self.map_max_length,
+                    **self.map_llm_params,
+                )
+                for data in context_chunks
+            ])
+
+        tasks = {
+            asyncio.create_task(
+                self._map_response_single_batch(
+                    context_data=data,
+                    query=query,
+                    max_length=self.map_max_length,
+                    **self.map_llm_params,
+                )
+            ): index
+            for index, data in enumerate(context_chunks)
+        }
+        results: dict[int, SearchResult] = {}
+        buffer = _KeyPointBuffer(self.tokenizer, self.max_data_tokens)
+        pending = set(tasks)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    results[tasks[task]] = task.result()
+                    buffer.add(tasks[task], task.result())
+                lowest_score = buffer.lowest_score()
+                if (
+                    pending
+                    and lowest_score is not None
+                    and lowest_score >= self.map_stop_score
+                ):
+                    logger.debug(
+                        "Reduce context filled with key points scoring at least %d, "
+                        "cancelling %d map batches",
+                        self.map_stop_score,
+                        len(pending),
+                    )
+                    break
+        finally:
+            for task in pending:
+                task.cancel()
+
+        return [results[index] for index in sorted(results)]
+
     async def _map_response_single_batch(
         self,
         context_data: str,
@@ -257,8 +316,8 @@ class GlobalSearch(BaseSearch[GlobalContextBuilder]):
                 context_text=context_data,
                 completion_time=time.time() - start_time,
                 llm_calls=1,
-                prompt_tokens=len(self.tokenizer.encode(search_prompt)),
-                output_tokens=len(self.tokenizer.encode(search_response)),
+                prompt_tokens=self.tokenizer.num_tokens(search_prompt),
+                output_tokens=self.tokenizer.num_tokens(search_response),
             )
 
         except Exception:
@@ -269,7 +328,7 @@ class GlobalSearch(BaseSearch[GlobalContextBuilder]):
                 context_text=context_data,
                 completion_time=time.time() - start_time,
                 llm_calls=1,
-                prompt_tokens=len(self.tokenizer.encode(search_prompt)),
+                prompt_tokens=self.tokenizer.num_tokens(search_prompt),
                 output_tokens=0,
             )
 
@@ -371,12 +430,12 @@ class GlobalSearch(BaseSearch[GlobalContextBuilder]):
                 formatted_response_data.append(point["answer"])  # type: ignore
                 formatted_response_text = "\n".join(formatted_response_data)
                 if (
-                    total_tokens + len(self.tokenizer.encode(formatted_response_text))
+                    total_tokens + self.tokenizer.num_tokens(formatted_response_text)
                     > self.max_data_tokens
                 ):
                     break
                 data.append(formatted_response_text)
-                total_tokens += len(self.tokenizer.encode(formatted_response_text))
+                total_tokens += self.tokenizer.num_tokens(formatted_response_text)
             text_data = "\n\n".join(data)
 
             search_prompt = self.reduce_system_prompt.format(
@@ -415,8 +474,8 @@ class GlobalSearch(BaseSearch[GlobalContextBuilder]):
                 context_text=text_data,
                 completion_time=time.time() - start_time,
                 llm_calls=1,
-                prompt_tokens=len(self.tokenizer.encode(search_prompt)),
-                output_tokens=len(self.tokenizer.encode(search_response)),
+                prompt_tokens=self.tokenizer.num_tokens(search_prompt),
+                output_tokens=self.tokenizer.num_tokens(search_response),
             )
         except Exception:
             logger.exception("Exception in reduce_response")
@@ -426,7 +485,7 @@ class GlobalSearch(BaseSearch[GlobalContextBuilder]):
                 context_text=text_data,
                 completion_time=time.time() - start_time,
                 llm_calls=1,
-                prompt_tokens=len(self.tokenizer.encode(search_prompt)),
+                prompt_tokens=self.tokenizer.num_tokens(search_prompt),
                 output_tokens=0,
             )
 
@@ -484,12 +543,12 @@ class GlobalSearch(BaseSearch[GlobalContextBuilder]):
             ]
             formatted_response_text = "\n".join(formatted_response_data)
             if (
-                total_tokens + len(self.tokenizer.encode(formatted_response_text))
+                total_tokens + self.tokenizer.num_tokens(formatted_response_text)
                 > self.max_data_tokens
             ):
                 break
             data.append(formatted_response_text)
-            total_tokens += len(self.tokenizer.encode(formatted_response_text))
+            total_tokens += self.tokenizer.num_tokens(formatted_response_text)
         text_data = "\n\n".join(data)
 
         search_prompt = self.reduce_system_prompt.format(
@@ -519,3 +578,45 @@ class GlobalSearch(BaseSearch[GlobalContextBuilder]):
             for callback in self.callbacks:
                 callback.on_llm_new_token(response_text)
             yield response_text
+
+
+class _KeyPointBuffer:
+    """Incremental top-k buffer of map key points bounded by a token budget."""
+
+    def __init__(self, tokenizer: Tokenizer, max_tokens: int):
+        self._tokenizer = tokenizer
+        self._max_tokens = max_tokens
+        # (negated score, token count) kept sorted by descending score
+        self._points: list[tuple[int, int]] = []
+
+    def add(self, index: int, response: SearchResult) -> None:
+        """Add the scored key points of a map response."""
+        if not isinstance(response.response, list):
+            return
+        for element in response.response:
+            if not isinstance(element, dict):
+                continue
+            if "answer" not in element or "score" not in element:
+                continue
+            if element["score"] <= 0:
+                continue
+            text = "\n".join([
+                f"----Analyst {index + 1}----",
+                f"Importance Score: {element['score']}",
+                element["answer"],
+            ])
+            bisect.insort(
+                self._points,
+                (-element["score"], self._tokenizer.num_tokens(text)),
+            )
+
+    def lowest_score(self) -> int | None:
+        """Return the lowest score that fits the budget, or None if it is not full."""
+        total_tokens = 0
+        lowest = None
+        for negated_score, tokens in self._points:
+            if total_tokens + tokens > self._max_tokens:
+                return lowest
+            total_tokens += tokens
+            lowest = -negated_score
+        return None
@@ -10,6 +10,7 @@ import pandas as pd
 from graphrag_llm.tokenizer import Tokenizer
 from graphrag_vectors import VectorStore
 
+from graphrag.config.enums import RetrievalMode
 from graphrag.data_model.community_report import CommunityReport
 from graphrag.data_model.covariate import Covariate
 from graphrag.data_model.entity import Entity
@@ -42,6 +43,8 @@ from graphrag.query.context_builder.source_context import (
 from graphrag.query.input.retrieval.community_reports import (
     get_candidate_communities,
 )
+from graphrag.query.input.retrieval.entity_name_matcher import EntityNameMatcher
+from graphrag.query.input.retrieval.lexical_index import LexicalIndex
 from graphrag.query.input.retrieval.text_units import get_candidate_text_units
 from graphrag.tokenizer.get_tokenizer import get_tokenizer
 
@@ -65,6 +68,9 @@ class LocalSearchMixedContext(LocalContextBuilder):
         covariates: dict[str, list[Covariate]] | None = None,
         tokenizer: Tokenizer | None = None,
         embedding_vectorstore_key: str = EntityVectorStoreKey.ID,
+        lexical_index: LexicalIndex | None = None,
+        retrieval_mode: RetrievalMode = RetrievalMode.Vector,
+        entity_name_matcher: EntityNameMatcher | None = None,
     ):
         if community_reports is None:
             community_reports = []
@@ -87,8 +93,11 @@ class LocalSearchMixedContext(LocalContextBuilder):
         self.text_embedder = text_embedder
         self.tokenizer = tokenizer or get_tokenizer()
         self.embedding_vectorstore_key = embedding_vectorstore_key
+        self.lexical_index = lexical_index
+        self.retrieval_mode = retrieval_mode
+        self.entity_name_matcher = entity_name_matcher
 
-    def build_context(
+    async def build_context(
         self,
         query: str,
         conversation_history: ConversationHistory | None = None,
@@ -136,7 +145,7 @@ class LocalSearchMixedContext(LocalContextBuilder):
             )
             query = f"{query}\n{pre_user_questions}"
 
-        selected_entities = map_query_to_entities(
+        selected_entities = await map_query_to_entities(
             query=query,
             text_embedding_vectorstore=self.entity_text_embeddings,
             text_embedder=self.text_embedder,
@@ -146,6 +155,9 @@ class LocalSearchMixedContext(LocalContextBuilder):
             exclude_entity_names=exclude_entity_names,
             k=top_k_mapped_entities,
             oversample_scaler=2,
+            lexical_index=self.lexical_index,
+            retrieval_mode=self.retrieval_mode,
+            entity_name_matcher=self.entity_name_matcher,
         )
 
         # build context
@@ -397,7 +409,7 @@ class LocalSearchMixedContext(LocalContextBuilder):
             rank_description=rank_description,
             context_name="Entities",
         )
-        entity_tokens = len(self.tokenizer.encode(entity_context))
+        entity_tokens = self.tokenizer.num_tokens(entity_context)
 
         # build relationship-covariate context
         added_entities = []
@@ -441,7 +453,7 @@ class LocalSearchMixedContext(LocalContextBuilder):
                     column_delimiter=column_delimiter,
                     context_name=covariate,
                 )
-                total_tokens += len(self.tokenizer.encode(covariate_context))
+                total_tokens += self.tokenizer.num_tokens(covariate_context)
                 current_context.append(covariate_context)
                 current_context_data[covariate.lower()] = covariate_context_data
 
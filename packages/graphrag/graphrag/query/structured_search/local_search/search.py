@@ -63,7 +63,7 @@ class LocalSearch(BaseSearch[LocalContextBuilder]):
         start_time = time.time()
         search_prompt = ""
         llm_calls, prompt_tokens, output_tokens = {}, {}, {}
-        context_result = self.context_builder.build_context(
+        context_result = await self.context_builder.build_context(
             query=query,
             conversation_history=conversation_history,
             **kwargs,
@@ -112,8 +112,8 @@ class LocalSearch(BaseSearch[LocalContextBuilder]):
                     callback.on_llm_new_token(response_text)
 
             llm_calls["response"] = 1
-            prompt_tokens["response"] = len(self.tokenizer.encode(search_prompt))
-            output_tokens["response"] = len(self.tokenizer.encode(full_response))
+            prompt_tokens["response"] = self.tokenizer.num_tokens(search_prompt)
+            output_tokens["response"] = self.tokenizer.num_tokens(full_response)
 
             for callback in self.callbacks:
                 callback.on_context(context_result.context_records)
@@ -139,7 +139,7 @@ class LocalSearch(BaseSearch[LocalContextBuilder]):
                 context_text=context_result.context_chunks,
                 completion_time=time.time() - start_time,
                 llm_calls=1,
-                prompt_tokens=len(self.tokenizer.encode(search_prompt)),
+                prompt_tokens=self.tokenizer.num_tokens(search_prompt),
                 output_tokens=0,
             )
 
@@ -151,7 +151,7 @@ class LocalSearch(BaseSearch[LocalContextBuilder]):
         """Build local search context that fits a single context window and generate answer for the user query."""
         start_time = time.time()
 
-        context_result = self.context_builder.build_context(
+        context_result = await self.context_builder.build_context(
             query=query,
             conversation_history=conversation_history,
             **self.context_builder_params,
@@ -57,3 +57,20 @@ async def test_child():
     await storage.delete("test.txt")
     output = await storage.get("test.txt")
     assert output is None
+
+
+async def test_copy_to(tmp_path):
+    source = FileStorage(base_dir=str(tmp_path / "source"))
+    target = FileStorage(base_dir=str(tmp_path / "target"))
+    await source.set("a.parquet", b"\x00\x01")
+    await source.set("b.txt", "hello")
+
+    await source.copy_to(target, ["a.parquet", "b.txt", "missing.txt"])
+
+    assert await target.get("a.parquet", as_bytes=True) == b"\x00\x01"
+    assert await target.get("b.txt") == "hello"
+    assert not await target.has("missing.txt")
+
+    # the copy is independent of later writes to the source
+    await source.set("b.txt", "changed")
+    assert await target.get("b.txt") == "hello"
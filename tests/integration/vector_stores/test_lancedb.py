@@ -284,6 +284,21 @@ class TestLanceDBVectorStore:
         results = store.similarity_search_by_text("test", mock_embedder, k=2)
         assert len(results) == 2
 
+    async def test_similarity_search_by_text_async(
+        self, store_with_fields, sample_documents_with_metadata
+    ):
+        """Test text-based similarity search with an async embedder."""
+        store = store_with_fields
+        store.load_documents(sample_documents_with_metadata)
+
+        async def mock_embedder(text: str) -> list[float]:  # noqa: RUF029
+            return [0.1, 0.2, 0.3, 0.4, 0.5]
+
+        results = await store.similarity_search_by_text_async(
+            "test", mock_embedder, k=2
+        )
+        assert len(results) == 2
+
     def test_similarity_search_k_limit(
         self, store_with_fields, sample_documents_with_metadata
     ):
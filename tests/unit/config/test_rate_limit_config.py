@@ -64,3 +64,47 @@ def test_sliding_window_validation() -> None:
         requests_per_period=100,
         tokens_per_period=1000,
     )
+
+
+def test_adaptive_validation() -> None:
+    """Test that invalid concurrency bounds raise validation errors."""
+
+    with pytest.raises(
+        ValueError,
+        match="max_concurrency must be a positive integer for Adaptive rate limit\\.",
+    ):
+        _ = RateLimitConfig(
+            type=RateLimitType.Adaptive,
+            max_concurrency=0,
+        )
+
+    with pytest.raises(
+        ValueError,
+        match="Adaptive rate limit requires min_concurrency <= initial_concurrency <= max_concurrency\\.",
+    ):
+        _ = RateLimitConfig(
+            type=RateLimitType.Adaptive,
+            initial_concurrency=10,
+            max_concurrency=5,
+        )
+
+    with pytest.raises(
+        ValueError,
+        match="latency_threshold must be greater than 1 for Adaptive rate limit\\.",
+    ):
+        _ = RateLimitConfig(
+            type=RateLimitType.Adaptive,
+            latency_threshold=0.5,
+        )
+
+    # passes validation
+    _ = RateLimitConfig(
+        type=RateLimitType.Adaptive,
+    )
+    _ = RateLimitConfig(
+        type=RateLimitType.Adaptive,
+        min_concurrency=2,
+        initial_concurrency=4,
+        max_concurrency=32,
+        latency_threshold=5.0,
+    )
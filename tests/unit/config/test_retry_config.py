@@ -37,6 +37,33 @@ def test_exponential_backoff_validation() -> None:
             max_delay=0.5,
         )
 
+    with pytest.raises(
+        ValueError,
+        match="retry_budget must be greater than 0 for Exponential Backoff retry\\.",
+    ):
+        _ = RetryConfig(
+            type=RetryType.ExponentialBackoff,
+            retry_budget=0,
+        )
+
+    with pytest.raises(
+        ValueError,
+        match="circuit_breaker_threshold must be between 0 and 1 for Exponential Backoff retry\\.",
+    ):
+        _ = RetryConfig(
+            type=RetryType.ExponentialBackoff,
+            circuit_breaker_threshold=1.5,
+        )
+
+    with pytest.raises(
+        ValueError,
+        match="circuit_breaker_cooldown must be greater than 0 for Exponential Backoff retry\\.",
+    ):
+        _ = RetryConfig(
+            type=RetryType.ExponentialBackoff,
+            circuit_breaker_cooldown=0,
+        )
+
     # passes validation
     _ = RetryConfig(type=RetryType.ExponentialBackoff)
     _ = RetryConfig(
@@ -45,6 +72,12 @@ def test_exponential_backoff_validation() -> None:
         base_delay=2.0,
         max_delay=30,
     )
+    _ = RetryConfig(
+        type=RetryType.ExponentialBackoff,
+        retry_budget=0.2,
+        circuit_breaker_threshold=0.5,
+        circuit_breaker_cooldown=10,
+    )
 
 
 def test_immediate_validation() -> None:
@@ -68,6 +68,9 @@ def assert_retry_configs(actual: RetryConfig, expected: RetryConfig) -> None:
     assert actual.base_delay == expected.base_delay
     assert actual.jitter == expected.jitter
     assert actual.max_delay == expected.max_delay
+    assert actual.retry_budget == expected.retry_budget
+    assert actual.circuit_breaker_threshold == expected.circuit_breaker_threshold
+    assert actual.circuit_breaker_cooldown == expected.circuit_breaker_cooldown
 
 
 def assert_rate_limit_configs(
@@ -77,6 +80,12 @@ def assert_rate_limit_configs(
     assert actual.period_in_seconds == expected.period_in_seconds
     assert actual.requests_per_period == expected.requests_per_period
     assert actual.tokens_per_period == expected.tokens_per_period
+    assert actual.initial_concurrency == expected.initial_concurrency
+    assert actual.min_concurrency == expected.min_concurrency
+    assert actual.max_concurrency == expected.max_concurrency
+    assert actual.latency_threshold == expected.latency_threshold
+    assert actual.database_path == expected.database_path
+    assert actual.quota_key == expected.quota_key
 
 
 def assert_metrics_configs(actual: MetricsConfig, expected: MetricsConfig) -> None:
@@ -190,6 +199,7 @@ def assert_extract_graph_configs(
     assert actual.entity_types == expected.entity_types
     assert actual.max_gleanings == expected.max_gleanings
     assert actual.completion_model_id == expected.completion_model_id
+    assert actual.pack_max_tokens == expected.pack_max_tokens
 
 
 def assert_text_analyzer_configs(
@@ -233,6 +243,8 @@ def assert_summarize_descriptions_configs(
     assert actual.prompt == expected.prompt
     assert actual.max_length == expected.max_length
     assert actual.completion_model_id == expected.completion_model_id
+    assert actual.batch_max_tokens == expected.batch_max_tokens
+    assert actual.batch_prompt == expected.batch_prompt
 
 
 def assert_community_reports_configs(
@@ -253,6 +265,8 @@ def assert_extract_claims_configs(
     assert actual.description == expected.description
     assert actual.max_gleanings == expected.max_gleanings
     assert actual.completion_model_id == expected.completion_model_id
+    assert actual.combined_with_graph == expected.combined_with_graph
+    assert actual.combined_prompt == expected.combined_prompt
 
 
 def assert_cluster_graph_configs(
@@ -261,6 +275,7 @@ def assert_cluster_graph_configs(
     assert actual.max_cluster_size == expected.max_cluster_size
     assert actual.use_lcc == expected.use_lcc
     assert actual.seed == expected.seed
+    assert actual.incremental == expected.incremental
 
 
 def assert_local_search_configs(
@@ -275,6 +290,8 @@ def assert_local_search_configs(
     assert actual.top_k_entities == expected.top_k_entities
     assert actual.top_k_relationships == expected.top_k_relationships
     assert actual.max_context_tokens == expected.max_context_tokens
+    assert actual.retrieval_mode == expected.retrieval_mode
+    assert actual.match_entity_names == expected.match_entity_names
 
 
 def assert_global_search_configs(
@@ -287,11 +304,16 @@ def assert_global_search_configs(
     assert actual.data_max_tokens == expected.data_max_tokens
     assert actual.map_max_length == expected.map_max_length
     assert actual.reduce_max_length == expected.reduce_max_length
+    assert actual.map_stop_score == expected.map_stop_score
     assert actual.dynamic_search_threshold == expected.dynamic_search_threshold
     assert actual.dynamic_search_keep_parent == expected.dynamic_search_keep_parent
     assert actual.dynamic_search_num_repeats == expected.dynamic_search_num_repeats
     assert actual.dynamic_search_use_summary == expected.dynamic_search_use_summary
     assert actual.dynamic_search_max_level == expected.dynamic_search_max_level
+    assert (
+        actual.dynamic_search_rating_cache_size
+        == expected.dynamic_search_rating_cache_size
+    )
 
 
 def assert_drift_search_configs(
@@ -325,6 +347,10 @@ def assert_drift_search_configs(
         actual.local_search_llm_max_gen_tokens
         == expected.local_search_llm_max_gen_tokens
     )
+    assert (
+        actual.local_search_match_entity_names
+        == expected.local_search_match_entity_names
+    )
 
 
 def assert_basic_search_configs(
@@ -332,6 +358,7 @@ def assert_basic_search_configs(
 ) -> None:
     assert actual.prompt == expected.prompt
     assert actual.k == expected.k
+    assert actual.retrieval_mode == expected.retrieval_mode
 
 
 def assert_graphrag_configs(actual: GraphRagConfig, expected: GraphRagConfig) -> None:
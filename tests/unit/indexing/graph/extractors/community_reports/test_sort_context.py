@@ -3,10 +3,12 @@
 import math
 import platform
 
+from graphrag.config.defaults import ENCODING_MODEL
 from graphrag.index.operations.summarize_communities.graph_context.sort_context import (
     sort_context,
 )
 from graphrag.tokenizer.get_tokenizer import get_tokenizer
+from graphrag_llm.tokenizer.tiktoken_tokenizer import TiktokenTokenizer
 
 nan = math.nan
 
@@ -219,3 +221,22 @@ def test_sort_context_max_tokens():
     assert ctx is not None, "Context is none"
     num = tokenizer.num_tokens(ctx)
     assert num <= 800, f"num_tokens is not less than or equal to 800: {num}"
+
+
+def test_sort_context_max_tokens_matches_growing_context():
+    tokenizer = get_tokenizer()
+    full = sort_context(context, tokenizer=tokenizer)
+
+    for max_tokens in [100, 300, 500]:
+        ctx = sort_context(context, tokenizer=tokenizer, max_context_tokens=max_tokens)
+        assert tokenizer.num_tokens(ctx, cache=False) <= max_tokens
+        # the rows are the highest degree edges of the full context
+        assert set(ctx.splitlines()) <= set(full.splitlines())
+
+
+def test_sort_context_does_not_cache_context_strings():
+    tokenizer = TiktokenTokenizer(encoding_name=ENCODING_MODEL)
+    sort_context(context, tokenizer=tokenizer, max_context_tokens=2000)
+
+    # only the section headers are cached, not every growing context string
+    assert len(tokenizer._token_count_cache) <= 3  # noqa: SLF001
@@ -0,0 +1,73 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+import asyncio
+
+from graphrag_input import InputConfig, InputType, create_input_reader
+from graphrag_storage.memory_storage import MemoryStorage
+
+
+class SlowMemoryStorage(MemoryStorage):
+    """Memory storage that simulates per-file latency and tracks calls."""
+
+    def __init__(self, delays: dict[str, float], **kwargs):
+        super().__init__(**kwargs)
+        self.delays = delays
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.creation_date_calls: list[str] = []
+
+    async def get(self, key, as_bytes=None, encoding=None):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(self.delays.get(key, 0))
+        self.in_flight -= 1
+        return await super().get(key, as_bytes, encoding)
+
+    async def get_creation_date(self, key):
+        self.creation_date_calls.append(key)
+        return "2024-01-01 00:00:00 +0000"
+
+
+async def _create_storage(delays: dict[str, float]) -> SlowMemoryStorage:
+    storage = SlowMemoryStorage(delays)
+    for name in delays:
+        await storage.set(name, f"title,text\n{name},a\n{name},b\n{name},c\n")
+    return storage
+
+
+async def test_reader_bounds_concurrency():
+    storage = await _create_storage({f"input{i}.csv": 0.01 for i in range(10)})
+    config = InputConfig(type=InputType.Csv, concurrency=3)
+    reader = create_input_reader(config, storage)
+    documents = await reader.read_files()
+    assert len(documents) == 30
+    assert storage.max_in_flight == 3
+
+
+async def test_reader_ordered_yields_in_file_order():
+    storage = await _create_storage({"a.csv": 0.05, "b.csv": 0, "c.csv": 0})
+    config = InputConfig(type=InputType.Csv, title_column="title", concurrency=3)
+    reader = create_input_reader(config, storage)
+    documents = await reader.read_files()
+    assert [doc.title for doc in documents[::3]] == ["a.csv", "b.csv", "c.csv"]
+
+
+async def test_reader_unordered_yields_as_completed():
+    storage = await _create_storage({"a.csv": 0.05, "b.csv": 0, "c.csv": 0})
+    config = InputConfig(
+        type=InputType.Csv, title_column="title", concurrency=3, ordered=False
+    )
+    reader = create_input_reader(config, storage)
+    documents = await reader.read_files()
+    assert len(documents) == 9
+    assert documents[-1].title == "a.csv"
+
+
+async def test_reader_gets_creation_date_once_per_file():
+    storage = await _create_storage({"a.csv": 0, "b.csv": 0})
+    config = InputConfig(type=InputType.Csv)
+    reader = create_input_reader(config, storage)
+    documents = await reader.read_files()
+    assert len(documents) == 6
+    assert sorted(storage.creation_date_calls) == ["a.csv", "b.csv"]
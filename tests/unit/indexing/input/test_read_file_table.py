@@ -0,0 +1,105 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+from dataclasses import asdict
+
+import pytest
+from graphrag_input import InputConfig, InputType, create_input_reader
+from graphrag_storage import StorageConfig, create_storage
+
+
+async def _read_both(config: InputConfig, base_dir: str):
+    storage = create_storage(StorageConfig(base_dir=base_dir))
+    reader = create_input_reader(config, storage)
+    documents = [asdict(doc) for doc in await reader.read_files()]
+    rows = [row async for table in reader.iter_tables() for row in table.to_pylist()]
+    return documents, rows
+
+
+@pytest.mark.parametrize(
+    ("input_type", "base_dir"),
+    [
+        (InputType.Csv, "tests/unit/indexing/input/data/multiple-csvs"),
+        (InputType.JsonLines, "tests/unit/indexing/input/data/one-jsonl"),
+        (InputType.Json, "tests/unit/indexing/input/data/multiple-jsons"),
+        (InputType.Parquet, "tests/unit/indexing/input/data/one-parquet"),
+        (InputType.Text, "tests/unit/indexing/input/data/multiple-txts"),
+    ],
+)
+async def test_table_path_matches_row_path(input_type, base_dir):
+    config = InputConfig(type=input_type)
+    documents, rows = await _read_both(config, base_dir)
+    assert len(rows) == len(documents)
+    for doc, row in zip(documents, rows, strict=True):
+        assert row["id"] == doc["id"]
+        assert row["title"] == doc["title"]
+        assert row["text"] == doc["text"]
+        assert row["creation_date"] == doc["creation_date"]
+        if doc["raw_data"] is not None:
+            assert {k: row["raw_data"][k] for k in doc["raw_data"]} == doc["raw_data"]
+
+
+async def test_table_path_with_title_column():
+    config = InputConfig(type=InputType.Csv, title_column="title")
+    documents, rows = await _read_both(config, "tests/unit/indexing/input/data/one-csv")
+    assert [row["title"] for row in rows] == [doc["title"] for doc in documents]
+
+
+async def test_table_path_skips_invalid_jsonl_rows():
+    config = InputConfig(type=InputType.JsonLines)
+    documents, rows = await _read_both(
+        config, "tests/unit/indexing/input/data/jsonl-with-invalid-and-blank-lines"
+    )
+    assert [row["text"] for row in rows] == [doc["text"] for doc in documents]
+
+
+async def test_table_path_nested_column(tmp_path):
+    (tmp_path / "input.jsonl").write_text(
+        '{"meta": {"name": "A"}, "body": "first"}\n'
+        '{"meta": {"name": "B"}, "body": "second"}\n',
+        encoding="utf-8",
+    )
+    config = InputConfig(
+        type=InputType.JsonLines, title_column="meta.name", text_column="body"
+    )
+    documents, rows = await _read_both(config, str(tmp_path))
+    assert [row["title"] for row in rows] == ["A", "B"]
+    assert [row["text"] for row in rows] == [doc["text"] for doc in documents]
+
+
+@pytest.mark.parametrize(
+    ("input_type", "file_name", "content"),
+    [
+        (
+            InputType.Json,
+            "input.json",
+            '[{"text": "x", "a": 1}, {"b": {"c": 2}, "text": "y"}]',
+        ),
+        (
+            InputType.JsonLines,
+            "input.jsonl",
+            '{"text": "x", "a": 1}\n{"b": {"c": 2}, "text": "y"}\n{"text": "z", "a": }\n',
+        ),
+    ],
+)
+async def test_table_path_keeps_keys_of_later_rows(
+    tmp_path, input_type, file_name, content
+):
+    (tmp_path / file_name).write_text(content, encoding="utf-8")
+    config = InputConfig(type=input_type, title_column="b.c")
+    _, rows = await _read_both(InputConfig(type=input_type), str(tmp_path))
+
+    assert [row["raw_data"] for row in rows] == [
+        {"text": "x", "a": 1, "b": None},
+        {"text": "y", "a": None, "b": {"c": 2}},
+    ]
+
+    # a configured column missing from the first row is still found
+    storage = create_storage(StorageConfig(base_dir=str(tmp_path)))
+    reader = create_input_reader(config, storage)
+    titles = [
+        row["title"]
+        async for table in reader.iter_tables()
+        for row in table.to_pylist()
+    ]
+    assert titles == [None, 2]
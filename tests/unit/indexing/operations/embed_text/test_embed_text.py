@@ -4,6 +4,7 @@
 """Unit tests for the streaming embed_text operation."""
 
 from collections.abc import AsyncIterator
+from types import SimpleNamespace
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -15,7 +16,9 @@ from graphrag.callbacks.noop_workflow_callbacks import (
 from graphrag.index.operations.embed_text.embed_text import embed_text
 from graphrag.index.operations.embed_text.run_embed_text import (
     TextEmbeddingResult,
+    run_embed_text,
 )
+from graphrag_llm.tokenizer.tiktoken_tokenizer import TiktokenTokenizer
 from graphrag_storage.tables.table import Table
 
 
@@ -416,3 +419,85 @@ async def test_embed_text_partial_none_embeddings():
     assert len(output_table.rows) == 2
     assert output_table.rows[0]["id"] == "a"
     assert output_table.rows[1]["id"] == "c"
+
+
+@pytest.mark.asyncio
+async def test_embed_text_deduplicates_identical_texts():
+    """Verify identical texts are embedded once, including across flushes."""
+    rows = [
+        {"id": "1", "text": "boilerplate"},
+        {"id": "2", "text": "unique"},
+        {"id": "3", "text": "boilerplate"},
+        {"id": "4", "text": "boilerplate"},
+        {"id": "5", "text": "other"},
+    ]
+    input_table = FakeInputTable(rows)
+    output_table = FakeOutputTable()
+    vector_store = _make_mock_vector_store()
+
+    with patch(
+        "graphrag.index.operations.embed_text.embed_text.run_embed_text",
+        new_callable=AsyncMock,
+    ) as mock_run:
+        mock_run.side_effect = [
+            TextEmbeddingResult(embeddings=[[1.0], [2.0]]),
+            TextEmbeddingResult(embeddings=[[3.0]]),
+        ]
+
+        count = await embed_text(
+            input_table=input_table,
+            callbacks=NoopWorkflowCallbacks(),
+            model=MagicMock(),
+            tokenizer=MagicMock(),
+            embed_column="text",
+            batch_size=3,
+            batch_max_tokens=8191,
+            num_threads=1,
+            vector_store=vector_store,
+            output_table=output_table,
+        )
+
+    assert count == 5
+    assert [call.args[0] for call in mock_run.call_args_list] == [
+        ["boilerplate", "unique"],
+        ["other"],
+    ]
+    assert {row["id"]: row["embedding"] for row in output_table.rows} == {
+        "1": [1.0],
+        "2": [2.0],
+        "3": [1.0],
+        "4": [1.0],
+        "5": [3.0],
+    }
+
+
+@pytest.mark.asyncio
+async def test_run_embed_text_embeds_each_distinct_text_once():
+    """Verify duplicate inputs are sent once and fanned back out in order."""
+    sent: list[str] = []
+
+    async def embedding_async(input: list[str]) -> SimpleNamespace:  # noqa: RUF029
+        sent.extend(input)
+        return SimpleNamespace(embeddings=[[float(len(text))] for text in input])
+
+    model = MagicMock()
+    model.embedding_async = embedding_async
+
+    result = await run_embed_text(
+        ["a", "bb", "a", "ccc", "bb"],
+        NoopWorkflowCallbacks(),
+        model,
+        TiktokenTokenizer(encoding_name="o200k_base"),
+        batch_size=10,
+        batch_max_tokens=8191,
+        num_threads=1,
+    )
+
+    assert sent == ["a", "bb", "ccc"]
+    assert [list(vector) for vector in result.embeddings or []] == [
+        [1.0],
+        [2.0],
+        [1.0],
+        [3.0],
+        [2.0],
+    ]
@@ -0,0 +1,133 @@
+# Copyright (C) 2026 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Tests for combined single-pass graph and claim extraction."""
+
+from types import SimpleNamespace
+from typing import Any
+
+from graphrag.index.operations.extract_covariates.claim_extractor import (
+    ClaimExtractor,
+)
+from graphrag.index.operations.extract_graph.graph_claim_extractor import (
+    GraphClaimExtractor,
+)
+from graphrag.index.operations.extract_graph.graph_extractor import GraphExtractor
+from graphrag.prompts.index.extract_claims import EXTRACT_CLAIMS_PROMPT
+from graphrag.prompts.index.extract_graph import GRAPH_EXTRACTION_PROMPT
+from graphrag.prompts.index.extract_graph_claims import (
+    GRAPH_CLAIMS_EXTRACTION_PROMPT,
+)
+
+EXTRACTION_RESPONSE = """
+("entity"<|>COMPANY A<|>ORGANIZATION<|>Company A is a test company)
+##
+("entity"<|>PERSON C<|>PERSON<|>Person C owns Company A)
+##
+("relationship"<|>PERSON C<|>COMPANY A<|>Person C owns Company A<|>9)
+##
+("claim"<|>COMPANY A<|>NONE<|>BID RIGGING<|>SUSPECTED<|>NONE<|>NONE<|>Company A is suspected of bid rigging<|>Company A rigged bids)
+<|COMPLETE|>
+""".strip()
+
+GLEANING_RESPONSE = """
+("claim"<|>PERSON C<|>NONE<|>CORRUPTION<|>SUSPECTED<|>2015-01-01<|>2015-12-31<|>Person C is suspected of corruption<|>Person C was suspected)
+<|COMPLETE|>
+""".strip()
+
+
+class RecordingModel:
+    """A mock completion model that records every prompt it is sent."""
+
+    def __init__(self, responses: list[str]) -> None:
+        self.responses = responses
+        self.calls: list[list[dict[str, Any]]] = []
+
+    async def completion_async(
+        self, messages: list[dict[str, Any]], **kwargs: Any
+    ) -> SimpleNamespace:
+        self.calls.append(messages)
+        return SimpleNamespace(
+            content=self.responses[(len(self.calls) - 1) % len(self.responses)]
+        )
+
+    @property
+    def prompt_chars(self) -> int:
+        return sum(len(str(message["content"])) for c in self.calls for message in c)
+
+
+async def test_extracts_entities_relationships_and_claims():
+    model = RecordingModel([EXTRACTION_RESPONSE])
+    extractor = GraphClaimExtractor(
+        model=model,  # type: ignore
+        prompt=GRAPH_CLAIMS_EXTRACTION_PROMPT,
+        max_gleanings=0,
+        claim_description="red flags",
+    )
+
+    entities, relationships, claims = await extractor(
+        "Company A rigged bids.", entity_types=["organization"], source_id="tu1"
+    )
+
+    assert entities["title"].tolist() == ["COMPANY A", "PERSON C"]
+    assert relationships[["source", "target"]].values.tolist() == [
+        ["PERSON C", "COMPANY A"]
+    ]
+    assert claims.to_dict("records") == [
+        {
+            "subject_id": "COMPANY A",
+            "object_id": "NONE",
+            "type": "BID RIGGING",
+            "status": "SUSPECTED",
+            "start_date": "NONE",
+            "end_date": "NONE",
+            "description": "Company A is suspected of bid rigging",
+            "source_text": "Company A rigged bids",
+            "text_unit_id": "tu1",
+        }
+    ]
+    assert len(model.calls) == 1
+    assert "red flags" in model.calls[0][0]["content"]
+
+
+async def test_gleanings_add_claims():
+    model = RecordingModel([EXTRACTION_RESPONSE, GLEANING_RESPONSE, "N"])
+    extractor = GraphClaimExtractor(
+        model=model,  # type: ignore
+        prompt=GRAPH_CLAIMS_EXTRACTION_PROMPT,
+        max_gleanings=2,
+        claim_description="red flags",
+    )
+
+    _, _, claims = await extractor("text", entity_types=["person"], source_id="tu1")
+
+    # extraction, one gleaning, then the model answers N to the loop prompt
+    assert len(model.calls) == 3
+    assert claims["subject_id"].tolist() == ["COMPANY A", "PERSON C"]
+
+
+async def test_halves_prompt_input_compared_to_separate_extraction():
+    text = "Company A was fined for bid rigging by Government Agency B. " * 200
+
+    separate = RecordingModel([EXTRACTION_RESPONSE])
+    await GraphExtractor(
+        model=separate,  # type: ignore
+        prompt=GRAPH_EXTRACTION_PROMPT,
+        max_gleanings=0,
+    )(text, entity_types=["organization"], source_id="tu1")
+    await ClaimExtractor(
+        model=separate,  # type: ignore
+        extraction_prompt=EXTRACT_CLAIMS_PROMPT,
+        max_gleanings=0,
+    )([text], ["organization"], {}, "red flags")
+
+    combined = RecordingModel([EXTRACTION_RESPONSE])
+    await GraphClaimExtractor(
+        model=combined,  # type: ignore
+        prompt=GRAPH_CLAIMS_EXTRACTION_PROMPT,
+        max_gleanings=0,
+        claim_description="red flags",
+    )(text, entity_types=["organization"], source_id="tu1")
+
+    assert len(combined.calls) == len(separate.calls) / 2
+    assert combined.prompt_chars < 0.6 * separate.prompt_chars
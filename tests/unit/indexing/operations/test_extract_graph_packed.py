@@ -0,0 +1,186 @@
+# Copyright (C) 2026 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Tests for graph extraction with short text units packed into shared prompts."""
+
+import re
+from types import SimpleNamespace
+from typing import Any
+
+import pandas as pd
+from graphrag.callbacks.noop_workflow_callbacks import NoopWorkflowCallbacks
+from graphrag.config.enums import AsyncType
+from graphrag.index.operations.extract_graph.extract_graph import extract_graph
+from graphrag.index.operations.extract_graph.graph_extractor import GraphExtractor
+from graphrag.index.operations.extract_graph.utils import pack_text_units
+from graphrag.prompts.index.extract_graph import GRAPH_EXTRACTION_PROMPT
+from graphrag_llm.tokenizer import Tokenizer
+
+
+class CharTokenizer(Tokenizer):
+    def __init__(self, **kwargs: Any) -> None:
+        pass
+
+    def encode(self, text: str) -> list[int]:
+        return [ord(char) for char in text]
+
+    def decode(self, tokens: list[int]) -> str:
+        return "".join(chr(token) for token in tokens)
+
+
+class EmployeeModel:
+    """A mock completion model that extracts "<name> works at ACME" records."""
+
+    def __init__(self) -> None:
+        self.tokenizer = CharTokenizer()
+        self.prompt_chars = 0
+        self.requests = 0
+
+    async def completion_async(
+        self, messages: list[dict[str, Any]], **kwargs: Any
+    ) -> SimpleNamespace:
+        prompt = str(messages[-1]["content"])
+        self.prompt_chars += len(prompt)
+        self.requests += 1
+        records = []
+        documents = re.findall(r"-Document (\d+)-\n(P\d+) works at ACME", prompt)
+        for number, name in documents or re.findall(
+            r"Text: ()(P\d+) works at ACME", prompt
+        ):
+            if number:
+                records.append(f'("document"<|>{number})')
+            records.extend([
+                f'("entity"<|>{name}<|>PERSON<|>{name} is an employee)',
+                '("entity"<|>ACME<|>ORGANIZATION<|>ACME is a company)',
+                f'("relationship"<|>{name}<|>ACME<|>{name} works at ACME<|>5)',
+            ])
+        return SimpleNamespace(content="\n##\n".join(records) + "\n<|COMPLETE|>")
+
+
+class FixedModel:
+    """A mock completion model that always sends the same response."""
+
+    def __init__(self, response: str) -> None:
+        self.response = response
+
+    async def completion_async(self, **kwargs: Any) -> SimpleNamespace:
+        return SimpleNamespace(content=self.response)
+
+
+class SequenceModel:
+    """A mock completion model that sends its responses in order."""
+
+    def __init__(self, *responses: str) -> None:
+        self.responses = list(responses)
+
+    async def completion_async(self, **kwargs: Any) -> SimpleNamespace:
+        return SimpleNamespace(content=self.responses.pop(0))
+
+
+async def _extract(
+    model: EmployeeModel, text_units: pd.DataFrame, pack_max_tokens: int
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    return await extract_graph(
+        text_units,
+        NoopWorkflowCallbacks(),
+        text_column="text",
+        id_column="id",
+        model=model,  # type: ignore
+        prompt=GRAPH_EXTRACTION_PROMPT,
+        entity_types=["person", "organization"],
+        max_gleanings=0,
+        num_threads=4,
+        async_type=AsyncType.AsyncIO,
+        pack_max_tokens=pack_max_tokens,
+    )
+
+
+def test_pack_text_units():
+    assert pack_text_units([10, 20, 30, 100, 5, 5], max_tokens=60) == [
+        [0, 1, 2],
+        [3],
+        [4, 5],
+    ]
+    assert pack_text_units([], max_tokens=60) == []
+
+
+async def test_packed_extraction_keeps_text_unit_ids():
+    text_units = pd.DataFrame({
+        "id": [f"tu{i}" for i in range(20)],
+        "text": [f"P{i} works at ACME" for i in range(20)],
+    })
+    single = EmployeeModel()
+    expected = await _extract(single, text_units, pack_max_tokens=0)
+
+    packed = EmployeeModel()
+    entities, relationships = await _extract(packed, text_units, pack_max_tokens=100)
+
+    assert single.requests == 20
+    assert packed.requests == 4
+    # the prompt template is sent once per pack instead of once per text unit
+    assert packed.prompt_chars < single.prompt_chars * 0.3
+
+    pd.testing.assert_frame_equal(entities, expected[0])
+    pd.testing.assert_frame_equal(relationships, expected[1])
+    acme = entities.set_index("title").loc["ACME"]
+    assert acme["text_unit_ids"] == [f"tu{i}" for i in range(20)]
+    assert entities.set_index("title").loc["P7", "text_unit_ids"] == ["tu7"]
+    assert relationships.set_index("source").loc["P7", "text_unit_ids"] == ["tu7"]
+
+
+async def test_records_outside_documents_are_attributed_by_mention(caplog):
+    records = [
+        '("entity"<|>ACME<|>ORGANIZATION<|>ACME is a company)',
+        '("entity"<|>AI<|>CONCEPT<|>AI is a field of study)',
+        '("document"<|>2)',
+        '("entity"<|>P1<|>PERSON<|>P1 is an employee)',
+        '("document"<|>9)',
+        '("entity"<|>P0<|>PERSON<|>P0 is an employee)',
+        '("relationship"<|>P0<|>ACME<|>P0 works at ACME<|>5)',
+    ]
+    model = FixedModel("\n##\n".join(records))
+    extractor = GraphExtractor(model=model, prompt="{input_text}", max_gleanings=0)  # type: ignore
+
+    entities, relationships = await extractor.extract_packed(
+        ["P0 works at ACME", "P1 works at ACME", "P2 said it works elsewhere"],
+        entity_types=[],
+        source_ids=["tu0", "tu1", "tu2"],
+    )
+
+    assert sorted(zip(entities["title"], entities["source_id"], strict=True)) == [
+        ("ACME", "tu0"),
+        ("ACME", "tu1"),
+        ("P0", "tu0"),
+        ("P1", "tu1"),
+    ]
+    assert relationships[["source", "target", "source_id"]].to_numpy().tolist() == [
+        ["P0", "ACME", "tu0"]
+    ]
+    # "AI" only appears inside "said", so the record is dropped instead of guessed
+    assert "Dropped 1 entities and 0 relationships" in caplog.text
+
+
+async def test_gleaned_records_are_not_attributed_to_the_last_document():
+    records = [
+        '("document"<|>1)',
+        '("entity"<|>P0<|>PERSON<|>P0 is a person)',
+        '("document"<|>2)',
+        '("entity"<|>P1<|>PERSON<|>P1 is a person)',
+    ]
+    # the gleaning does not reopen a document record
+    model = SequenceModel(
+        "\n##\n".join(records), '("entity"<|>BOB<|>PERSON<|>Bob met P0)'
+    )
+    extractor = GraphExtractor(model=model, prompt="{input_text}", max_gleanings=1)  # type: ignore
+
+    entities, _ = await extractor.extract_packed(
+        ["P0 met Bob", "P1 works alone"],
+        entity_types=[],
+        source_ids=["tu0", "tu1"],
+    )
+
+    assert sorted(zip(entities["title"], entities["source_id"], strict=True)) == [
+        ("BOB", "tu0"),
+        ("P0", "tu0"),
+        ("P1", "tu1"),
+    ]
@@ -0,0 +1,210 @@
+# Copyright (C) 2026 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Tests for entity and relationship description summarization."""
+
+import asyncio
+import json
+from types import SimpleNamespace
+from typing import Any
+
+import pandas as pd
+import pytest
+from graphrag.callbacks.noop_workflow_callbacks import NoopWorkflowCallbacks
+from graphrag.index.operations.summarize_descriptions.description_summary_extractor import (
+    BatchSummaryResponse,
+)
+from graphrag.index.operations.summarize_descriptions.summarize_descriptions import (
+    summarize_descriptions,
+)
+from graphrag_llm.tokenizer import Tokenizer
+
+PROMPT = "{entity_name}|{description_list}|{max_length}"
+BATCH_PROMPT = "{input_items}|{max_length}"
+
+
+class CharTokenizer(Tokenizer):
+    def __init__(self, **kwargs: Any) -> None:
+        pass
+
+    def encode(self, text: str) -> list[int]:
+        return [ord(char) for char in text]
+
+    def decode(self, tokens: list[int]) -> str:
+        return "".join(chr(token) for token in tokens)
+
+
+class ConcurrencyModel:
+    """A mock completion model that tracks how many requests are in flight."""
+
+    def __init__(self, fail_on: str | None = None) -> None:
+        self.tokenizer = CharTokenizer()
+        self.fail_on = fail_on
+        self.in_flight = 0
+        self.peak = 0
+        self.started: list[Any] = []
+        self.events: list[tuple[str, Any]] = []
+
+    async def completion_async(self, messages: str, **kwargs: Any) -> SimpleNamespace:
+        id = json.loads(messages.split("|")[0])
+        id = tuple(id) if isinstance(id, list) else id
+        self.started.append(id)
+        self.events.append(("start", id))
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(0.001)
+            if id == self.fail_on:
+                msg = "summarization failed"
+                raise RuntimeError(msg)
+            return SimpleNamespace(content=f"summary of {id}")
+        finally:
+            self.in_flight -= 1
+            self.events.append(("end", id))
+
+
+class BatchModel:
+    """A mock completion model that answers single and batched summarization prompts."""
+
+    def __init__(self, skip: str | None = None) -> None:
+        self.tokenizer = CharTokenizer()
+        self.skip = skip
+        self.requests = 0
+
+    async def completion_async(
+        self, messages: str, response_format: Any = None, **kwargs: Any
+    ) -> SimpleNamespace:
+        self.requests += 1
+        if response_format is None:
+            id = json.loads(messages.split("|")[0])
+            return SimpleNamespace(content=f"summary of {id}")
+        items = json.loads(messages.split("|")[0])
+        summaries = [
+            {"id": item["id"], "description": f"summary of {item['entities']}"}
+            for item in items
+            if item["entities"] != self.skip
+        ]
+        return SimpleNamespace(
+            formatted_response=BatchSummaryResponse(summaries=summaries)  # type: ignore
+        )
+
+
+def _graph(nodes: int, edges: int) -> tuple[pd.DataFrame, pd.DataFrame]:
+    entities = pd.DataFrame({
+        "title": [f"N{i}" for i in range(nodes)],
+        "description": [[f"N{i} is a node", f"N{i} has edges"] for i in range(nodes)],
+    })
+    relationships = pd.DataFrame({
+        "source": [f"N{i}" for i in range(edges)],
+        "target": [f"N{i + 1}" for i in range(edges)],
+        "description": [["c", "d"]] * edges,
+    })
+    return entities, relationships
+
+
+async def _summarize(
+    model: Any,
+    entities: pd.DataFrame,
+    relationships: pd.DataFrame,
+    num_threads: int = 4,
+    batch_max_tokens: int = 0,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    return await summarize_descriptions(
+        entities,
+        relationships,
+        NoopWorkflowCallbacks(),
+        model,  # type: ignore
+        max_summary_length=100,
+        max_input_tokens=1000,
+        prompt=PROMPT,
+        num_threads=num_threads,
+        batch_prompt=BATCH_PROMPT,
+        batch_max_tokens=batch_max_tokens,
+    )
+
+
+async def test_summarizes_nodes_and_edges_with_bounded_concurrency():
+    model = ConcurrencyModel()
+    entities, relationships = _graph(nodes=40, edges=30)
+
+    node_summaries, edge_summaries = await _summarize(model, entities, relationships)
+
+    assert model.peak == 4
+    assert len(model.started) == 70
+    # relationships start as soon as workers free up, not after every entity
+    assert model.events.index(("start", ("N0", "N1"))) < model.events.index((
+        "end",
+        "N39",
+    ))
+
+    nodes = dict(
+        zip(node_summaries["title"], node_summaries["description"], strict=True)
+    )
+    assert nodes == {f"N{i}": f"summary of N{i}" for i in range(40)}
+    edges = edge_summaries.set_index(["source", "target"])["description"]
+    assert edges["N3", "N4"] == "summary of ('N3', 'N4')"
+    assert len(edges) == 30
+
+
+async def test_single_descriptions_and_empty_graphs():
+    model = ConcurrencyModel()
+    entities = pd.DataFrame({"title": ["A"], "description": [["only", "only"]]})
+
+    node_summaries, edge_summaries = await _summarize(model, entities, _graph(0, 0)[1])
+
+    assert model.started == []
+    assert node_summaries.to_dict("records") == [{"title": "A", "description": "only"}]
+    assert list(edge_summaries.columns) == ["source", "target", "description"]
+    assert edge_summaries.empty
+
+
+async def test_failure_cancels_remaining_work():
+    model = ConcurrencyModel(fail_on="N5")
+    entities, relationships = _graph(nodes=200, edges=0)
+
+    with pytest.raises(RuntimeError, match="summarization failed"):
+        await _summarize(model, entities, relationships)
+
+    assert len(model.started) < 20
+
+
+async def test_batched_summaries_map_back_by_id():
+    entities, relationships = _graph(nodes=200, edges=150)
+    single = BatchModel()
+    expected = await _summarize(single, entities, relationships)
+
+    batched = BatchModel()
+    node_summaries, edge_summaries = await _summarize(
+        batched, entities, relationships, batch_max_tokens=1000
+    )
+
+    assert single.requests == 350
+    assert batched.requests < 350 / 10
+    pd.testing.assert_frame_equal(
+        node_summaries.sort_values("title", ignore_index=True),
+        expected[0].sort_values("title", ignore_index=True),
+    )
+    pd.testing.assert_frame_equal(
+        edge_summaries.sort_values(["source", "target"], ignore_index=True),
+        expected[1].sort_values(["source", "target"], ignore_index=True),
+    )
+
+
+async def test_batched_summaries_fall_back_for_missing_and_large_items():
+    entities, relationships = _graph(nodes=10, edges=0)
+    entities["description"] = [
+        *entities["description"][:9],
+        ["x" * 200, "y" * 200],
+    ]
+    model = BatchModel(skip="N3")
+
+    node_summaries, _ = await _summarize(
+        model, entities, relationships, batch_max_tokens=250
+    )
+
+    nodes = dict(
+        zip(node_summaries["title"], node_summaries["description"], strict=True)
+    )
+    assert nodes == {f"N{i}": f"summary of N{i}" for i in range(10)}
+    # one batch, a retry of the skipped item, and the item too large to share a batch
+    assert model.requests == 3
@@ -293,3 +293,49 @@ class TestClusterGraphRealData:
         assert "SCROOGE" in all_level_0_nodes
         assert "ABRAHAM" in all_level_0_nodes
         assert "JACOB MARLEY" in all_level_0_nodes
+
+
+# -------------------------------------------------------------------
+# Warm start
+# -------------------------------------------------------------------
+
+
+class TestClusterGraphStartingCommunities:
+    """Verify clustering warm-started from a prior partition."""
+
+    def test_seeded_partition_is_kept(self):
+        """Two triangles seeded with their own communities stay separate."""
+        edges = _make_edges([
+            ("A", "B", 1.0),
+            ("B", "C", 1.0),
+            ("A", "C", 1.0),
+            ("D", "E", 1.0),
+            ("E", "F", 1.0),
+            ("D", "F", 1.0),
+            ("C", "D", 0.1),
+        ])
+        clusters = cluster_graph(
+            edges,
+            max_cluster_size=10,
+            use_lcc=False,
+            seed=42,
+            starting_communities={"A": 3, "B": 3, "C": 3, "D": 7, "E": 7, "F": 7},
+        )
+
+        assert sorted(map(sorted, _node_sets(clusters))) == [
+            ["A", "B", "C"],
+            ["D", "E", "F"],
+        ]
+
+    def test_unseeded_and_unknown_nodes(self):
+        """New nodes are seeded on their own and removed nodes are ignored."""
+        edges = _make_edges([("X", "Y", 1.0), ("X", "Z", 1.0), ("Y", "Z", 1.0)])
+        clusters = cluster_graph(
+            edges,
+            max_cluster_size=10,
+            use_lcc=False,
+            seed=42,
+            starting_communities={"X": 0, "Y": 0, "GONE": 1},
+        )
+
+        assert _node_sets(clusters) == [{"X", "Y", "Z"}]
@@ -0,0 +1,95 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+from pathlib import Path
+
+from graphrag.config.enums import IndexingMethod
+from graphrag.config.models.graph_rag_config import GraphRagConfig
+from graphrag.index.estimate import estimate_index, format_estimate
+from graphrag_llm.config import RateLimitConfig
+
+from tests.unit.config.utils import (
+    DEFAULT_COMPLETION_MODEL_CONFIG,
+    DEFAULT_EMBEDDING_MODELS,
+)
+
+
+def _config(input_dir: Path, **kwargs) -> GraphRagConfig:
+    return GraphRagConfig(
+        completion_models={"default_completion_model": DEFAULT_COMPLETION_MODEL_CONFIG},
+        embedding_models=DEFAULT_EMBEDDING_MODELS,
+        input_storage={"base_dir": str(input_dir)},
+        chunking={"size": 100, "overlap": 0},
+        **kwargs,
+    )
+
+
+def _write_input(input_dir: Path) -> None:
+    input_dir.mkdir()
+    for index in range(3):
+        (input_dir / f"doc_{index}.txt").write_text(
+            " ".join(f"word{number}" for number in range(400)), encoding="utf-8"
+        )
+
+
+async def test_estimate_counts_chunks_and_gleanings(tmp_path: Path):
+    _write_input(tmp_path / "input")
+    config = _config(tmp_path / "input", extract_graph={"max_gleanings": 2})
+
+    estimate = await estimate_index(config, completion_tokens_per_request=100)
+
+    assert estimate.num_documents == 3
+    assert estimate.num_text_units > 3
+    workflows = {workflow.workflow: workflow for workflow in estimate.workflows}
+
+    # one extraction, two gleanings and one continuation check per chunk
+    extract_graph = workflows["extract_graph"]
+    assert extract_graph.requests == estimate.num_text_units * 4
+    assert extract_graph.completion_tokens == estimate.num_text_units * 301
+    assert extract_graph.prompt_tokens > estimate.text_unit_tokens * 4
+
+    assert workflows["summarize_descriptions"].requests is None
+    assert "extract_covariates" not in workflows
+
+    embeddings = workflows["generate_text_embeddings (text units)"]
+    assert embeddings.requests == -(-estimate.num_text_units // 16)
+    assert embeddings.prompt_tokens == estimate.text_unit_tokens
+
+    assert "n/a" in format_estimate(estimate)
+
+
+async def test_estimate_packed_extraction(tmp_path: Path):
+    _write_input(tmp_path / "input")
+    config = _config(
+        tmp_path / "input",
+        extract_graph={"max_gleanings": 0, "pack_max_tokens": 1000},
+    )
+
+    estimate = await estimate_index(config)
+    workflows = {workflow.workflow: workflow for workflow in estimate.workflows}
+
+    extract_graph = workflows["extract_graph"]
+    assert extract_graph.requests < estimate.num_text_units / 4
+    assert extract_graph.prompt_tokens > estimate.text_unit_tokens
+
+
+async def test_estimate_fast_method_and_rate_limits(tmp_path: Path):
+    _write_input(tmp_path / "input")
+    config = _config(tmp_path / "input", extract_claims={"enabled": True})
+    config.completion_models["default_completion_model"].rate_limit = RateLimitConfig(
+        requests_per_period=6
+    )
+
+    standard = await estimate_index(config, seconds_per_completion=1.0)
+    workflows = {workflow.workflow: workflow for workflow in standard.workflows}
+    assert workflows["extract_covariates"].requests == standard.num_text_units * 2
+    # 6 requests per minute is slower than the concurrency limit
+    assert workflows["extract_covariates"].seconds == (
+        workflows["extract_covariates"].requests * 10
+    )
+
+    fast = await estimate_index(config, method=IndexingMethod.Fast)
+    workflows = {workflow.workflow: workflow for workflow in fast.workflows}
+    assert "extract_graph" not in workflows
+    assert "extract_covariates" not in workflows
+    assert fast.requests == workflows["generate_text_embeddings (text units)"].requests
@@ -0,0 +1,104 @@
+# Copyright (C) 2026 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Tests for content-hash based delta detection in incremental updates."""
+
+import pandas as pd
+from graphrag.index.update.incremental_index import (
+    get_changed_text_units,
+    get_delta_docs,
+)
+from graphrag.index.workflows.update_text_units import _update_and_merge_text_units
+from graphrag_storage import StorageConfig, StorageType, create_storage
+from graphrag_storage.tables.parquet_table_provider import ParquetTableProvider
+
+
+def _provider() -> ParquetTableProvider:
+    return ParquetTableProvider(
+        storage=create_storage(StorageConfig(type=StorageType.Memory))
+    )
+
+
+async def test_get_delta_docs_uses_content_hash():
+    provider = _provider()
+    await provider.write_dataframe(
+        "documents",
+        pd.DataFrame({
+            "id": ["1", "2", "3"],
+            "title": ["a.txt", "b.txt", "c.txt"],
+            "text": ["alpha", "beta", "gamma"],
+        }),
+    )
+    input_dataset = pd.DataFrame({
+        "id": ["x", "y", "z"],
+        # a.txt unchanged, b.txt edited, c.txt renamed to d.txt
+        "title": ["a.txt", "b.txt", "d.txt"],
+        "text": ["alpha", "beta v2", "gamma"],
+    })
+
+    delta = await get_delta_docs(input_dataset, provider)
+
+    # the edit would be merged next to the previous b.txt, so it is skipped
+    assert delta.new_inputs.empty
+    assert delta.deleted_inputs.empty
+
+
+async def test_get_delta_docs_finds_new_and_deleted_documents():
+    provider = _provider()
+    await provider.write_dataframe(
+        "documents",
+        pd.DataFrame({
+            "id": ["1", "2"],
+            "title": ["a.txt", "b.txt"],
+            "text": ["alpha", "beta"],
+        }),
+    )
+    input_dataset = pd.DataFrame({
+        "id": ["x", "y"],
+        "title": ["a.txt", "e.txt"],
+        "text": ["alpha", "epsilon"],
+    })
+
+    delta = await get_delta_docs(input_dataset, provider)
+
+    assert delta.new_inputs["title"].tolist() == ["e.txt"]
+    assert delta.deleted_inputs["title"].tolist() == ["b.txt"]
+
+
+async def test_get_changed_text_units():
+    provider = _provider()
+    await provider.write_dataframe(
+        "text_units", pd.DataFrame({"id": ["t1", "t2"], "text": ["one", "two"]})
+    )
+    text_units = pd.DataFrame({"id": ["t2", "t3"], "text": ["two", "three"]})
+
+    changed = await get_changed_text_units(text_units, provider)
+
+    assert changed["id"].tolist() == ["t3"]
+
+
+async def test_get_changed_text_units_without_previous_table():
+    text_units = pd.DataFrame({"id": ["t1"], "text": ["one"]})
+
+    changed = await get_changed_text_units(text_units, _provider())
+
+    assert changed["id"].tolist() == ["t1"]
+
+
+def test_merge_text_units_skips_existing_ids():
+    old_text_units = pd.DataFrame({
+        "id": ["t1", "t2"],
+        "human_readable_id": [0, 1],
+        "entity_ids": [["e1"], ["e2"]],
+    })
+    delta_text_units = pd.DataFrame({
+        "id": ["t2", "t3"],
+        "human_readable_id": [0, 1],
+        "entity_ids": [["e9"], ["e3"]],
+    })
+
+    merged = _update_and_merge_text_units(old_text_units, delta_text_units, {})
+
+    assert merged["id"].tolist() == ["t1", "t2", "t3"]
+    assert merged["entity_ids"].tolist() == [["e1"], ["e2"], ["e3"]]
+    assert merged["human_readable_id"].tolist() == [0, 1, 2]
@@ -0,0 +1,74 @@
+# Copyright (C) 2026 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Tests for reclustering communities on incremental update."""
+
+import pandas as pd
+from graphrag.index.update.communities import (
+    _get_starting_communities,
+    _reconcile_communities,
+)
+
+
+def _community_row(
+    community: int,
+    entity_ids: list[str],
+    level: int = 0,
+    parent: int = -1,
+    children: list[int] | None = None,
+    row_id: str | None = None,
+    period: str = "2026-01-01",
+) -> dict:
+    """Build a community row matching COMMUNITIES_FINAL_COLUMNS shape."""
+    return {
+        "id": row_id or f"c{community}",
+        "human_readable_id": community,
+        "community": community,
+        "level": level,
+        "parent": parent,
+        "children": children or [],
+        "title": f"Community {community}",
+        "entity_ids": entity_ids,
+        "relationship_ids": [],
+        "text_unit_ids": [],
+        "period": period,
+        "size": len(entity_ids),
+    }
+
+
+def test_get_starting_communities():
+    old = pd.DataFrame([
+        _community_row(0, ["e1", "e2"], children=[2]),
+        _community_row(1, ["e3", "gone"]),
+        _community_row(2, ["e1"], level=1, parent=0),
+    ])
+    entities = pd.DataFrame({"id": ["e1", "e2", "e3"], "title": ["A", "B", "C"]})
+
+    assert _get_starting_communities(old, entities) == {"A": 0, "B": 0, "C": 1}
+
+
+def test_reconcile_keeps_unchanged_communities():
+    old = pd.DataFrame([
+        _community_row(0, ["e1", "e2"]),
+        _community_row(1, ["e3", "e4"]),
+    ])
+    new = pd.DataFrame([
+        _community_row(
+            0, ["e3", "e4", "e5"], row_id="new-a", period="2026-02-01", children=[2]
+        ),
+        _community_row(1, ["e2", "e1"], row_id="new-b", period="2026-02-01"),
+        _community_row(2, ["e5"], level=1, parent=0, row_id="new-c"),
+    ])
+
+    communities, changed = _reconcile_communities(old, new)
+
+    unchanged = communities[communities["id"] == "c0"].iloc[0]
+    assert unchanged["community"] == 0
+    assert unchanged["period"] == "2026-01-01"
+    assert changed == [2, 3]
+    grown = communities[communities["id"] == "new-a"].iloc[0]
+    assert grown["community"] == 2
+    assert grown["title"] == "Community 2"
+    assert list(grown["children"]) == [3]
+    child = communities[communities["id"] == "new-c"].iloc[0]
+    assert child["parent"] == 2
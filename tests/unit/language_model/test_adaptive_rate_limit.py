@@ -0,0 +1,237 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Unit tests for the adaptive rate limiter."""
+
+import asyncio
+import time
+from email.utils import formatdate
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+from graphrag_llm.config import RateLimitConfig, RateLimitType
+from graphrag_llm.middleware.with_rate_limiting import with_rate_limiting
+from graphrag_llm.rate_limit import create_rate_limiter
+from graphrag_llm.rate_limit.adaptive_rate_limiter import AdaptiveRateLimiter
+from graphrag_llm.types import LLMCompletionResponse
+from graphrag_llm.utils import create_completion_response, get_retry_after
+from graphrag_llm.utils.response_headers import parse_duration
+
+
+class RateLimitError(Exception):
+    status_code = 429
+
+    def __init__(self, headers: dict[str, str]) -> None:
+        super().__init__("rate limited")
+        self.response = SimpleNamespace(headers=headers)
+
+
+class _ThrottlingModel:
+    """A mock provider that throttles requests above its concurrency capacity."""
+
+    def __init__(self, capacity: int, retry_after: str | None = None) -> None:
+        self.capacity = capacity
+        self.retry_after = retry_after
+        self.in_flight = 0
+        self.peak = 0
+        self.throttled = 0
+
+    async def async_(self, **kwargs: Any) -> LLMCompletionResponse:
+        self.in_flight += 1
+        try:
+            self.peak = max(self.peak, self.in_flight)
+            await asyncio.sleep(0.01)
+            if self.in_flight > self.capacity:
+                self.throttled += 1
+                headers = {"retry-after": self.retry_after} if self.retry_after else {}
+                raise RateLimitError(headers)
+            return create_completion_response("ok")
+        finally:
+            self.in_flight -= 1
+
+    def sync(self, **kwargs: Any) -> LLMCompletionResponse:
+        raise NotImplementedError
+
+
+async def _run(limiter: AdaptiveRateLimiter, model: _ThrottlingModel, requests: int):
+    _, middleware = with_rate_limiting(
+        sync_middleware=model.sync,
+        async_middleware=model.async_,
+        rate_limiter=limiter,
+        tokenizer=MagicMock(),
+    )
+
+    async def request() -> None:
+        while True:
+            try:
+                await middleware()
+            except RateLimitError:
+                continue
+            return
+
+    await asyncio.gather(*(request() for _ in range(requests)))
+
+
+def test_factory_creates_adaptive_rate_limiter():
+    limiter = create_rate_limiter(
+        RateLimitConfig(type=RateLimitType.Adaptive, initial_concurrency=3)
+    )
+    assert isinstance(limiter, AdaptiveRateLimiter)
+    assert limiter.concurrency == 3
+
+
+def test_grows_while_requests_succeed():
+    limiter = AdaptiveRateLimiter(initial_concurrency=2, max_concurrency=5)
+    for _ in range(6):
+        limiter.record_response(latency=0.1)
+    assert 2 < limiter.concurrency < 5
+
+    for _ in range(100):
+        limiter.record_response(latency=0.1)
+    assert limiter.concurrency == 5
+
+
+def test_shrinks_once_per_round_when_throttled():
+    limiter = AdaptiveRateLimiter(initial_concurrency=16)
+    limiter.record_response(latency=0.0, throttled=True)
+    assert limiter.concurrency == 8
+
+    # responses to requests sent before the decrease do not shrink it again
+    limiter.record_response(latency=1.0, throttled=True)
+    assert limiter.concurrency == 8
+
+    limiter.record_response(latency=0.0, throttled=True)
+    limiter.record_response(latency=0.0, throttled=True)
+    limiter.record_response(latency=0.0, throttled=True)
+    limiter.record_response(latency=0.0, throttled=True)
+    assert limiter.concurrency == 1
+
+
+def test_shrinks_on_latency_spike():
+    limiter = AdaptiveRateLimiter(
+        initial_concurrency=8, max_concurrency=8, latency_threshold=3.0
+    )
+    for _ in range(5):
+        limiter.record_response(latency=0.1)
+        limiter.record_response(latency=0.2)
+    assert limiter.concurrency == 8
+
+    limiter.record_response(latency=1.0)
+    assert limiter.concurrency == 4
+
+
+def test_mixed_length_responses_do_not_shrink():
+    limiter = AdaptiveRateLimiter(initial_concurrency=8, latency_threshold=3.0)
+    # short and long completions, an order of magnitude apart
+    for i in range(200):
+        limiter.record_response(latency=2.0 if i % 4 == 0 else 0.2)
+    assert limiter.concurrency > 8
+
+
+def test_factory_passes_latency_threshold():
+    limiter = create_rate_limiter(
+        RateLimitConfig(
+            type=RateLimitType.Adaptive, initial_concurrency=8, latency_threshold=10.0
+        )
+    )
+    for _ in range(10):
+        limiter.record_response(latency=0.1)
+    limiter.record_response(latency=0.5)
+    assert limiter.concurrency >= 8
+
+
+async def test_retry_after_pauses_new_requests():
+    limiter = AdaptiveRateLimiter()
+    limiter.record_response(latency=0.0, headers={"retry-after": "0.2"}, throttled=True)
+
+    start = time.perf_counter()
+    async with limiter.acquire_async(0):
+        pass
+    assert time.perf_counter() - start >= 0.15
+
+
+def test_exhausted_quota_pauses_new_requests():
+    limiter = AdaptiveRateLimiter(initial_concurrency=4)
+    limiter.record_response(
+        latency=0.0,
+        headers={
+            "x-ratelimit-remaining-requests": "0",
+            "x-ratelimit-reset-requests": "150ms",
+        },
+    )
+    assert limiter.concurrency == 4
+
+    start = time.perf_counter()
+    with limiter.acquire(0):
+        pass
+    assert time.perf_counter() - start >= 0.1
+
+
+async def test_limits_concurrent_requests():
+    limiter = AdaptiveRateLimiter(initial_concurrency=3, max_concurrency=3)
+    model = _ThrottlingModel(capacity=100)
+
+    await _run(limiter, model, requests=20)
+
+    assert model.peak == 3
+    assert model.throttled == 0
+
+
+async def test_converges_to_provider_capacity():
+    limiter = AdaptiveRateLimiter(initial_concurrency=1, max_concurrency=64)
+    model = _ThrottlingModel(capacity=8, retry_after="0.01")
+
+    await _run(limiter, model, requests=400)
+
+    assert 4 <= limiter.concurrency <= 9
+    # throttling is the exception, not a retry storm
+    assert model.throttled < 40
+
+
+@pytest.mark.parametrize(
+    ("headers", "expected"),
+    [
+        ({}, None),
+        ({"retry-after": "3"}, 3.0),
+        ({"retry-after-ms": "250", "retry-after": "3"}, 0.25),
+        (
+            {
+                "x-ratelimit-remaining-requests": "0",
+                "x-ratelimit-reset-requests": "6m0s",
+            },
+            360.0,
+        ),
+        (
+            {
+                "x-ratelimit-remaining-requests": "5",
+                "x-ratelimit-reset-requests": "6m0s",
+            },
+            None,
+        ),
+        (
+            {
+                "x-ratelimit-remaining-tokens": "0",
+                "x-ratelimit-reset-tokens": "1.5s",
+                "x-ratelimit-remaining-requests": "0",
+                "x-ratelimit-reset-requests": "20ms",
+            },
+            1.5,
+        ),
+    ],
+)
+def test_get_retry_after(headers: dict[str, str], expected: float | None):
+    assert get_retry_after(headers) == expected
+
+
+def test_get_retry_after_http_date():
+    retry_after = get_retry_after({"retry-after": formatdate(time.time() + 30)})
+    assert retry_after is not None
+    assert 25 < retry_after <= 30
+
+
+def test_parse_duration():
+    assert parse_duration("1h2m3s") == pytest.approx(3723.0)
+    assert parse_duration("20ms") == pytest.approx(0.02)
+    assert parse_duration("soon") is None
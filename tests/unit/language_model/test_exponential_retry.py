@@ -0,0 +1,211 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Unit tests for the retry budget, Retry-After and circuit breaker."""
+
+import asyncio
+import time
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from graphrag_llm.config import RetryConfig, RetryType
+from graphrag_llm.retry import create_retry
+from graphrag_llm.retry.circuit_breaker import CircuitBreaker
+from graphrag_llm.retry.exponential_retry import ExponentialRetry
+
+
+class RateLimitError(Exception):
+    status_code = 429
+
+    def __init__(self, headers: dict[str, str] | None = None) -> None:
+        super().__init__("rate limited")
+        self.response = SimpleNamespace(headers=headers or {})
+
+
+class _OutageModel:
+    """A mock provider that fails every request until the outage ends."""
+
+    def __init__(self, outage: float, headers: dict[str, str] | None = None) -> None:
+        self.outage_end = time.monotonic() + outage
+        self.headers = headers
+        self.attempts = 0
+
+    async def __call__(self, **kwargs: Any) -> str:
+        self.attempts += 1
+        await asyncio.sleep(0.001)
+        if time.monotonic() < self.outage_end:
+            raise RateLimitError(self.headers)
+        return "ok"
+
+
+async def _run(retrier: ExponentialRetry, model: _OutageModel, requests: int):
+    return await asyncio.gather(
+        *(
+            retrier.retry_async(func=model, input_args={"metrics": {}})
+            for _ in range(requests)
+        ),
+        return_exceptions=True,
+    )
+
+
+def test_retriers_with_the_same_settings_are_shared():
+    config = RetryConfig(type=RetryType.ExponentialBackoff, retry_budget=0.1)
+    assert create_retry(config) is create_retry(config.model_copy())
+    assert create_retry(config) is not create_retry(
+        RetryConfig(type=RetryType.ExponentialBackoff, retry_budget=0.2)
+    )
+
+
+def test_retriers_are_shared_per_model():
+    config = RetryConfig(type=RetryType.ExponentialBackoff, retry_budget=0.1)
+    completion = create_retry(config, model_id="openai/gpt-4o")
+
+    assert create_retry(config, model_id="openai/gpt-4o") is completion
+    assert create_retry(config, model_id="openai/text-embedding-3") is not completion
+
+
+async def test_honors_retry_after():
+    retrier = ExponentialRetry(base_delay=10.0, jitter=False)
+    model = _OutageModel(outage=0.02, headers={"retry-after-ms": "50"})
+
+    start = time.perf_counter()
+    result = await retrier.retry_async(func=model, input_args={})
+
+    assert result == "ok"
+    assert model.attempts == 2
+    assert 0.05 <= time.perf_counter() - start < 1
+
+
+async def test_retry_budget_bounds_retries_during_outage():
+    retrier = ExponentialRetry(
+        max_retries=5, base_delay=1.5, jitter=False, max_delay=0.01, retry_budget=0.1
+    )
+    model = _OutageModel(outage=60)
+
+    results = await _run(retrier, model, requests=200)
+
+    assert all(isinstance(result, RateLimitError) for result in results)
+    # without a budget every request would be retried 5 times (1200 attempts)
+    assert model.attempts <= 200 + 10 + 20
+
+
+async def test_circuit_breaker_pauses_callers_during_outage():
+    def retrier(**kwargs: Any) -> ExponentialRetry:
+        return ExponentialRetry(
+            max_retries=100, base_delay=1.5, jitter=False, max_delay=0.01, **kwargs
+        )
+
+    without_breaker = _OutageModel(outage=0.3)
+    await _run(retrier(), without_breaker, requests=50)
+
+    with_breaker = _OutageModel(outage=0.3)
+    start = time.perf_counter()
+    results = await _run(
+        retrier(circuit_breaker_threshold=0.5, circuit_breaker_cooldown=0.1),
+        with_breaker,
+        requests=50,
+    )
+
+    assert results == ["ok"] * 50
+    assert with_breaker.attempts < without_breaker.attempts / 2
+    assert time.perf_counter() - start < 1
+
+
+def test_circuit_breaker_opens_and_closes():
+    breaker = CircuitBreaker(failure_threshold=0.5, cooldown=0.05, window=4)
+    breaker.record_success()
+    breaker.record_failure()
+    breaker.record_success()
+    assert breaker.wait_time == 0
+
+    breaker.record_failure()
+    assert breaker.wait_time > 0
+
+    # the provider can ask for a longer pause than the cooldown
+    time.sleep(0.05)
+    breaker.record_failure(retry_after=0.2)
+    assert breaker.wait_time > 0.1
+
+    # once half open, a success closes the circuit again
+    time.sleep(0.2)
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.wait_time == 0
+
+
+def test_half_open_circuit_lets_one_probe_through():
+    breaker = CircuitBreaker(failure_threshold=0.5, cooldown=0.05, window=2)
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.acquire() > 0
+
+    time.sleep(0.05)
+    assert breaker.acquire() == 0
+    # the others wait for the probe
+    assert breaker.acquire() > 0
+    breaker.record_failure()
+    assert breaker.acquire() > 0.04
+
+    time.sleep(0.05)
+    assert breaker.acquire() == 0
+    breaker.record_success()
+    assert breaker.acquire() == 0
+    assert breaker.acquire() == 0
+
+
+async def test_waiting_callers_do_not_all_retry_when_the_cooldown_ends():
+    retrier = ExponentialRetry(
+        max_retries=100,
+        base_delay=1.5,
+        jitter=False,
+        max_delay=0.01,
+        circuit_breaker_threshold=0.5,
+        circuit_breaker_cooldown=0.05,
+    )
+    model = _OutageModel(outage=0.3)
+
+    results = await _run(retrier, model, requests=50)
+
+    assert results == ["ok"] * 50
+    # each cooldown ends with one probe instead of all 50 callers retrying
+    assert model.attempts < 50 + 50 + 20
+
+
+@pytest.mark.parametrize(
+    "error_name", ["BadRequestError", "AuthenticationError", "NotFoundError"]
+)
+def test_skipped_errors_do_not_open_the_circuit(error_name: str):
+    error = type(error_name, (Exception,), {})
+    retrier = ExponentialRetry(circuit_breaker_threshold=0.1)
+
+    def func() -> None:
+        raise error
+
+    for _ in range(30):
+        with pytest.raises(error):
+            retrier.retry(func=func, input_args={})
+    assert retrier._wait_time() == 0  # noqa: SLF001
+
+
+async def test_skipped_server_errors_open_the_circuit():
+    error = type("ServiceUnavailableError", (Exception,), {"status_code": 503})
+    retrier = ExponentialRetry(
+        circuit_breaker_threshold=0.5, circuit_breaker_cooldown=0.2
+    )
+    attempts = 0
+
+    async def func() -> None:
+        nonlocal attempts
+        attempts += 1
+        await asyncio.sleep(0.001)
+        raise error
+
+    start = time.perf_counter()
+    for _ in range(25):
+        with pytest.raises(error):
+            await retrier.retry_async(func=func, input_args={})
+
+    # 503s are not retried, but the outage still pauses later requests
+    assert attempts == 25
+    assert time.perf_counter() - start >= 0.2
@@ -0,0 +1,170 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Unit tests for the rate limiter shared across processes."""
+
+import asyncio
+import multiprocessing
+import sqlite3
+import time
+from contextlib import closing
+from pathlib import Path
+
+from graphrag_llm.config import RateLimitConfig, RateLimitType
+from graphrag_llm.rate_limit import create_rate_limiter
+from graphrag_llm.rate_limit.shared_sliding_window_rate_limiter import (
+    SharedSlidingWindowRateLimiter,
+)
+
+
+class RecordingRateLimiter(SharedSlidingWindowRateLimiter):
+    """Reports the timestamp each granted request was recorded with."""
+
+    def __init__(self, timestamps, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.timestamps = timestamps
+
+    def _try_acquire_in_transaction(
+        self, connection: sqlite3.Connection, token_count: int
+    ) -> float:
+        wait = super()._try_acquire_in_transaction(connection, token_count)
+        if wait == 0:
+            # read inside the transaction so scheduling delays don't skew it
+            (granted,) = connection.execute(
+                "SELECT MAX(timestamp) FROM rate_limit_window"
+            ).fetchone()
+            self.timestamps.put(granted)
+        return wait
+
+
+def _acquire_many(database_path: str, count: int, timestamps) -> None:
+    limiter = RecordingRateLimiter(
+        timestamps,
+        period_in_seconds=1,
+        requests_per_period=10,
+        database_path=database_path,
+    )
+    for _ in range(count):
+        with limiter.acquire(0):
+            pass
+
+
+def _max_requests_per_window(timestamps: list[float], period: float) -> int:
+    timestamps = sorted(timestamps)
+    return max(
+        sum(1 for other in timestamps[index:] if other < timestamp + period)
+        for index, timestamp in enumerate(timestamps)
+    )
+
+
+def test_factory_creates_shared_rate_limiter(tmp_path: Path):
+    limiter = create_rate_limiter(
+        RateLimitConfig(
+            type=RateLimitType.SharedSlidingWindow,
+            requests_per_period=10,
+            database_path=str(tmp_path / "limits.sqlite"),
+        )
+    )
+    assert isinstance(limiter, SharedSlidingWindowRateLimiter)
+
+
+def test_factory_defaults_quota_key(tmp_path: Path):
+    database_path = tmp_path / "limits.sqlite"
+    config = RateLimitConfig(
+        type=RateLimitType.SharedSlidingWindow,
+        requests_per_period=10,
+        database_path=str(database_path),
+    )
+    with create_rate_limiter(config, default_quota_key="azure/gpt-4o").acquire(0):
+        pass
+    config.quota_key = "shared"
+    with create_rate_limiter(config, default_quota_key="azure/gpt-4o").acquire(0):
+        pass
+
+    with closing(sqlite3.connect(database_path)) as connection:
+        keys = connection.execute(
+            "SELECT DISTINCT quota_key FROM rate_limit_window ORDER BY quota_key"
+        ).fetchall()
+    assert keys == [("azure/gpt-4o",), ("shared",)]
+
+
+def test_processes_share_one_quota(tmp_path: Path):
+    database_path = str(tmp_path / "limits.sqlite")
+    context = multiprocessing.get_context("spawn")
+    timestamps = context.Queue()
+    processes = [
+        context.Process(target=_acquire_many, args=(database_path, 5, timestamps))
+        for _ in range(3)
+    ]
+    for process in processes:
+        process.start()
+    collected = [timestamps.get(timeout=60) for _ in range(15)]
+    for process in processes:
+        process.join(timeout=60)
+        assert process.exitcode == 0
+
+    # each process alone would send its 5 requests at once
+    assert _max_requests_per_window(collected, period=1.0) <= 10
+    assert max(collected) - min(collected) >= 1.0
+
+
+def test_token_quota_and_keys(tmp_path: Path):
+    database_path = str(tmp_path / "limits.sqlite")
+
+    def limiter(quota_key: str) -> SharedSlidingWindowRateLimiter:
+        return SharedSlidingWindowRateLimiter(
+            period_in_seconds=1,
+            tokens_per_period=100,
+            database_path=database_path,
+            quota_key=quota_key,
+        )
+
+    first, second, other = limiter("a"), limiter("a"), limiter("b")
+    with first.acquire(80):
+        pass
+
+    # another deployment has its own quota
+    start = time.perf_counter()
+    with other.acquire(80):
+        pass
+    assert time.perf_counter() - start < 0.5
+
+    # the same deployment waits for the first request to leave the window
+    with second.acquire(80):
+        pass
+    assert time.perf_counter() - start >= 0.8
+
+
+async def test_async_acquire_does_not_block_event_loop(tmp_path: Path):
+    database_path = tmp_path / "limits.sqlite"
+    limiter = SharedSlidingWindowRateLimiter(
+        requests_per_period=10, database_path=str(database_path)
+    )
+    ticks = 0
+
+    async def tick() -> None:
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    # another process holds the database lock for a while
+    blocker = sqlite3.connect(database_path, isolation_level=None)
+    blocker.execute("BEGIN IMMEDIATE")
+    ticker = asyncio.create_task(tick())
+    try:
+
+        async def acquire() -> None:
+            async with limiter.acquire_async(0):
+                pass
+
+        acquiring = asyncio.create_task(acquire())
+        await asyncio.sleep(0.3)
+        assert not acquiring.done()
+        blocker.execute("COMMIT")
+        await asyncio.wait_for(acquiring, timeout=10)
+    finally:
+        ticker.cancel()
+        blocker.close()
+
+    assert ticks >= 10
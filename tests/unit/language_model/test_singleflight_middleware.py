@@ -0,0 +1,118 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Unit tests for the LLM singleflight middleware."""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import pytest
+from graphrag_llm.middleware.with_singleflight import with_singleflight
+from graphrag_llm.types import LLMCompletionResponse
+from graphrag_llm.utils import create_completion_response
+
+
+def _cache_key(input_args: dict[str, Any]) -> str:
+    return input_args["messages"]
+
+
+class _Model:
+    def __init__(self, delay: float = 0.05, error: Exception | None = None) -> None:
+        self.delay = delay
+        self.error = error
+        self.calls: list[str] = []
+        self.lock = threading.Lock()
+
+    def sync(self, **kwargs: Any) -> LLMCompletionResponse:
+        with self.lock:
+            self.calls.append(kwargs["messages"])
+        time.sleep(self.delay)
+        if self.error:
+            raise self.error
+        kwargs["metrics"]["compute_duration_seconds"] = self.delay
+        return create_completion_response(kwargs["messages"])
+
+    async def async_(self, **kwargs: Any) -> LLMCompletionResponse:
+        self.calls.append(kwargs["messages"])
+        await asyncio.sleep(self.delay)
+        if self.error:
+            raise self.error
+        kwargs["metrics"]["compute_duration_seconds"] = self.delay
+        return create_completion_response(kwargs["messages"])
+
+    def wrap(self):
+        return with_singleflight(
+            sync_middleware=self.sync,
+            async_middleware=self.async_,
+            cache_key_creator=_cache_key,
+        )
+
+
+async def test_async_identical_requests_share_one_call():
+    model = _Model()
+    _, middleware = model.wrap()
+    metrics = [{} for _ in range(4)]
+
+    responses = await asyncio.gather(
+        middleware(messages="a", metrics=metrics[0]),
+        middleware(messages="a", metrics=metrics[1]),
+        middleware(messages="b", metrics=metrics[2]),
+        middleware(messages="a", metrics=metrics[3]),
+    )
+
+    assert sorted(model.calls) == ["a", "b"]
+    assert [response.content for response in responses] == ["a", "a", "b", "a"]
+    assert metrics[0] == {"compute_duration_seconds": 0.05}
+    assert metrics[1] == {"compute_duration_seconds": 0.05, "coalesced_responses": 1}
+
+    # once the request completes, new requests are sent again
+    await middleware(messages="a", metrics={})
+    assert model.calls.count("a") == 2
+
+
+async def test_async_error_is_shared():
+    model = _Model(error=ValueError("boom"))
+    _, middleware = model.wrap()
+
+    results = await asyncio.gather(
+        middleware(messages="a", metrics={}),
+        middleware(messages="a", metrics={}),
+        return_exceptions=True,
+    )
+
+    assert model.calls == ["a"]
+    assert all(isinstance(result, ValueError) for result in results)
+
+
+async def test_async_follower_retries_when_leader_is_cancelled():
+    model = _Model()
+    _, middleware = model.wrap()
+
+    leader = asyncio.create_task(middleware(messages="a", metrics={}))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(middleware(messages="a", metrics={}))
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    response = await follower
+
+    assert response.content == "a"
+    assert model.calls == ["a", "a"]
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+
+
+def test_sync_identical_requests_share_one_call_across_threads():
+    model = _Model(delay=0.2)
+    middleware, _ = model.wrap()
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        responses = list(
+            executor.map(lambda _: middleware(messages="a", metrics={}), range(4))
+        )
+
+    assert model.calls == ["a"]
+    assert [response.content for response in responses] == ["a"] * 4
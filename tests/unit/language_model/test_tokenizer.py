@@ -0,0 +1,78 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Unit tests for batched tokenization and the token count cache."""
+
+from typing import Any
+
+from graphrag_llm.tokenizer import Tokenizer
+from graphrag_llm.tokenizer.tiktoken_tokenizer import TiktokenTokenizer
+from graphrag_llm.tokenizer.token_count_cache import TokenCountCache
+
+
+class CountingTokenizer(Tokenizer):
+    """A character tokenizer that records every text it encodes."""
+
+    def __init__(self, **kwargs: Any) -> None:
+        self.encoded: list[str] = []
+
+    def encode(self, text: str) -> list[int]:
+        self.encoded.append(text)
+        return [ord(char) for char in text]
+
+    def decode(self, tokens: list[int]) -> str:
+        return "".join(chr(token) for token in tokens)
+
+
+def test_num_tokens_is_cached():
+    tokenizer = CountingTokenizer()
+    assert tokenizer.num_tokens("hello") == 5
+    assert tokenizer.num_tokens("hello") == 5
+    assert tokenizer.encoded == ["hello"]
+
+
+def test_num_tokens_batch_encodes_only_new_texts():
+    tokenizer = CountingTokenizer()
+    tokenizer.num_tokens("a")
+
+    counts = tokenizer.num_tokens_batch(["a", "bb", "ccc", "bb", ""])
+
+    assert counts == [1, 2, 3, 2, 0]
+    assert tokenizer.encoded == ["a", "bb", "ccc", ""]
+    assert tokenizer.num_tokens_batch([]) == []
+
+
+def test_uncached_counts_leave_the_cache_alone():
+    tokenizer = CountingTokenizer()
+
+    assert tokenizer.num_tokens("hello", cache=False) == 5
+    assert tokenizer.num_tokens_batch(["a", "bb"], cache=False) == [1, 2]
+
+    assert len(tokenizer._token_count_cache) == 0  # noqa: SLF001
+    assert tokenizer.num_tokens("hello") == 5
+    assert tokenizer.encoded == ["hello", "a", "bb", "hello"]
+
+
+def test_cache_is_bounded():
+    cache = TokenCountCache(max_size=2)
+    first, second, third = (cache.key(text) for text in ["a", "b", "c"])
+    cache.set(first, 1)
+    cache.set(second, 2)
+    assert cache.get(first) == 1
+
+    cache.set(third, 3)
+
+    assert len(cache) == 2
+    assert cache.get(second) is None
+    assert cache.get(first) == 1
+    assert cache.get(third) == 3
+
+
+def test_tiktoken_batch_matches_single_encoding():
+    tokenizer = TiktokenTokenizer(encoding_name="o200k_base")
+    texts = ["The quick brown fox", "jumps over", "the lazy dog. " * 50]
+
+    assert tokenizer.encode_batch(texts) == [tokenizer.encode(t) for t in texts]
+    assert tokenizer.num_tokens_batch(texts) == [
+        len(tokenizer.encode(t)) for t in texts
+    ]
@@ -0,0 +1,143 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Tests for frontier-based dynamic community selection."""
+
+import asyncio
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+from graphrag.data_model.community import Community
+from graphrag.data_model.community_report import CommunityReport
+from graphrag.query.context_builder.dynamic_community_selection import (
+    DynamicCommunitySelection,
+    RatingCache,
+)
+
+# community -> (parent, children, level)
+TREE = {
+    "0": ("-1", ["1", "2"], "0"),
+    "1": ("0", ["3"], "1"),
+    "2": ("0", [], "1"),
+    "3": ("1", [], "2"),
+}
+RATINGS = {"0": 5, "1": 5, "2": 0, "3": 5}
+DELAYS = {"0": 0.0, "1": 0.0, "2": 0.2, "3": 0.0}
+
+
+def _create_selector(
+    rating_cache: RatingCache | None = None,
+) -> DynamicCommunitySelection:
+    communities = [
+        Community(
+            id=f"comm-{short_id}",
+            short_id=short_id,
+            title=f"Community {short_id}",
+            level=level,
+            parent=parent,
+            children=children,
+        )
+        for short_id, (parent, children, level) in TREE.items()
+    ]
+    reports = [
+        CommunityReport(
+            id=f"report-{short_id}",
+            short_id=short_id,
+            title=f"Report {short_id}",
+            community_id=short_id,
+            summary=f"summary {short_id}",
+            full_content=f"full content {short_id}",
+            rank=1.0,
+        )
+        for short_id in TREE
+    ]
+    return DynamicCommunitySelection(
+        community_reports=reports,
+        communities=communities,
+        model=MagicMock(),
+        tokenizer=MagicMock(),
+        threshold=1,
+        keep_parent=False,
+        max_level=2,
+        rating_cache=rating_cache,
+    )
+
+
+async def test_select_expands_frontier_without_waiting_for_level():
+    completed: list[str] = []
+
+    async def fake_rate_relevancy(description: str, **_: Any) -> dict[str, Any]:
+        community = description.rsplit(" ", 1)[-1]
+        await asyncio.sleep(DELAYS[community])
+        completed.append(community)
+        return {
+            "rating": RATINGS[community],
+            "llm_calls": 1,
+            "prompt_tokens": 1,
+            "output_tokens": 1,
+        }
+
+    selector = _create_selector()
+    with patch(
+        "graphrag.query.context_builder.dynamic_community_selection.rate_relevancy",
+        side_effect=fake_rate_relevancy,
+    ):
+        reports, llm_info = await selector.select("What is X?")
+
+    assert completed.index("3") < completed.index("2")
+    assert sorted(report.community_id for report in reports) == ["3"]
+    assert llm_info["ratings"] == RATINGS
+    assert llm_info["llm_calls"] == 4
+
+
+async def test_select_reuses_ratings_for_normalized_query():
+    async def fake_rate_relevancy(description: str, **_: Any) -> dict[str, Any]:  # noqa: RUF029
+        community = description.rsplit(" ", 1)[-1]
+        return {
+            "rating": RATINGS[community],
+            "llm_calls": 1,
+            "prompt_tokens": 1,
+            "output_tokens": 1,
+        }
+
+    selector = _create_selector()
+    with patch(
+        "graphrag.query.context_builder.dynamic_community_selection.rate_relevancy",
+        side_effect=fake_rate_relevancy,
+    ) as rate:
+        first, _ = await selector.select("What is X?")
+        second, llm_info = await selector.select("  what is x ")
+
+    assert rate.call_count == 4
+    assert llm_info["llm_calls"] == 0
+    assert llm_info["ratings"] == RATINGS
+    assert [report.community_id for report in second] == [
+        report.community_id for report in first
+    ]
+
+
+async def test_selectors_share_a_bounded_rating_cache():
+    async def fake_rate_relevancy(description: str, **_: Any) -> dict[str, Any]:  # noqa: RUF029
+        community = description.rsplit(" ", 1)[-1]
+        return {
+            "rating": RATINGS[community],
+            "llm_calls": 1,
+            "prompt_tokens": 1,
+            "output_tokens": 1,
+        }
+
+    cache = RatingCache(max_size=4)
+    with patch(
+        "graphrag.query.context_builder.dynamic_community_selection.rate_relevancy",
+        side_effect=fake_rate_relevancy,
+    ) as rate:
+        await _create_selector(cache).select("What is X?")
+        _, llm_info = await _create_selector(cache).select("What is X?")
+        assert rate.call_count == 4
+        assert llm_info["llm_calls"] == 0
+
+        # a new query evicts the least recently used ratings
+        await _create_selector(cache).select("What is Y?")
+        assert len(cache) == 4
+        _, llm_info = await _create_selector(cache).select("What is X?")
+        assert llm_info["llm_calls"] == 4
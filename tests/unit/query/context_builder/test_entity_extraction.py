@@ -1,6 +1,8 @@
 # Copyright (c) 2024 Microsoft Corporation.
 # Licensed under the MIT License
 
+import asyncio
+import time
 from typing import Any
 
 from graphrag.data_model.entity import Entity
@@ -8,10 +10,11 @@ from graphrag.query.context_builder.entity_extraction import (
     EntityVectorStoreKey,
     map_query_to_entities,
 )
+from graphrag.query.input.retrieval.entity_name_matcher import EntityNameMatcher
 from graphrag_llm.config import LLMProviderType, ModelConfig
 from graphrag_llm.embedding import create_embedding
 from graphrag_vectors import (
-    TextEmbedder,
+    AsyncTextEmbedder,
     VectorStore,
     VectorStoreDocument,
     VectorStoreSearchResult,
@@ -57,10 +60,10 @@ class MockVectorStore(VectorStore):
             for document in self.documents[:k]
         ]
 
-    def similarity_search_by_text(
+    async def similarity_search_by_text_async(
         self,
         text: str,
-        text_embedder: TextEmbedder,
+        text_embedder: AsyncTextEmbedder,
         k: int = 10,
         select: list[str] | None = None,
         filters: Any = None,
@@ -94,7 +97,7 @@ class MockVectorStore(VectorStore):
         raise NotImplementedError
 
 
-def test_map_query_to_entities():
+async def test_map_query_to_entities():
     entities = [
         Entity(
             id="2da37c7a-50a8-44d4-aa2c-fd401e19976c",
@@ -122,7 +125,7 @@ def test_map_query_to_entities():
         ),
     ]
 
-    assert map_query_to_entities(
+    assert await map_query_to_entities(
         query="t22",
         text_embedding_vectorstore=MockVectorStore([
             VectorStoreDocument(id=entity.title, vector=None) for entity in entities
@@ -141,7 +144,7 @@ def test_map_query_to_entities():
         )
     ]
 
-    assert map_query_to_entities(
+    assert await map_query_to_entities(
         query="",
         text_embedding_vectorstore=MockVectorStore([
             VectorStoreDocument(id=entity.id, vector=None) for entity in entities
@@ -164,3 +167,122 @@ def test_map_query_to_entities():
             rank=3,
         ),
     ]
+
+
+class CountingVectorStore(MockVectorStore):
+    def __init__(self, documents: list[VectorStoreDocument]) -> None:
+        super().__init__(documents)
+        self.requested_k: list[int] = []
+
+    def similarity_search_by_vector(
+        self,
+        query_embedding: list[float],
+        k: int = 10,
+        select: list[str] | None = None,
+        filters: Any = None,
+        include_vectors: bool = True,
+    ) -> list[VectorStoreSearchResult]:
+        self.requested_k.append(k)
+        return super().similarity_search_by_vector(query_embedding, k)
+
+    async def similarity_search_by_text_async(
+        self,
+        text: str,
+        text_embedder: AsyncTextEmbedder,
+        k: int = 10,
+        select: list[str] | None = None,
+        filters: Any = None,
+        include_vectors: bool = True,
+    ) -> list[VectorStoreSearchResult]:
+        # embed through the text embedder like a real vector store
+        return await VectorStore.similarity_search_by_text_async(
+            self, text, text_embedder, k
+        )
+
+
+async def test_map_query_to_entities_with_exact_name_matches():
+    entities = [
+        Entity(id="e1", short_id="1", title="Contoso"),
+        Entity(id="e2", short_id="2", title="Fabrikam"),
+        Entity(id="e3", short_id="3", title="Northwind"),
+    ]
+    all_entities_dict = {entity.id: entity for entity in entities}
+    matcher = EntityNameMatcher((entity.id, entity.title) for entity in entities)
+    store = CountingVectorStore([
+        VectorStoreDocument(id=entity.id, vector=None) for entity in entities
+    ])
+
+    # enough exact hits skip the vector search entirely
+    result = await map_query_to_entities(
+        query="Compare fabrikam and Contoso",
+        text_embedding_vectorstore=store,
+        text_embedder=embedding_model,
+        all_entities_dict=all_entities_dict,
+        k=2,
+        entity_name_matcher=matcher,
+    )
+    assert [entity.id for entity in result] == ["e2", "e1"]
+    assert store.requested_k == []
+
+    # otherwise the full oversampled vector search follows the exact hits
+    result = await map_query_to_entities(
+        query="What does Northwind sell?",
+        text_embedding_vectorstore=store,
+        text_embedder=embedding_model,
+        all_entities_dict=all_entities_dict,
+        k=2,
+        oversample_scaler=1,
+        entity_name_matcher=matcher,
+    )
+    assert [entity.id for entity in result] == ["e3", "e1", "e2"]
+    assert store.requested_k == [2]
+
+    # excluded entities do not count as exact hits
+    result = await map_query_to_entities(
+        query="Compare fabrikam and Contoso",
+        text_embedding_vectorstore=store,
+        text_embedder=embedding_model,
+        all_entities_dict=all_entities_dict,
+        exclude_entity_names=["Fabrikam"],
+        k=2,
+        oversample_scaler=1,
+        entity_name_matcher=matcher,
+    )
+    assert [entity.id for entity in result] == ["e1"]
+    assert store.requested_k == [2, 2]
+
+
+class SlowEmbedding:
+    def __init__(self, latency: float) -> None:
+        self.latency = latency
+
+    async def embedding_async(self, **kwargs: Any):
+        await asyncio.sleep(self.latency)
+        return embedding_model.embedding(**kwargs)
+
+
+async def test_map_query_to_entities_embeds_concurrently():
+    entities = [Entity(id=f"e{i}", short_id=str(i), title=f"t{i}") for i in range(5)]
+    store = CountingVectorStore([
+        VectorStoreDocument(id=entity.id, vector=None) for entity in entities
+    ])
+    latency, queries = 0.1, 10
+
+    start = time.perf_counter()
+    results = await asyncio.gather(
+        *(
+            map_query_to_entities(
+                query=f"query {i}",
+                text_embedding_vectorstore=store,
+                text_embedder=SlowEmbedding(latency),  # type: ignore
+                all_entities_dict={entity.id: entity for entity in entities},
+                k=2,
+            )
+            for i in range(queries)
+        )
+    )
+    elapsed = time.perf_counter() - start
+
+    assert all(len(result) == 4 for result in results)
+    # serialized embedding calls would take latency * queries
+    assert elapsed < latency * queries / 2
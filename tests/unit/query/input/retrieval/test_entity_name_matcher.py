@@ -0,0 +1,50 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+from graphrag.query.input.retrieval.entity_name_matcher import EntityNameMatcher
+
+
+def test_find_matches_names_case_insensitively():
+    matcher = EntityNameMatcher([
+        ("1", "Contoso"),
+        ("2", "Northwind Traders"),
+        ("3", "Fabrikam"),
+    ])
+
+    assert matcher.find("How does NORTHWIND traders compete with contoso?") == [
+        "2",
+        "1",
+    ]
+
+
+def test_find_requires_word_boundaries():
+    matcher = EntityNameMatcher([("1", "art"), ("2", "C++")])
+
+    assert matcher.find("a party about C++ and art.") == ["2", "1"]
+    assert matcher.find("partial starts") == []
+
+
+def test_find_matches_short_names_with_their_case():
+    matcher = EntityNameMatcher([("1", "AI"), ("2", "US"), ("3", "Microsoft")])
+
+    assert matcher.find("Did MICROSOFT invest in AI in the US?") == ["3", "1", "2"]
+    assert matcher.find("tell us what ai said") == []
+
+
+def test_find_prefers_leftmost_longest_match():
+    matcher = EntityNameMatcher([
+        ("1", "New York"),
+        ("2", "New York City"),
+        ("3", "York"),
+        ("4", "City Hall"),
+    ])
+
+    assert matcher.find("new york city hall") == ["2"]
+    assert matcher.find("york and new york") == ["3", "1"]
+
+
+def test_find_returns_every_entity_sharing_a_name():
+    matcher = EntityNameMatcher([("1", "Mercury"), ("2", "mercury"), ("3", "")])
+
+    assert len(matcher) == 1
+    assert matcher.find("mercury") == ["1", "2"]
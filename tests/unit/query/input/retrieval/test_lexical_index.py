@@ -0,0 +1,38 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+from graphrag.query.input.retrieval.lexical_index import (
+    LexicalIndex,
+    reciprocal_rank_fusion,
+    tokenize,
+)
+
+
+def test_tokenize():
+    assert tokenize("Part XJ-200, rev. B") == ["part", "xj", "200", "rev", "b"]
+
+
+def test_search_ranks_exact_terms_first():
+    index = LexicalIndex([
+        ("a", "The pump uses part XJ-200 for the intake valve."),
+        ("b", "Valves and pumps are covered in the maintenance guide."),
+        ("c", "Unrelated text about the weather."),
+    ])
+
+    results = index.search("xj-200 maintenance", k=2)
+
+    assert [doc_id for doc_id, _ in results] == ["a", "b"]
+    assert results[0][1] > results[1][1]
+
+
+def test_search_without_matches():
+    index = LexicalIndex([("a", "some text")])
+
+    assert index.search("missing", k=5) == []
+    assert LexicalIndex([]).search("anything") == []
+
+
+def test_reciprocal_rank_fusion():
+    fused = reciprocal_rank_fusion([["a", "b", "c"], ["c", "a"]])
+
+    assert fused == ["a", "c", "b"]
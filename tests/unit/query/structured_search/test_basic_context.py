@@ -0,0 +1,88 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Tests for the basic search context builder."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+from graphrag.config.enums import RetrievalMode
+from graphrag.data_model.text_unit import TextUnit
+from graphrag.query.input.retrieval.lexical_index import LexicalIndex
+from graphrag.query.structured_search.basic_search.basic_context import (
+    BasicSearchContext,
+)
+from graphrag_vectors import VectorStoreDocument, VectorStoreSearchResult
+
+
+def _create_context(ranked_ids: list[str]) -> BasicSearchContext:
+    text_units = [
+        TextUnit(id=f"tu{i}", short_id=str(i), text=f"text unit {i}")
+        for i in range(100)
+    ]
+    vector_store = MagicMock()
+    vector_store.similarity_search_by_text_async = AsyncMock(
+        return_value=[
+            VectorStoreSearchResult(
+                document=VectorStoreDocument(id=text_unit_id, vector=None), score=1.0
+            )
+            for text_unit_id in ranked_ids
+        ]
+    )
+    return BasicSearchContext(
+        text_embedder=MagicMock(),
+        text_unit_embeddings=vector_store,
+        text_units=text_units,
+    )
+
+
+async def test_build_context_keeps_similarity_order():
+    context = _create_context(["tu42", "tu7", "missing", "tu13"])
+
+    result = await context.build_context("query", k=4)
+
+    assert result.context_chunks == (
+        "id|text\n42|text unit 42\n7|text unit 7\n13|text unit 13\n"
+    )
+    assert result.context_records["sources"]["id"].tolist() == ["42", "7", "13"]
+
+
+async def test_build_context_respects_token_limit():
+    context = _create_context(["tu1", "tu2", "tu3"])
+
+    result = await context.build_context("query", k=3, max_context_tokens=12)
+
+    assert result.context_records["sources"]["id"].tolist() == ["1"]
+
+
+async def test_build_context_empty_query():
+    context = _create_context(["tu1"])
+
+    result = await context.build_context("")
+
+    assert result.context_chunks == "id|text\n"
+    assert result.context_records["sources"].empty
+
+
+async def test_build_context_lexical_mode_skips_embedding():
+    context = _create_context(["tu1"])
+    context.retrieval_mode = RetrievalMode.Lexical
+    context.lexical_index = LexicalIndex(
+        (unit.id, unit.text) for unit in context.text_units or []
+    )
+
+    result = await context.build_context("unit 42", k=1)
+
+    assert result.context_records["sources"]["id"].tolist() == ["42"]
+    context.text_unit_embeddings.similarity_search_by_text_async.assert_not_called()  # type: ignore
+
+
+async def test_build_context_hybrid_mode_fuses_rankings():
+    context = _create_context(["tu7", "tu42"])
+    context.retrieval_mode = RetrievalMode.Hybrid
+    context.lexical_index = LexicalIndex(
+        (unit.id, unit.text) for unit in context.text_units or []
+    )
+
+    result = await context.build_context("unit 42", k=2)
+
+    assert result.context_records["sources"]["id"].tolist() == ["42", "7"]
@@ -0,0 +1,164 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Tests for running many queries through one search engine."""
+
+import asyncio
+import re
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import MagicMock
+
+import graphrag.api.query as query_api
+import pandas as pd
+import pytest
+from graphrag.config.models.drift_search_config import DRIFTSearchConfig
+from graphrag.query.structured_search.base import BaseSearch, SearchResult
+from graphrag.query.structured_search.batch_search import embed_queries, search_many
+from graphrag.query.structured_search.drift_search.primer import PrimerResponse
+from graphrag.query.structured_search.drift_search.search import DRIFTSearch
+from graphrag_llm.config import LLMProviderType, ModelConfig
+from graphrag_llm.embedding import create_embedding
+from graphrag_llm.utils import create_completion_response
+
+from tests.unit.config.utils import get_default_graphrag_config
+
+
+class CountingEmbedding:
+    def __init__(self) -> None:
+        self.model = create_embedding(
+            ModelConfig(
+                type=LLMProviderType.MockLLM,
+                model_provider="openai",
+                model="text-embedding-3-small",
+                mock_responses=[1.0, 2.0],
+            )
+        )
+        self.inputs: list[list[str]] = []
+
+    def embedding(self, **kwargs: Any):
+        self.inputs.append(kwargs["input"])
+        return self.model.embedding(**kwargs)
+
+    async def embedding_async(self, **kwargs: Any):
+        return self.embedding(**kwargs)
+
+
+class DriftModel:
+    """A mock completion model that primes and answers DRIFT queries."""
+
+    def __init__(self) -> None:
+        self.tokenizer = MagicMock()
+        self.tokenizer.num_tokens.return_value = 1
+        self.primed: list[str] = []
+
+    async def completion_async(
+        self, messages: Any, response_format: Any = None, **kwargs: Any
+    ) -> Any:
+        if response_format is PrimerResponse:
+            query = re.search(r"For the query:\s+(\w+)", messages)[1]  # type: ignore
+            self.primed.append(query)
+            primer = PrimerResponse(
+                intermediate_answer=f"notes on {query}",
+                score=50,
+                follow_up_queries=[f"more on {query}"],
+            )
+            return SimpleNamespace(formatted_response=primer, content="")
+        context, query = messages[0]["content"], messages[1]["content"]
+        return create_completion_response(f"{query} from {context}")
+
+
+async def test_embed_queries_batches_distinct_queries():
+    inner = CountingEmbedding()
+
+    embedder = await embed_queries(inner, ["a", "b", "a", "c"], batch_size=2)  # type: ignore
+
+    assert inner.inputs == [["a", "b"], ["c"]]
+    assert embedder.embedding(input=["c"]).first_embedding == [1.0, 2.0]
+    assert await embedder.embedding_async(input=["b", "a"]) is not None
+    assert len(inner.inputs) == 2
+
+    # unknown inputs fall through to the wrapped model
+    embedder.embedding(input=["d"])
+    assert inner.inputs[-1] == ["d"]
+
+
+async def test_search_many_limits_concurrency_and_keeps_order():
+    running = 0
+    peak = 0
+
+    async def search(query: str, **_: Any) -> SearchResult:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        if query == "bad":
+            msg = "failed"
+            raise ValueError(msg)
+        return SearchResult(
+            response=query,
+            context_data={},
+            context_text="",
+            completion_time=0,
+            llm_calls=1,
+            prompt_tokens=0,
+            output_tokens=0,
+        )
+
+    engine = MagicMock(spec=BaseSearch)
+    engine.search = search
+
+    result = await search_many(engine, ["q1", "bad", "q2", "q3"], concurrency=2)
+
+    assert peak == 2
+    assert [
+        r.response if isinstance(r, SearchResult) else type(r) for r in result.results
+    ] == ["q1", ValueError, "q2", "q3"]
+    assert result.queries_per_minute > 0
+
+
+async def test_drift_search_many_keeps_state_per_query(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+):
+    model = DriftModel()
+
+    async def build_context(query: str, **_: Any):  # noqa: RUF029
+        reports = pd.DataFrame({"full_content": ["a report"]})
+        return reports, {"llm_calls": 0, "prompt_tokens": 0, "output_tokens": 0}
+
+    context_builder = SimpleNamespace(
+        config=DRIFTSearchConfig(n_depth=0, primer_folds=1),
+        build_context=build_context,
+        local_system_prompt="",
+        local_mixed_context=MagicMock(),
+        reduce_system_prompt="{context_data}",
+        response_type="",
+    )
+    monkeypatch.setattr(
+        query_api,
+        "_get_drift_search_engine",
+        lambda **_: DRIFTSearch(model=model, context_builder=context_builder),  # type: ignore
+    )
+    config = get_default_graphrag_config()
+    config.concurrent_requests = 1
+    config.reporting.base_dir = str(tmp_path)
+
+    result = await query_api.drift_search_many(
+        config=config,
+        entities=pd.DataFrame(),
+        communities=pd.DataFrame(),
+        community_reports=pd.DataFrame(),
+        text_units=pd.DataFrame(),
+        relationships=pd.DataFrame(),
+        community_level=2,
+        response_type="",
+        queries=["alpha", "beta"],
+    )
+
+    assert model.primed == ["alpha", "beta"]
+    assert [r.response for r in result.results] == [  # type: ignore
+        "alpha from ['notes on alpha']",
+        "beta from ['notes on beta']",
+    ]
@@ -0,0 +1,86 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Tests for the global search map step."""
+
+import asyncio
+from typing import Any
+from unittest.mock import MagicMock
+
+from graphrag.query.structured_search.base import SearchResult
+from graphrag.query.structured_search.global_search.search import GlobalSearch
+from graphrag.tokenizer.get_tokenizer import get_tokenizer
+
+
+def _create_search(
+    scores: dict[str, int],
+    delays: dict[str, float],
+    max_data_tokens: int,
+    map_stop_score: int | None = None,
+) -> GlobalSearch:
+    search = GlobalSearch(
+        model=MagicMock(),
+        context_builder=MagicMock(),
+        tokenizer=get_tokenizer(),
+        max_data_tokens=max_data_tokens,
+        map_stop_score=map_stop_score,
+    )
+
+    async def map_batch(context_data: str, **_: Any) -> SearchResult:
+        await asyncio.sleep(delays[context_data])
+        return SearchResult(
+            response=[
+                {"answer": f"{context_data} answer {i}", "score": scores[context_data]}
+                for i in range(5)
+            ],
+            context_data=context_data,
+            context_text=context_data,
+            completion_time=0,
+            llm_calls=1,
+            prompt_tokens=1,
+            output_tokens=1,
+        )
+
+    search._map_response_single_batch = map_batch  # type: ignore  # noqa: SLF001
+    return search
+
+
+async def test_map_cancels_batches_once_reduce_context_meets_stop_score():
+    search = _create_search(
+        scores={"a": 80, "b": 85, "slow": 100},
+        delays={"a": 0, "b": 0, "slow": 60},
+        max_data_tokens=50,
+        map_stop_score=80,
+    )
+
+    responses = await asyncio.wait_for(
+        search._map_responses(["a", "slow", "b"], query="q"),  # noqa: SLF001
+        timeout=5,
+    )
+
+    assert [response.context_data for response in responses] == ["a", "b"]
+
+
+async def test_map_waits_while_reduce_context_is_below_stop_score():
+    search = _create_search(
+        scores={"a": 50, "b": 50, "slow": 90},
+        delays={"a": 0, "b": 0, "slow": 0.1},
+        max_data_tokens=50,
+        map_stop_score=80,
+    )
+
+    responses = await search._map_responses(["a", "slow", "b"], query="q")  # noqa: SLF001
+
+    assert [response.context_data for response in responses] == ["a", "slow", "b"]
+
+
+async def test_map_runs_every_batch_without_stop_score():
+    search = _create_search(
+        scores={"a": 100, "b": 100, "slow": 100},
+        delays={"a": 0, "b": 0, "slow": 0.1},
+        max_data_tokens=50,
+    )
+
+    responses = await search._map_responses(["a", "slow", "b"], query="q")  # noqa: SLF001
+
+    assert [response.context_data for response in responses] == ["a", "slow", "b"]
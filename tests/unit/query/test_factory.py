@@ -0,0 +1,103 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Tests for reusing retrieval indexes across search engines."""
+
+import gc
+from unittest.mock import MagicMock
+
+import graphrag.api.query as query_api
+import pandas as pd
+import pytest
+from graphrag.config.enums import RetrievalMode
+from graphrag.data_model.entity import Entity
+from graphrag.data_model.text_unit import TextUnit
+from graphrag.query.factory import (
+    build_text_unit_lexical_index,
+    get_basic_search_engine,
+    get_local_search_engine,
+)
+
+from tests.unit.config.utils import get_default_graphrag_config
+
+
+def test_basic_search_engine_uses_the_lexical_index_passed_in():
+    config = get_default_graphrag_config()
+    config.basic_search.retrieval_mode = RetrievalMode.Hybrid
+    text_units = [
+        TextUnit(id="tu0", short_id="0", text="alpha beta"),
+        TextUnit(id="tu1", short_id="1", text="gamma epsilon"),
+    ]
+
+    def lexical_index(**kwargs):
+        engine = get_basic_search_engine(
+            text_units=text_units,
+            text_unit_embeddings=MagicMock(),
+            config=config,
+            response_type="",
+            **kwargs,
+        )
+        return engine.context_builder.lexical_index
+
+    index = build_text_unit_lexical_index(text_units)
+    assert lexical_index(lexical_index=index) is index
+
+    built = lexical_index()
+    assert built is not index
+    assert built.search("epsilon")[0][0] == "tu1"
+
+
+def _entity_name_matcher(match_entity_names: bool):
+    config = get_default_graphrag_config()
+    config.local_search.match_entity_names = match_entity_names
+    engine = get_local_search_engine(
+        config=config,
+        reports=[],
+        text_units=[],
+        entities=[Entity(id="e1", short_id="1", title="Contoso")],
+        relationships=[],
+        covariates={},
+        response_type="",
+        description_embedding_store=MagicMock(),
+    )
+    return engine.context_builder.entity_name_matcher
+
+
+def test_entity_name_matcher_is_opt_in():
+    assert _entity_name_matcher(match_entity_names=False) is None
+
+    matcher = _entity_name_matcher(match_entity_names=True)
+    assert matcher is not None
+    assert matcher.find("who owns contoso?") == ["e1"]
+
+
+def test_api_builds_the_lexical_index_once_per_loaded_dataset(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setattr(query_api, "get_embedding_store", MagicMock())
+    config = get_default_graphrag_config()
+    config.basic_search.retrieval_mode = RetrievalMode.Hybrid
+
+    def lexical_index(text_units: pd.DataFrame):
+        engine = query_api._get_basic_search_engine(  # noqa: SLF001
+            config=config, text_units=text_units, response_type="", callbacks=None
+        )
+        return engine.context_builder.lexical_index
+
+    text_units = pd.DataFrame({
+        "id": ["tu0", "tu1"],
+        "text": ["alpha", "beta"],
+        "document_id": ["d0", "d0"],
+    })
+    first = lexical_index(text_units)
+
+    # every query over the same loaded data shares the index
+    assert lexical_index(text_units) is first
+    assert lexical_index(text_units.copy()) is not first
+
+    # the index goes with the data it was built from
+    key = ("text_units", id(text_units))
+    assert key in query_api._lexical_indexes  # noqa: SLF001
+    del text_units
+    gc.collect()
+    assert key not in query_api._lexical_indexes  # noqa: SLF001
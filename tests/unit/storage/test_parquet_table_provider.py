@@ -5,6 +5,8 @@ import unittest
 from io import BytesIO
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import pytest
 from graphrag_storage import (
     StorageConfig,
@@ -88,3 +90,70 @@ class TestParquetTableProvider(unittest.IsolatedAsyncioTestCase):
 
         # Now it exists
         assert await self.table_provider.has("test_table")
+
+    async def test_write_batch(self):
+        async with self.table_provider.open("batched") as table:
+            await table.write_batch(pa.table({"id": ["a", "b"], "n": [1, 2]}))
+            await table.write_batch(pa.RecordBatch.from_pydict({"id": ["c"], "n": [3]}))
+
+        result = await self.table_provider.read_dataframe("batched")
+
+        assert result["id"].tolist() == ["a", "b", "c"]
+        assert result["n"].tolist() == [1, 2, 3]
+
+    async def test_write_batch_appends_without_truncate(self):
+        await self.table_provider.write_dataframe(
+            "batched", pd.DataFrame({"id": ["a"], "n": [1]})
+        )
+        async with self.table_provider.open("batched", truncate=False) as table:
+            await table.write_batch(pa.table({"id": ["b"], "n": [2]}))
+
+        result = await self.table_provider.read_dataframe("batched")
+
+        assert result["id"].tolist() == ["a", "b"]
+
+    async def test_interleaved_writes_keep_call_order(self):
+        async with self.table_provider.open("mixed") as table:
+            await table.write({"id": "a", "n": 1})
+            await table.write_batch(pa.table({"id": ["b", "c"], "n": [2, 3]}))
+            await table.write({"id": "d", "n": 4})
+            await table.write({"id": "e", "n": 5})
+            await table.write_batch(pa.table({"id": ["f"], "n": [6]}))
+
+        result = await self.table_provider.read_dataframe("mixed")
+
+        assert result["id"].tolist() == ["a", "b", "c", "d", "e", "f"]
+        assert result["n"].tolist() == [1, 2, 3, 4, 5, 6]
+
+    async def test_rows_and_batches_write_the_same_file(self):
+        async with self.table_provider.open("rows") as table:
+            await table.write({"id": "a", "n": 1})
+            await table.write({"id": "b", "n": 2})
+        async with self.table_provider.open("batches") as table:
+            await table.write_batch(pa.table({"id": ["a", "b"], "n": [1, 2]}))
+
+        rows = pq.read_metadata(
+            BytesIO(await self.storage.get("rows.parquet", as_bytes=True))
+        )
+        batches = pq.read_metadata(
+            BytesIO(await self.storage.get("batches.parquet", as_bytes=True))
+        )
+
+        assert rows.metadata.keys() == batches.metadata.keys() == {b"ARROW:schema"}
+        pd.testing.assert_frame_equal(
+            await self.table_provider.read_dataframe("rows"),
+            await self.table_provider.read_dataframe("batches"),
+        )
+
+    async def test_copy_to(self):
+        df = pd.DataFrame({"id": ["a", "b"], "n": [1, 2]})
+        await self.table_provider.write_dataframe("entities", df)
+        await self.table_provider.write_dataframe("relationships", df)
+        target = ParquetTableProvider(
+            storage=create_storage(StorageConfig(type=StorageType.Memory))
+        )
+
+        await self.table_provider.copy_to(target)
+
+        assert sorted(target.list()) == ["entities", "relationships"]
+        pd.testing.assert_frame_equal(await target.read_dataframe("entities"), df)
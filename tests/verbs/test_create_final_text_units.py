@@ -1,9 +1,14 @@
 # Copyright (c) 2024 Microsoft Corporation.
 # Licensed under the MIT License
 
+import os
+import random
+import time
+from collections.abc import AsyncIterator
 from typing import Any
 
 import pandas as pd
+import pytest
 from graphrag.data_model.row_transformers import (
     transform_entity_row,
     transform_relationship_row,
@@ -15,7 +20,9 @@ from graphrag.index.workflows.create_final_text_units import (
     run_workflow,
 )
 from graphrag_storage.file_storage import FileStorage
+from graphrag_storage.memory_storage import MemoryStorage
 from graphrag_storage.tables.csv_table import CSVTable
+from graphrag_storage.tables.parquet_table import ParquetTable
 from graphrag_storage.tables.table import Table
 
 from tests.unit.config.utils import get_default_graphrag_config
@@ -58,6 +65,37 @@ class _FakeWriteTable(Table):
         """No-op."""
 
 
+class _FakeInputTable(Table):
+    """In-memory read-only table that yields the given rows."""
+
+    def __init__(self, rows: list[dict[str, Any]]) -> None:
+        """Store the rows to be yielded."""
+        self.rows = rows
+
+    def __aiter__(self) -> AsyncIterator[dict[str, Any]]:
+        """Yield a copy of each row."""
+        return self._iter()
+
+    async def _iter(self) -> AsyncIterator[dict[str, Any]]:
+        for row in self.rows:
+            yield dict(row)
+
+    async def write(self, row: dict[str, Any]) -> None:
+        """Not supported."""
+        raise NotImplementedError
+
+    async def length(self) -> int:
+        """Return the number of rows."""
+        return len(self.rows)
+
+    async def has(self, row_id: str) -> bool:
+        """Check the rows for a matching id."""
+        return any(r.get("id") == row_id for r in self.rows)
+
+    async def close(self) -> None:
+        """No-op."""
+
+
 # ---------------------------------------------------------------------------
 # Parquet-based integration test (exercises run_workflow)
 # ---------------------------------------------------------------------------
@@ -94,13 +132,15 @@ async def test_create_final_text_units():
 # ---------------------------------------------------------------------------
 
 
-async def test_create_final_text_units_csv_path():
+@pytest.mark.parametrize("batch_size", [10_000, 3])
+async def test_create_final_text_units_csv_path(batch_size: int):
     """Exercise create_final_text_units through real CSVTable reads.
 
     Reads the CSV fixture files in tests/verbs/data/ (which use the
     pandas/numpy newline-separated list format) via CSVTable with the
     same row transformers used by run_workflow. This exercises the full
-    CSV round-trip including backwards-compatible list parsing.
+    CSV round-trip including backwards-compatible list parsing, written
+    in a single batch and in many small ones.
     """
     expected_df = load_test_table("text_units")
 
@@ -130,6 +170,7 @@ async def test_create_final_text_units_csv_path():
         relationships_table,
         output,
         covariates_table,
+        batch_size=batch_size,
     )
 
     assert len(output.rows) == len(expected_df)
@@ -139,3 +180,59 @@ async def test_create_final_text_units_csv_path():
         assert column in actual_df.columns
 
     compare_outputs(actual_df, expected_df)
+
+
+# ---------------------------------------------------------------------------
+# Throughput benchmark on synthetic data (opt-in)
+# ---------------------------------------------------------------------------
+
+BENCHMARK_ROWS = int(os.environ.get("GRAPHRAG_BENCHMARK_ROWS", "0"))
+
+
+@pytest.mark.skipif(
+    not BENCHMARK_ROWS,
+    reason="set GRAPHRAG_BENCHMARK_ROWS to the number of text units to benchmark",
+)
+async def test_create_final_text_units_throughput():
+    """Report the rows/sec of create_final_text_units on synthetic data.
+
+    Run with, e.g.:
+    GRAPHRAG_BENCHMARK_ROWS=200000 pytest -s -k throughput tests/verbs/test_create_final_text_units.py
+    """
+    n = BENCHMARK_ROWS
+    rng = random.Random(0)
+    text_units = [
+        {
+            "id": f"tu{i}",
+            "text": "x" * 50,
+            "n_tokens": 12,
+            "document_id": f"d{i // 10}",
+        }
+        for i in range(n)
+    ]
+    entities = [
+        {"id": f"e{i}", "text_unit_ids": [f"tu{rng.randrange(n)}" for _ in range(3)]}
+        for i in range(n // 2)
+    ]
+    relationships = [
+        {"id": f"r{i}", "text_unit_ids": [f"tu{rng.randrange(n)}" for _ in range(2)]}
+        for i in range(n)
+    ]
+    covariates = [
+        {"id": f"c{i}", "text_unit_id": f"tu{rng.randrange(n)}"} for i in range(n // 4)
+    ]
+    output = ParquetTable(MemoryStorage(), "text_units")
+
+    start = time.perf_counter()
+    await create_final_text_units(
+        _FakeInputTable(text_units),
+        _FakeInputTable(entities),
+        _FakeInputTable(relationships),
+        output,
+        _FakeInputTable(covariates),
+    )
+    await output.close()
+    elapsed = time.perf_counter() - start
+
+    print(f"create_final_text_units: {n / elapsed:,.0f} rows/s over {n:,} rows")
+    assert await output.length() == n
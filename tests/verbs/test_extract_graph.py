@@ -1,12 +1,17 @@
 # Copyright (c) 2024 Microsoft Corporation.
 # Licensed under the MIT License
 
+from graphrag.data_model.schemas import COVARIATES_FINAL_COLUMNS
+from graphrag.index.workflows.extract_covariates import (
+    run_workflow as run_covariates_workflow,
+)
 from graphrag.index.workflows.extract_graph import run_workflow
 
 from tests.unit.config.utils import get_default_graphrag_config
 
 from .util import (
     create_test_context,
+    load_test_table,
 )
 
 MOCK_LLM_ENTITY_RESPONSES = [
@@ -62,3 +67,56 @@ async def test_extract_graph():
     # we need to update the mocking to provide somewhat unique graphs so a true merge happens
     # the assertion should grab a node and ensure the description matches the mock description, not the original as we are doing below
     assert nodes_actual["description"].to_numpy()[0] == "Company_A is a test company"
+
+
+MOCK_LLM_ENTITY_CLAIM_RESPONSES = [
+    """
+    ("entity"<|>COMPANY_A<|>COMPANY<|>Company_A is a test company)
+    ##
+    ("entity"<|>PERSON_C<|>PERSON<|>Person_C is director of Company_A)
+    ##
+    ("relationship"<|>COMPANY_A<|>PERSON_C<|>Person_C is director of Company_A<|>1)
+    ##
+    ("claim"<|>COMPANY_A<|>PERSON_C<|>APPOINTMENT<|>TRUE<|>2022-01-10T00:00:00<|>NONE<|>Company_A appointed Person_C as director<|>Person_C is director of Company_A)
+    <|COMPLETE|>
+    """.strip()
+]
+
+
+async def test_extract_graph_with_claims():
+    text_units = load_test_table("text_units")
+    context = await create_test_context(
+        storage=["text_units"],
+    )
+
+    config = get_default_graphrag_config()
+    config.extract_claims.enabled = True
+    config.extract_claims.combined_with_graph = True
+    config.extract_graph.max_gleanings = 0
+    config.completion_models["default_completion_model"].type = "mock"
+    config.completion_models[
+        "default_completion_model"
+    ].mock_responses = MOCK_LLM_ENTITY_CLAIM_RESPONSES
+
+    await run_workflow(config, context)
+    # claims were already extracted, so the claims workflow leaves them alone
+    await run_covariates_workflow(config, context)
+
+    nodes_actual = await context.output_table_provider.read_dataframe("entities")
+    edges_actual = await context.output_table_provider.read_dataframe("relationships")
+    claims_actual = await context.output_table_provider.read_dataframe("covariates")
+
+    assert set(nodes_actual["title"]) == {"COMPANY_A", "PERSON_C"}
+    assert len(edges_actual) == 1
+
+    assert list(claims_actual.columns) == COVARIATES_FINAL_COLUMNS
+    assert len(claims_actual) == len(text_units)
+    assert set(claims_actual["text_unit_id"]) == set(text_units["id"])
+    claim = claims_actual.iloc[0]
+    assert claim["covariate_type"] == "claim"
+    assert claim["subject_id"] == "COMPANY_A"
+    assert claim["object_id"] == "PERSON_C"
+    assert claim["type"] == "APPOINTMENT"
+    assert claim["status"] == "TRUE"
+    assert claim["end_date"] == "NONE"
+    assert claim["source_text"] == "Person_C is director of Company_A"
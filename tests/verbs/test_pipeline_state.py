@@ -4,8 +4,10 @@
 """Tests for pipeline state passthrough."""
 
 from graphrag.config.models.graph_rag_config import GraphRagConfig
+from graphrag.index.run.run_pipeline import _run_pipeline
 from graphrag.index.run.utils import create_run_context
 from graphrag.index.typing.context import PipelineRunContext
+from graphrag.index.typing.pipeline import Pipeline
 from graphrag.index.typing.workflow import WorkflowFunctionOutput
 from graphrag.index.workflows.factory import PipelineFactory
 
@@ -26,6 +28,12 @@ async def run_workflow_2(  # noqa: RUF029
     return WorkflowFunctionOutput(result=None)
 
 
+async def run_workflow_3(  # noqa: RUF029
+    _config: GraphRagConfig, _context: PipelineRunContext
+):
+    return WorkflowFunctionOutput(result=None, run_only=["workflow_2"])
+
+
 async def test_pipeline_state():
     # checks that we can update the arbitrary state block within the pipeline run context
     PipelineFactory.register("workflow_1", run_workflow_1)
@@ -52,3 +60,24 @@ async def test_pipeline_existing_state():
         await fn(config, context)
 
     assert context.state["count"] == 5
+
+
+async def test_pipeline_run_only():
+    config = get_default_graphrag_config()
+    context = create_run_context()
+    pipeline = Pipeline([
+        ("workflow_1", run_workflow_1),
+        ("workflow_3", run_workflow_3),
+        ("workflow_1", run_workflow_1),
+        ("workflow_2", run_workflow_2),
+    ])
+
+    results = [result async for result in _run_pipeline(pipeline, config, context)]
+
+    assert [result.workflow for result in results] == [
+        "workflow_1",
+        "workflow_3",
+        "workflow_2",
+    ]
+    assert all(result.error is None for result in results)
+    assert context.state["count"] == 2
@@ -0,0 +1,81 @@
+# Copyright (C) 2026 Microsoft
+# Licensed under the MIT License
+
+"""Verb test for incremental reclustering in the update workflows."""
+
+from unittest.mock import patch
+
+from graphrag.config.enums import IndexingMethod
+from graphrag.index.workflows.factory import PipelineFactory
+from graphrag.index.workflows.update_communities import (
+    run_workflow as run_update_communities,
+)
+from graphrag.index.workflows.update_community_reports import (
+    run_workflow as run_update_community_reports,
+)
+from graphrag_storage.memory_storage import MemoryStorage
+from graphrag_storage.tables.parquet_table_provider import ParquetTableProvider
+
+from tests.unit.config.utils import get_default_graphrag_config
+
+from .test_create_community_reports import MOCK_RESPONSES
+from .util import create_test_context
+
+
+async def test_update_communities_incremental():
+    """Verify reclustering keeps reports of communities whose membership held."""
+    context = await create_test_context(
+        storage=[
+            "covariates",
+            "relationships",
+            "entities",
+            "communities",
+            "community_reports",
+        ]
+    )
+    context.state["update_timestamp"] = "20260220-000000"
+    previous_table_provider = ParquetTableProvider(storage=MemoryStorage())
+    await context.output_table_provider.copy_to(previous_table_provider)
+    old_reports = await previous_table_provider.read_dataframe("community_reports")
+
+    config = get_default_graphrag_config()
+    config.cluster_graph.incremental = True
+    config.completion_models["default_completion_model"].type = "mock"
+    config.completion_models["default_completion_model"].mock_responses = MOCK_RESPONSES  # type: ignore
+
+    with (
+        patch(
+            "graphrag.index.workflows.update_communities.get_update_table_providers",
+        ) as communities_providers,
+        patch(
+            "graphrag.index.workflows.update_community_reports.get_update_table_providers",
+        ) as reports_providers,
+    ):
+        providers = (context.output_table_provider, previous_table_provider, None)
+        communities_providers.return_value = providers
+        reports_providers.return_value = providers
+        await run_update_communities(config, context)
+        await run_update_community_reports(config, context)
+
+    changed = context.state["incremental_update_changed_communities"]
+    communities = await context.output_table_provider.read_dataframe("communities")
+    reports = await context.output_table_provider.read_dataframe("community_reports")
+
+    assert sorted(reports["community"]) == sorted(communities["community"])
+    kept = reports[~reports["community"].isin(changed)]
+    assert len(kept) > 0
+    assert set(kept["id"]) <= set(old_reports["id"])
+    assert (
+        reports[reports["community"].isin(changed)]["title"] == "<report_title>"
+    ).all()
+
+
+def test_update_pipelines_regenerate_reports_like_their_index_method():
+    standard = PipelineFactory.pipelines[IndexingMethod.StandardUpdate]
+    fast = PipelineFactory.pipelines[IndexingMethod.FastUpdate]
+
+    assert "update_community_reports" in standard
+    assert "update_community_reports_text" not in standard
+    assert "update_community_reports_text" in fast
+    assert "update_community_reports" not in fast
+    assert all(name in PipelineFactory.workflows for name in [*standard, *fast])
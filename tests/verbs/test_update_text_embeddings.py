@@ -5,10 +5,18 @@
 
 from unittest.mock import patch
 
-from graphrag.config.embeddings import all_embeddings
+from graphrag.config.embeddings import all_embeddings, text_unit_text_embedding
+from graphrag.index.operations.embed_text.run_embed_text import run_embed_text
+from graphrag.index.workflows.generate_text_embeddings import (
+    generate_text_embeddings,
+)
 from graphrag.index.workflows.update_text_embeddings import (
     run_workflow,
+    update_text_embeddings,
 )
+from graphrag_llm.embedding import create_embedding
+from graphrag_storage.memory_storage import MemoryStorage
+from graphrag_storage.tables.parquet_table_provider import ParquetTableProvider
 
 from tests.unit.config.utils import get_default_graphrag_config
 
@@ -63,3 +71,54 @@ async def test_update_text_embeddings():
     assert len(entity_embeddings.columns) == 2
     assert "id" in entity_embeddings.columns
     assert "embedding" in entity_embeddings.columns
+
+
+async def test_update_text_embeddings_embeds_only_delta():
+    """Verify only new and changed rows are re-embedded on update."""
+    context = await create_test_context(storage=["text_units"])
+    config = get_default_graphrag_config()
+    llm_settings = config.get_embedding_model_config(
+        config.embed_text.embedding_model_id
+    )
+    llm_settings.type = "mock"
+    llm_settings.mock_responses = [1.0] * 3072
+    config.embed_text.names = [text_unit_text_embedding]
+    config.snapshots.embeddings = True
+    model = create_embedding(llm_settings)
+
+    await generate_text_embeddings(
+        config=config,
+        table_provider=context.output_table_provider,
+        callbacks=context.callbacks,
+        model=model,
+        tokenizer=model.tokenizer,
+    )
+
+    previous_table_provider = ParquetTableProvider(storage=MemoryStorage())
+    await context.output_table_provider.copy_to(previous_table_provider)
+
+    text_units = await context.output_table_provider.read_dataframe("text_units")
+    text_units.loc[0, "text"] = "changed text"
+    text_units = text_units.drop(index=1)
+    await context.output_table_provider.write_dataframe("text_units", text_units)
+
+    with patch(
+        "graphrag.index.operations.embed_text.embed_text.run_embed_text",
+        wraps=run_embed_text,
+    ) as spy:
+        await update_text_embeddings(
+            config=config,
+            table_provider=context.output_table_provider,
+            previous_table_provider=previous_table_provider,
+            callbacks=context.callbacks,
+            model=model,
+            tokenizer=model.tokenizer,
+        )
+
+    embedded = [text for call in spy.call_args_list for text in call.args[0]]
+    assert embedded == ["changed text"]
+
+    snapshot = await context.output_table_provider.read_dataframe(
+        f"embeddings.{text_unit_text_embedding}"
+    )
+    assert sorted(snapshot["id"]) == sorted(text_units["id"])